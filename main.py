@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.app import TrendRadarApp
+from src.notifiers.smtp_pool import close_smtp_pool
 
 
 def main():
@@ -86,7 +87,11 @@ def main():
             return 0
 
         # 运行主流程
-        success = app.run(mode=args.mode)
+        try:
+            success = app.run(mode=args.mode)
+        finally:
+            app.close()
+            close_smtp_pool()
 
         return 0 if success else 1
 
@@ -19,6 +19,8 @@ import pytz
 import requests
 import yaml
 
+from src.core.snapshot import build_batch_blocks, snapshot_path, write_snapshot
+
 
 VERSION = "3.0.4"
 
@@ -582,6 +584,9 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
             for id_value in failed_ids:
                 f.write(f"{id_value}\n")
 
+    # 结构化快照（供 MCP 等程序读取，txt 仅用于展示），原子写入
+    write_snapshot(snapshot_path(file_path), build_batch_blocks(results, id_to_name, failed_ids))
+
     return file_path
 
 
@@ -1,11 +1,13 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现TTL缓存机制，以及按文件指纹失效、按字节数淘汰的LRU缓存，提升数据访问性能。
 """
 
+import sys
 import time
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
 from threading import Lock
 
 
@@ -119,8 +121,147 @@ class CacheService:
             }
 
 
+def estimate_size(value: Any) -> int:
+    """
+    估算对象占用的内存字节数（递归统计容器内的元素）
+
+    Args:
+        value: 待估算的对象
+
+    Returns:
+        估算的字节数
+    """
+    size = 0
+    seen = set()
+    stack = [value]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+
+    return size
+
+
+class FingerprintLRUCache:
+    """
+    按指纹失效的LRU缓存
+
+    每个条目附带数据来源的指纹（如目录下文件的修改时间和大小），
+    读取时指纹不一致即视为失效；条目不按时间过期，
+    总字节数超过上限时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        初始化缓存
+
+        Args:
+            max_bytes: 缓存占用的字节数上限
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: str, fingerprint: Hashable) -> Optional[Any]:
+        """
+        获取缓存数据
+
+        Args:
+            key: 缓存键
+            fingerprint: 数据来源的当前指纹
+
+        Returns:
+            缓存的值，不存在或指纹不一致时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] == fingerprint:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+                # 数据来源已变化，丢弃旧条目
+                self._remove(key)
+                self._invalidations += 1
+            self._misses += 1
+        return None
+
+    def set(self, key: str, fingerprint: Hashable, value: Any) -> None:
+        """
+        设置缓存数据
+
+        Args:
+            key: 缓存键
+            fingerprint: 数据来源的指纹
+            value: 缓存值
+        """
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # 单个条目超过上限时不缓存
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (fingerprint, value, size)
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """删除条目（调用方需持有锁）"""
+        _, _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+    def clear(self) -> None:
+        """清空所有缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> dict:
+        """
+        获取缓存统计信息
+
+        Returns:
+            统计信息字典
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "total_entries": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
 # 全局缓存实例
 _global_cache = None
+_titles_cache = None
 
 
 def get_cache() -> CacheService:
@@ -134,3 +275,16 @@ def get_cache() -> CacheService:
     if _global_cache is None:
         _global_cache = CacheService()
     return _global_cache
+
+
+def get_titles_cache() -> FingerprintLRUCache:
+    """
+    获取全局标题数据缓存实例
+
+    Returns:
+        全局标题数据缓存
+    """
+    global _titles_cache
+    if _titles_cache is None:
+        _titles_cache = FingerprintLRUCache()
+    return _titles_cache
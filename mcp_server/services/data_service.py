@@ -6,11 +6,12 @@
 
 import re
 from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from .cache_service import get_cache
 from .parser_service import ParserService
+from .search_index import get_search_index
 from ..utils.errors import DataNotFoundError
 
 
@@ -26,6 +27,7 @@ class DataService:
         """
         self.parser = ParserService(project_root)
         self.cache = get_cache()
+        self.search_index = get_search_index(self.parser)
 
     def get_latest_news(
         self,
@@ -210,48 +212,28 @@ class DataService:
             # 默认搜索今天
             start_date = end_date = datetime.now()
 
-        # 收集所有匹配的新闻
+        # 收集所有匹配的新闻（通过倒排索引查询整个日期范围）
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                # 搜索包含关键词的标题
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        if keyword.lower() in title.lower():
-                            # 计算平均排名
-                            avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
-
-                            results.append({
-                                "title": title,
-                                "platform": platform_id,
-                                "platform_name": platform_name,
-                                "ranks": info["ranks"],
-                                "count": len(info["ranks"]),
-                                "avg_rank": round(avg_rank, 2),
-                                "url": info.get("url", ""),
-                                "mobileUrl": info.get("mobileUrl", ""),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            })
-
-                            platform_distribution[platform_id] += 1
-
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
+        for item in self.search_index.search(keyword, start_date, end_date, platforms):
+            ranks = item["ranks"]
+            # 计算平均排名
+            avg_rank = sum(ranks) / len(ranks) if ranks else 0
+
+            results.append({
+                "title": item["title"],
+                "platform": item["platform"],
+                "platform_name": item["platform_name"],
+                "ranks": ranks,
+                "count": len(ranks),
+                "avg_rank": round(avg_rank, 2),
+                "url": item["url"],
+                "mobileUrl": item["mobileUrl"],
+                "date": item["date"]
+            })
 
-            # 下一天
-            current_date += timedelta(days=1)
+            platform_distribution[item["platform"]] += 1
 
         if not results:
             raise DataNotFoundError(
@@ -600,5 +582,6 @@ class DataService:
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
             },
             "cache": self.cache.get_stats(),
+            "titles_cache": self.parser.titles_cache.get_stats(),
             "health": "healthy"
         }
@@ -0,0 +1,186 @@
+"""
+标题关键词存储
+
+标题进入解析缓存时统一提取一次关键词，并按日期持久化到
+output/YYYY年MM月DD日/.keywords.json，分析工具直接读取预先计算的结果。
+
+- 默认分词与 AnalyticsTools 原有实现一致：去掉URL和标点后按空白和中文标点切分
+- 设置环境变量 KEYWORD_SEGMENTATION=true 且安装 jieba 时，对中文片段再做分词
+- 文件中记录分词方式，分词方式变化时整体重建；同一天新增的标题只计算新增部分
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import jieba
+    JIEBA_AVAILABLE = True
+except ImportError:
+    JIEBA_AVAILABLE = False
+
+# 停用词
+STOPWORDS = {
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很',
+    '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'
+}
+
+# 持久化文件名（位于日期目录下，不影响 txt 目录的指纹）
+KEYWORDS_FILE = ".keywords.json"
+
+_CJK_PATTERN = re.compile(r'[一-鿿]')
+
+
+def extract_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取关键词（简单实现）
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表
+    """
+    # 移除URL和特殊字符
+    title = re.sub(r'http[s]?://\S+', '', title)
+    title = re.sub(r'[^\w\s]', ' ', title)
+
+    # 简单分词（按空格和常见分隔符）
+    words = re.split(r'[\s，。！？、]+', title)
+
+    # 过滤停用词和短词
+    return [
+        word.strip() for word in words
+        if word.strip() and len(word.strip()) >= min_length and word.strip() not in STOPWORDS
+    ]
+
+
+def segment_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    提取关键词并对中文片段分词（需要 jieba）
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表
+    """
+    keywords = []
+    for word in extract_keywords(title, min_length):
+        if not _CJK_PATTERN.search(word):
+            keywords.append(word)
+            continue
+        keywords.extend(
+            token for token in jieba.lcut(word)
+            if len(token) >= min_length and token not in STOPWORDS
+        )
+    return keywords
+
+
+class KeywordStore:
+    """按日期持久化的标题关键词"""
+
+    def __init__(self, segmentation: bool = None):
+        """
+        初始化关键词存储
+
+        Args:
+            segmentation: 是否对中文分词，默认读取环境变量 KEYWORD_SEGMENTATION
+        """
+        if segmentation is None:
+            segmentation = os.environ.get("KEYWORD_SEGMENTATION", "").lower() in ("1", "true", "yes")
+        if segmentation and not JIEBA_AVAILABLE:
+            print("Warning: 未安装 jieba，关键词不做中文分词")
+            segmentation = False
+
+        self.segmentation = segmentation
+        self.tokenizer = "jieba" if segmentation else "regex"
+
+    def extract(self, title: str) -> List[str]:
+        """
+        按当前分词方式提取关键词
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            关键词列表
+        """
+        return segment_keywords(title) if self.segmentation else extract_keywords(title)
+
+    def get_keywords(self, date_dir: Path, titles: Sequence[str]) -> Dict[str, Tuple[str, ...]]:
+        """
+        获取一天中各标题的关键词（只为没有记录的标题提取，并写回文件）
+
+        Args:
+            date_dir: 日期目录（output/YYYY年MM月DD日）
+            titles: 标题列表
+
+        Returns:
+            {标题: 关键词元组}
+        """
+        keywords_file = date_dir / KEYWORDS_FILE
+        stored = self._load(keywords_file)
+
+        result = {}
+        added = False
+        for title in titles:
+            if title in result:
+                continue
+            keywords = stored.get(title)
+            if keywords is None:
+                keywords = stored[title] = self.extract(title)
+                added = True
+            result[title] = tuple(keywords)
+
+        if added:
+            self._save(keywords_file, stored)
+
+        return result
+
+    def _load(self, keywords_file: Path) -> Dict[str, List[str]]:
+        """
+        读取关键词文件（分词方式不一致时视为空）
+
+        Args:
+            keywords_file: 文件路径
+
+        Returns:
+            {标题: 关键词列表}
+        """
+        if not keywords_file.exists():
+            return {}
+
+        try:
+            with open(keywords_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Warning: 读取关键词文件 {keywords_file} 失败: {e}")
+            return {}
+
+        if data.get("tokenizer") != self.tokenizer:
+            return {}
+        return data.get("keywords", {})
+
+    def _save(self, keywords_file: Path, keywords: Dict[str, List[str]]) -> None:
+        """
+        写入关键词文件（先写临时文件再替换）
+
+        Args:
+            keywords_file: 文件路径
+            keywords: {标题: 关键词列表}
+        """
+        tmp_file = keywords_file.with_name(keywords_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"tokenizer": self.tokenizer, "keywords": keywords},
+                    f, ensure_ascii=False, separators=(",", ":")
+                )
+            os.replace(tmp_file, keywords_file)
+        except Exception as e:
+            print(f"Warning: 保存关键词文件 {keywords_file} 失败: {e}")
@@ -5,19 +5,126 @@
 """
 
 import re
+import json
+from bisect import bisect_left
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from datetime import datetime
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from .cache_service import get_cache, get_titles_cache
+from .keyword_store import KeywordStore
+from .similarity_index import SimilarityIndex
+
+
+class ParsedDay:
+    """
+    单日标题数据的列式存储
+
+    所有平台的标题按平台连续存放在几列元组中，平台过滤只需按区间取出对应行，
+    同一天的数据只解析和缓存一份
+    """
+
+    def __init__(
+        self,
+        all_titles: Dict,
+        id_to_name: Dict,
+        all_timestamps: Dict,
+        title_keywords: Optional[Dict[str, Tuple[str, ...]]] = None
+    ):
+        """
+        从合并后的标题数据构建
+
+        Args:
+            all_titles: {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: {platform_id: platform_name}
+            all_timestamps: {filename: timestamp}
+            title_keywords: {title: 关键词元组}，预先提取的标题关键词
+        """
+        titles, ranks, urls, mobile_urls = [], [], [], []
+        self.platform_slices: Dict[str, Tuple[int, int]] = {}
+
+        for platform_id, platform_titles in all_titles.items():
+            start = len(titles)
+            for title, info in platform_titles.items():
+                titles.append(title)
+                ranks.append(tuple(info.get("ranks", [])))
+                urls.append(info.get("url", ""))
+                mobile_urls.append(info.get("mobileUrl", ""))
+            self.platform_slices[platform_id] = (start, len(titles))
+
+        self.titles = tuple(titles)
+        self.ranks = tuple(ranks)
+        self.urls = tuple(urls)
+        self.mobile_urls = tuple(mobile_urls)
+        self.id_to_name = id_to_name
+        self.timestamps = all_timestamps
+        self.title_keywords = title_keywords or {}
+
+    def view(self, platform_ids: Optional[List[str]] = None) -> Tuple[Dict, Dict, Dict]:
+        """
+        按平台取出标题数据（每次返回新的字典，调用方可以自由修改）
+
+        Args:
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，结构同 read_all_titles_for_date
+        """
+        if platform_ids:
+            selected = [pid for pid in self.platform_slices if pid in platform_ids]
+        else:
+            selected = list(self.platform_slices)
+
+        all_titles = {}
+        for platform_id in selected:
+            start, end = self.platform_slices[platform_id]
+            all_titles[platform_id] = {
+                self.titles[i]: {
+                    "ranks": list(self.ranks[i]),
+                    "url": self.urls[i],
+                    "mobileUrl": self.mobile_urls[i],
+                }
+                for i in range(start, end)
+            }
+
+        return all_titles, dict(self.id_to_name), dict(self.timestamps)
+
+    def iter_rows(
+        self,
+        rows: Iterable[int],
+        platform_ids: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, str, Dict]]:
+        """
+        按行号取出标题（行号升序，即与 view 的遍历顺序一致）
+
+        Args:
+            rows: 行号集合
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Yields:
+            (platform_id, title, info) 元组，info 为 {ranks, url, mobileUrl}
+        """
+        rows = sorted(rows)
+        for platform_id, (start, end) in self.platform_slices.items():
+            if platform_ids and platform_id not in platform_ids:
+                continue
+            for i in rows[bisect_left(rows, start):bisect_left(rows, end)]:
+                yield platform_id, self.titles[i], {
+                    "ranks": list(self.ranks[i]),
+                    "url": self.urls[i],
+                    "mobileUrl": self.mobile_urls[i],
+                }
 
 
 class ParserService:
     """文件解析服务类"""
 
+    # txt 报告旁的结构化快照后缀
+    SNAPSHOT_SUFFIX = ".jsonl"
+
     def __init__(self, project_root: str = None):
         """
         初始化解析服务
@@ -34,6 +141,10 @@ class ParserService:
 
         # 初始化缓存服务
         self.cache = get_cache()
+        # 标题数据缓存（按数据目录指纹失效）
+        self.titles_cache = get_titles_cache()
+        # 标题关键词（解析时提取一次并持久化）
+        self.keyword_store = KeywordStore()
 
     @staticmethod
     def clean_title(title: str) -> str:
@@ -56,6 +167,8 @@ class ParserService:
         """
         解析单个txt文件的标题数据
 
+        优先读取同名的结构化快照（.jsonl），旧数据没有快照或快照无法解析时解析展示文本
+
         Args:
             file_path: txt文件路径
 
@@ -70,6 +183,74 @@ class ParserService:
         if not file_path.exists():
             raise FileParseError(str(file_path), "文件不存在")
 
+        snapshot_file = file_path.with_suffix(self.SNAPSHOT_SUFFIX)
+        if snapshot_file.exists():
+            try:
+                return self.parse_snapshot_file(snapshot_file)
+            except FileParseError as e:
+                print(f"Warning: 读取快照 {snapshot_file} 失败，改为解析文本: {e}")
+
+        return self._parse_txt_content(file_path)
+
+    def parse_snapshot_file(self, file_path: Path) -> Tuple[Dict, Dict]:
+        """
+        解析结构化快照文件
+
+        快照每行一个 JSON 区块，标题区块（type 为 titles）按列存储各字段；
+        读取规则与 src/core/snapshot.load_platform_titles 一致（排名按快照原样返回）
+
+        Args:
+            file_path: .jsonl 快照文件路径
+
+        Returns:
+            (titles_by_id, id_to_name) 元组，结构同 parse_txt_file
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
+        titles_by_id = {}
+        id_to_name = {}
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+
+                    block = json.loads(line)
+                    if block.get("type") != "titles":
+                        continue
+
+                    for source_id, name in block["platforms"].items():
+                        id_to_name[source_id] = name or source_id
+
+                    for source_id, title, ranks, url, mobile_url in zip(
+                        block["platform"], block["title"], block["ranks"],
+                        block["url"], block["mobile_url"]
+                    ):
+                        titles_by_id.setdefault(source_id, {})[title] = {
+                            "ranks": ranks,
+                            "url": url,
+                            "mobileUrl": mobile_url,
+                        }
+        except Exception as e:
+            raise FileParseError(str(file_path), str(e))
+
+        return titles_by_id, id_to_name
+
+    def _parse_txt_content(self, file_path: Path) -> Tuple[Dict, Dict]:
+        """
+        从展示文本解析标题数据（兼容没有快照的旧数据）
+
+        Args:
+            file_path: txt文件路径
+
+        Returns:
+            (titles_by_id, id_to_name) 元组，结构同 parse_txt_file
+
+        Raises:
+            FileParseError: 文件解析错误
+        """
         titles_by_id = {}
         id_to_name = {}
 
@@ -157,6 +338,30 @@ class ParserService:
             date = datetime.now()
         return date.strftime("%Y年%m月%d日")
 
+    @staticmethod
+    def get_folder_fingerprint(txt_dir: Path) -> Optional[str]:
+        """
+        计算数据目录的指纹
+
+        由目录下文件的数量、最新修改时间和总大小组成，新增、删除或改写文件时都会变化
+
+        Args:
+            txt_dir: txt数据目录
+
+        Returns:
+            指纹字符串，目录不存在时返回None
+        """
+        try:
+            stats = [entry.stat() for entry in txt_dir.iterdir() if entry.is_file()]
+        except OSError:
+            return None
+
+        return "{}:{}:{}".format(
+            len(stats),
+            max((stat.st_mtime_ns for stat in stats), default=0),
+            sum(stat.st_size for stat in stats),
+        )
+
     def read_all_titles_for_date(
         self,
         date: datetime = None,
@@ -165,6 +370,9 @@ class ParserService:
         """
         读取指定日期的所有标题文件（带缓存）
 
+        缓存按数据目录指纹失效：爬虫写入新文件后立即重新读取，历史日期不会过期；
+        每天只缓存一份全部平台的列式数据，平台过滤从中取出视图
+
         Args:
             date: 日期对象，默认为今天
             platform_ids: 平台ID列表，None表示所有平台
@@ -178,22 +386,114 @@ class ParserService:
         Raises:
             DataNotFoundError: 数据不存在
         """
-        # 生成缓存键
+        parsed_day, _ = self._get_parsed_day(date)
+
+        result = parsed_day.view(platform_ids)
+        if not result[0]:
+            raise DataNotFoundError(
+                f"{self.get_date_folder_name(date)} 没有有效的数据",
+                suggestion="请检查数据文件格式或重新运行爬虫"
+            )
+
+        return result
+
+    def _get_parsed_day(self, date: datetime = None) -> Tuple[ParsedDay, Optional[str]]:
+        """
+        获取指定日期的列式数据（带缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            (parsed_day, fingerprint) 元组，数据目录不存在时指纹为None
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        # 缓存键只与日期有关，不同的平台过滤共用同一份解析结果
         date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
+        cache_key = f"parsed_day:{self.project_root}:{date_str}"
+
+        # 目录不存在时不走缓存，由 load_titles_for_date 抛出 DataNotFoundError
+        fingerprint = self.get_folder_fingerprint(self.project_root / "output" / date_str / "txt")
+        parsed_day = None
+        if fingerprint is not None:
+            parsed_day = self.titles_cache.get(cache_key, fingerprint)
+
+        if parsed_day is None:
+            # 缓存未命中，读取全部平台并提取标题关键词
+            all_titles, id_to_name, all_timestamps = self.load_titles_for_date(date)
+            title_keywords = self.keyword_store.get_keywords(
+                self.project_root / "output" / date_str,
+                [title for titles in all_titles.values() for title in titles]
+            )
+            parsed_day = ParsedDay(all_titles, id_to_name, all_timestamps, title_keywords)
+            if fingerprint is not None:
+                self.titles_cache.set(cache_key, fingerprint, parsed_day)
+
+        return parsed_day, fingerprint
+
+    def get_title_keywords(self, date: datetime = None) -> Dict[str, Tuple[str, ...]]:
+        """
+        获取指定日期各标题预先提取的关键词
 
-        # 尝试从缓存获取
-        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
-        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
+        Args:
+            date: 日期对象，默认为今天
 
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
+        Returns:
+            {title: 关键词元组}（与缓存共享，调用方不应修改）
 
-        # 缓存未命中，读取文件
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        parsed_day, _ = self._get_parsed_day(date)
+        return parsed_day.title_keywords
+
+    def get_similarity_index(self, date: datetime = None) -> Tuple[ParsedDay, SimilarityIndex]:
+        """
+        获取指定日期的标题相似度索引（与列式数据使用同一指纹缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            (parsed_day, index) 元组，索引的行号与 parsed_day 的列一致
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
+        parsed_day, fingerprint = self._get_parsed_day(date)
+        cache_key = f"similarity:{self.project_root}:{self.get_date_folder_name(date)}"
+
+        index = None
+        if fingerprint is not None:
+            index = self.titles_cache.get(cache_key, fingerprint)
+
+        if index is None or index.size != len(parsed_day.titles):
+            index = SimilarityIndex(parsed_day.titles)
+            if fingerprint is not None:
+                self.titles_cache.set(cache_key, fingerprint, index)
+
+        return parsed_day, index
+
+    def load_titles_for_date(
+        self,
+        date: datetime = None,
+        platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """
+        读取指定日期的所有标题文件（不使用缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            (all_titles, id_to_name, all_timestamps) 元组，结构同 read_all_titles_for_date
+
+        Raises:
+            DataNotFoundError: 数据不存在
+        """
         date_folder = self.get_date_folder_name(date)
         txt_dir = self.project_root / "output" / date_folder / "txt"
 
@@ -253,11 +553,7 @@ class ParserService:
                 suggestion="请检查数据文件格式或重新运行爬虫"
             )
 
-        # 缓存结果
-        result = (all_titles, id_to_name, all_timestamps)
-        self.cache.set(cache_key, result)
-
-        return result
+        return all_titles, id_to_name, all_timestamps
 
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
@@ -0,0 +1,412 @@
+"""
+全文倒排索引服务
+
+为 output/ 下所有日期的新闻标题建立持久化倒排索引（output/.search_index.db），
+关键词搜索不再逐日解析 txt 文件。
+
+- 中文等非 ASCII 文字按相邻两字切分（bigram），英文和数字按单词切分，
+  单词额外索引各个后缀，查询时按前缀范围匹配即可覆盖单词内部的子串
+- 超长单词只索引前 MAX_SUFFIX_POSITIONS 个位置的后缀，并为标题加上 LONG_WORD_TOKEN 标记，
+  英文查询词同时匹配带标记的标题，由最终的包含判断过滤
+- 以日期目录下文件的修改时间和大小作为版本，只重建新增或变化的日期，删除已不存在的日期
+- 索引只用于筛选候选标题，最终仍按原来的不区分大小写包含判断过滤，结果与逐日扫描一致
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .parser_service import ParserService
+from ..utils.errors import DataNotFoundError
+
+# 单词只为前若干个位置生成后缀（超长单词中更靠后的子串退化为扫描验证）
+MAX_SUFFIX_POSITIONS = 32
+
+# 含超长单词的标题的标记（不是字母数字，不会与索引词冲突）
+LONG_WORD_TOKEN = "\x01long"
+
+# 索引格式版本（写入日期签名，格式变化时重建所有日期）
+INDEX_VERSION = 2
+
+# 日期目录名格式
+DATE_FOLDER_PATTERN = re.compile(r'(\d{4})年(\d{2})月(\d{2})日$')
+
+
+def _iter_runs(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    将文本切分为连续的同类字符段
+
+    Args:
+        text: 已转为小写的文本
+
+    Yields:
+        (类型, 字符段)：类型 "w" 为 ASCII 字母数字，"c" 为其他文字（中文等）
+    """
+    run = []
+    run_kind = None
+
+    for ch in text:
+        if ch.isascii():
+            kind = "w" if ch.isalnum() else None
+        else:
+            kind = "c" if ch.isalnum() else None
+
+        if kind != run_kind and run:
+            yield run_kind, "".join(run)
+            run = []
+        run_kind = kind
+        if kind is not None:
+            run.append(ch)
+
+    if run:
+        yield run_kind, "".join(run)
+
+
+def index_tokens(title: str) -> Set[str]:
+    """
+    计算标题的索引词
+
+    Args:
+        title: 新闻标题
+
+    Returns:
+        索引词集合
+    """
+    tokens = set()
+    for kind, run in _iter_runs(title.lower()):
+        if kind == "w":
+            for i in range(min(len(run), MAX_SUFFIX_POSITIONS)):
+                tokens.add(run[i:])
+            if len(run) > MAX_SUFFIX_POSITIONS:
+                tokens.add(LONG_WORD_TOKEN)
+        elif len(run) == 1:
+            tokens.add(run)
+        else:
+            for i in range(len(run) - 1):
+                tokens.add(run[i:i + 2])
+    return tokens
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """
+    计算查询词对应的索引条件
+
+    包含查询词的标题一定满足全部条件；单个中文字无法用 bigram 表达，不生成条件
+
+    Args:
+        query: 查询词
+
+    Returns:
+        [(索引词, 是否按前缀匹配)]，为空时需要扫描验证
+    """
+    terms = {}
+    for kind, run in _iter_runs(query.lower()):
+        if kind == "w":
+            terms[run] = True
+        elif len(run) >= 2:
+            for i in range(len(run) - 1):
+                terms.setdefault(run[i:i + 2], False)
+    return list(terms.items())
+
+
+class SearchIndex:
+    """标题倒排索引"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS days (
+            date TEXT PRIMARY KEY,
+            signature TEXT NOT NULL,
+            indexed_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS docs (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            platform TEXT NOT NULL,
+            platform_name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            title_lower TEXT NOT NULL,
+            ranks TEXT NOT NULL,
+            url TEXT NOT NULL,
+            mobile_url TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_docs_date ON docs (date, id);
+        CREATE TABLE IF NOT EXISTS postings (
+            token TEXT NOT NULL,
+            doc_id INTEGER NOT NULL,
+            PRIMARY KEY (token, doc_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+    """
+
+    def __init__(
+        self,
+        parser: ParserService,
+        db_path: Optional[Path] = None,
+        refresh_interval: float = 10.0
+    ):
+        """
+        初始化索引
+
+        Args:
+            parser: 文件解析服务（提供数据目录和标题解析）
+            db_path: 索引数据库路径，默认 output/.search_index.db
+            refresh_interval: 两次检查数据目录变化的最小间隔（秒）
+        """
+        self.parser = parser
+        self.output_dir = parser.project_root / "output"
+        self.db_path = Path(db_path) if db_path else self.output_dir / ".search_index.db"
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._last_refresh = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        获取数据库连接（首次调用时创建表结构）
+
+        Returns:
+            数据库连接
+        """
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _scan_day_folders(self) -> Dict[str, Tuple[datetime, str]]:
+        """
+        扫描数据目录
+
+        Returns:
+            {日期(YYYY-MM-DD): (日期对象, 版本签名)}，签名为索引格式版本和 txt 目录的指纹
+        """
+        days = {}
+        if not self.output_dir.exists():
+            return days
+
+        for date_folder in self.output_dir.iterdir():
+            match = DATE_FOLDER_PATTERN.match(date_folder.name)
+            if not match:
+                continue
+            try:
+                date = datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                continue
+            signature = self.parser.get_folder_fingerprint(date_folder / "txt")
+            if signature is not None:
+                days[date.strftime("%Y-%m-%d")] = (date, f"v{INDEX_VERSION}:{signature}")
+        return days
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        增量更新索引
+
+        Args:
+            force: 是否忽略检查间隔
+
+        Returns:
+            重建的日期数
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.refresh_interval:
+                return 0
+            self._last_refresh = now
+
+            conn = self._connect()
+            indexed = {row["date"]: row["signature"] for row in conn.execute("SELECT date, signature FROM days")}
+            current = self._scan_day_folders()
+
+            rebuilt = 0
+            for date_str in indexed.keys() - current.keys():
+                with conn:
+                    self._delete_day(conn, date_str)
+            for date_str, (date, signature) in sorted(current.items()):
+                if indexed.get(date_str) != signature:
+                    self._index_day(conn, date_str, date, signature)
+                    rebuilt += 1
+            return rebuilt
+
+    @staticmethod
+    def _delete_day(conn: sqlite3.Connection, date_str: str) -> None:
+        """
+        删除某天的索引
+
+        Args:
+            conn: 数据库连接
+            date_str: 日期(YYYY-MM-DD)
+        """
+        conn.execute(
+            "DELETE FROM postings WHERE doc_id IN (SELECT id FROM docs WHERE date = ?)", (date_str,)
+        )
+        conn.execute("DELETE FROM docs WHERE date = ?", (date_str,))
+        conn.execute("DELETE FROM days WHERE date = ?", (date_str,))
+
+    def _index_day(self, conn: sqlite3.Connection, date_str: str, date: datetime, signature: str) -> None:
+        """
+        重建某天的索引（在同一事务内替换）
+
+        Args:
+            conn: 数据库连接
+            date_str: 日期(YYYY-MM-DD)
+            date: 日期对象
+            signature: 目录版本签名
+        """
+        try:
+            all_titles, id_to_name, _ = self.parser.load_titles_for_date(date)
+        except DataNotFoundError:
+            all_titles, id_to_name = {}, {}
+
+        with conn:
+            self._delete_day(conn, date_str)
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in titles.items():
+                    cursor = conn.execute(
+                        "INSERT INTO docs (date, platform, platform_name, title, title_lower, "
+                        "ranks, url, mobile_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            date_str, platform_id, platform_name, title, title.lower(),
+                            json.dumps(info.get("ranks", [])), info.get("url", ""),
+                            info.get("mobileUrl", ""),
+                        ),
+                    )
+                    conn.executemany(
+                        "INSERT INTO postings (token, doc_id) VALUES (?, ?)",
+                        ((token, cursor.lastrowid) for token in index_tokens(title)),
+                    )
+            conn.execute(
+                "INSERT INTO days (date, signature, indexed_at) VALUES (?, ?, ?)",
+                (date_str, signature, time.time()),
+            )
+
+    def search(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        搜索标题包含关键词（不区分大小写）的新闻
+
+        Args:
+            keyword: 关键词
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platforms: 平台ID过滤列表
+
+        Returns:
+            新闻列表，按日期升序，同一天内保持数据文件中的顺序；
+            每条为 {title, platform, platform_name, ranks, url, mobileUrl, date}
+        """
+        self.refresh()
+
+        keyword_lower = keyword.lower()
+        conditions = ["d.date BETWEEN ? AND ?"]
+        params: List = [start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")]
+
+        if platforms:
+            conditions.append(f"d.platform IN ({','.join('?' * len(platforms))})")
+            params.extend(platforms)
+
+        terms = query_terms(keyword)
+        if terms:
+            subqueries = []
+            term_params: List = []
+            for token, prefix in terms:
+                if prefix:
+                    # 查询词可能位于超长单词中未索引的位置，带标记的标题也作为候选
+                    subqueries.append(
+                        "SELECT doc_id FROM postings WHERE (token >= ? AND token < ?) OR token = ?"
+                    )
+                    term_params.extend([token, token + "\U0010ffff", LONG_WORD_TOKEN])
+                else:
+                    subqueries.append("SELECT doc_id FROM postings WHERE token = ?")
+                    term_params.append(token)
+            conditions.insert(0, f"d.id IN ({' INTERSECT '.join(subqueries)})")
+            params = term_params + params
+        else:
+            # 没有可用的索引条件（如单个汉字），在日期范围内扫描
+            conditions.append("instr(d.title_lower, ?) > 0")
+            params.append(keyword_lower)
+
+        sql = (
+            "SELECT d.date, d.platform, d.platform_name, d.title, d.title_lower, d.ranks, "
+            f"d.url, d.mobile_url FROM docs d WHERE {' AND '.join(conditions)} ORDER BY d.date, d.id"
+        )
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+
+        return [
+            {
+                "title": row["title"],
+                "platform": row["platform"],
+                "platform_name": row["platform_name"],
+                "ranks": json.loads(row["ranks"]),
+                "url": row["url"],
+                "mobileUrl": row["mobile_url"],
+                "date": row["date"],
+            }
+            for row in rows
+            if keyword_lower in row["title_lower"]
+        ]
+
+    def get_stats(self) -> Dict:
+        """
+        获取索引统计
+
+        Returns:
+            {days, docs, postings, db_size}
+        """
+        with self._lock:
+            conn = self._connect()
+            days = conn.execute("SELECT COUNT(*) FROM days").fetchone()[0]
+            docs = conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+            postings = conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+        return {
+            "days": days,
+            "docs": docs,
+            "postings": postings,
+            "db_size": self.db_path.stat().st_size if self.db_path.exists() else 0,
+        }
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# 按数据目录共享的索引实例
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(parser: ParserService) -> SearchIndex:
+    """
+    获取数据目录对应的共享索引实例
+
+    Args:
+        parser: 文件解析服务
+
+    Returns:
+        索引实例
+    """
+    key = str(Path(parser.project_root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = SearchIndex(parser)
+        return index
@@ -0,0 +1,220 @@
+"""
+标题相似度索引
+
+为单日标题预先计算字符 n-gram 的 MinHash 签名并按 LSH 分桶，
+相似标题查找只需取出与查询落入同一桶的候选标题，再对候选逐一计算精确相似度。
+
+- 分片（shingle）为小写标题的单字和相邻两字
+- 签名长度 NUM_PERM，每 ROWS 个值为一个 band，任一 band 完全相同即为候选
+- 阈值低于 LSH_MIN_THRESHOLD 时 LSH 召回率不足，退化为全部标题
+- 另外维护关键词倒排表和小写标题列表，用于关键词重合和子串包含的精确候选
+- 安装 NumPy 时批量计算签名，结果与纯 Python 计算完全一致
+"""
+
+import random
+import re
+import zlib
+from typing import Dict, Iterable, List, Sequence, Set
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 签名长度和 LSH 分段（ROWS 个值为一个 band）
+NUM_PERM = 64
+ROWS = 2
+BANDS = NUM_PERM // ROWS
+
+# 低于该相似度阈值时不使用 LSH 筛选
+LSH_MIN_THRESHOLD = 0.5
+
+# NumPy 批量计算时每批的标题数（限制中间矩阵的内存）
+NUMPY_CHUNK_SIZE = 512
+
+_MASK64 = (1 << 64) - 1
+_rng = random.Random(20240601)
+# 乘法移位哈希的参数：h -> ((a * h + b) mod 2^64) >> 32
+_HASH_A = [_rng.getrandbits(64) | 1 for _ in range(NUM_PERM)]
+_HASH_B = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+
+# 与 SearchTools._extract_keywords 相同的分词规则
+_WORD_PATTERN = re.compile(r'[\w]+')
+
+
+def shingle_hashes(text: str) -> List[int]:
+    """
+    计算文本分片的哈希值
+
+    Args:
+        text: 文本
+
+    Returns:
+        去重后的分片哈希列表（空文本返回空列表）
+    """
+    text = "".join(text.lower().split())
+    shingles = set(text)
+    shingles.update(text[i:i + 2] for i in range(len(text) - 1))
+    return [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+
+
+def minhash_signature(text: str) -> tuple:
+    """
+    计算文本的 MinHash 签名
+
+    Args:
+        text: 文本
+
+    Returns:
+        长度为 NUM_PERM 的签名，空文本返回空元组
+    """
+    hashes = shingle_hashes(text)
+    if not hashes:
+        return ()
+    return tuple(
+        min(((a * h + b) & _MASK64) >> 32 for h in hashes)
+        for a, b in zip(_HASH_A, _HASH_B)
+    )
+
+
+def minhash_signatures(texts: Sequence[str]) -> List[tuple]:
+    """
+    批量计算 MinHash 签名（安装 NumPy 时向量化计算）
+
+    Args:
+        texts: 文本列表
+
+    Returns:
+        签名列表，与 minhash_signature 逐条计算的结果一致
+    """
+    if not NUMPY_AVAILABLE:
+        return [minhash_signature(text) for text in texts]
+
+    hash_a = np.array(_HASH_A, dtype=np.uint64)
+    hash_b = np.array(_HASH_B, dtype=np.uint64)
+    signatures = []
+
+    for chunk_start in range(0, len(texts), NUMPY_CHUNK_SIZE):
+        chunk = texts[chunk_start:chunk_start + NUMPY_CHUNK_SIZE]
+        hashes = []
+        offsets = []
+        non_empty = []
+        for text in chunk:
+            text_hashes = shingle_hashes(text)
+            non_empty.append(bool(text_hashes))
+            if text_hashes:
+                offsets.append(len(hashes))
+                hashes.extend(text_hashes)
+
+        rows = iter(())
+        if hashes:
+            values = np.array(hashes, dtype=np.uint64)[:, None] * hash_a + hash_b
+            minimums = np.minimum.reduceat(values >> np.uint64(32), np.array(offsets), axis=0)
+            rows = iter(minimums.tolist())
+
+        signatures.extend(tuple(next(rows)) if flag else () for flag in non_empty)
+
+    return signatures
+
+
+def _band_keys(signature: tuple) -> List[int]:
+    """
+    计算签名各 band 的桶键
+
+    Args:
+        signature: MinHash 签名
+
+    Returns:
+        长度为 BANDS 的桶键列表
+    """
+    keys = []
+    for band in range(BANDS):
+        key = 0
+        for value in signature[band * ROWS:(band + 1) * ROWS]:
+            key = (key << 32) | value
+        keys.append(key)
+    return keys
+
+
+class SimilarityIndex:
+    """单日标题的相似度索引"""
+
+    def __init__(self, titles: Sequence[str]):
+        """
+        构建索引
+
+        Args:
+            titles: 标题列表（行号与 ParsedDay 的列一致）
+        """
+        self.size = len(titles)
+        self.titles_lower = tuple(title.lower() for title in titles)
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(BANDS)]
+        self._keywords: Dict[str, List[int]] = {}
+
+        for row, signature in enumerate(minhash_signatures(titles)):
+            if not signature:
+                continue
+            for band, key in enumerate(_band_keys(signature)):
+                self._buckets[band].setdefault(key, []).append(row)
+
+        for row, title in enumerate(titles):
+            for word in set(_WORD_PATTERN.findall(title)):
+                self._keywords.setdefault(word, []).append(row)
+
+    def lsh_candidates(self, text: str, threshold: float) -> Set[int]:
+        """
+        获取与文本相似度可能达到阈值的候选行
+
+        Args:
+            text: 查询文本
+            threshold: SequenceMatcher 相似度阈值
+
+        Returns:
+            候选行号集合（阈值过低时为全部行）
+        """
+        if threshold < LSH_MIN_THRESHOLD:
+            return set(range(self.size))
+
+        signature = minhash_signature(text)
+        if not signature:
+            return set()
+
+        candidates = set()
+        for band, key in enumerate(_band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        # 长度相差过大时相似度上限 2*min/(len1+len2) 已低于阈值
+        length = len(text)
+        return {
+            row for row in candidates
+            if 2.0 * min(length, len(self.titles_lower[row])) >= threshold * (length + len(self.titles_lower[row]))
+        }
+
+    def keyword_candidates(self, keywords: Iterable[str]) -> Set[int]:
+        """
+        获取包含任一关键词（按分词结果）的行
+
+        Args:
+            keywords: 关键词列表
+
+        Returns:
+            行号集合
+        """
+        rows = set()
+        for keyword in keywords:
+            rows.update(self._keywords.get(keyword, ()))
+        return rows
+
+    def substring_candidates(self, text: str) -> Set[int]:
+        """
+        获取标题包含文本（不区分大小写）的行
+
+        Args:
+            text: 查询文本
+
+        Returns:
+            行号集合
+        """
+        text_lower = text.lower()
+        return {row for row, title in enumerate(self.titles_lower) if text_lower in title}
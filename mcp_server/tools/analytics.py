@@ -7,7 +7,7 @@
 import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 from ..services.data_service import DataService
@@ -306,38 +306,24 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集趋势数据
+            # 通过倒排索引一次查询整个日期范围，再按天统计话题出现次数
+            matched_by_date = defaultdict(list)
+            for item in self.data_service.search_index.search(topic, start_date, end_date):
+                matched_by_date[item["date"]].append(item["title"])
+
+            # 收集趋势数据（没有数据的日期计为0）
             trend_data = []
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                date_str = current_date.strftime("%Y-%m-%d")
+                matched_titles = matched_by_date.get(date_str, [])
 
-                    # 统计该时间点的话题出现次数
-                    count = 0
-                    matched_titles = []
-
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-                                matched_titles.append(title)
-
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count,
-                        "sample_titles": matched_titles[:3]  # 只保留前3个样本
-                    })
-
-                except DataNotFoundError:
-                    trend_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0,
-                        "sample_titles": []
-                    })
+                trend_data.append({
+                    "date": date_str,
+                    "count": len(matched_titles),
+                    "sample_titles": matched_titles[:3]  # 只保留前3个样本
+                })
 
                 # 按天增加时间
                 current_date += timedelta(days=1)
@@ -455,6 +441,7 @@ class AnalyticsTools:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
                         date=current_date
                     )
+                    title_keywords = self._get_title_keywords(current_date)
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -467,8 +454,8 @@ class AnalyticsTools:
                             if topic and topic.lower() in title.lower():
                                 platform_stats[platform_name]["topic_mentions"] += 1
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
+                            # 预先提取的关键词
+                            keywords = self._lookup_keywords(title_keywords, title)
                             platform_stats[platform_name]["top_keywords"].update(keywords)
 
                 except DataNotFoundError:
@@ -559,6 +546,7 @@ class AnalyticsTools:
 
             # 读取今天的数据
             all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            title_keywords = self._get_title_keywords()
 
             # 关键词共现统计
             cooccurrence = Counter()
@@ -566,8 +554,8 @@ class AnalyticsTools:
 
             for platform_id, titles in all_titles.items():
                 for title in titles.keys():
-                    # 提取关键词
-                    keywords = self._extract_keywords(title)
+                    # 预先提取的关键词
+                    keywords = self._lookup_keywords(title_keywords, title)
 
                     # 记录每个关键词出现的标题
                     for kw in keywords:
@@ -596,7 +584,7 @@ class AnalyticsTools:
                 # 找出同时包含两个关键词的标题样本
                 titles_with_both = [
                     title for title in keyword_titles[kw1]
-                    if kw2 in self._extract_keywords(title)
+                    if kw2 in self._lookup_keywords(title_keywords, title)
                 ]
 
                 result_pairs.append({
@@ -953,36 +941,35 @@ class AnalyticsTools:
 
             limit = validate_limit(limit, default=50)
 
-            # 读取数据
-            all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
+            # 读取数据和相似度索引，只对 LSH 候选计算精确相似度
+            parsed_day, index = self.data_service.parser.get_similarity_index()
+            id_to_name = parsed_day.id_to_name
+            candidates = index.lsh_candidates(reference_title, threshold)
 
             # 计算相似度
             similar_items = []
 
-            for platform_id, titles in all_titles.items():
-                platform_name = id_to_name.get(platform_id, platform_id)
+            for platform_id, title, info in parsed_day.iter_rows(candidates):
+                if title == reference_title:
+                    continue
 
-                for title, info in titles.items():
-                    if title == reference_title:
-                        continue
+                # 计算相似度
+                similarity = self._calculate_similarity(reference_title, title)
 
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                if similarity >= threshold:
+                    news_item = {
+                        "title": title,
+                        "platform": platform_id,
+                        "platform_name": id_to_name.get(platform_id, platform_id),
+                        "similarity": round(similarity, 3),
+                        "rank": info["ranks"][0] if info["ranks"] else 0
+                    }
 
-                    if similarity >= threshold:
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "similarity": round(similarity, 3),
-                            "rank": info["ranks"][0] if info["ranks"] else 0
-                        }
-
-                        # 条件性添加 URL 字段
-                        if include_url:
-                            news_item["url"] = info.get("url", "")
+                    # 条件性添加 URL 字段
+                    if include_url:
+                        news_item["url"] = info.get("url", "")
 
-                        similar_items.append(news_item)
+                    similar_items.append(news_item)
 
             # 按相似度排序
             similar_items.sort(key=lambda x: x["similarity"], reverse=True)
@@ -1074,6 +1061,7 @@ class AnalyticsTools:
 
             # 读取数据
             all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date()
+            title_keywords = self._get_title_keywords()
 
             # 搜索包含实体的新闻
             related_news = []
@@ -1100,8 +1088,8 @@ class AnalyticsTools:
                             "rank": ranks[0] if ranks else 999
                         })
 
-                        # 提取实体周边的关键词
-                        keywords = self._extract_keywords(title)
+                        # 实体周边的关键词
+                        keywords = self._lookup_keywords(title_keywords, title)
                         entity_context.update(keywords)
 
             if not related_news:
@@ -1213,6 +1201,7 @@ class AnalyticsTools:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
                         date=current_date
                     )
+                    title_keywords = self._get_title_keywords(current_date)
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -1225,8 +1214,8 @@ class AnalyticsTools:
                                 "date": current_date.strftime("%Y-%m-%d")
                             })
 
-                            # 提取关键词
-                            keywords = self._extract_keywords(title)
+                            # 预先提取的关键词
+                            keywords = self._lookup_keywords(title_keywords, title)
                             all_keywords.update(keywords)
 
                 except DataNotFoundError:
@@ -1661,6 +1650,7 @@ class AnalyticsTools:
 
             # 读取当前和之前的数据
             current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+            current_title_keywords = self._get_title_keywords()
 
             # 读取昨天的数据作为基准
             yesterday = datetime.now() - timedelta(days=1)
@@ -1670,6 +1660,7 @@ class AnalyticsTools:
                 )
             except DataNotFoundError:
                 previous_all_titles = {}
+            previous_title_keywords = self._get_title_keywords(yesterday)
 
             # 统计当前的关键词频率
             current_keywords = Counter()
@@ -1677,7 +1668,7 @@ class AnalyticsTools:
 
             for _, titles in current_all_titles.items():
                 for title in titles.keys():
-                    keywords = self._extract_keywords(title)
+                    keywords = self._lookup_keywords(current_title_keywords, title)
                     current_keywords.update(keywords)
 
                     for kw in keywords:
@@ -1688,7 +1679,7 @@ class AnalyticsTools:
 
             for _, titles in previous_all_titles.items():
                 for title in titles.keys():
-                    keywords = self._extract_keywords(title)
+                    keywords = self._lookup_keywords(previous_title_keywords, title)
                     previous_keywords.update(keywords)
 
             # 检测异常热度
@@ -1805,12 +1796,13 @@ class AnalyticsTools:
                     all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
                         date=date
                     )
+                    title_keywords = self._get_title_keywords(date)
 
                     # 统计关键词
                     keywords_count = Counter()
                     for _, titles in all_titles.items():
                         for title in titles.keys():
-                            keywords = self._extract_keywords(title)
+                            keywords = self._lookup_keywords(title_keywords, title)
                             keywords_count.update(keywords)
 
                     # 记录每个关键词的历史数据
@@ -1823,13 +1815,14 @@ class AnalyticsTools:
             # 添加今天的数据
             try:
                 all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+                title_keywords = self._get_title_keywords()
 
                 keywords_count = Counter()
                 keyword_titles = defaultdict(list)
 
                 for _, titles in all_titles.items():
                     for title in titles.keys():
-                        keywords = self._extract_keywords(title)
+                        keywords = self._lookup_keywords(title_keywords, title)
                         keywords_count.update(keywords)
 
                         for kw in keywords:
@@ -1920,32 +1913,47 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
-    def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
+    def _extract_keywords(self, title: str) -> List[str]:
         """
-        从标题中提取关键词（简单实现）
+        从标题中提取关键词（与预先提取使用相同的分词方式）
 
         Args:
             title: 标题文本
-            min_length: 最小关键词长度
 
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
+        return self.data_service.parser.keyword_store.extract(title)
 
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
+    def _get_title_keywords(self, date: datetime = None) -> Dict[str, Tuple[str, ...]]:
+        """
+        读取指定日期各标题预先提取的关键词
 
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
+        Args:
+            date: 日期对象，默认为今天
 
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
+        Returns:
+            {标题: 关键词元组}，没有数据时返回空字典
+        """
+        try:
+            return self.data_service.parser.get_title_keywords(date)
+        except DataNotFoundError:
+            return {}
+
+    def _lookup_keywords(self, title_keywords: Dict[str, Tuple[str, ...]], title: str) -> Tuple[str, ...]:
+        """
+        查找标题的关键词（数据在两次读取之间更新导致缺失时现场提取）
 
+        Args:
+            title_keywords: {标题: 关键词元组}
+            title: 标题文本
+
+        Returns:
+            关键词元组
+        """
+        keywords = title_keywords.get(title)
+        if keywords is None:
+            keywords = tuple(self._extract_keywords(title))
         return keywords
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
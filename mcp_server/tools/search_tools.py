@@ -121,37 +121,38 @@ class SearchTools:
                 start_date = end_date = latest
 
             # 收集所有匹配的新闻
-            all_matches = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 根据搜索模式执行不同的搜索逻辑
-                    if search_mode == "keyword":
-                        matches = self._search_by_keyword_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
-                    elif search_mode == "fuzzy":
-                        matches = self._search_by_fuzzy_mode(
-                            query, all_titles, id_to_name, current_date, threshold, include_url
-                        )
-                    else:  # entity
-                        matches = self._search_by_entity_mode(
-                            query, all_titles, id_to_name, current_date, include_url
-                        )
+            if search_mode == "keyword":
+                # 关键词模式通过倒排索引一次查询整个日期范围
+                all_matches = self._search_by_keyword_mode(
+                    query, start_date, end_date, platforms, include_url
+                )
+            else:
+                all_matches = []
+                current_date = start_date
+
+                while current_date <= end_date:
+                    try:
+                        # 根据搜索模式执行不同的搜索逻辑
+                        if search_mode == "fuzzy":
+                            matches = self._search_by_fuzzy_mode(
+                                query, current_date, platforms, threshold, include_url
+                            )
+                        else:  # entity
+                            all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
+                                date=current_date,
+                                platform_ids=platforms
+                            )
+                            matches = self._search_by_entity_mode(
+                                query, all_titles, id_to_name, current_date, include_url
+                            )
 
-                    all_matches.extend(matches)
+                        all_matches.extend(matches)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                    except DataNotFoundError:
+                        # 该日期没有数据，继续下一天
+                        pass
 
-                current_date += timedelta(days=1)
+                    current_date += timedelta(days=1)
 
             if not all_matches:
                 # 获取可用日期范围用于错误提示
@@ -242,101 +243,106 @@ class SearchTools:
     def _search_by_keyword_mode(
         self,
         query: str,
-        all_titles: Dict,
-        id_to_name: Dict,
-        current_date: datetime,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]],
         include_url: bool
     ) -> List[Dict]:
         """
-        关键词搜索模式（精确匹配）
+        关键词搜索模式（精确匹配，通过倒排索引查询）
 
         Args:
             query: 搜索关键词
-            all_titles: 所有标题字典
-            id_to_name: 平台ID到名称映射
-            current_date: 当前日期
+            start_date: 开始日期
+            end_date: 结束日期
+            platforms: 平台过滤列表
+            include_url: 是否包含URL链接
 
         Returns:
             匹配的新闻列表
         """
         matches = []
-        query_lower = query.lower()
 
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
-
-            for title, info in titles.items():
-                # 精确包含判断
-                if query_lower in title.lower():
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": 1.0,  # 精确匹配，相似度为1
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+        for item in self.data_service.search_index.search(query, start_date, end_date, platforms):
+            ranks = item["ranks"]
+            news_item = {
+                "title": item["title"],
+                "platform": item["platform"],
+                "platform_name": item["platform_name"],
+                "date": item["date"],
+                "similarity_score": 1.0,  # 精确匹配，相似度为1
+                "ranks": ranks,
+                "count": len(ranks),
+                "rank": ranks[0] if ranks else 999
+            }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+            # 条件性添加 URL 字段
+            if include_url:
+                news_item["url"] = item["url"]
+                news_item["mobileUrl"] = item["mobileUrl"]
 
-                    matches.append(news_item)
+            matches.append(news_item)
 
         return matches
 
     def _search_by_fuzzy_mode(
         self,
         query: str,
-        all_titles: Dict,
-        id_to_name: Dict,
         current_date: datetime,
+        platforms: Optional[List[str]],
         threshold: float,
         include_url: bool
     ) -> List[Dict]:
         """
         模糊搜索模式（使用相似度算法）
 
+        通过相似度索引筛选候选标题：包含查询词、与查询词有共同关键词，
+        或 LSH 判定相似度可能达到阈值的标题，再逐一执行精确匹配
+
         Args:
             query: 搜索内容
-            all_titles: 所有标题字典
-            id_to_name: 平台ID到名称映射
             current_date: 当前日期
+            platforms: 平台过滤列表
             threshold: 相似度阈值
+            include_url: 是否包含URL链接
 
         Returns:
             匹配的新闻列表
+
+        Raises:
+            DataNotFoundError: 该日期没有数据
         """
-        matches = []
+        parsed_day, index = self.data_service.parser.get_similarity_index(current_date)
+        id_to_name = parsed_day.id_to_name
 
-        for platform_id, titles in all_titles.items():
-            platform_name = id_to_name.get(platform_id, platform_id)
+        candidates = index.substring_candidates(query)
+        candidates |= index.keyword_candidates(self._extract_keywords(query))
+        candidates |= index.lsh_candidates(query, threshold)
 
-            for title, info in titles.items():
-                # 模糊匹配
-                is_match, similarity = self._fuzzy_match(query, title, threshold)
+        matches = []
 
-                if is_match:
-                    news_item = {
-                        "title": title,
-                        "platform": platform_id,
-                        "platform_name": platform_name,
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "similarity_score": round(similarity, 4),
-                        "ranks": info.get("ranks", []),
-                        "count": len(info.get("ranks", [])),
-                        "rank": info["ranks"][0] if info["ranks"] else 999
-                    }
+        for platform_id, title, info in parsed_day.iter_rows(candidates, platforms):
+            # 模糊匹配
+            is_match, similarity = self._fuzzy_match(query, title, threshold)
+
+            if is_match:
+                news_item = {
+                    "title": title,
+                    "platform": platform_id,
+                    "platform_name": id_to_name.get(platform_id, platform_id),
+                    "date": current_date.strftime("%Y-%m-%d"),
+                    "similarity_score": round(similarity, 4),
+                    "ranks": info.get("ranks", []),
+                    "count": len(info.get("ranks", [])),
+                    "rank": info["ranks"][0] if info["ranks"] else 999
+                }
 
-                    # 条件性添加 URL 字段
-                    if include_url:
-                        news_item["url"] = info.get("url", "")
-                        news_item["mobileUrl"] = info.get("mobileUrl", "")
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = info.get("url", "")
+                    news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                    matches.append(news_item)
+                matches.append(news_item)
 
         return matches
 
@@ -578,48 +584,53 @@ class SearchTools:
 
             while current_date <= search_end:
                 try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    # 读取该日期的数据和相似度索引
+                    parsed_day, index = self.data_service.parser.get_similarity_index(current_date)
+                    id_to_name = parsed_day.id_to_name
+
+                    # 综合相似度大于0需要有共同关键词，或文本相似度不低于 threshold / 0.3
+                    candidates = index.keyword_candidates(reference_keywords)
+                    if threshold <= 0.3:
+                        candidates |= index.lsh_candidates(reference_text, threshold / 0.3)
 
                     # 搜索相关新闻
-                    for platform_id, titles in all_titles.items():
+                    for platform_id, title, info in parsed_day.iter_rows(candidates):
                         platform_name = id_to_name.get(platform_id, platform_id)
 
-                        for title, info in titles.items():
-                            # 计算标题相似度
-                            title_similarity = self._calculate_similarity(reference_text, title)
+                        # 计算标题相似度
+                        title_similarity = self._calculate_similarity(reference_text, title)
 
-                            # 提取标题关键词
-                            title_keywords = self._extract_keywords(title)
+                        # 提取标题关键词
+                        title_keywords = self._extract_keywords(title)
 
-                            # 计算关键词重合度
-                            keyword_overlap = self._calculate_keyword_overlap(
-                                reference_keywords,
-                                title_keywords
-                            )
+                        # 计算关键词重合度
+                        keyword_overlap = self._calculate_keyword_overlap(
+                            reference_keywords,
+                            title_keywords
+                        )
 
-                            # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
-                            combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
-
-                            if combined_score >= threshold:
-                                news_item = {
-                                    "title": title,
-                                    "platform": platform_id,
-                                    "platform_name": platform_name,
-                                    "date": current_date.strftime("%Y-%m-%d"),
-                                    "similarity_score": round(combined_score, 4),
-                                    "keyword_overlap": round(keyword_overlap, 4),
-                                    "text_similarity": round(title_similarity, 4),
-                                    "common_keywords": list(set(reference_keywords) & set(title_keywords)),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
-                                }
-
-                                # 条件性添加 URL 字段
-                                if include_url:
-                                    news_item["url"] = info.get("url", "")
-                                    news_item["mobileUrl"] = info.get("mobileUrl", "")
-
-                                all_related_news.append(news_item)
+                        # 综合相似度 (70% 关键词重合 + 30% 文本相似度)
+                        combined_score = keyword_overlap * 0.7 + title_similarity * 0.3
+
+                        if combined_score >= threshold:
+                            news_item = {
+                                "title": title,
+                                "platform": platform_id,
+                                "platform_name": platform_name,
+                                "date": current_date.strftime("%Y-%m-%d"),
+                                "similarity_score": round(combined_score, 4),
+                                "keyword_overlap": round(keyword_overlap, 4),
+                                "text_similarity": round(title_similarity, 4),
+                                "common_keywords": list(set(reference_keywords) & set(title_keywords)),
+                                "rank": info["ranks"][0] if info["ranks"] else 0
+                            }
+
+                            # 条件性添加 URL 字段
+                            if include_url:
+                                news_item["url"] = info.get("url", "")
+                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+
+                            all_related_news.append(news_item)
 
                 except DataNotFoundError:
                     # 该日期没有数据，继续下一天
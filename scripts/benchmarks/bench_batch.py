@@ -0,0 +1,209 @@
+# coding=utf-8
+"""消息分批基准测试
+
+在合成的大报告上对比原分批算法（字符串拼接、每次重新编码整个批次）与
+增量字节计数 + 列表拼接的实现，覆盖所有推送平台格式，并校验不含超长词组时两者输出一致；
+最后对比所有渠道各自渲染与共用 RenderCache 渲染一次推送的耗时。
+
+用法:
+    python -m scripts.benchmarks.bench_batch [--titles 5000] [--groups 50] [--new 500]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional
+
+from src.core.reporter import NewsReporter
+from src.notifiers.batch_sender import BatchSender
+from src.notifiers.render_cache import RenderCache
+
+# 平台格式及其默认批次大小（与各通知器一致）
+PLATFORM_BATCH_SIZES = {
+    "feishu": 29000,
+    "dingtalk": 20000,
+    "wework": 4000,
+    "telegram": 4000,
+    "ntfy": 4000,
+}
+
+
+def generate_report_data(
+    title_count: int,
+    group_count: int,
+    new_count: int = 0,
+    seed: int = 42
+) -> Dict:
+    """生成合成报告数据
+
+    Args:
+        title_count: 词组统计中的标题总数
+        group_count: 词组数量
+        new_count: 新增标题数
+        seed: 随机种子
+
+    Returns:
+        Dict: 与 NewsReporter.prepare_report_data 返回结构一致的数据
+    """
+    rng = random.Random(seed)
+    platforms = [("zhihu", "知乎"), ("weibo", "微博"), ("douyin", "抖音"), ("baidu", "百度热搜")]
+
+    def title_data(index: int, is_new: bool) -> Dict:
+        platform, name = rng.choice(platforms)
+        first = rng.randint(1, 30)
+        return {
+            "title": f"合成标题{index} " + "热点" * rng.randint(1, 12),
+            "platform": platform,
+            "source_name": name,
+            "time_display": "[08:00 ~ 20:00]" if rng.random() < 0.5 else "",
+            "count": rng.randint(1, 8),
+            "ranks": sorted({first, rng.randint(1, 30)}),
+            "rank_threshold": 10,
+            "url": f"https://example.com/news/{index}",
+            "mobile_url": f"https://m.example.com/news/{index}" if rng.random() < 0.3 else "",
+            "is_new": is_new,
+        }
+
+    groups: List[List[Dict]] = [[] for _ in range(group_count)]
+    for i in range(title_count):
+        groups[rng.randrange(group_count)].append(title_data(i, False))
+
+    stats = [
+        {
+            "word": f"词组{i}",
+            "count": len(titles),
+            "percentage": round(len(titles) / title_count * 100, 2),
+            "titles": titles,
+        }
+        for i, titles in enumerate(groups)
+        if titles
+    ]
+
+    new_by_source: Dict[str, Dict] = {}
+    for i in range(new_count):
+        data = title_data(title_count + i, True)
+        source = new_by_source.setdefault(data["platform"], {
+            "source_id": data["platform"],
+            "source_name": data["source_name"],
+            "titles": [],
+        })
+        source["titles"].append(data)
+
+    return {
+        "stats": stats,
+        "new_titles": list(new_by_source.values()),
+        "failed_ids": ["toutiao"],
+        "total_new_count": new_count,
+    }
+
+
+def legacy_split(
+    sender: BatchSender,
+    report_data: Dict,
+    platform: str,
+    update_info: Optional[Dict] = None,
+    max_bytes: int = 20000,
+    mode: str = "daily"
+) -> List[str]:
+    """原分批算法（字符串拼接，每个词组都重新编码整个当前批次）"""
+    batches = []
+    base_footer = sender._build_footer(update_info, platform, mode)
+    safe_max_bytes = max_bytes - len(base_footer.encode("utf-8")) - 500
+
+    header = sender._build_header(report_data, platform)
+    current_batch = header
+
+    for stat in report_data["stats"]:
+        if stat["count"] <= 0:
+            continue
+
+        stat_content = (
+            sender._build_stat_heading(stat, platform)
+            + "".join(sender._build_stat_lines(stat, platform))
+            + "\n"
+        )
+        stat_size = len(stat_content.encode("utf-8"))
+        current_size = len(current_batch.encode("utf-8"))
+
+        if current_size + stat_size > safe_max_bytes and current_batch.strip():
+            batches.append(current_batch + base_footer)
+            current_batch = header
+
+        current_batch += stat_content
+
+    if report_data.get("new_titles"):
+        heading, lines = sender._build_new_titles_parts(report_data["new_titles"], platform)
+        new_section = heading + "".join(lines)
+        new_size = len(new_section.encode("utf-8"))
+        current_size = len(current_batch.encode("utf-8"))
+
+        if current_size + new_size > safe_max_bytes and current_batch.strip():
+            batches.append(current_batch + base_footer)
+            current_batch = header
+
+        current_batch += new_section
+
+    if report_data.get("failed_ids"):
+        current_batch += sender._build_failed_section(report_data["failed_ids"], platform)
+
+    if current_batch.strip() != header.strip():
+        batches.append(current_batch + base_footer)
+
+    return batches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="消息分批基准测试")
+    parser.add_argument("--titles", type=int, default=5000, help="标题总数")
+    parser.add_argument("--groups", type=int, default=50, help="词组数量")
+    parser.add_argument("--new", type=int, default=500, help="新增标题数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数（取最小值）")
+    args = parser.parse_args()
+
+    report_data = generate_report_data(args.titles, args.groups, args.new)
+    sender = BatchSender(NewsReporter())
+    print(f"报告: {args.titles} 条标题, {args.groups} 个词组, {args.new} 条新增")
+
+    for platform, max_bytes in PLATFORM_BATCH_SIZES.items():
+        def best(func):
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                batches = func(sender, report_data, platform, None, max_bytes, "daily")
+                timings.append(time.perf_counter() - start)
+            return min(timings), batches
+
+        legacy_time, legacy_batches = best(legacy_split)
+        new_time, new_batches = best(BatchSender.split_content_into_batches)
+
+        over_limit = sum(1 for batch in legacy_batches if len(batch.encode("utf-8")) > max_bytes)
+        print(
+            f"{platform:<9} 上限 {max_bytes:>5}B: 原算法 {legacy_time * 1000:7.1f}ms "
+            f"({len(legacy_batches)} 批, 超限 {over_limit}), "
+            f"增量计数 {new_time * 1000:7.1f}ms ({len(new_batches)} 批, 超限 "
+            f"{sum(1 for batch in new_batches if len(batch.encode('utf-8')) > max_bytes)}), "
+            f"加速比 {legacy_time / new_time:.1f}x"
+        )
+
+    def render_all(use_cache: bool) -> float:
+        start = time.perf_counter()
+        cache = RenderCache(report_data)
+        for platform, max_bytes in PLATFORM_BATCH_SIZES.items():
+            if use_cache:
+                cache.get_batches(platform, None, max_bytes)
+            else:
+                BatchSender(NewsReporter()).split_content_into_batches(
+                    report_data, platform, None, max_bytes
+                )
+        return time.perf_counter() - start
+
+    separate = min(render_all(False) for _ in range(args.repeat))
+    cached = min(render_all(True) for _ in range(args.repeat))
+    print(
+        f"全部渠道: 各自渲染 {separate * 1000:7.1f}ms, 共用缓存 {cached * 1000:7.1f}ms, "
+        f"加速比 {separate / cached:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
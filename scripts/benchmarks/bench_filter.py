@@ -0,0 +1,138 @@
+# coding=utf-8
+"""关键词匹配基准测试
+
+在合成语料（默认 1000 个词组 × 100000 条标题）上对比逐词子串查找
+与编译后的 Aho–Corasick 匹配器，并校验两者的匹配结果完全一致。
+
+用法:
+    python -m scripts.benchmarks.bench_filter [--groups 1000] [--titles 100000]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.core.matcher import KeywordMatcher
+
+
+CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动同工也能下过子说产种面而方后多定行学法所民得经十三之进着等部度家电力里如水化高自二理起小物现实加量都两体制机当使点从业本去把性好应开它合还因由其些然前外天政四日那社义事平形相全表间样与关各重新线内数正心反你明看原又么利比或但质气第向道命此变条只没结解问意建月公无系军很情者最立代想已通并提直题党程展五果料象员革位入常文总次品式活设及管特件长求老头基资边流路级少图山统接知较将组见计别她手角期根论运农指几九区强放决西被干做必战先回则任取据处队南给色光门即保治北造百规热领七海口东导器压志世金增争济阶油思术极交受联什认六共权收证改清己美再采转更单风切打白教速花带安场身车例真务具万每目至达走积示议声报斗完类八离华名确才科张信马节话米整空元况今集温传土许步群广石记需段研界拉林律叫且究观越织装影算低持音众书布复容儿须际商非验连断深难近矿千周委素技备半办青省列习响约支般史感劳便团往酸历市克何除消构府称太准精值号率族维划选标写存候毛亲快效斯院查江型眼王按格养易置派层片始却专状育厂京识适属圆包火住调满县局照参红细引听该铁价严"
+
+
+def generate_corpus(
+    group_count: int,
+    title_count: int,
+    seed: int = 42
+) -> Tuple[List[Dict], List[str], List[str]]:
+    """生成合成词组和标题语料
+
+    Args:
+        group_count: 词组数量
+        title_count: 标题数量
+        seed: 随机种子
+
+    Returns:
+        Tuple[List[Dict], List[str], List[str]]: (词组, 过滤词, 标题)
+    """
+    rng = random.Random(seed)
+
+    def random_word(min_len: int = 2, max_len: int = 3) -> str:
+        return "".join(rng.choice(CHARS) for _ in range(rng.randint(min_len, max_len)))
+
+    vocabulary = [random_word() for _ in range(group_count * 3)]
+    vocabulary += ["AI", "iPhone", "GPT", "Python", "NBA"]
+
+    word_groups = []
+    for _ in range(group_count):
+        normal = rng.sample(vocabulary, rng.randint(1, 3))
+        required = rng.sample(vocabulary, 1) if rng.random() < 0.3 else []
+        word_groups.append({
+            "required": required,
+            "normal": normal,
+            "group_key": " ".join(normal),
+        })
+
+    filter_words = [random_word() for _ in range(max(1, group_count // 20))]
+
+    titles = []
+    for _ in range(title_count):
+        parts = []
+        for _ in range(rng.randint(2, 5)):
+            if rng.random() < 0.4:
+                word = rng.choice(vocabulary)
+                parts.append(word.lower() if rng.random() < 0.5 else word)
+            else:
+                parts.append(random_word(2, 6))
+        titles.append("".join(parts))
+
+    return word_groups, filter_words, titles
+
+
+def naive_first_group(
+    title: str,
+    word_groups: List[Dict],
+    filter_words: List[str]
+) -> Optional[int]:
+    """逐词子串查找（NewsFilter 原实现的匹配逻辑）
+
+    Args:
+        title: 新闻标题
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+
+    Returns:
+        Optional[int]: 第一个匹配的词组下标
+    """
+    title_lower = title.lower()
+
+    if any(word.lower() in title_lower for word in filter_words):
+        return None
+
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(
+            word.lower() in title_lower for word in group["required"]
+        ):
+            continue
+        if group["normal"] and not any(
+            word.lower() in title_lower for word in group["normal"]
+        ):
+            continue
+        return index
+
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="关键词匹配基准测试")
+    parser.add_argument("--groups", type=int, default=1000, help="词组数量")
+    parser.add_argument("--titles", type=int, default=100000, help="标题数量")
+    args = parser.parse_args()
+
+    word_groups, filter_words, titles = generate_corpus(args.groups, args.titles)
+    print(f"语料: {len(word_groups)} 个词组, {len(filter_words)} 个过滤词, {len(titles)} 条标题")
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(word_groups, filter_words)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive_results = [naive_first_group(title, word_groups, filter_words) for title in titles]
+    naive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled_results = [matcher.first_group(title) for title in titles]
+    compiled_time = time.perf_counter() - start
+
+    if naive_results != compiled_results:
+        raise SystemExit("匹配结果不一致")
+
+    matched = sum(1 for result in compiled_results if result is not None)
+    print(f"匹配: {matched} 条")
+    print(f"逐词查找: {naive_time:.2f}s ({naive_time / len(titles) * 1e6:.1f} µs/条)")
+    print(f"编译匹配: {compiled_time:.2f}s ({compiled_time / len(titles) * 1e6:.1f} µs/条), "
+          f"构建耗时 {build_time * 1000:.1f}ms")
+    print(f"加速比: {naive_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+# coding=utf-8
+"""通知吞吐基准测试
+
+启动模拟各渠道响应格式的本地 webhook 服务器（飞书/钉钉/企业微信/Telegram/ntfy）
+和本地 SMTP 服务器，将 100 / 1k / 10k 条标题的合成报告完整推送一遍，
+输出每个渠道的端到端耗时、发送字节数、批次数和发送线程的 CPU 时间。
+
+保存结果后可作为回归基线：与基线相比 CPU 时间增长超过容差时以非零状态码退出。
+
+用法:
+    python -m scripts.benchmarks.bench_notify [--sizes 100,1000,10000] [--channels feishu,email]
+        [--delay 0] [--repeat 3] [--save results.json] [--baseline results.json --tolerance 0.3]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.core.reporter import NewsReporter
+from src.notifiers.base import BaseNotifier
+from src.notifiers.dingtalk import DingTalkNotifier
+from src.notifiers.email import EmailNotifier
+from src.notifiers.feishu import FeishuNotifier
+from src.notifiers.ntfy import NtfyNotifier
+from src.notifiers.smtp_pool import SMTPPool
+from src.notifiers.telegram import TelegramNotifier
+from src.notifiers.transport import NotifierTransport
+from src.notifiers.wework import WeWorkNotifier
+from scripts.benchmarks.bench_batch import generate_report_data
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.smtp import AuthResult
+    AIOSMTPD_AVAILABLE = True
+except ImportError:
+    AIOSMTPD_AVAILABLE = False
+
+# 各渠道成功时的响应体（与官方接口的成功响应一致）
+CHANNEL_RESPONSES = {
+    "feishu": {"StatusCode": 0, "StatusMessage": "success", "code": 0, "msg": "success"},
+    "dingtalk": {"errcode": 0, "errmsg": "ok"},
+    "wework": {"errcode": 0, "errmsg": "ok"},
+    "telegram": {"ok": True, "result": {"message_id": 1}},
+    "ntfy": {"id": "bench", "event": "message", "topic": "bench"},
+}
+
+NOTIFIER_CLASSES = {
+    "feishu": FeishuNotifier,
+    "dingtalk": DingTalkNotifier,
+    "wework": WeWorkNotifier,
+    "telegram": TelegramNotifier,
+    "ntfy": NtfyNotifier,
+    "email": EmailNotifier,
+}
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+class WebhookStandIn:
+    """模拟单个渠道的本地 webhook 服务器
+
+    支持 HTTP/1.1 keep-alive，记录请求数和收到的请求体字节数
+    """
+
+    def __init__(self, channel: str, delay: float = 0.0):
+        """初始化服务器
+
+        Args:
+            channel: 渠道标识（决定响应格式）
+            delay: 每个请求的响应延迟（秒），模拟真实接口的往返时间
+        """
+        self.channel = channel
+        self.delay = delay
+        self.requests = 0
+        self.bytes_received = 0
+        lock = threading.Lock()
+        stand_in = self
+        response_body = json.dumps(CHANNEL_RESPONSES[channel]).encode("utf-8")
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 响应头和响应体分两次写入，关闭 Nagle 算法避免与客户端的延迟确认叠加出 40ms 等待
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                size = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(size)
+                with lock:
+                    stand_in.requests += 1
+                    stand_in.bytes_received += size
+                if stand_in.delay:
+                    time.sleep(stand_in.delay)
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response_body)))
+                self.end_headers()
+                self.wfile.write(response_body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """服务器地址"""
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def reset(self) -> None:
+        """清零计数"""
+        self.requests = 0
+        self.bytes_received = 0
+
+    def start(self) -> None:
+        """启动服务器"""
+        self.thread.start()
+
+    def stop(self) -> None:
+        """停止服务器"""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _SMTPCountingHandler:
+    """aiosmtpd 处理器：只统计邮件数和字节数"""
+
+    def __init__(self, stand_in: "SMTPStandIn"):
+        self.stand_in = stand_in
+
+    async def handle_DATA(self, server, session, envelope):
+        self.stand_in.requests += 1
+        self.stand_in.bytes_received += len(envelope.original_content)
+        return "250 OK"
+
+
+class SMTPStandIn:
+    """本地 SMTP 服务器（接受任意账号登录，不使用 TLS）"""
+
+    def __init__(self):
+        """初始化服务器"""
+        self.requests = 0
+        self.bytes_received = 0
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        self.controller = Controller(
+            _SMTPCountingHandler(self),
+            hostname="127.0.0.1",
+            port=port,
+            authenticator=lambda *args: AuthResult(success=True),
+            auth_require_tls=False,
+            data_size_limit=0,
+        )
+
+    @property
+    def host(self) -> str:
+        return self.controller.hostname
+
+    @property
+    def port(self) -> int:
+        return self.controller.port
+
+    def reset(self) -> None:
+        """清零计数"""
+        self.requests = 0
+        self.bytes_received = 0
+
+    def start(self) -> None:
+        """启动服务器"""
+        self.controller.start()
+
+    def stop(self) -> None:
+        """停止服务器"""
+        self.controller.stop()
+
+
+def channel_config(channel: str, stand_in) -> Dict:
+    """生成指向本地服务器的渠道配置
+
+    Args:
+        channel: 渠道标识
+        stand_in: 本地服务器
+
+    Returns:
+        Dict: 通知器配置
+    """
+    config = {"BATCH_SEND_INTERVAL": 0}
+    if channel == "feishu":
+        config["FEISHU_WEBHOOK_URL"] = f"{stand_in.base_url}/open-apis/bot/v2/hook/bench"
+    elif channel == "dingtalk":
+        config["DINGTALK_WEBHOOK_URL"] = f"{stand_in.base_url}/robot/send?access_token=bench"
+    elif channel == "wework":
+        config["WEWORK_WEBHOOK_URL"] = f"{stand_in.base_url}/cgi-bin/webhook/send?key=bench"
+    elif channel == "telegram":
+        config.update({
+            "TELEGRAM_BOT_TOKEN": "bench",
+            "TELEGRAM_CHAT_ID": "1",
+            "TELEGRAM_API_URL": stand_in.base_url,
+        })
+    elif channel == "ntfy":
+        config.update({"NTFY_SERVER_URL": stand_in.base_url, "NTFY_TOPIC": "bench"})
+    elif channel == "email":
+        config.update({
+            "EMAIL_FROM": "bench@example.com",
+            "EMAIL_PASSWORD": "bench",
+            "EMAIL_TO": "bench@example.com",
+            "EMAIL_SMTP_SERVER": stand_in.host,
+            "EMAIL_SMTP_PORT": str(stand_in.port),
+            "EMAIL_SMTP_STARTTLS": False,
+        })
+    return config
+
+
+def run_channel(
+    notifier: BaseNotifier,
+    stand_in,
+    report_data: Dict,
+    html_file: Optional[str] = None
+) -> Dict:
+    """将报告完整推送到一个渠道
+
+    Args:
+        notifier: 通知器
+        stand_in: 本地服务器
+        report_data: 报告数据
+        html_file: 邮件使用的 HTML 文件
+
+    Returns:
+        Dict: {success, latency, cpu, bytes, batches}
+    """
+    stand_in.reset()
+
+    # 通知器逐批打印日志，测量期间丢弃输出
+    with contextlib.redirect_stdout(io.StringIO()):
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if isinstance(notifier, EmailNotifier):
+            success = notifier.send(report_data, "基准测试", html_file_path=html_file)
+        else:
+            success = notifier.send(report_data, "基准测试")
+        cpu = time.thread_time() - cpu_start
+        latency = time.perf_counter() - wall_start
+
+    return {
+        "success": bool(success),
+        "latency": latency,
+        "cpu": cpu,
+        "bytes": stand_in.bytes_received,
+        "batches": stand_in.requests,
+    }
+
+
+def run_benchmark(
+    sizes: List[int],
+    channels: List[str],
+    delay: float = 0.0,
+    repeat: int = 3
+) -> Dict[str, Dict]:
+    """运行基准测试
+
+    Args:
+        sizes: 报告标题数列表
+        channels: 渠道列表
+        delay: 本地服务器的响应延迟（秒）
+        repeat: 重复次数（耗时取最小值）
+
+    Returns:
+        Dict[str, Dict]: {"渠道/标题数": run_channel 的结果}
+    """
+    if "email" in channels and not AIOSMTPD_AVAILABLE:
+        print("未安装 aiosmtpd，跳过邮件渠道")
+        channels = [channel for channel in channels if channel != "email"]
+
+    stand_ins = {
+        channel: SMTPStandIn() if channel == "email" else WebhookStandIn(channel, delay)
+        for channel in channels
+    }
+    for stand_in in stand_ins.values():
+        stand_in.start()
+
+    transport = NotifierTransport()
+    smtp_pool = SMTPPool()
+    reporter = NewsReporter()
+    results = {}
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for size in sizes:
+                report_data = generate_report_data(size, max(10, size // 100), size // 10)
+                html_file = Path(tmp_dir) / f"report_{size}.html"
+                html_file.write_text(
+                    reporter._build_email_html(report_data, size, "daily"), encoding="utf-8"
+                )
+
+                for channel in channels:
+                    config = channel_config(channel, stand_ins[channel])
+                    if channel == "email":
+                        notifier = EmailNotifier(config, transport=transport, smtp_pool=smtp_pool)
+                    else:
+                        notifier = NOTIFIER_CLASSES[channel](config, transport=transport)
+
+                    runs = [
+                        run_channel(notifier, stand_ins[channel], report_data, str(html_file))
+                        for _ in range(repeat)
+                    ]
+                    results[f"{channel}/{size}"] = {
+                        **runs[-1],
+                        "success": all(run["success"] for run in runs),
+                        "latency": min(run["latency"] for run in runs),
+                        "cpu": min(run["cpu"] for run in runs),
+                    }
+    finally:
+        smtp_pool.close()
+        transport.close()
+        for stand_in in stand_ins.values():
+            stand_in.stop()
+
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    tolerance: float
+) -> List[str]:
+    """与基线比较 CPU 时间
+
+    Args:
+        results: 本次结果
+        baseline: 基线结果
+        tolerance: 允许的相对增长（0.3 表示 30%）
+
+    Returns:
+        List[str]: 超出容差的条目说明
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        # 低于 1ms 的差异视为测量噪声
+        limit = base["cpu"] * (1 + tolerance) + 0.001
+        if result["cpu"] > limit:
+            regressions.append(
+                f"{key}: CPU {result['cpu'] * 1000:.1f}ms > 基线 {base['cpu'] * 1000:.1f}ms"
+            )
+        if result["batches"] != base["batches"]:
+            regressions.append(f"{key}: 批次数 {result['batches']} != 基线 {base['batches']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="通知吞吐基准测试")
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES), help="报告标题数，逗号分隔"
+    )
+    parser.add_argument("--channels", default=",".join(NOTIFIER_CLASSES), help="渠道，逗号分隔")
+    parser.add_argument("--delay", type=float, default=0.0, help="本地服务器响应延迟(秒)")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数（取最小值）")
+    parser.add_argument("--save", help="结果保存为 JSON 文件")
+    parser.add_argument("--baseline", help="基线 JSON 文件，CPU 时间超出容差时以状态码 1 退出")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="相对基线允许的 CPU 时间增长")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    channels = [channel.strip() for channel in args.channels.split(",") if channel.strip()]
+    results = run_benchmark(sizes, channels, args.delay, args.repeat)
+
+    print(f"{'渠道/标题数':<16} {'耗时':>9} {'CPU':>9} {'字节':>11} {'批次':>5}  状态")
+    for key, result in results.items():
+        print(
+            f"{key:<16} {result['latency'] * 1000:7.1f}ms {result['cpu'] * 1000:7.1f}ms "
+            f"{result['bytes']:>11,} {result['batches']:>5}  {'成功' if result['success'] else '失败'}"
+        )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"结果已保存: {args.save}")
+
+    failed = [key for key, result in results.items() if not result["success"]]
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"回归: {line}")
+        failed.extend(regressions)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# coding=utf-8
+"""报告生成基准测试
+
+在合成的大数据量一天上对比两种报告生成方式:
+- 逐个生成: 每个报告和通知各自转换新增标题并调用 prepare_report_data（共 5 次），顺序生成
+- 报告上下文: 只构建一次 ReportContext，txt/json/html 顺序或并行生成
+
+输出各阶段耗时、重复构建报告数据的内存分配量，并校验两种方式生成的文本报告内容一致。
+
+用法:
+    python -m scripts.benchmarks.bench_report [--groups 200] [--titles 50000] [--new 5000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+
+from src.app import TrendRadarApp
+from src.core.ranking import NewsRanking
+from src.core.reporter import NewsReporter
+from scripts.benchmarks.bench_weights import generate_word_stats
+
+REPORT_CALLS = 5  # 时间戳 txt、汇总 txt、JSON、HTML、通知
+
+
+def generate_new_titles(word_stats: Dict, new_count: int, seed: int = 42) -> Dict:
+    """从词组统计中抽取新增标题
+
+    Args:
+        word_stats: generate_word_stats 返回的数据
+        new_count: 新增标题数
+        seed: 随机种子
+
+    Returns:
+        Dict: 与 detect_latest_new_titles 返回结构一致的新增标题 {平台ID: {标题: 数据}}
+    """
+    rng = random.Random(seed)
+    all_titles = [
+        title_data
+        for group in word_stats.values()
+        for titles in group["titles"].values()
+        for title_data in titles
+    ]
+
+    new_titles = {}
+    for title_data in rng.sample(all_titles, min(new_count, len(all_titles))):
+        new_titles.setdefault(title_data["platform"], {})[title_data["title"]] = {
+            "ranks": title_data["ranks"][-1:],
+            "url": title_data["url"],
+            "mobileUrl": title_data["mobileUrl"],
+        }
+    return new_titles
+
+
+def convert_new_titles(new_titles: Dict, id_to_name: Dict):
+    """与 TrendRadarApp 相同的新增标题转换"""
+    return TrendRadarApp._convert_new_titles_to_news(None, new_titles, id_to_name)
+
+
+def render_separately(reporter: NewsReporter, stats, total_titles: int, new_titles, id_to_name):
+    """逐个生成报告（每次调用都重新准备报告数据）"""
+    common = {"stats": stats, "total_titles": total_titles, "failed_ids": [], "mode": "daily"}
+    paths = {
+        "timestamp_txt": reporter.generate_text_report(
+            **common, new_news_list=convert_new_titles(new_titles, id_to_name),
+            is_daily_summary=False
+        ),
+        "summary_txt": reporter.generate_text_report(
+            **common, new_news_list=convert_new_titles(new_titles, id_to_name),
+            is_daily_summary=True
+        ),
+        "json": reporter.generate_json_report(
+            **common, new_news_list=convert_new_titles(new_titles, id_to_name),
+            is_daily_summary=True
+        ),
+        "html": reporter.generate_html_report(
+            **common, new_news_list=convert_new_titles(new_titles, id_to_name),
+            is_daily_summary=True
+        ),
+    }
+    reporter.prepare_report_data(
+        stats, [], convert_new_titles(new_titles, id_to_name), "daily"
+    )
+    return paths
+
+
+def render_with_context(
+    reporter: NewsReporter, stats, total_titles: int, new_titles, id_to_name, parallel: bool
+):
+    """构建一次报告上下文并生成报告"""
+    context = reporter.build_context(
+        stats, total_titles, [], convert_new_titles(new_titles, id_to_name), "daily"
+    )
+    return reporter.render_reports(context, parallel=parallel)
+
+
+def run_in_tempdir(func, *args):
+    """在临时输出目录中运行并返回 (耗时, 各报告内容)"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            start = time.perf_counter()
+            paths = func(*args)
+            elapsed = time.perf_counter() - start
+            contents = {
+                name: Path(path).read_text(encoding="utf-8")
+                for name, path in paths.items()
+                if name.endswith("_txt")  # JSON 和 HTML 含生成时间
+            }
+        finally:
+            os.chdir(cwd)
+    return elapsed, contents
+
+
+def measure_report_data_bytes(reporter: NewsReporter, stats, new_titles, id_to_name) -> int:
+    """测量构建一份报告数据分配的内存（字节）"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    report_data = reporter.prepare_report_data(
+        stats, [], convert_new_titles(new_titles, id_to_name), "daily"
+    )
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del report_data
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="报告生成基准测试")
+    parser.add_argument("--groups", type=int, default=200, help="词组数量")
+    parser.add_argument("--titles", type=int, default=50000, help="标题总数")
+    parser.add_argument("--new", type=int, default=5000, help="新增标题数")
+    args = parser.parse_args()
+
+    word_stats = generate_word_stats(args.groups, args.titles)
+    stats = NewsRanking(news_filter=None)._generate_statistics(word_stats, args.titles)
+    new_titles = generate_new_titles(word_stats, args.new)
+    id_to_name = {platform: platform for platform in new_titles}
+    reporter = NewsReporter()
+    print(f"语料: {args.groups} 个词组, {args.titles} 条标题, {args.new} 条新增")
+
+    separate_time, separate_contents = run_in_tempdir(
+        render_separately, reporter, stats, args.titles, new_titles, id_to_name
+    )
+    print(f"逐个生成 ({REPORT_CALLS} 次准备，顺序): {separate_time:.2f}s")
+
+    for label, parallel in [("顺序", False), ("并行", True)]:
+        context_time, context_contents = run_in_tempdir(
+            render_with_context, reporter, stats, args.titles, new_titles, id_to_name, parallel
+        )
+        timings = reporter.get_render_timings()
+        print(f"报告上下文 (1 次准备，{label}): {context_time:.2f}s, "
+              f"节省 {separate_time - context_time:.2f}s")
+        print("  " + ", ".join(f"{name} {elapsed * 1000:.0f}ms" for name, elapsed in timings.items()))
+
+        if context_contents != separate_contents:
+            raise SystemExit("两种方式生成的报告内容不一致")
+
+    report_bytes = measure_report_data_bytes(reporter, stats, new_titles, id_to_name)
+    print(f"单份报告数据分配 {report_bytes / 1024 / 1024:.1f}MB, "
+          f"少分配 {(REPORT_CALLS - 1) * report_bytes / 1024 / 1024:.1f}MB")
+    print("报告内容一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# coding=utf-8
+"""标题相似度索引基准测试
+
+在合成的新闻标题语料（每个事件有多条改写的标题）上，对比逐条计算
+SequenceMatcher 相似度的全量扫描与 SimilarityIndex 的 LSH 候选 + 精确计算：
+- 召回率：全量扫描结果中被索引找回的比例（精确计算保证没有误报）
+- 延迟：单次查询的平均耗时，以及索引构建耗时
+
+用法:
+    python -m scripts.benchmarks.bench_similarity [--titles 5000] [--queries 200] [--thresholds 0.5 0.6 0.7 0.8]
+"""
+
+import argparse
+import random
+import time
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+from mcp_server.services.similarity_index import NUMPY_AVAILABLE, SimilarityIndex
+
+# 常用汉字，用于合成事件描述
+CHARS = (
+    "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主发年动同工也能下过子说产种面"
+    "而方后多定行学法所民得经十三之进着等部度家电力里如水化高自二理起小物现实加量都两体制机当使点从业本去把"
+    "性好应开它合还因由其些然前外天政四日那社义事平形相全表间样与关各重新线内数正心反你明看原又么利比或但质"
+    "气第向道命此变条只没结解问意建月公无系军很情者最立代想已通并提直题党程展五果料象员革位入常文总次品式活"
+)
+PREFIXES = ["", "", "", "突发：", "快讯｜", "热议：", "#热搜# "]
+SUFFIXES = ["", "", "", "，网友热议", "（附详情）", "，官方最新回应", " 多地已执行", "！"]
+
+
+def generate_titles(count: int, seed: int = 42) -> List[str]:
+    """生成合成标题语料
+
+    每个事件有一段核心描述，同一事件的标题在核心描述上加前后缀、替换个别字或插入短语
+
+    Args:
+        count: 标题数量
+        seed: 随机种子
+
+    Returns:
+        List[str]: 标题列表
+    """
+    rng = random.Random(seed)
+
+    def phrase(min_len: int, max_len: int) -> str:
+        return "".join(rng.choice(CHARS) for _ in range(rng.randint(min_len, max_len)))
+
+    events = [phrase(8, 18) for _ in range(max(1, count // 4))]
+
+    titles = []
+    while len(titles) < count:
+        core = list(rng.choice(events))
+        for _ in range(rng.randint(0, 2)):
+            core[rng.randrange(len(core))] = rng.choice(CHARS)
+        if rng.random() < 0.3:
+            position = rng.randrange(len(core))
+            core[position:position] = phrase(2, 4)
+        titles.append(f"{rng.choice(PREFIXES)}{''.join(core)}{rng.choice(SUFFIXES)}")
+
+    return titles
+
+
+def run_benchmark(title_count: int, query_count: int, thresholds: List[float], seed: int = 42) -> Dict:
+    """运行基准测试
+
+    Args:
+        title_count: 语料标题数量
+        query_count: 查询次数
+        thresholds: 相似度阈值列表
+        seed: 随机种子
+
+    Returns:
+        Dict: {"build": 构建耗时, 阈值: {recall, expected, scan_ms, index_ms, candidates}}
+    """
+    titles = generate_titles(title_count, seed)
+    queries = random.Random(seed + 1).sample(titles, min(query_count, len(titles)))
+
+    start = time.perf_counter()
+    index = SimilarityIndex(titles)
+    results = {"build": time.perf_counter() - start}
+
+    for threshold in thresholds:
+        expected = found = candidate_total = 0
+        scan_time = index_time = 0.0
+
+        for query in queries:
+            start = time.perf_counter()
+            truth = {
+                row for row, title in enumerate(titles)
+                if SequenceMatcher(None, query, title).ratio() >= threshold
+            }
+            scan_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            candidates = index.lsh_candidates(query, threshold)
+            matched = {
+                row for row in candidates
+                if SequenceMatcher(None, query, titles[row]).ratio() >= threshold
+            }
+            index_time += time.perf_counter() - start
+
+            expected += len(truth)
+            found += len(matched & truth)
+            candidate_total += len(candidates)
+
+        results[threshold] = {
+            "recall": found / expected if expected else 1.0,
+            "expected": expected,
+            "scan_ms": scan_time / len(queries) * 1000,
+            "index_ms": index_time / len(queries) * 1000,
+            "candidates": candidate_total / len(queries),
+        }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="标题相似度索引基准测试")
+    parser.add_argument("--titles", type=int, default=5000, help="语料标题数量")
+    parser.add_argument("--queries", type=int, default=200, help="查询次数")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.6, 0.7, 0.8], help="相似度阈值")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.titles, args.queries, args.thresholds)
+    print(f"语料: {args.titles} 条标题, {args.queries} 次查询, NumPy: {'是' if NUMPY_AVAILABLE else '否'}")
+    print(f"索引构建: {results['build'] * 1000:.1f} ms")
+
+    for threshold in args.thresholds:
+        result = results[threshold]
+        print(
+            f"  阈值 {threshold:.2f}: 召回率 {result['recall']:.3f} ({result['expected']} 条)"
+            f"  全量扫描 {result['scan_ms']:.2f} ms  索引 {result['index_ms']:.2f} ms"
+            f"  平均候选 {result['candidates']:.0f} 条"
+            f"  提升 {result['scan_ms'] / max(result['index_ms'], 1e-9):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
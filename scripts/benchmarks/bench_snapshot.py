@@ -0,0 +1,161 @@
+# coding=utf-8
+"""快照读取基准测试
+
+对比三个读取入口在解析展示文本与读取结构化快照（.jsonl）时的吞吐量：
+- NewsRanking.parse_file_titles
+- NewsReporter._parse_existing_summary
+- ParserService.parse_txt_file
+
+用法:
+    python -m scripts.benchmarks.bench_snapshot [--groups 100] [--titles-per-group 50] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from mcp_server.services.parser_service import ParserService
+from src.core.ranking import NewsRanking
+from src.core.reporter import NewsReporter
+from src.core.snapshot import snapshot_path, write_snapshot
+from src.models.news import News, WordGroupStatistic
+
+PLATFORMS = [("zhihu", "知乎"), ("weibo", "微博"), ("douyin", "抖音"), ("baidu", "百度热搜")]
+
+
+def generate_stats(group_count: int, titles_per_group: int, seed: int = 42) -> List[WordGroupStatistic]:
+    """生成合成词组统计
+
+    Args:
+        group_count: 词组数量
+        titles_per_group: 每个词组的标题数量
+        seed: 随机种子
+
+    Returns:
+        List[WordGroupStatistic]: 词组统计列表
+    """
+    rng = random.Random(seed)
+    stats = []
+    for g in range(group_count):
+        news_list = []
+        for t in range(titles_per_group):
+            platform, name = rng.choice(PLATFORMS)
+            ranks = sorted(rng.randint(1, 50) for _ in range(rng.randint(1, 8)))
+            news_list.append(News(
+                title=f"词组{g} 的第{t}条热点新闻标题",
+                url=f"https://example.com/{platform}/{g}/{t}",
+                platform=platform,
+                platform_name=name,
+                rank=ranks[0],
+                mobile_url=f"https://m.example.com/{platform}/{g}/{t}",
+                extra={
+                    "time_display": "[08:00 ~ 20:00]",
+                    "count": len(ranks),
+                    "all_ranks": ranks,
+                    "mobileUrl": f"https://m.example.com/{platform}/{g}/{t}",
+                },
+            ))
+        stats.append(WordGroupStatistic(word=f"词组{g}", count=len(news_list), news_list=news_list))
+    return stats
+
+
+def write_platform_batch(txt_path: Path, stats: List[WordGroupStatistic]) -> None:
+    """按平台分组格式写入批次文本和快照（main_legacy.py 的输出格式）
+
+    Args:
+        txt_path: txt 文件路径
+        stats: 词组统计列表
+    """
+    by_platform = {}
+    for stat in stats:
+        for news in stat.news_list:
+            by_platform.setdefault((news.platform, news.platform_name), []).append(news)
+
+    lines = []
+    titles = {
+        "type": "titles", "platforms": {}, "platform": [], "title": [],
+        "ranks": [], "url": [], "mobile_url": [],
+    }
+    for (platform, name), news_list in by_platform.items():
+        lines.append(f"{platform} | {name}")
+        titles["platforms"][platform] = name
+        for news in news_list:
+            lines.append(f"{news.rank}. {news.title} [URL:{news.url}] [MOBILE:{news.mobile_url}]")
+            titles["platform"].append(platform)
+            titles["title"].append(news.title)
+            titles["ranks"].append([news.rank])
+            titles["url"].append(news.url)
+            titles["mobile_url"].append(news.mobile_url)
+        lines.append("")
+
+    txt_path.write_text("\n".join(lines), encoding="utf-8")
+    write_snapshot(snapshot_path(txt_path), [{"type": "meta", "version": 1, "kind": "batch"}, titles])
+
+
+def measure(label: str, func: Callable, title_count: int, repeat: int) -> float:
+    """测量读取吞吐量
+
+    Args:
+        label: 名称
+        func: 读取函数
+        title_count: 每次读取的标题数
+        repeat: 重复次数
+
+    Returns:
+        float: 吞吐量（条/秒）
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    throughput = title_count * repeat / elapsed
+    print(f"  {label}: {elapsed / repeat * 1000:.1f} ms/次, {throughput:,.0f} 条/秒")
+    return throughput
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="快照读取基准测试")
+    parser.add_argument("--groups", type=int, default=100, help="词组数量")
+    parser.add_argument("--titles-per-group", type=int, default=50, help="每个词组的标题数量")
+    parser.add_argument("--repeat", type=int, default=20, help="重复次数")
+    args = parser.parse_args()
+
+    stats = generate_stats(args.groups, args.titles_per_group)
+    title_count = args.groups * args.titles_per_group
+    print(f"语料: {args.groups} 个词组, {title_count} 条标题")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        reporter = NewsReporter()
+        ranking = NewsRanking(news_filter=None)
+        parser_service = ParserService(project_root=tmp_dir)
+
+        report_path = reporter.generate_text_report(stats, title_count, mode="daily")
+        batch_path = Path(tmp_dir) / "batch.txt"
+        write_platform_batch(batch_path, stats)
+
+        cases = [
+            ("NewsRanking.parse_file_titles", report_path,
+             lambda: ranking._parse_text_titles(report_path),
+             lambda: ranking.parse_file_titles(report_path)),
+            ("NewsReporter._parse_existing_summary", report_path,
+             lambda: reporter._parse_summary_text(report_path),
+             lambda: reporter._parse_existing_summary(report_path)),
+            ("ParserService.parse_txt_file", batch_path,
+             lambda: parser_service._parse_txt_content(batch_path),
+             lambda: parser_service.parse_txt_file(batch_path)),
+        ]
+
+        for label, _, text_reader, snapshot_reader in cases:
+            print(label)
+            text_throughput = measure("文本解析", text_reader, title_count, args.repeat)
+            snapshot_throughput = measure("快照读取", snapshot_reader, title_count, args.repeat)
+            print(f"  提升: {snapshot_throughput / text_throughput:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
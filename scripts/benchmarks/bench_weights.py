@@ -0,0 +1,102 @@
+# coding=utf-8
+"""权重计算与排序基准测试
+
+在合成的词组统计数据上对比逐条计算权重 + 全量排序与 NumPy 批量计算 + 前 K 选择，
+并校验两者的排序结果完全一致。
+
+用法:
+    python -m scripts.benchmarks.bench_weights [--groups 500] [--titles 200000] [--top-k 20]
+"""
+
+import argparse
+import random
+import time
+from typing import Dict
+
+from src.core.ranking import NewsRanking
+
+
+def generate_word_stats(group_count: int, title_count: int, seed: int = 42) -> Dict:
+    """生成合成词组统计数据
+
+    Args:
+        group_count: 词组数量
+        title_count: 标题总数
+        seed: 随机种子
+
+    Returns:
+        Dict: 与 NewsRanking 内部 word_stats 结构一致的数据
+    """
+    rng = random.Random(seed)
+    platforms = ["zhihu", "weibo", "douyin", "baidu", "toutiao", "bilibili"]
+
+    word_stats = {f"词组{i}": {"count": 0, "titles": {}} for i in range(group_count)}
+    group_keys = list(word_stats.keys())
+
+    for i in range(title_count):
+        group = word_stats[rng.choice(group_keys)]
+        platform = rng.choice(platforms)
+        appearances = rng.randint(1, 24)
+        ranks = [rng.randint(1, 50) for _ in range(appearances)]
+
+        group["count"] += 1
+        group["titles"].setdefault(platform, []).append({
+            "title": f"标题{i}",
+            "platform": platform,
+            "source_name": platform,
+            "first_time": "08:00",
+            "last_time": "20:00",
+            "time_display": "[08:00 ~ 20:00]",
+            "count": appearances,
+            "ranks": ranks,
+            "rank_threshold": 10,
+            "url": "",
+            "mobileUrl": "",
+            "is_new": False,
+        })
+
+    return word_stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="权重计算与排序基准测试")
+    parser.add_argument("--groups", type=int, default=500, help="词组数量")
+    parser.add_argument("--titles", type=int, default=200000, help="标题总数")
+    parser.add_argument("--top-k", type=int, default=20, help="每个词组保留的条数")
+    args = parser.parse_args()
+
+    word_stats = generate_word_stats(args.groups, args.titles)
+    ranking = NewsRanking(news_filter=None)
+    print(f"语料: {args.groups} 个词组, {args.titles} 条标题, top_k={args.top_k}")
+
+    results = {}
+    for label, vectorized, top_k in [
+        ("逐条计算 + 全量排序", False, None),
+        ("批量计算 + 全量排序", True, None),
+        ("批量计算 + 前K选择", True, args.top_k),
+    ]:
+        ranking.vectorized = vectorized
+        ranking.phase_timings = {"filter": 0.0, "stats": 0.0, "weight": 0.0, "sort": 0.0}
+
+        start = time.perf_counter()
+        stats = ranking._generate_statistics(word_stats, args.titles, top_k)
+        elapsed = time.perf_counter() - start
+
+        results[label] = {
+            stat.word: [news.title for news in stat.news_list] for stat in stats
+        }
+        timings = ranking.phase_timings
+        print(f"{label}: 总计 {elapsed:.2f}s (权重 {timings['weight']:.2f}s, "
+              f"排序 {timings['sort']:.2f}s)")
+
+    scalar = results["逐条计算 + 全量排序"]
+    if results["批量计算 + 全量排序"] != scalar:
+        raise SystemExit("批量计算的排序结果不一致")
+    top_k_result = results["批量计算 + 前K选择"]
+    if any(titles != scalar[word][:args.top_k] for word, titles in top_k_result.items()):
+        raise SystemExit("前K选择的结果不一致")
+    print("排序结果一致")
+
+
+if __name__ == "__main__":
+    main()
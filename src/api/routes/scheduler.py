@@ -122,6 +122,9 @@ async def trigger_now(request: TriggerRequest):
     """
     scheduler = get_scheduler()
 
+    if scheduler.executor.is_busy:
+        raise HTTPException(status_code=409, detail="已有爬虫任务在执行中,请稍后再试")
+
     # 异步触发任务（不等待执行完成）
     import asyncio
     asyncio.create_task(scheduler.trigger_now(mode=request.mode))
@@ -130,3 +133,24 @@ async def trigger_now(request: TriggerRequest):
         "success": True,
         "message": f"任务已触发 (模式: {request.mode or '默认'}),正在后台执行"
     }
+
+
+@router.post("/cancel", summary="取消正在执行的任务")
+async def cancel_task():
+    """取消正在执行的爬取任务
+
+    线程执行模式下任务会在当前阶段结束后退出,进程执行模式下立即终止
+
+    返回:
+    - success: 是否成功
+    """
+    scheduler = get_scheduler()
+    cancelled = await scheduler.cancel_task()
+
+    if not cancelled:
+        raise HTTPException(status_code=400, detail="当前没有正在执行的任务")
+
+    return {
+        "success": True,
+        "message": "已请求取消任务"
+    }
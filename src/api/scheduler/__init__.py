@@ -2,5 +2,11 @@
 """定时任务调度器模块"""
 
 from .task_scheduler import CrawlerScheduler
+from .executor import ThreadCrawlerExecutor, ProcessCrawlerExecutor, CrawlerBusyError
 
-__all__ = ["CrawlerScheduler"]
+__all__ = [
+    "CrawlerScheduler",
+    "ThreadCrawlerExecutor",
+    "ProcessCrawlerExecutor",
+    "CrawlerBusyError",
+]
@@ -0,0 +1,227 @@
+# coding=utf-8
+"""爬虫任务执行后端
+
+将同步的爬虫流程移出 API 事件循环执行，避免爬取期间阻塞所有接口：
+- ThreadCrawlerExecutor: 在专用工作线程中执行，通过事件协作式取消
+- ProcessCrawlerExecutor: 在独立子进程中执行，取消时直接终止子进程
+"""
+
+import asyncio
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from src.app import CrawlCancelledError
+
+
+# 进度回调: (阶段标识, 描述信息)
+ProgressCallback = Callable[[str, str], None]
+
+# 爬虫流程: (运行模式, 进度回调, 取消事件) -> 是否成功
+CrawlerPipeline = Callable[[str, ProgressCallback, threading.Event], bool]
+
+
+class CrawlerBusyError(RuntimeError):
+    """已有爬虫任务在执行中"""
+
+
+class ThreadCrawlerExecutor:
+    """在专用工作线程中执行爬虫流程
+
+    同一时间只允许一个任务执行；进度回调会被转发回事件循环线程，
+    取消通过 threading.Event 通知流程在下一个阶段边界处退出
+    """
+
+    def __init__(self, pipeline: CrawlerPipeline):
+        """初始化执行器
+
+        Args:
+            pipeline: 爬虫流程函数
+        """
+        self.pipeline = pipeline
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cancel_event: Optional[threading.Event] = None
+
+    @property
+    def is_busy(self) -> bool:
+        """是否有任务正在执行"""
+        return self._cancel_event is not None
+
+    async def run(self, mode: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        """执行一次爬虫流程
+
+        Args:
+            mode: 运行模式
+            on_progress: 进度回调（在事件循环线程中调用）
+
+        Returns:
+            bool: 是否运行成功
+
+        Raises:
+            CrawlerBusyError: 已有任务在执行
+            CrawlCancelledError: 任务被取消
+        """
+        if self.is_busy:
+            raise CrawlerBusyError("已有爬虫任务在执行中")
+
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+
+        def progress(stage: str, message: str) -> None:
+            if on_progress is not None:
+                loop.call_soon_threadsafe(on_progress, stage, message)
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawler")
+
+        try:
+            return await loop.run_in_executor(
+                self._pool, self.pipeline, mode, progress, cancel_event
+            )
+        finally:
+            self._cancel_event = None
+
+    def cancel(self) -> bool:
+        """请求取消正在执行的任务
+
+        Returns:
+            bool: 是否有任务被请求取消
+        """
+        if self._cancel_event is None:
+            return False
+        self._cancel_event.set()
+        return True
+
+    def shutdown(self) -> None:
+        """关闭执行器（请求取消正在执行的任务，不阻塞等待其退出）"""
+        self.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+def _run_pipeline_in_process(config_path: str, mode: str, message_queue) -> None:
+    """子进程入口：运行爬虫流程并通过队列回传进度和结果
+
+    Args:
+        config_path: 配置文件路径
+        mode: 运行模式
+        message_queue: 进程间消息队列
+    """
+    from src.app import TrendRadarApp
+    from src.notifiers.smtp_pool import close_smtp_pool
+
+    def progress(stage: str, message: str) -> None:
+        message_queue.put(("progress", stage, message))
+
+    try:
+        app = TrendRadarApp(config_path=config_path)
+        try:
+            success = app.run(mode=mode, progress_callback=progress)
+        finally:
+            # 子进程退出前等待发送队列投递
+            app.close()
+            close_smtp_pool()
+        message_queue.put(("result", success, None))
+    except Exception as e:
+        message_queue.put(("result", False, str(e)))
+
+
+class ProcessCrawlerExecutor:
+    """在独立子进程中执行爬虫流程
+
+    子进程崩溃或卡死都不会影响 API 进程，取消时直接终止子进程
+    """
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, config_path: str):
+        """初始化执行器
+
+        Args:
+            config_path: 配置文件路径（子进程中重新加载）
+        """
+        self.config_path = config_path
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._cancelled = False
+
+    @property
+    def is_busy(self) -> bool:
+        """是否有任务正在执行"""
+        return self._process is not None
+
+    async def run(self, mode: str, on_progress: Optional[ProgressCallback] = None) -> bool:
+        """在子进程中执行一次爬虫流程
+
+        Args:
+            mode: 运行模式
+            on_progress: 进度回调（在事件循环线程中调用）
+
+        Returns:
+            bool: 是否运行成功
+
+        Raises:
+            CrawlerBusyError: 已有任务在执行
+            CrawlCancelledError: 任务被取消
+        """
+        if self.is_busy:
+            raise CrawlerBusyError("已有爬虫任务在执行中")
+
+        message_queue = self._context.Queue()
+        process = self._context.Process(
+            target=_run_pipeline_in_process,
+            args=(self.config_path, mode, message_queue),
+            name="trendradar-crawler",
+            daemon=True
+        )
+        self._process = process
+        self._cancelled = False
+        process.start()
+
+        try:
+            while True:
+                try:
+                    message = await asyncio.to_thread(
+                        message_queue.get, True, self.POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    if self._cancelled:
+                        raise CrawlCancelledError("爬虫子进程已被终止")
+                    if not process.is_alive():
+                        raise RuntimeError(f"爬虫子进程异常退出 (exitcode={process.exitcode})")
+                    continue
+
+                if message[0] == "progress":
+                    if on_progress is not None:
+                        on_progress(message[1], message[2])
+                elif message[0] == "result":
+                    _, success, error = message
+                    if error:
+                        raise RuntimeError(error)
+                    return success
+        finally:
+            await asyncio.to_thread(process.join, 5)
+            if process.is_alive():
+                process.kill()
+            message_queue.close()
+            self._process = None
+
+    def cancel(self) -> bool:
+        """终止正在执行的子进程
+
+        Returns:
+            bool: 是否有任务被终止
+        """
+        if self._process is None or not self._process.is_alive():
+            return False
+        self._cancelled = True
+        self._process.terminate()
+        return True
+
+    def shutdown(self) -> None:
+        """关闭执行器（终止正在执行的子进程）"""
+        self.cancel()
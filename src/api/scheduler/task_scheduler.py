@@ -4,14 +4,20 @@
 提供基于 APScheduler 的定时任务调度功能
 """
 
+import threading
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.job import Job
 
-from src.app import TrendRadarApp
+from src.app import TrendRadarApp, CrawlCancelledError
+from src.api.scheduler.executor import (
+    ThreadCrawlerExecutor,
+    ProcessCrawlerExecutor,
+    CrawlerBusyError,
+)
 from src.utils.time import get_beijing_time
 
 
@@ -21,8 +27,9 @@ class CrawlerScheduler:
     功能:
     - 基于配置自动启动定时爬取任务
     - 支持 interval(间隔) 和 cron(定时) 两种调度模式
-    - 提供任务的启动、停止、暂停、恢复控制
-    - 记录任务执行历史和状态
+    - 提供任务的启动、停止、暂停、恢复、取消控制
+    - 记录任务执行历史、状态和实时进度
+    - 爬虫流程在工作线程或子进程中执行，不阻塞 API 事件循环
     """
 
     def __init__(self, config: Dict[str, Any], config_path: str = "config/config.yaml"):
@@ -44,6 +51,13 @@ class CrawlerScheduler:
         self.current_job: Optional[Job] = None
         self.is_running = False
 
+        # 执行后端（thread: 专用工作线程, process: 独立子进程）
+        backend = self.config.get("scheduler", {}).get("executor", "thread")
+        if backend == "process":
+            self.executor = ProcessCrawlerExecutor(config_path)
+        else:
+            self.executor = ThreadCrawlerExecutor(self._run_pipeline)
+
     async def start(self) -> None:
         """启动调度器"""
         scheduler_config = self.config.get("scheduler", {})
@@ -68,6 +82,8 @@ class CrawlerScheduler:
             self.is_running = False
             print("✓ 定时任务调度器已停止")
 
+        self.executor.shutdown()
+
     def _add_crawler_job(self, scheduler_config: Dict) -> None:
         """添加爬虫任务
 
@@ -104,12 +120,45 @@ class CrawlerScheduler:
             misfire_grace_time=300  # 错过任务的宽限时间(5分钟)
         )
 
+    def _run_pipeline(
+        self,
+        mode: str,
+        progress_callback: Callable[[str, str], None],
+        cancel_event: threading.Event
+    ) -> bool:
+        """爬虫流程（在执行后端的工作线程中调用）
+
+        Args:
+            mode: 运行模式
+            progress_callback: 进度回调
+            cancel_event: 取消事件
+
+        Returns:
+            bool: 是否运行成功
+        """
+        app = TrendRadarApp(config_path=self.config_path)
+        try:
+            return app.run(
+                mode=mode,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event
+            )
+        finally:
+            # 等待发送队列投递并停止投递线程，避免与下一次运行的投递线程重叠
+            app.close()
+
     async def _run_crawler_task(self, mode: str) -> None:
         """执行爬虫任务
 
+        流程在执行后端中运行，事件循环只负责等待结果和记录进度
+
         Args:
             mode: 运行模式 (daily/current/incremental)
         """
+        if self.executor.is_busy:
+            print(f"⚠️  已有爬虫任务在执行中，跳过本次触发 ({mode} 模式)")
+            return
+
         start_time = get_beijing_time()
         task_id = start_time.strftime("%Y%m%d_%H%M%S")
 
@@ -118,42 +167,48 @@ class CrawlerScheduler:
         print(f"模式: {mode} | 时间: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
 
+        record = self._record_execution(
+            task_id=task_id,
+            mode=mode,
+            start_time=start_time
+        )
+
+        def on_progress(stage: str, message: str) -> None:
+            record["current_stage"] = stage
+            record["progress"].append({
+                "time": get_beijing_time().strftime("%Y-%m-%d %H:%M:%S"),
+                "stage": stage,
+                "message": message,
+            })
+
         try:
-            # 创建 TrendRadarApp 实例并运行
-            app = TrendRadarApp(config_path=self.config_path)
-            success = app.run(mode=mode)
+            success = await self.executor.run(mode, on_progress)
+            status = "success" if success else "failed"
+            error = None
 
-            end_time = get_beijing_time()
-            duration = (end_time - start_time).total_seconds()
+            print("\n" + "=" * 60)
+            print(f"定时任务执行{'成功' if success else '失败'}")
+            print("=" * 60)
 
-            # 记录执行历史
-            self._record_execution(
-                task_id=task_id,
-                mode=mode,
-                start_time=start_time,
-                end_time=end_time,
-                duration=duration,
-                success=success
-            )
+        except CrawlerBusyError as e:
+            success = False
+            status = "skipped"
+            error = str(e)
+            print(f"⚠️  {e}")
+
+        except CrawlCancelledError as e:
+            success = False
+            status = "cancelled"
+            error = f"任务已取消: {e}"
 
             print("\n" + "=" * 60)
-            print(f"定时任务执行{'成功' if success else '失败'} - 耗时: {duration:.2f} 秒")
+            print(f"定时任务已取消: {e}")
             print("=" * 60)
 
         except Exception as e:
-            end_time = get_beijing_time()
-            duration = (end_time - start_time).total_seconds()
-
-            # 记录失败
-            self._record_execution(
-                task_id=task_id,
-                mode=mode,
-                start_time=start_time,
-                end_time=end_time,
-                duration=duration,
-                success=False,
-                error=str(e)
-            )
+            success = False
+            status = "failed"
+            error = str(e)
 
             print("\n" + "=" * 60)
             print(f"定时任务执行异常: {e}")
@@ -162,18 +217,34 @@ class CrawlerScheduler:
             import traceback
             traceback.print_exc()
 
+        end_time = get_beijing_time()
+        duration = (end_time - start_time).total_seconds()
+
+        record.update({
+            "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "duration": duration,
+            "success": success,
+            "status": status,
+            "error": error,
+        })
+
+        print(f"耗时: {duration:.2f} 秒")
+
     def _record_execution(
         self,
         task_id: str,
         mode: str,
         start_time: datetime,
-        end_time: datetime,
-        duration: float,
-        success: bool,
+        end_time: Optional[datetime] = None,
+        duration: Optional[float] = None,
+        success: Optional[bool] = None,
         error: Optional[str] = None
-    ) -> None:
+    ) -> Dict[str, Any]:
         """记录任务执行历史
 
+        未传入 end_time 时视为刚开始执行的任务，记录状态为 running，
+        执行结束后由调用方原地更新该记录
+
         Args:
             task_id: 任务ID
             mode: 运行模式
@@ -182,15 +253,26 @@ class CrawlerScheduler:
             duration: 执行时长(秒)
             success: 是否成功
             error: 错误信息
+
+        Returns:
+            Dict: 执行记录（已加入历史列表）
         """
+        if end_time is None:
+            status = "running"
+        else:
+            status = "success" if success else "failed"
+
         record = {
             "task_id": task_id,
             "mode": mode,
             "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-            "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S") if end_time else None,
             "duration": duration,
             "success": success,
-            "error": error
+            "status": status,
+            "error": error,
+            "current_stage": None,
+            "progress": [],
         }
 
         self.execution_history.append(record)
@@ -199,6 +281,8 @@ class CrawlerScheduler:
         if len(self.execution_history) > self.max_history_size:
             self.execution_history.pop(0)
 
+        return record
+
     def get_status(self) -> Dict[str, Any]:
         """获取调度器状态
 
@@ -213,6 +297,8 @@ class CrawlerScheduler:
             "scheduler_state": "running" if self.scheduler.running else "stopped",
             "trigger_type": scheduler_config.get("trigger_type", "interval"),
             "mode": scheduler_config.get("mode", "daily"),
+            "executor": scheduler_config.get("executor", "thread"),
+            "task_running": self.executor.is_busy,
         }
 
         # 添加触发器信息
@@ -228,9 +314,10 @@ class CrawlerScheduler:
                 status["next_run_time"] = next_run.strftime("%Y-%m-%d %H:%M:%S")
 
         # 添加执行历史统计
+        finished = [r for r in self.execution_history if r.get("status") != "running"]
         if self.execution_history:
-            total = len(self.execution_history)
-            success = sum(1 for r in self.execution_history if r["success"])
+            total = len(finished)
+            success = sum(1 for r in finished if r["success"])
             failed = total - success
 
             status["execution_stats"] = {
@@ -288,3 +375,16 @@ class CrawlerScheduler:
 
         print(f"手动触发任务 - 模式: {mode}")
         await self._run_crawler_task(mode)
+
+    async def cancel_task(self) -> bool:
+        """取消正在执行的爬虫任务
+
+        线程后端会在下一个流程阶段开始前退出，进程后端直接终止子进程
+
+        Returns:
+            bool: 是否有任务被取消
+        """
+        cancelled = self.executor.cancel()
+        if cancelled:
+            print("✓ 已请求取消正在执行的爬虫任务")
+        return cancelled
@@ -20,6 +20,7 @@ from src.api.services.llm_service import create_llm_service_from_config
 from src.api.services.chat_service import ChatService
 from src.api.scheduler import CrawlerScheduler
 from src.api.routes import chat, system, dashboard, scheduler
+from src.notifiers.smtp_pool import close_smtp_pool
 
 
 # 全局实例
@@ -101,6 +102,7 @@ async def lifespan(app: FastAPI):
     print("\nTrendRadar API 服务器关闭中...")
     if crawler_scheduler:
         await crawler_scheduler.stop()
+    close_smtp_pool()
     print("TrendRadar API 服务器已关闭")
 
 
@@ -1,17 +1,25 @@
 # coding=utf-8
 """TrendRadar 主应用"""
 
-from typing import List, Dict
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Callable, Optional
 
 from src.core.config import ConfigManager
 from src.core.filter import NewsFilter
 from src.core.ranking import NewsRanking
 from src.core.reporter import NewsReporter
+from src.sources.base import fetch_executor
 from src.sources.registry import get_registry
 from src.notifiers.manager import NotificationManager
 from src.models.news import News
 
 
+class CrawlCancelledError(Exception):
+    """运行被外部取消"""
+
+
 class TrendRadarApp:
     """TrendRadar 主应用类
 
@@ -28,6 +36,10 @@ class TrendRadarApp:
         print("TrendRadar - 热点新闻聚合与分析")
         print("=" * 60)
 
+        # 运行控制（由 run 设置）
+        self._progress_callback: Optional[Callable[[str, str], None]] = None
+        self._cancel_event: Optional[threading.Event] = None
+
         # 加载配置
         self.config_manager = ConfigManager(config_path)
         self.config = self.config_manager._config
@@ -65,15 +77,28 @@ class TrendRadarApp:
         # 通知管理器
         self.notification_manager = NotificationManager(self.config)
 
-    def run(self, mode: str = "daily") -> bool:
+    def run(
+        self,
+        mode: str = "daily",
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> bool:
         """运行完整流程
 
         Args:
             mode: 运行模式 (daily/current/incremental)
+            progress_callback: 进度回调，每进入一个阶段调用一次 (阶段标识, 描述)
+            cancel_event: 取消事件，被设置后在下一个阶段开始前中止运行
 
         Returns:
             bool: 是否运行成功
+
+        Raises:
+            CrawlCancelledError: 运行被取消
         """
+        self._progress_callback = progress_callback
+        self._cancel_event = cancel_event
+
         print(f"开始运行 - 模式: {mode}")
         print("-" * 60)
 
@@ -85,7 +110,7 @@ class TrendRadarApp:
                 return False
 
             # 2. 爬取新闻
-            print("\n[1/6] 爬取新闻数据...")
+            self._enter_stage("fetch", "[1/6] 爬取新闻数据...")
             all_news, failed_ids = self._fetch_all_news(sources)
             if not all_news:
                 print("警告: 未获取到任何新闻数据")
@@ -94,7 +119,13 @@ class TrendRadarApp:
             print(f"✓ 成功爬取 {len(all_news)} 条新闻")
 
             # 3. 读取历史数据（用于统计）
-            print("\n[2/6] 读取历史数据...")
+            self._enter_stage("history", "[2/6] 读取历史数据...")
+            # 先将本次爬取的批次追加到当日标题索引，再读取当日聚合数据
+            current_results, current_id_to_name, _ = self._convert_news_to_results(
+                all_news, sources
+            )
+            self.news_ranking.record_batch(current_results, current_id_to_name)
+
             # 读取所有历史数据，不进行平台过滤
             all_results, id_to_name, title_info = self.news_ranking.read_all_today_titles()
 
@@ -108,7 +139,7 @@ class TrendRadarApp:
             print(f"✓ 读取历史数据完成（共 {sum(len(titles) for titles in all_results.values())} 条）")
 
             # 4. 检测新增新闻
-            print("\n[3/6] 检测新增新闻...")
+            self._enter_stage("detect", "[3/6] 检测新增新闻...")
             new_titles = self.news_ranking.detect_latest_new_titles(
                 current_results=all_results
             )
@@ -116,67 +147,52 @@ class TrendRadarApp:
             print(f"✓ 检测到 {new_count} 条新增新闻")
 
             # 5. 计算统计和排序
-            print("\n[4/6] 计算权重并排序...")
+            self._enter_stage("statistics", "[4/6] 计算权重并排序...")
+            max_news = self.config.get("MAX_NEWS_PER_KEYWORD", 0)
             stats, total_titles = self.news_ranking.calculate_statistics(
                 results=all_results,
                 id_to_name=id_to_name,
                 title_info=title_info,
                 new_titles=new_titles,
-                mode=mode
+                mode=mode,
+                top_k=max_news if max_news > 0 else None
             )
             print(f"✓ 统计完成，匹配 {sum(s.count for s in stats)} 条新闻")
 
             # 6. 生成报告
-            print("\n[5/6] 生成报告...")
+            self._enter_stage("report", "[5/6] 生成报告...")
             report_type = self._get_report_type(mode)
-            is_daily_summary = True  # 总是生成当日汇总
 
-            # 生成时间戳文本报告（用于历史追踪）
-            timestamp_txt_path = self.news_reporter.generate_text_report(
+            # 报告数据每次运行只准备一次，由所有报告和通知共享
+            report_context = self.news_reporter.build_context(
                 stats=stats,
                 total_titles=total_titles,
                 failed_ids=failed_ids,
                 new_news_list=self._convert_new_titles_to_news(new_titles, id_to_name),
-                mode=mode,
-                is_daily_summary=False  # 时间戳文件
-            )
-            print(f"✓ 时间戳报告: {timestamp_txt_path}")
-
-            # 生成当日汇总文本报告（追加合并模式）
-            summary_txt_path = self.news_reporter.generate_text_report(
-                stats=stats,
-                total_titles=total_titles,
-                failed_ids=failed_ids,
-                new_news_list=self._convert_new_titles_to_news(new_titles, id_to_name),
-                mode=mode,
-                is_daily_summary=is_daily_summary  # 汇总文件
+                mode=mode
             )
-            print(f"✓ 汇总报告: {summary_txt_path}")
 
-            # 生成 JSON 报告(全量覆写)
-            json_path = self.news_reporter.generate_json_report(
-                stats=stats,
-                total_titles=total_titles,
-                failed_ids=failed_ids,
-                new_news_list=self._convert_new_titles_to_news(new_titles, id_to_name),
-                mode=mode,
-                is_daily_summary=is_daily_summary
-            )
-            print(f"✓ JSON 报告: {json_path}")
+            # 时间戳文本（历史追踪）、当日汇总文本（追加合并）、JSON（全量覆写）、
+            # 邮件 HTML（服务器端渲染）互不依赖，并行生成
+            report_paths = self.news_reporter.render_reports(report_context)
+            html_path = report_paths["html"]
+            print(f"✓ 时间戳报告: {report_paths['timestamp_txt']}")
+            print(f"✓ 汇总报告: {report_paths['summary_txt']}")
+            print(f"✓ JSON 报告: {report_paths['json']}")
+            print(f"✓ HTML 报告: {html_path}")
 
-            # 生成邮件专用的 HTML 报告（服务器端渲染）
-            html_path = self.news_reporter.generate_html_report(
-                stats=stats,
-                total_titles=total_titles,
-                failed_ids=failed_ids,
-                new_news_list=self._convert_new_titles_to_news(new_titles, id_to_name),
-                mode=mode,
-                is_daily_summary=is_daily_summary
+            timings = self.news_reporter.get_render_timings()
+            print(
+                f"报告耗时：准备 {timings['prepare'] * 1000:.1f}ms，"
+                f"时间戳 {timings['timestamp_txt'] * 1000:.1f}ms，"
+                f"汇总 {timings['summary_txt'] * 1000:.1f}ms，"
+                f"JSON {timings['json'] * 1000:.1f}ms，"
+                f"HTML {timings['html'] * 1000:.1f}ms，"
+                f"并行总计 {timings['total'] * 1000:.1f}ms"
             )
-            print(f"✓ HTML 报告: {html_path}")
 
             # 7. 发送通知
-            print("\n[6/6] 发送通知...")
+            self._enter_stage("notify", "[6/6] 发送通知...")
 
             # 三重检查：开关 + 配置 + 内容
             enable_notification = self.config.get("ENABLE_NOTIFICATION", True)
@@ -210,17 +226,9 @@ class TrendRadarApp:
                 print("=" * 60)
                 return True
 
-            # 准备报告数据
-            report_data = self.news_reporter.prepare_report_data(
-                stats=stats,
-                failed_ids=failed_ids,
-                new_news_list=self._convert_new_titles_to_news(new_titles, id_to_name),
-                mode=mode
-            )
-
             # 发送通知
             self.notification_manager.send_notifications(
-                report_data=report_data,
+                report_data=report_context.report_data,
                 report_type=report_type,
                 update_info=None,  # TODO: 实现版本检查
                 proxy_url=self.config.get("DEFAULT_PROXY") if self.config.get("USE_PROXY") else None,
@@ -234,12 +242,40 @@ class TrendRadarApp:
 
             return True
 
+        except CrawlCancelledError as e:
+            print(f"\n运行已取消: {e}")
+            raise
+
         except Exception as e:
             print(f"\n错误: 运行过程中出现异常: {e}")
             import traceback
             traceback.print_exc()
             return False
 
+    def close(self) -> None:
+        """释放资源：等待发送队列投递（有上限）并关闭推送连接"""
+        self.notification_manager.close(
+            drain_timeout=self.config.get("NOTIFICATION_OUTBOX_DRAIN_TIMEOUT", 120)
+        )
+
+    def _enter_stage(self, stage: str, message: str) -> None:
+        """进入流程的下一个阶段
+
+        Args:
+            stage: 阶段标识
+            message: 阶段描述
+
+        Raises:
+            CrawlCancelledError: 运行已被取消
+        """
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise CrawlCancelledError(f"在 {stage} 阶段开始前被取消")
+
+        print(f"\n{message}")
+
+        if self._progress_callback is not None:
+            self._progress_callback(stage, message)
+
     def _get_sources(self) -> List:
         """获取启用的信息源
 
@@ -257,26 +293,72 @@ class TrendRadarApp:
     def _fetch_all_news(self, sources: List) -> tuple:
         """从所有信息源获取新闻
 
+        同步入口，内部通过 _afetch_all_news 并发获取所有信息源
+
         Args:
             sources: 信息源列表
 
         Returns:
             tuple: (所有新闻列表, 失败的ID列表)
         """
-        all_news = []
-        failed_ids = []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._afetch_all_news(sources))
+
+        # 已处于事件循环中（如 API 调度器），在独立线程的新事件循环中执行
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._afetch_all_news(sources)).result()
 
+    async def _afetch_all_news(self, sources: List) -> tuple:
+        """并发从所有信息源获取新闻
+
+        每个信息源都有独立的超时时间，超时或失败的信息源记入失败列表，
+        不影响其他信息源；返回的新闻顺序与信息源顺序一致。
+        同步信息源在本次爬取专用的线程池中执行，结束后不等待超时仍在运行的线程，
+        使超时同样限制同步信息源的总耗时（这些线程在后台运行到结束）
+
+        Args:
+            sources: 信息源列表
+
+        Returns:
+            tuple: (所有新闻列表, 失败的ID列表)
+        """
         request_interval = self.config.get("REQUEST_INTERVAL", 1000)
+        default_timeout = self.config.get("SOURCE_TIMEOUT", 120)
+
+        async def fetch_one(source) -> List[News]:
+            timeout = source.get_source_config().get("timeout", default_timeout)
+            print(f"  正在爬取: {source.source_name}...")
+            return await asyncio.wait_for(
+                source.afetch_news(request_interval=request_interval),
+                timeout=timeout
+            )
 
-        for source in sources:
-            try:
-                print(f"  正在爬取: {source.source_name}...")
-                news_list = source.fetch_news(request_interval=request_interval)
-                all_news.extend(news_list)
-                print(f"  ✓ {source.source_name}: {len(news_list)} 条")
-            except Exception as e:
-                print(f"  ✗ {source.source_name}: 失败 - {e}")
+        executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="source")
+        token = fetch_executor.set(executor)
+        try:
+            results = await asyncio.gather(
+                *(fetch_one(source) for source in sources),
+                return_exceptions=True
+            )
+        finally:
+            fetch_executor.reset(token)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        all_news = []
+        failed_ids = []
+
+        for source, result in zip(sources, results):
+            if isinstance(result, asyncio.TimeoutError):
+                print(f"  ✗ {source.source_name}: 超时")
                 failed_ids.append(source.source_id)
+            elif isinstance(result, BaseException):
+                print(f"  ✗ {source.source_name}: 失败 - {result}")
+                failed_ids.append(source.source_id)
+            else:
+                all_news.extend(result)
+                print(f"  ✓ {source.source_name}: {len(result)} 条")
 
         return all_news, failed_ids
 
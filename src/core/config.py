@@ -58,10 +58,13 @@ class ConfigManager:
             "USE_PROXY": config_data["crawler"]["use_proxy"],
             "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
             "ENABLE_CRAWLER": config_data["crawler"]["enable_crawler"],
+            "CRAWLER_MAX_WORKERS": config_data["crawler"].get("max_workers", 1),
+            "SOURCE_TIMEOUT": config_data["crawler"].get("source_timeout", 120),
 
             # 报告配置
             "REPORT_MODE": config_data["report"]["mode"],
             "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
+            "MAX_NEWS_PER_KEYWORD": config_data["report"].get("max_news_per_keyword", 0),
 
             # 通知配置
             "ENABLE_NOTIFICATION": config_data["notification"]["enable_notification"],
@@ -70,6 +73,27 @@ class ConfigManager:
             "FEISHU_BATCH_SIZE": config_data["notification"].get("feishu_batch_size", 29000),
             "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
             "FEISHU_MESSAGE_SEPARATOR": config_data["notification"]["feishu_message_separator"],
+            "NOTIFICATION_CONCURRENT": config_data["notification"].get("concurrent_dispatch", False),
+            "NOTIFICATION_CHANNEL_TIMEOUT": config_data["notification"].get("channel_timeout", 300),
+            "NOTIFICATION_CHANNEL_TIMEOUTS": config_data["notification"].get("channel_timeouts", {}),
+            "NOTIFICATION_ASYNC": config_data["notification"].get("async_dispatch", False),
+            "NOTIFICATION_CHANNEL_CONCURRENCY": config_data["notification"].get("channel_concurrency", 1),
+            "NOTIFICATION_POOL_MAXSIZE": config_data["notification"].get("pool_maxsize", 4),
+            "NOTIFICATION_HTTP2": config_data["notification"].get("http2", False),
+            "NOTIFICATION_OUTBOX": config_data["notification"].get("outbox", {}).get("enabled", False),
+            "NOTIFICATION_OUTBOX_MAX_ATTEMPTS": config_data["notification"].get("outbox", {}).get("max_attempts", 5),
+            "NOTIFICATION_OUTBOX_BACKOFF_BASE": config_data["notification"].get("outbox", {}).get("backoff_base", 2.0),
+            "NOTIFICATION_OUTBOX_BACKOFF_MAX": config_data["notification"].get("outbox", {}).get("backoff_max", 300.0),
+            "NOTIFICATION_OUTBOX_RATE_LIMITS": config_data["notification"].get("outbox", {}).get("rate_limits", {}),
+            "NOTIFICATION_OUTBOX_DRAIN_TIMEOUT": config_data["notification"].get("outbox", {}).get("drain_timeout", 120),
+            "NOTIFICATION_OUTBOX_RETENTION_DAYS": config_data["notification"].get("outbox", {}).get("retention_days", 7),
+            "NOTIFICATION_DELTA": config_data["notification"].get("delta_push", {}).get("enabled", False),
+            "NOTIFICATION_DELTA_DIGEST": config_data["notification"].get("delta_push", {}).get("disappeared_digest", True),
+            "NOTIFICATION_DELTA_DIGEST_LIMIT": config_data["notification"].get("delta_push", {}).get("disappeared_limit", 10),
+            "EMAIL_PLAIN_TEXT": config_data["notification"].get("email", {}).get("plain_text", False),
+            "EMAIL_SMTP_STARTTLS": config_data["notification"].get("email", {}).get("starttls", True),
+            "EMAIL_SMTP_KEEPALIVE": config_data["notification"].get("email", {}).get("keepalive", True),
+            "EMAIL_SMTP_IDLE_TIMEOUT": config_data["notification"].get("email", {}).get("idle_timeout", 0),
 
             # 推送窗口配置
             "PUSH_WINDOW": {
@@ -79,6 +103,7 @@ class ConfigManager:
                     "END": config_data["notification"].get("push_window", {}).get("time_range", {}).get("end", "22:00"),
                 },
                 "ONCE_PER_DAY": config_data["notification"].get("push_window", {}).get("once_per_day", True),
+                "PER_CHANNEL": config_data["notification"].get("push_window", {}).get("per_channel", False),
                 "RECORD_RETENTION_DAYS": config_data["notification"].get("push_window", {}).get("push_record_retention_days", 7),
             },
 
@@ -171,6 +196,11 @@ class ConfigManager:
             os.environ.get("TELEGRAM_CHAT_ID", "").strip() or
             webhooks.get("telegram_chat_id", "")
         )
+        config["TELEGRAM_API_URL"] = (
+            os.environ.get("TELEGRAM_API_URL", "").strip() or
+            webhooks.get("telegram_api_url", "") or
+            "https://api.telegram.org"
+        )
 
         # 邮件
         config["EMAIL_FROM"] = (
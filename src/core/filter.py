@@ -5,6 +5,12 @@ import os
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
+from src.core.matcher import KeywordMatcher
+
+
+# 未配置任何词组时，所有标题归入的虚拟词组
+ALL_NEWS_GROUP_KEY = "全部新闻"
+
 
 class NewsFilter:
     """新闻筛选器
@@ -30,6 +36,7 @@ class NewsFilter:
         self.frequency_file = frequency_file
         self.word_groups: List[Dict] = []
         self.filter_words: List[str] = []
+        self.matcher: Optional[KeywordMatcher] = None
 
         self._load_frequency_words()
 
@@ -84,6 +91,7 @@ class NewsFilter:
 
         self.word_groups = processed_groups
         self.filter_words = filter_words
+        self.matcher = KeywordMatcher(processed_groups, filter_words)
 
         print(f"已加载 {len(self.word_groups)} 个词组，{len(self.filter_words)} 个过滤词")
 
@@ -100,37 +108,39 @@ class NewsFilter:
         if not self.word_groups:
             return True
 
-        title_lower = title.lower()
+        return self.find_group(title) is not None
 
-        # 过滤词检查（任一匹配则排除）
-        if any(filter_word.lower() in title_lower for filter_word in self.filter_words):
-            return False
+    def find_group(self, title: str) -> Optional[Dict]:
+        """查找标题匹配的第一个词组
 
-        # 词组匹配检查
-        for group in self.word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
+        Args:
+            title: 新闻标题
 
-            # 必须词检查（所有必须词都要包含）
-            if required_words:
-                all_required_present = all(
-                    req_word.lower() in title_lower for req_word in required_words
-                )
-                if not all_required_present:
-                    continue
+        Returns:
+            Optional[Dict]: 匹配的词组，命中过滤词或没有匹配时返回 None
+        """
+        group_index = self.matcher.first_group(title)
+        if group_index is None:
+            return None
+        return self.word_groups[group_index]
 
-            # 普通词检查（任一包含即可）
-            if normal_words:
-                any_normal_present = any(
-                    normal_word.lower() in title_lower for normal_word in normal_words
-                )
-                if not any_normal_present:
-                    continue
+    def classify(self, title: str) -> Optional[str]:
+        """一次调用完成筛选和词组归类
 
-            # 该词组匹配成功
-            return True
+        Args:
+            title: 新闻标题
+
+        Returns:
+            Optional[str]: 匹配的词组键，未配置词组时返回 "全部新闻"，
+                命中过滤词或没有匹配时返回 None
+        """
+        if not self.word_groups:
+            return ALL_NEWS_GROUP_KEY
 
-        return False
+        group = self.find_group(title)
+        if group is None:
+            return None
+        return group["group_key"]
 
     def filter_news_list(self, news_list: List) -> List:
         """筛选新闻列表
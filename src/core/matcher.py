@@ -0,0 +1,159 @@
+# coding=utf-8
+"""多模式关键词匹配模块
+
+基于 Aho–Corasick 自动机，一次扫描标题即可找出所有命中的关键词，
+再根据命中集合直接确定第一个匹配的词组，避免对每个词组逐个做子串查找。
+匹配语义与逐词 `word.lower() in title.lower()` 完全一致。
+"""
+
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+
+class KeywordMatcher:
+    """编译后的关键词组匹配器
+
+    负责：
+    - 将所有词组的必须词、普通词和过滤词编译为一个自动机
+    - 单次扫描标题得到命中关键词集合
+    - 按词组顺序返回第一个匹配的词组
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        """编译匹配器
+
+        Args:
+            word_groups: 词组列表 [{required, normal, group_key}]
+            filter_words: 过滤词列表
+        """
+        self._pattern_ids: Dict[str, int] = {}
+
+        # 自动机：goto 转移表、失败指针、每个状态的输出（模式ID列表）
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        # 空关键词在任何标题中都视为命中（与 "" in title 的语义一致）
+        self._always_hit: Set[int] = set()
+
+        self._filter_ids = frozenset(self._add_pattern(word) for word in filter_words)
+
+        self._group_required: List[frozenset] = []
+        self._group_normal: List[frozenset] = []
+        self._pattern_groups: Dict[int, List[int]] = {}
+
+        for group_index, group in enumerate(word_groups):
+            required = frozenset(self._add_pattern(word) for word in group["required"])
+            normal = frozenset(self._add_pattern(word) for word in group["normal"])
+            self._group_required.append(required)
+            self._group_normal.append(normal)
+
+            for pattern_id in required | normal:
+                self._pattern_groups.setdefault(pattern_id, []).append(group_index)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, word: str) -> int:
+        """将关键词加入 trie
+
+        Args:
+            word: 关键词（按小写匹配）
+
+        Returns:
+            int: 模式ID（相同关键词共享同一ID）
+        """
+        word = word.lower()
+        if word in self._pattern_ids:
+            return self._pattern_ids[word]
+
+        pattern_id = len(self._pattern_ids)
+        self._pattern_ids[word] = pattern_id
+
+        if not word:
+            self._always_hit.add(pattern_id)
+            return pattern_id
+
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append(pattern_id)
+        return pattern_id
+
+    def _build_failure_links(self) -> None:
+        """按广度优先构建失败指针，并沿失败链合并输出"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+
+                fallback_output = self._output[self._fail[next_state]]
+                if fallback_output:
+                    self._output[next_state] = self._output[next_state] + fallback_output
+
+    def scan(self, title: str) -> Set[int]:
+        """扫描标题，返回所有命中的模式ID
+
+        Args:
+            title: 新闻标题
+
+        Returns:
+            Set[int]: 命中的模式ID集合
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        hits = set(self._always_hit)
+        state = 0
+        for char in title.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+
+        return hits
+
+    def first_group(self, title: str, apply_filters: bool = True) -> Optional[int]:
+        """返回第一个匹配的词组下标
+
+        Args:
+            title: 新闻标题
+            apply_filters: 是否检查过滤词（命中任一过滤词则不匹配）
+
+        Returns:
+            Optional[int]: 词组下标，不匹配时返回 None
+        """
+        hits = self.scan(title)
+
+        if apply_filters and not self._filter_ids.isdisjoint(hits):
+            return None
+
+        candidates = set()
+        for pattern_id in hits:
+            candidates.update(self._pattern_groups.get(pattern_id, ()))
+
+        for group_index in sorted(candidates):
+            if not self._group_required[group_index] <= hits:
+                continue
+            normal = self._group_normal[group_index]
+            if normal and normal.isdisjoint(hits):
+                continue
+            return group_index
+
+        return None
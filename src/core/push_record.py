@@ -1,10 +1,20 @@
 # coding=utf-8
-"""推送记录管理模块"""
+"""推送记录管理模块
+
+推送状态服务：
+- 当天的推送记录缓存在内存中，按文件的修改时间和大小判断是否需要重新读取
+  （其他进程写入的记录也能感知）
+- 过期记录在首次读写时清理，每天最多一次
+- 写入时先写临时文件再替换，避免中断时留下损坏的记录
+- 除整体推送状态外，按渠道记录当天的推送历史
+"""
 
 import json
+import os
+import threading
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from src.utils.time import get_beijing_time
 
@@ -14,21 +24,26 @@ class PushRecordManager:
 
     负责：
     - 管理推送记录文件
-    - 检查是否已推送
+    - 检查是否已推送（整体或按渠道）
     - 清理过期记录
     - 时间窗口检查
     """
 
-    def __init__(self, retention_days: int = 7):
+    def __init__(self, retention_days: int = 7, record_dir: Optional[Path] = None):
         """初始化推送记录管理器
 
         Args:
             retention_days: 记录保留天数
+            record_dir: 记录目录，默认 output/.push_records
         """
-        self.record_dir = Path("output") / ".push_records"
+        self.record_dir = Path(record_dir) if record_dir else Path("output") / ".push_records"
         self.retention_days = retention_days
+        self._lock = threading.RLock()
+        # 当天记录的缓存: (文件路径, (修改时间, 大小), 记录)
+        self._cache: Optional[Tuple[Path, Optional[Tuple[int, int]], Optional[dict]]] = None
+        # 最近一次清理过期记录的日期
+        self._cleanup_date: Optional[str] = None
         self.ensure_record_dir()
-        self.cleanup_old_records()
 
     def ensure_record_dir(self) -> None:
         """确保记录目录存在"""
@@ -46,6 +61,7 @@ class PushRecordManager:
     def cleanup_old_records(self) -> None:
         """清理过期的推送记录"""
         current_time = get_beijing_time()
+        self._cleanup_date = current_time.strftime("%Y%m%d")
 
         for record_file in self.record_dir.glob("push_record_*.json"):
             try:
@@ -65,43 +81,118 @@ class PushRecordManager:
             except Exception as e:
                 print(f"清理记录文件失败 {record_file}: {e}")
 
-    def has_pushed_today(self) -> bool:
-        """检查今天是否已经推送过
+    def _cleanup_if_needed(self) -> None:
+        """每天最多清理一次过期记录"""
+        if self._cleanup_date != get_beijing_time().strftime("%Y%m%d"):
+            self.cleanup_old_records()
+
+    @staticmethod
+    def _file_signature(record_file: Path) -> Optional[Tuple[int, int]]:
+        """获取文件的修改时间和大小（文件不存在时为 None）
+
+        Args:
+            record_file: 记录文件路径
 
         Returns:
-            bool: 是否已推送
+            Optional[Tuple[int, int]]: (修改时间(纳秒), 大小)
         """
-        record_file = self.get_today_record_file()
+        try:
+            stat = record_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
-        if not record_file.exists():
-            return False
+    def _read_today(self) -> Optional[dict]:
+        """读取今天的推送记录（文件未变化时使用缓存）
+
+        Returns:
+            Optional[dict]: 推送记录，不存在或损坏时返回 None
+        """
+        with self._lock:
+            self._cleanup_if_needed()
+            record_file = self.get_today_record_file()
+            signature = self._file_signature(record_file)
+
+            if self._cache is not None and self._cache[:2] == (record_file, signature):
+                return self._cache[2]
 
+            record = None
+            if signature is not None:
+                try:
+                    with open(record_file, "r", encoding="utf-8") as f:
+                        record = json.load(f)
+                except Exception as e:
+                    print(f"读取推送记录失败: {e}")
+
+            self._cache = (record_file, signature, record)
+            return record
+
+    def _write_today(self, record: dict) -> None:
+        """写入今天的推送记录（临时文件写完后原子替换）
+
+        Args:
+            record: 推送记录
+        """
+        record_file = self.get_today_record_file()
+        tmp_file = record_file.with_name(f".{record_file.name}.{os.getpid()}.tmp")
+
+        self.ensure_record_dir()
         try:
-            with open(record_file, "r", encoding="utf-8") as f:
-                record = json.load(f)
-            return record.get("pushed", False)
-        except Exception as e:
-            print(f"读取推送记录失败: {e}")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, record_file)
+        except Exception:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        self._cache = (record_file, self._file_signature(record_file), record)
+
+    def has_pushed_today(self, channel: Optional[str] = None) -> bool:
+        """检查今天是否已经推送过
+
+        Args:
+            channel: 渠道标识，为 None 时检查整体推送状态
+
+        Returns:
+            bool: 是否已推送
+        """
+        record = self._read_today()
+        if not record:
             return False
+        if channel is None:
+            return record.get("pushed", False)
+        return channel in record.get("channels", {})
 
-    def record_push(self, report_type: str) -> None:
+    def record_push(self, report_type: str, channels: Optional[List[str]] = None) -> None:
         """记录推送
 
         Args:
             report_type: 报告类型 (daily/current/incremental)
+            channels: 推送成功的渠道列表
         """
-        record_file = self.get_today_record_file()
         now = get_beijing_time()
-
-        record = {
-            "pushed": True,
-            "push_time": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "report_type": report_type,
-        }
+        push_time = now.strftime("%Y-%m-%d %H:%M:%S")
 
         try:
-            with open(record_file, "w", encoding="utf-8") as f:
-                json.dump(record, f, ensure_ascii=False, indent=2)
+            with self._lock:
+                previous = self._read_today() or {}
+                channel_records = dict(previous.get("channels", {}))
+                for channel in channels or []:
+                    history = channel_records.get(channel, {})
+                    channel_records[channel] = {
+                        "first_push_time": history.get("first_push_time", push_time),
+                        "last_push_time": push_time,
+                        "report_type": report_type,
+                        "count": history.get("count", 0) + 1,
+                    }
+
+                record = {
+                    "pushed": True,
+                    "push_time": push_time,
+                    "report_type": report_type,
+                    "channels": channel_records,
+                }
+                self._write_today(record)
             print(f"推送记录已保存: {report_type} at {now.strftime('%H:%M:%S')}")
         except Exception as e:
             print(f"保存推送记录失败: {e}")
@@ -112,17 +203,22 @@ class PushRecordManager:
         Returns:
             Optional[dict]: 推送记录，不存在返回 None
         """
-        record_file = self.get_today_record_file()
+        record = self._read_today()
+        return dict(record) if record is not None else None
 
-        if not record_file.exists():
-            return None
+    def get_channel_history(self, channel: str) -> Optional[Dict]:
+        """获取渠道今天的推送历史
 
-        try:
-            with open(record_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"读取推送记录失败: {e}")
+        Args:
+            channel: 渠道标识
+
+        Returns:
+            Optional[Dict]: {first_push_time, last_push_time, report_type, count}，未推送返回 None
+        """
+        record = self._read_today()
+        if not record:
             return None
+        return record.get("channels", {}).get(channel)
 
     def is_in_time_range(self, start_time: str, end_time: str) -> bool:
         """检查当前时间是否在指定时间范围内
@@ -186,9 +282,11 @@ class PushRecordManager:
     def clear_today_record(self) -> None:
         """清除今天的推送记录（用于测试）"""
         record_file = self.get_today_record_file()
-        if record_file.exists():
-            record_file.unlink()
-            print(f"已清除今天的推送记录")
+        with self._lock:
+            self._cache = None
+            if record_file.exists():
+                record_file.unlink()
+                print(f"已清除今天的推送记录")
 
     def get_record_count(self) -> int:
         """获取记录文件数量
@@ -197,3 +295,26 @@ class PushRecordManager:
             int: 记录文件数量
         """
         return len(list(self.record_dir.glob("push_record_*.json")))
+
+
+# 按记录目录共享的推送记录管理器
+_shared_managers: Dict[Tuple[str, int], PushRecordManager] = {}
+_shared_lock = threading.Lock()
+
+
+def get_push_record_manager(retention_days: int = 7) -> PushRecordManager:
+    """获取进程内共享的推送记录管理器（按当前目录下的记录目录区分）
+
+    Args:
+        retention_days: 记录保留天数
+
+    Returns:
+        PushRecordManager: 推送记录管理器
+    """
+    record_dir = (Path("output") / ".push_records").resolve()
+    key = (str(record_dir), retention_days)
+    with _shared_lock:
+        manager = _shared_managers.get(key)
+        if manager is None:
+            manager = _shared_managers[key] = PushRecordManager(retention_days, record_dir)
+        return manager
@@ -2,13 +2,18 @@
 """新闻权重计算和排序模块"""
 
 import os
+import time
+import uuid
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
 from src.models.news import News, WordGroupStatistic
-from src.core.filter import NewsFilter
-from src.utils.time import format_date_folder
+from src.core.filter import NewsFilter, ALL_NEWS_GROUP_KEY
+from src.core.snapshot import find_snapshot, load_platform_titles
+from src.core.title_index import TitleIndex
+from src.core.weights import TitleScores, NUMPY_AVAILABLE
+from src.utils.time import format_date_folder, format_time_filename
 from src.utils.file import clean_title
 
 
@@ -46,12 +51,16 @@ class NewsRanking:
         self.frequency_weight = frequency_weight
         self.hotness_weight = hotness_weight
 
+        # 安装了 NumPy 时批量计算权重，否则逐条计算
+        self.vectorized = NUMPY_AVAILABLE
+
+        # 最近一次 calculate_statistics 各阶段耗时（秒）
+        self.phase_timings: Dict[str, float] = {"filter": 0.0, "stats": 0.0, "weight": 0.0, "sort": 0.0}
+
     def parse_file_titles(self, file_path: Path) -> Tuple[Dict, Dict]:
-        """解析单个txt文件的标题数据
+        """读取单个txt报告的标题数据
 
-        支持两种格式:
-        1. 按平台分组: "platform_id | name\\n1. title..."
-        2. 按词组分组: "词组名 (共N条)\\n[平台名] 标题..."
+        优先读取同名的结构化快照（.jsonl），旧数据没有快照时才解析展示文本
 
         Args:
             file_path: 文件路径
@@ -61,6 +70,28 @@ class NewsRanking:
                 - titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
                 - id_to_name: {platform_id: platform_name}
         """
+        snapshot_file = find_snapshot(file_path)
+        if snapshot_file is not None:
+            try:
+                return load_platform_titles(snapshot_file)
+            except Exception as e:
+                print(f"读取快照 {snapshot_file.name} 出错，改为解析文本: {e}")
+
+        return self._parse_text_titles(file_path)
+
+    def _parse_text_titles(self, file_path: Path) -> Tuple[Dict, Dict]:
+        """从展示文本解析标题数据（兼容没有快照的旧数据）
+
+        支持两种格式:
+        1. 按平台分组: "platform_id | name\\n1. title..."
+        2. 按词组分组: "词组名 (共N条)\\n[平台名] 标题..."
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Tuple[Dict, Dict]: (titles_by_id, id_to_name)，同 parse_file_titles
+        """
         titles_by_id = {}
         id_to_name = {}
 
@@ -158,7 +189,10 @@ class NewsRanking:
         self,
         current_platform_ids: Optional[List[str]] = None
     ) -> Tuple[Dict, Dict, Dict]:
-        """读取当天所有标题文件
+        """读取当天所有标题的聚合结果
+
+        数据来自当日标题索引（每次运行通过 record_batch 追加批次），
+        索引不存在时会从当天已有的 txt 快照文件构建一次
 
         Args:
             current_platform_ids: 当前监控的平台ID列表（用于过滤）
@@ -169,51 +203,78 @@ class NewsRanking:
                 - id_to_name: {platform_id: platform_name}
                 - title_info: {platform_id: {title: {first_time, last_time, count, ranks, url, mobileUrl}}}
         """
-        date_folder = format_date_folder()
-        txt_dir = Path("output") / date_folder / "txt"
+        date_dir = Path("output") / format_date_folder()
+        index = TitleIndex.for_date_dir(date_dir)
+
+        self._import_txt_snapshots(index, date_dir / "txt")
+
+        return index.load(current_platform_ids)
+
+    def record_batch(
+        self,
+        results: Dict,
+        id_to_name: Dict,
+        time_info: Optional[str] = None
+    ) -> bool:
+        """将本次爬取批次追加到当日标题索引
+
+        追加第一个爬取批次之前先导入当天已有的 txt 快照（升级后首次运行），
+        否则之后读取时会因已有爬取批次而跳过导入，丢失当天更早的数据
+
+        Args:
+            results: 本批次数据 {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: 平台ID到名称的映射
+            time_info: 批次时间标识，默认使用当前时间
+
+        Returns:
+            bool: 是否追加成功
+        """
+        if time_info is None:
+            time_info = format_time_filename()
+
+        date_dir = Path("output") / format_date_folder()
+        index = TitleIndex.for_date_dir(date_dir)
+        self._import_txt_snapshots(index, date_dir / "txt")
 
+        # 时间标识只精确到分钟，批次键附加序号，同一分钟内的多次运行各自记录
+        batch_key = f"crawl:{time_info}:{uuid.uuid4().hex[:12]}"
+        return index.append_batch(results, id_to_name, time_info, batch_key=batch_key)
+
+    def _import_txt_snapshots(self, index: TitleIndex, txt_dir: Path) -> None:
+        """将尚未导入的 txt 快照文件导入索引
+
+        仅用于兼容旧数据：索引一旦开始直接记录爬取批次，txt 文件就只作为
+        展示用的报告，不再导入（避免与爬取批次重复计数）
+
+        Args:
+            index: 当日标题索引
+            txt_dir: txt 快照目录
+        """
         if not txt_dir.exists():
-            return {}, {}, {}
+            return
+
+        if index.get_batch_keys(kind="crawl"):
+            return
 
-        all_results = {}
-        final_id_to_name = {}
-        title_info = {}
+        imported = set(index.get_batch_keys(kind="snapshot"))
 
         # 排除汇总文件，只读取时间戳文件
         files = sorted([
             f for f in txt_dir.iterdir()
             if f.suffix == ".txt"
             and f.name not in ["当日汇总.txt", "当前榜单汇总.txt", "当日增量.txt"]
+            and f"snapshot:{f.name}" not in imported
         ])
 
         for file_path in files:
-            time_info = file_path.stem  # 文件名作为时间标识
-
             titles_by_id, file_id_to_name = self.parse_file_titles(file_path)
-
-            # 如果指定了平台过滤
-            if current_platform_ids is not None:
-                filtered_titles_by_id = {}
-                filtered_id_to_name = {}
-
-                for source_id, title_data in titles_by_id.items():
-                    if source_id in current_platform_ids:
-                        filtered_titles_by_id[source_id] = title_data
-                        if source_id in file_id_to_name:
-                            filtered_id_to_name[source_id] = file_id_to_name[source_id]
-
-                titles_by_id = filtered_titles_by_id
-                file_id_to_name = filtered_id_to_name
-
-            final_id_to_name.update(file_id_to_name)
-
-            # 处理每个平台的数据
-            for source_id, title_data in titles_by_id.items():
-                self._process_source_data(
-                    source_id, title_data, time_info, all_results, title_info
-                )
-
-        return all_results, final_id_to_name, title_info
+            index.append_batch(
+                titles_by_id,
+                file_id_to_name,
+                time_info=file_path.stem,  # 文件名作为时间标识
+                batch_key=f"snapshot:{file_path.name}",
+                kind="snapshot"
+            )
 
     def _process_source_data(
         self,
@@ -363,7 +424,8 @@ class NewsRanking:
         id_to_name: Dict,
         title_info: Optional[Dict] = None,
         new_titles: Optional[Dict] = None,
-        mode: str = "daily"
+        mode: str = "daily",
+        top_k: Optional[int] = None
     ) -> Tuple[List[WordGroupStatistic], int]:
         """统计词频并计算权重
 
@@ -373,6 +435,7 @@ class NewsRanking:
             title_info: 标题统计信息
             new_titles: 新增标题
             mode: 模式 (daily/current/incremental)
+            top_k: 每个词组只保留权重最高的前 K 条新闻（词组计数不受影响），None 表示全部保留
 
         Returns:
             Tuple[List[WordGroupStatistic], int]: (统计列表, 总标题数)
@@ -384,9 +447,11 @@ class NewsRanking:
         # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
         if not word_groups:
             print("频率词配置为空，将显示所有新闻")
-            word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
+            word_groups = [{"required": [], "normal": [], "group_key": ALL_NEWS_GROUP_KEY}]
             filter_words = []
 
+        self.phase_timings = {"filter": 0.0, "stats": 0.0, "weight": 0.0, "sort": 0.0}
+
         is_first_today = self.is_first_crawl_today()
 
         # 确定处理的数据源和新增标记逻辑
@@ -409,7 +474,10 @@ class NewsRanking:
         if new_titles is None:
             new_titles = {}
 
-        # 处理每个平台的每个标题
+        # 处理每个平台的每个标题（每个标题只做一次筛选和词组归类）
+        # 筛选只计 classify 的耗时，其余为统计累加的耗时
+        loop_start = time.perf_counter()
+        filter_time = 0.0
         for source_id, titles_data in results_to_process.items():
             total_titles += len(titles_data)
 
@@ -420,8 +488,10 @@ class NewsRanking:
                 if title in processed_titles.get(source_id, {}):
                     continue
 
-                # 使用筛选器检查是否匹配
-                if not self.news_filter.matches(title):
+                classify_start = time.perf_counter()
+                group_key = self.news_filter.classify(title)
+                filter_time += time.perf_counter() - classify_start
+                if group_key is None:
                     continue
 
                 # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -432,11 +502,14 @@ class NewsRanking:
 
                 # 处理标题数据
                 self._process_title_for_stats(
-                    title, title_data, source_id, word_groups, word_stats,
+                    title, title_data, source_id, group_key, word_stats,
                     title_info, new_titles, id_to_name, mode, all_news_are_new,
                     processed_titles
                 )
 
+        self.phase_timings["filter"] = filter_time
+        self.phase_timings["stats"] = time.perf_counter() - loop_start - filter_time
+
         # 打印汇总信息
         self._print_summary(
             mode, is_first_today, results, new_titles, matched_new_count,
@@ -444,10 +517,25 @@ class NewsRanking:
         )
 
         # 生成统计结果
-        stats = self._generate_statistics(word_stats, total_titles)
+        stats = self._generate_statistics(word_stats, total_titles, top_k)
+
+        timings = self.phase_timings
+        print(
+            f"统计耗时：筛选 {timings['filter'] * 1000:.1f}ms，统计 {timings['stats'] * 1000:.1f}ms，"
+            f"权重 {timings['weight'] * 1000:.1f}ms，排序 {timings['sort'] * 1000:.1f}ms"
+        )
 
         return stats, total_titles
 
+    def get_phase_timings(self) -> Dict[str, float]:
+        """获取最近一次统计各阶段的耗时
+
+        Returns:
+            Dict[str, float]: {filter, stats, weight, sort} 各阶段耗时（秒），
+                filter 为词组归类（classify），stats 为标题统计累加
+        """
+        return dict(self.phase_timings)
+
     def _determine_processing_mode(
         self,
         results: Dict,
@@ -537,7 +625,7 @@ class NewsRanking:
         title: str,
         title_data: Dict,
         source_id: str,
-        word_groups: List[Dict],
+        group_key: str,
         word_stats: Dict,
         title_info: Dict,
         new_titles: Dict,
@@ -552,7 +640,7 @@ class NewsRanking:
             title: 标题
             title_data: 标题数据
             source_id: 平台ID
-            word_groups: 词组配置
+            group_key: 匹配的词组键
             word_stats: 词组统计（会被修改）
             title_info: 标题信息
             new_titles: 新增标题
@@ -565,105 +653,71 @@ class NewsRanking:
         source_url = title_data.get("url", "")
         source_mobile_url = title_data.get("mobileUrl", "")
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # 如果是"全部新闻"模式，所有标题都匹配
-            if group_key == "全部新闻":
-                matched = True
-            else:
-                # 检查必须词
-                if required_words:
-                    all_required_present = all(
-                        req_word.lower() in title_lower for req_word in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词
-                if normal_words:
-                    any_normal_present = any(
-                        normal_word.lower() in title_lower for normal_word in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if not matched:
-                continue
+        # 更新词组统计
+        word_stats[group_key]["count"] += 1
+        if source_id not in word_stats[group_key]["titles"]:
+            word_stats[group_key]["titles"][source_id] = []
+
+        # 获取完整的统计信息
+        first_time = ""
+        last_time = ""
+        count_info = 1
+        ranks = source_ranks if source_ranks else []
+        url = source_url
+        mobile_url = source_mobile_url
+
+        # 对于 current 模式或 daily 模式，从历史统计信息中获取完整数据
+        if title_info and source_id in title_info and title in title_info[source_id]:
+            info = title_info[source_id][title]
+            first_time = info.get("first_time", "")
+            last_time = info.get("last_time", "")
+            count_info = info.get("count", 1)
+            if "ranks" in info and info["ranks"]:
+                ranks = info["ranks"]
+            url = info.get("url", source_url)
+            mobile_url = info.get("mobileUrl", source_mobile_url)
 
-            # 更新词组统计
-            word_stats[group_key]["count"] += 1
-            if source_id not in word_stats[group_key]["titles"]:
-                word_stats[group_key]["titles"][source_id] = []
-
-            # 获取完整的统计信息
-            first_time = ""
-            last_time = ""
-            count_info = 1
-            ranks = source_ranks if source_ranks else []
-            url = source_url
-            mobile_url = source_mobile_url
-
-            # 对于 current 模式或 daily 模式，从历史统计信息中获取完整数据
-            if title_info and source_id in title_info and title in title_info[source_id]:
-                info = title_info[source_id][title]
-                first_time = info.get("first_time", "")
-                last_time = info.get("last_time", "")
-                count_info = info.get("count", 1)
-                if "ranks" in info and info["ranks"]:
-                    ranks = info["ranks"]
-                url = info.get("url", source_url)
-                mobile_url = info.get("mobileUrl", source_mobile_url)
-
-            if not ranks:
-                ranks = [99]
-
-            # 格式化时间显示
-            if first_time and last_time and first_time != last_time:
-                time_display = f"[{first_time} ~ {last_time}]"
-            elif first_time:
-                time_display = first_time
-            else:
-                time_display = ""
-
-            source_name = id_to_name.get(source_id, source_id)
-
-            # 判断是否为新增
-            is_new = False
-            if all_news_are_new:
-                is_new = True
-            elif new_titles and source_id in new_titles:
-                new_titles_for_source = new_titles[source_id]
-                is_new = title in new_titles_for_source
-
-            # 添加到统计
-            word_stats[group_key]["titles"][source_id].append({
-                "title": title,
-                "platform": source_id,  # 平台ID (如 zhihu, weibo)
-                "source_name": source_name,  # 平台显示名称
-                "first_time": first_time,
-                "last_time": last_time,
-                "time_display": time_display,
-                "count": count_info,
-                "ranks": ranks,
-                "rank_threshold": self.rank_threshold,
-                "url": url,
-                "mobileUrl": mobile_url,
-                "is_new": is_new,
-            })
-
-            # 标记已处理
-            if source_id not in processed_titles:
-                processed_titles[source_id] = {}
-            processed_titles[source_id][title] = True
+        if not ranks:
+            ranks = [99]
 
-            break  # 只匹配第一个词组
+        # 格式化时间显示
+        if first_time and last_time and first_time != last_time:
+            time_display = f"[{first_time} ~ {last_time}]"
+        elif first_time:
+            time_display = first_time
+        else:
+            time_display = ""
+
+        source_name = id_to_name.get(source_id, source_id)
+
+        # 判断是否为新增
+        is_new = False
+        if all_news_are_new:
+            is_new = True
+        elif new_titles and source_id in new_titles:
+            new_titles_for_source = new_titles[source_id]
+            is_new = title in new_titles_for_source
+
+        # 添加到统计
+        word_stats[group_key]["titles"][source_id].append({
+            "title": title,
+            "platform": source_id,  # 平台ID (如 zhihu, weibo)
+            "source_name": source_name,  # 平台显示名称
+            "first_time": first_time,
+            "last_time": last_time,
+            "time_display": time_display,
+            "count": count_info,
+            "ranks": ranks,
+            "rank_threshold": self.rank_threshold,
+            "url": url,
+            "mobileUrl": mobile_url,
+            "is_new": is_new,
+        })
+
+        # 标记已处理
+        if source_id not in processed_titles:
+            processed_titles[source_id] = {}
+        processed_titles[source_id][title] = True
 
     def _print_summary(
         self,
@@ -686,7 +740,7 @@ class NewsRanking:
             word_groups: 词组配置
             results_to_process: 处理的结果
         """
-        is_show_all = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+        is_show_all = len(word_groups) == 1 and word_groups[0]["group_key"] == ALL_NEWS_GROUP_KEY
         filter_status = "全部显示" if is_show_all else "频率词匹配"
 
         if mode == "incremental":
@@ -717,33 +771,60 @@ class NewsRanking:
     def _generate_statistics(
         self,
         word_stats: Dict,
-        total_titles: int
+        total_titles: int,
+        top_k: Optional[int] = None
     ) -> List[WordGroupStatistic]:
         """生成统计结果
 
         Args:
             word_stats: 词组统计
             total_titles: 总标题数
+            top_k: 每个词组只保留权重最高的前 K 条新闻，None 表示全部保留
 
         Returns:
             List[WordGroupStatistic]: 统计列表
         """
         stats = []
 
+        # 将所有词组的标题展开为一个列表，权重一次性批量计算
+        all_titles = []
+        group_ranges = []
         for group_key, data in word_stats.items():
-            all_titles = []
+            start = len(all_titles)
             for source_id, title_list in data["titles"].items():
                 all_titles.extend(title_list)
+            group_ranges.append((group_key, data, start, len(all_titles)))
+
+        # 计算权重
+        weight_start = time.perf_counter()
+        scores = None
+        if self.vectorized:
+            scores = TitleScores.compute(
+                all_titles, self.rank_threshold, self.rank_weight,
+                self.frequency_weight, self.hotness_weight
+            )
+        if scores is None:
+            weights = [self._calculate_weight(item) for item in all_titles]
+        self.phase_timings["weight"] += time.perf_counter() - weight_start
 
+        for group_key, data, start, end in group_ranges:
             # 按权重排序
-            sorted_titles = sorted(
-                all_titles,
-                key=lambda x: (
-                    -self._calculate_weight(x),
-                    min(x["ranks"]) if x["ranks"] else 999,
-                    -x["count"],
-                ),
-            )
+            sort_start = time.perf_counter()
+            if scores is not None:
+                order = scores.order(start, end, top_k)
+            else:
+                order = sorted(
+                    range(start, end),
+                    key=lambda i: (
+                        -weights[i],
+                        min(all_titles[i]["ranks"]) if all_titles[i]["ranks"] else 999,
+                        -all_titles[i]["count"],
+                    ),
+                )
+                if top_k is not None:
+                    order = order[:max(top_k, 0)]
+            sorted_titles = [all_titles[i] for i in order]
+            self.phase_timings["sort"] += time.perf_counter() - sort_start
 
             # 转换为 News 对象
             news_list = []
@@ -778,7 +859,9 @@ class NewsRanking:
             stats.append(stat)
 
         # 按数量排序
+        sort_start = time.perf_counter()
         stats.sort(key=lambda x: x.count, reverse=True)
+        self.phase_timings["sort"] += time.perf_counter() - sort_start
 
         return stats
 
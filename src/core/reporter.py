@@ -4,11 +4,22 @@
 import os
 import json
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from string import Template
 from typing import List, Dict, Optional, Any, Tuple
 
 from src.models.news import News, WordGroupStatistic
+from src.core.snapshot import (
+    build_report_blocks,
+    find_snapshot,
+    load_report_summary,
+    snapshot_path,
+    write_snapshot,
+)
+from src.core.summary_state import SummaryState
 from src.utils.file import clean_title, html_escape
 from src.utils.time import format_time_filename, format_date_folder
 
@@ -31,6 +42,22 @@ MODE_METADATA = {
 }
 
 
+@dataclass(frozen=True)
+class ReportContext:
+    """一次运行的报告上下文
+
+    report_data 只在 NewsReporter.build_context 中构建一次，
+    由所有报告生成器和通知渠道共享（只读，不应修改）
+    """
+
+    stats: List[WordGroupStatistic]     # 词组统计列表
+    total_titles: int                   # 总标题数
+    failed_ids: List[str]               # 失败的平台ID列表
+    new_news_list: List[News]           # 新增新闻列表
+    mode: str                           # 运行模式
+    report_data: Dict[str, Any]         # prepare_report_data() 返回的数据
+
+
 class NewsReporter:
     """新闻报告生成器
 
@@ -48,6 +75,8 @@ class NewsReporter:
         """
         self.rank_threshold = rank_threshold
         self._email_template_cache: Optional[str] = None
+        # 最近一次 render_reports 各阶段耗时（秒）
+        self.render_timings: Dict[str, float] = {}
 
     def prepare_report_data(
         self,
@@ -145,6 +174,97 @@ class NewsReporter:
             ),
         }
 
+    def build_context(
+        self,
+        stats: List[WordGroupStatistic],
+        total_titles: int,
+        failed_ids: Optional[List[str]] = None,
+        new_news_list: Optional[List[News]] = None,
+        mode: str = "daily"
+    ) -> ReportContext:
+        """构建报告上下文（每次运行只准备一次报告数据）
+
+        Args:
+            stats: 词组统计列表
+            total_titles: 总标题数
+            failed_ids: 失败的平台ID列表
+            new_news_list: 新增新闻列表
+            mode: 模式 (daily/current/incremental)
+
+        Returns:
+            ReportContext: 报告上下文
+        """
+        start = time.perf_counter()
+        report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
+        self.render_timings = {"prepare": time.perf_counter() - start}
+
+        return ReportContext(
+            stats=stats,
+            total_titles=total_titles,
+            failed_ids=failed_ids or [],
+            new_news_list=new_news_list or [],
+            mode=mode,
+            report_data=report_data,
+        )
+
+    def render_reports(
+        self,
+        context: ReportContext,
+        parallel: bool = True
+    ) -> Dict[str, Path]:
+        """基于同一份报告上下文生成全部报告
+
+        时间戳文本、当日汇总文本、JSON、HTML 互不依赖，默认并行生成
+
+        Args:
+            context: 报告上下文
+            parallel: 是否并行生成
+
+        Returns:
+            Dict[str, Path]: {timestamp_txt, summary_txt, json, html} 各报告路径
+        """
+        common = {
+            "stats": context.stats,
+            "total_titles": context.total_titles,
+            "failed_ids": context.failed_ids,
+            "new_news_list": context.new_news_list,
+            "mode": context.mode,
+            "report_data": context.report_data,
+        }
+        renderers = {
+            "timestamp_txt": lambda: self.generate_text_report(**common, is_daily_summary=False),
+            "summary_txt": lambda: self.generate_text_report(**common, is_daily_summary=True),
+            "json": lambda: self.generate_json_report(**common, is_daily_summary=True),
+            "html": lambda: self.generate_html_report(**common, is_daily_summary=True),
+        }
+
+        def timed(name: str) -> Tuple[Path, float]:
+            start = time.perf_counter()
+            path = renderers[name]()
+            return path, time.perf_counter() - start
+
+        total_start = time.perf_counter()
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(renderers)) as executor:
+                futures = {name: executor.submit(timed, name) for name in renderers}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: timed(name) for name in renderers}
+
+        for name, (_, elapsed) in results.items():
+            self.render_timings[name] = elapsed
+        self.render_timings["total"] = time.perf_counter() - total_start
+
+        return {name: path for name, (path, _) in results.items()}
+
+    def get_render_timings(self) -> Dict[str, float]:
+        """获取最近一次报告生成各阶段的耗时
+
+        Returns:
+            Dict[str, float]: {prepare, timestamp_txt, summary_txt, json, html, total} 各阶段耗时（秒）
+        """
+        return dict(self.render_timings)
+
     def format_rank_display(
         self,
         ranks: List[int],
@@ -431,7 +551,8 @@ class NewsReporter:
         failed_ids: Optional[List[str]] = None,
         new_news_list: Optional[List[News]] = None,
         mode: str = "daily",
-        is_daily_summary: bool = False
+        is_daily_summary: bool = False,
+        report_data: Optional[Dict[str, Any]] = None
     ) -> Path:
         """生成文本报告
 
@@ -442,6 +563,7 @@ class NewsReporter:
             new_news_list: 新增新闻列表
             mode: 模式
             is_daily_summary: 是否为当日汇总
+            report_data: 已准备好的报告数据（来自 ReportContext，提供时不再重新准备）
 
         Returns:
             Path: 生成的文件路径
@@ -459,13 +581,46 @@ class NewsReporter:
 
         file_path = self.get_output_path("txt", filename)
 
-        report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
+        if report_data is None:
+            report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
+
+        # "当日汇总.txt" 由合并状态维护，每次只合并本批次数据
+        if filename == "当日汇总.txt":
+            if file_path.exists():
+                print(f"ℹ️  检测到现有汇总文件，使用追加合并模式")
+            return self._generate_merged_text_report(file_path, report_data, mode)
+
+        self._write_text_report(file_path, report_data, mode)
+        return file_path
+
+    def _write_text_report(
+        self,
+        file_path: Path,
+        report_data: Dict[str, Any],
+        mode: str
+    ) -> None:
+        """渲染并写入文本报告及其结构化快照
+
+        Args:
+            file_path: 文件路径
+            report_data: 报告数据
+            mode: 模式
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(self.render_text_report(report_data))
+
+        # 写入结构化快照（供程序读取，txt 仅用于展示）
+        write_snapshot(snapshot_path(file_path), build_report_blocks(report_data, mode))
 
-        # 如果是 "当日汇总.txt" 且文件已存在，使用追加合并模式
-        if filename == "当日汇总.txt" and file_path.exists():
-            print(f"ℹ️  检测到现有汇总文件，使用追加合并模式")
-            return self._generate_merged_text_report(file_path, report_data)
+    def render_text_report(self, report_data: Dict[str, Any]) -> str:
+        """渲染纯文本报告
 
+        Args:
+            report_data: 报告数据
+
+        Returns:
+            str: 文本报告内容
+        """
         content_lines = []
 
         # 写入词组统计
@@ -523,11 +678,7 @@ class NewsReporter:
             content_lines.append("==== 以下ID请求失败 ====")
             content_lines.append(", ".join(report_data["failed_ids"]))
 
-        # 写入文件
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(content_lines))
-
-        return file_path
+        return "\n".join(content_lines)
 
     def generate_json_report(
         self,
@@ -536,7 +687,8 @@ class NewsReporter:
         failed_ids: Optional[List[str]] = None,
         new_news_list: Optional[List[News]] = None,
         mode: str = "daily",
-        is_daily_summary: bool = False  # pylint: disable=unused-argument
+        is_daily_summary: bool = False,  # pylint: disable=unused-argument
+        report_data: Optional[Dict[str, Any]] = None
     ) -> Path:
         """生成 JSON 报告(全量覆写模式)
 
@@ -547,12 +699,14 @@ class NewsReporter:
             new_news_list: 新增新闻列表
             mode: 模式
             is_daily_summary: 是否为当日汇总
+            report_data: 已准备好的报告数据（来自 ReportContext，提供时不再重新准备）
 
         Returns:
             Path: JSON 文件路径
         """
         # 准备报告数据
-        report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
+        if report_data is None:
+            report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
 
         # 构建完整 JSON 数据
         json_data = self._build_full_json_data(
@@ -666,6 +820,8 @@ class NewsReporter:
     def _parse_existing_summary(self, file_path: Path) -> Dict[str, Any]:
         """解析现有的汇总文件
 
+        优先读取同名的结构化快照，旧数据没有快照时才解析展示文本
+
         Args:
             file_path: 文件路径
 
@@ -676,6 +832,24 @@ class NewsReporter:
                     "failed_ids": [...]
                 }
         """
+        snapshot_file = find_snapshot(file_path)
+        if snapshot_file is not None:
+            try:
+                return load_report_summary(snapshot_file)
+            except Exception as e:
+                print(f"⚠️  读取汇总快照失败，改为解析文本: {e}")
+
+        return self._parse_summary_text(file_path)
+
+    def _parse_summary_text(self, file_path: Path) -> Dict[str, Any]:
+        """从展示文本解析汇总文件（兼容没有快照的旧数据）
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Dict: 解析后的数据结构，同 _parse_existing_summary
+        """
         existing_stats = {}
         failed_ids = []
         current_word_group = None
@@ -855,7 +1029,7 @@ class NewsReporter:
                     # 转换为 report_data 格式
                     historical_title = {
                         "title": existing_title,
-                        "platform": "",  # 历史数据可能缺少平台ID
+                        "platform": existing_title_data.get("platform", ""),  # 旧版文本数据缺少平台ID
                         "source_name": existing_title_data.get("platform_name", ""),
                         "time_display": existing_title_data.get("time_display", ""),
                         "count": existing_title_data.get("count", 1),
@@ -896,84 +1070,36 @@ class NewsReporter:
     def _generate_merged_text_report(
         self,
         file_path: Path,
-        new_report_data: Dict[str, Any]
+        new_report_data: Dict[str, Any],
+        mode: str = "daily"
     ) -> Path:
         """生成合并后的文本报告
 
+        合并结果持久化在汇总文件旁的状态文件中，每次只合并本批次数据，
+        汇总文件由状态完整渲染（本批次未出现的词组也会保留）
+
         Args:
             file_path: 文件路径
             new_report_data: 新的报告数据
+            mode: 模式
 
         Returns:
             Path: 文件路径
         """
-        # 1. 解析现有汇总文件
-        existing_data = self._parse_existing_summary(file_path)
-
-        # 2. 合并数据
-        merged_data = self._merge_report_data(existing_data, new_report_data)
-
-        # 3. 生成内容
-        content_lines = []
-
-        # 写入词组统计
-        for stat in merged_data["stats"]:
-            content_lines.append(f"{stat['word']} (共{stat['count']}条)")
-            content_lines.append("")
-
-            for title_data in stat["titles"]:
-                # 简单的文本格式
-                line = f"[{title_data['source_name']}] {title_data['title']}"
-                if title_data["ranks"]:
-                    min_rank = min(title_data["ranks"])
-                    max_rank = max(title_data["ranks"])
-                    if min_rank == max_rank:
-                        line += f" [{min_rank}]"
-                    else:
-                        line += f" [{min_rank} - {max_rank}]"
-                if title_data["time_display"]:
-                    line += f" - {title_data['time_display']}"
-                if title_data["count"] > 1:
-                    line += f" ({title_data['count']}次)"
-                if title_data["url"]:
-                    line += f" [URL:{title_data['url']}]"
-                if title_data["mobile_url"]:
-                    line += f" [MOBILE:{title_data['mobile_url']}]"
-
-                content_lines.append(line)
-
-            content_lines.append("")
-
-        # 写入新增新闻（如果有）
-        if merged_data["new_titles"]:
-            content_lines.append("==== 最新批次新增 ====")
-            content_lines.append("")
-
-            for source_data in merged_data["new_titles"]:
-                content_lines.append(f"{source_data['source_name']} (新增{len(source_data['titles'])}条)")
-                content_lines.append("")
+        state = SummaryState.for_summary(file_path, self.rank_threshold)
 
-                for title_data in source_data["titles"]:
-                    line = f"{title_data['title']}"
-                    if title_data["ranks"]:
-                        line += f" [{title_data['ranks'][0]}]"
-                    if title_data["url"]:
-                        line += f" [URL:{title_data['url']}]"
-                    if title_data["mobile_url"]:
-                        line += f" [MOBILE:{title_data['mobile_url']}]"
+        if not file_path.exists():
+            # 新的一天（或汇总文件被删除），从空状态开始
+            state.reset()
+        elif not state.exists():
+            # 旧数据只有汇总文件，解析一次导入状态
+            state.seed(self._parse_existing_summary(file_path))
 
-                    content_lines.append(line)
+        # 只合并本批次数据，再由状态渲染完整汇总
+        state.merge(new_report_data)
+        merged_data = state.to_report_data(new_report_data)
 
-                content_lines.append("")
-
-        # 写入失败信息
-        if merged_data["failed_ids"]:
-            content_lines.append("==== 以下ID请求失败 ====")
-            content_lines.append(", ".join(merged_data["failed_ids"]))
-
-        # 写入文件
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(content_lines))
+        self._write_text_report(file_path, merged_data, mode)
 
         print(f"✓ 汇总文件已更新: {file_path.name}")
         return file_path
@@ -985,7 +1111,8 @@ class NewsReporter:
         failed_ids: Optional[List[str]] = None,
         new_news_list: Optional[List[News]] = None,
         mode: str = "daily",
-        is_daily_summary: bool = False
+        is_daily_summary: bool = False,
+        report_data: Optional[Dict[str, Any]] = None
     ) -> Path:
         """生成邮件专用的 HTML 报告（服务器端渲染，无 JS 依赖）
 
@@ -996,6 +1123,7 @@ class NewsReporter:
             new_news_list: 新增新闻列表
             mode: 模式
             is_daily_summary: 是否为当日汇总
+            report_data: 已准备好的报告数据（来自 ReportContext，提供时不再重新准备）
 
         Returns:
             Path: 生成的文件路径
@@ -1014,7 +1142,8 @@ class NewsReporter:
         file_path = self.get_output_path("html", filename)
 
         # 准备报告数据
-        report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
+        if report_data is None:
+            report_data = self.prepare_report_data(stats, failed_ids, new_news_list, mode)
 
         # 生成 HTML 内容
         html_content = self._build_email_html(report_data, total_titles, mode)
@@ -0,0 +1,281 @@
+# coding=utf-8
+"""结构化快照模块
+
+每个 txt 报告旁写入同名的 .jsonl 快照供程序读取，txt 文件只用于展示。
+相比从展示文本中反向解析，快照保留完整的排名列表、平台ID 和出现次数。
+
+快照每行一个 JSON 对象，每行对应一个区块，区块内按列存储（每个字段一个数组），
+读取时只需对少数几行做 json.loads，不必为每条标题创建中间记录:
+- meta: {"type": "meta", "version": 1, "kind": "report"|"batch", "mode": ...}
+- groups: {"type": "groups", "word": [...], "count": [...], "percentage": [...]}
+- titles: {"type": "titles", "platforms": {id: name}, "group": [...], "platform": [...],
+           "title": [...], "ranks": [[...]], "url": [...], "mobile_url": [...],
+           "count": [...], "time_display": [...], "is_new": [...]}
+- new: {"type": "new", "platforms": {id: name}, "platform": [...], "title": [...],
+        "ranks": [[...]], "url": [...], "mobile_url": [...]}
+- failed: {"type": "failed", "ids": [...]}
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.file import clean_title
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".jsonl"
+
+TITLE_COLUMNS = (
+    "group", "platform", "title", "ranks", "url", "mobile_url",
+    "count", "time_display", "is_new",
+)
+NEW_TITLE_COLUMNS = ("platform", "title", "ranks", "url", "mobile_url")
+
+
+def snapshot_path(txt_path: Path) -> Path:
+    """获取 txt 报告对应的快照路径
+
+    Args:
+        txt_path: txt 文件路径
+
+    Returns:
+        Path: 同目录同名的 .jsonl 文件路径
+    """
+    return Path(txt_path).with_suffix(SNAPSHOT_SUFFIX)
+
+
+def find_snapshot(txt_path: Path) -> Optional[Path]:
+    """查找 txt 报告对应的快照文件
+
+    Args:
+        txt_path: txt 文件路径
+
+    Returns:
+        Optional[Path]: 快照存在时返回其路径，否则返回 None
+    """
+    path = snapshot_path(txt_path)
+    return path if path.exists() else None
+
+
+def write_snapshot(path: Path, blocks: List[Dict[str, Any]]) -> Path:
+    """原子写入快照文件
+
+    Args:
+        path: 快照文件路径
+        blocks: 区块列表（每个区块写为一行）
+
+    Returns:
+        Path: 快照文件路径
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=SNAPSHOT_SUFFIX)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for block in blocks:
+                f.write(json.dumps(block, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return path
+
+
+def _empty_block(block_type: str, columns: Tuple[str, ...]) -> Dict[str, Any]:
+    """创建空的按列区块"""
+    block = {"type": block_type, "platforms": {}}
+    for column in columns:
+        block[column] = []
+    return block
+
+
+def build_report_blocks(report_data: Dict[str, Any], mode: str) -> List[Dict[str, Any]]:
+    """将报告数据转换为快照区块
+
+    Args:
+        report_data: NewsReporter.prepare_report_data 返回的数据
+        mode: 运行模式
+
+    Returns:
+        List[Dict]: 快照区块列表
+    """
+    groups = {"type": "groups", "word": [], "count": [], "percentage": []}
+    titles = _empty_block("titles", TITLE_COLUMNS)
+
+    for stat in report_data.get("stats", []):
+        groups["word"].append(stat["word"])
+        groups["count"].append(stat["count"])
+        groups["percentage"].append(stat.get("percentage", 0))
+
+        for title_data in stat["titles"]:
+            platform = title_data.get("platform", "")
+            titles["platforms"].setdefault(platform, title_data.get("source_name", ""))
+            titles["group"].append(stat["word"])
+            titles["platform"].append(platform)
+            titles["title"].append(title_data["title"])
+            titles["ranks"].append(list(title_data.get("ranks", [])))
+            titles["url"].append(title_data.get("url", ""))
+            titles["mobile_url"].append(title_data.get("mobile_url", ""))
+            titles["count"].append(title_data.get("count", 1))
+            titles["time_display"].append(title_data.get("time_display", ""))
+            titles["is_new"].append(title_data.get("is_new", False))
+
+    new_titles = _empty_block("new", NEW_TITLE_COLUMNS)
+    for source_data in report_data.get("new_titles", []):
+        for title_data in source_data["titles"]:
+            platform = title_data.get("platform", "")
+            new_titles["platforms"].setdefault(platform, title_data.get("source_name", ""))
+            new_titles["platform"].append(platform)
+            new_titles["title"].append(title_data["title"])
+            new_titles["ranks"].append(list(title_data.get("ranks", [])))
+            new_titles["url"].append(title_data.get("url", ""))
+            new_titles["mobile_url"].append(title_data.get("mobile_url", ""))
+
+    return [
+        {"type": "meta", "version": SNAPSHOT_VERSION, "kind": "report", "mode": mode},
+        groups,
+        titles,
+        new_titles,
+        {"type": "failed", "ids": list(report_data.get("failed_ids", []))},
+    ]
+
+
+def build_batch_blocks(
+    results: Dict[str, Dict],
+    id_to_name: Dict[str, str],
+    failed_ids: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """将一次爬取的结果转换为快照区块
+
+    Args:
+        results: {platform_id: {title: {ranks, url, mobileUrl}}}（值也可以是排名列表）
+        id_to_name: {platform_id: platform_name}
+        failed_ids: 请求失败的平台ID
+
+    Returns:
+        List[Dict]: 快照区块列表
+    """
+    titles = _empty_block("titles", NEW_TITLE_COLUMNS)
+
+    for platform_id, title_data in results.items():
+        titles["platforms"][platform_id] = id_to_name.get(platform_id) or platform_id
+        for title, info in title_data.items():
+            if isinstance(info, dict):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
+            else:
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
+            titles["platform"].append(platform_id)
+            titles["title"].append(clean_title(str(title)))
+            titles["ranks"].append(list(ranks))
+            titles["url"].append(url)
+            titles["mobile_url"].append(mobile_url)
+
+    return [
+        {"type": "meta", "version": SNAPSHOT_VERSION, "kind": "batch"},
+        titles,
+        {"type": "failed", "ids": list(failed_ids or [])},
+    ]
+
+
+def iter_blocks(path: Path) -> Iterator[Dict[str, Any]]:
+    """逐个读取快照区块
+
+    Args:
+        path: 快照文件路径
+
+    Yields:
+        Dict: 快照区块
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_platform_titles(path: Path) -> Tuple[Dict, Dict]:
+    """按平台读取快照中的标题
+
+    Args:
+        path: 快照文件路径
+
+    Returns:
+        Tuple[Dict, Dict]: (titles_by_id, id_to_name)，
+            结构与 NewsRanking.parse_file_titles 一致
+    """
+    titles_by_id = {}
+    id_to_name = {}
+
+    for block in iter_blocks(path):
+        if block.get("type") != "titles":
+            continue
+
+        for platform_id, name in block["platforms"].items():
+            id_to_name[platform_id] = name or platform_id
+
+        for platform_id, title, ranks, url, mobile_url in zip(
+            block["platform"], block["title"], block["ranks"],
+            block["url"], block["mobile_url"]
+        ):
+            platform_titles = titles_by_id.get(platform_id)
+            if platform_titles is None:
+                platform_titles = titles_by_id[platform_id] = {}
+            platform_titles[title] = {"ranks": ranks, "url": url, "mobileUrl": mobile_url}
+
+    return titles_by_id, id_to_name
+
+
+def load_report_summary(path: Path) -> Dict[str, Any]:
+    """按词组读取快照中的标题
+
+    Args:
+        path: 快照文件路径
+
+    Returns:
+        Dict: {"stats": {word_group: {title: title_data}}, "failed_ids": [...]}，
+            结构与 NewsReporter._parse_existing_summary 一致（另含 platform 字段）
+    """
+    stats = {}
+    failed_ids = []
+
+    for block in iter_blocks(path):
+        block_type = block.get("type")
+
+        if block_type == "groups":
+            for word in block["word"]:
+                stats.setdefault(word, {})
+        elif block_type == "titles":
+            names = block["platforms"]
+            for group, platform_id, title, ranks, url, mobile_url, count, time_display in zip(
+                block["group"], block["platform"], block["title"], block["ranks"],
+                block["url"], block["mobile_url"], block["count"], block["time_display"]
+            ):
+                group_titles = stats.setdefault(group, {})
+                if title not in group_titles:
+                    group_titles[title] = {
+                        "platform": platform_id,
+                        "platform_name": names.get(platform_id, ""),
+                        "url": url,
+                        "mobile_url": mobile_url,
+                        "ranks": ranks,
+                        "count": count,
+                        "time_display": time_display,
+                    }
+        elif block_type == "failed":
+            failed_ids = block["ids"]
+
+    return {
+        "stats": stats,
+        "failed_ids": failed_ids,
+    }
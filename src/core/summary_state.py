@@ -0,0 +1,333 @@
+# coding=utf-8
+"""当日汇总合并状态模块
+
+以 SQLite 文件持久化当日汇总的词组/标题合并结果（按 (词组, 标题) 为键），
+每次运行只更新本批次涉及的标题（O(本批次标题数)），当日汇总.txt 直接由该状态渲染，
+不再需要解析上一次的汇总文本再整体合并。
+
+合并语义与 NewsReporter._merge_report_data 一致：
+- 本批次的词组和标题排在前面，历史标题保持原有相对顺序
+- 重复标题累加出现次数、合并去重排名，保留已有的时间信息
+- 失败ID取并集
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict
+
+
+class SummaryState:
+    """当日汇总合并状态
+
+    负责：
+    - 将本批次报告数据合并到持久化状态
+    - 从已有的汇总文件导入初始状态（兼容旧数据）
+    - 导出用于渲染的完整报告数据
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS groups (
+            word TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS titles (
+            word TEXT NOT NULL,
+            title TEXT NOT NULL,
+            platform TEXT NOT NULL DEFAULT '',
+            platform_name TEXT NOT NULL DEFAULT '',
+            url TEXT NOT NULL DEFAULT '',
+            mobile_url TEXT NOT NULL DEFAULT '',
+            ranks TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            time_display TEXT NOT NULL DEFAULT '',
+            is_new INTEGER NOT NULL DEFAULT 0,
+            batch INTEGER NOT NULL DEFAULT 0,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (word, title)
+        );
+        CREATE TABLE IF NOT EXISTS failed_ids (
+            platform_id TEXT PRIMARY KEY,
+            position INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, state_path: Path, rank_threshold: int = 10):
+        """初始化状态
+
+        Args:
+            state_path: 状态文件路径
+            rank_threshold: 排名阈值（写入渲染数据）
+        """
+        self.state_path = Path(state_path)
+        self.rank_threshold = rank_threshold
+
+    @classmethod
+    def for_summary(cls, summary_path: Path, rank_threshold: int = 10) -> "SummaryState":
+        """获取汇总文件对应的状态（同目录的 <文件名>.state.db）
+
+        Args:
+            summary_path: 汇总文件路径
+            rank_threshold: 排名阈值
+
+        Returns:
+            SummaryState: 状态实例
+        """
+        summary_path = Path(summary_path)
+        return cls(summary_path.with_name(f"{summary_path.stem}.state.db"), rank_threshold)
+
+    def exists(self) -> bool:
+        """状态文件是否存在
+
+        Returns:
+            bool: 是否存在
+        """
+        return self.state_path.exists()
+
+    def reset(self) -> None:
+        """清空状态"""
+        if self.state_path.exists():
+            self.state_path.unlink()
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接（必要时创建表结构）
+
+        Returns:
+            sqlite3.Connection: 数据库连接
+        """
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.state_path, timeout=30)
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    def _next_value(self, conn: sqlite3.Connection, key: str, step: int) -> int:
+        """读取并推进计数器
+
+        Args:
+            conn: 数据库连接
+            key: 计数器名称
+            step: 推进步长（可为负数）
+
+        Returns:
+            int: 推进前的值
+        """
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        value = row[0] if row else 0
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value + step)
+        )
+        return value
+
+    def seed(self, existing_data: Dict[str, Any]) -> None:
+        """从已解析的汇总数据导入初始状态
+
+        Args:
+            existing_data: NewsReporter._parse_existing_summary 返回的数据
+        """
+        stats = existing_data.get("stats", {})
+        conn = self._connect()
+        try:
+            with conn:
+                group_position = self._next_value(conn, "group_front", 0)
+                title_position = self._next_value(conn, "title_front", 0)
+
+                for word, titles in stats.items():
+                    conn.execute(
+                        "INSERT OR IGNORE INTO groups (word, position) VALUES (?, ?)",
+                        (word, group_position)
+                    )
+                    group_position += 1
+
+                    for title, data in titles.items():
+                        conn.execute(
+                            "INSERT OR IGNORE INTO titles "
+                            "(word, title, platform, platform_name, url, mobile_url, "
+                            "ranks, count, time_display, position) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                word, title,
+                                data.get("platform", ""),
+                                data.get("platform_name", ""),
+                                data.get("url", ""),
+                                data.get("mobile_url", ""),
+                                json.dumps(data.get("ranks", [])),
+                                data.get("count", 1),
+                                data.get("time_display", ""),
+                                title_position,
+                            )
+                        )
+                        title_position += 1
+
+                for position, platform_id in enumerate(existing_data.get("failed_ids", [])):
+                    conn.execute(
+                        "INSERT OR IGNORE INTO failed_ids (platform_id, position) VALUES (?, ?)",
+                        (platform_id, position)
+                    )
+                self._next_value(conn, "failed_next", len(existing_data.get("failed_ids", [])))
+        finally:
+            conn.close()
+
+    def merge(self, report_data: Dict[str, Any]) -> None:
+        """合并本批次报告数据（只读写本批次涉及的行）
+
+        Args:
+            report_data: NewsReporter.prepare_report_data 返回的数据
+        """
+        stats = report_data.get("stats", [])
+        batch_titles = sum(len(stat["titles"]) for stat in stats)
+
+        conn = self._connect()
+        try:
+            with conn:
+                batch = self._next_value(conn, "batch", 1) + 1
+
+                # 本批次的词组和标题移到最前面：分配比现有位置都小的位置
+                group_position = self._next_value(conn, "group_front", -len(stats)) - len(stats)
+                title_position = self._next_value(conn, "title_front", -batch_titles) - batch_titles
+
+                for stat in stats:
+                    word = stat["word"]
+                    conn.execute(
+                        "INSERT INTO groups (word, position) VALUES (?, ?) "
+                        "ON CONFLICT(word) DO UPDATE SET position = excluded.position",
+                        (word, group_position)
+                    )
+                    group_position += 1
+
+                    for title_data in stat["titles"]:
+                        self._merge_title(conn, word, title_data, batch, title_position)
+                        title_position += 1
+
+                for platform_id in report_data.get("failed_ids", []):
+                    exists = conn.execute(
+                        "SELECT 1 FROM failed_ids WHERE platform_id = ?", (platform_id,)
+                    ).fetchone()
+                    if not exists:
+                        conn.execute(
+                            "INSERT INTO failed_ids (platform_id, position) VALUES (?, ?)",
+                            (platform_id, self._next_value(conn, "failed_next", 1))
+                        )
+        finally:
+            conn.close()
+
+    def _merge_title(
+        self,
+        conn: sqlite3.Connection,
+        word: str,
+        title_data: Dict[str, Any],
+        batch: int,
+        position: int
+    ) -> None:
+        """合并单个标题
+
+        Args:
+            conn: 数据库连接
+            word: 词组名
+            title_data: 标题数据
+            batch: 批次序号
+            position: 排列位置
+        """
+        title = title_data["title"]
+        row = conn.execute(
+            "SELECT ranks, count, time_display FROM titles WHERE word = ? AND title = ?",
+            (word, title)
+        ).fetchone()
+
+        ranks = title_data.get("ranks", [])
+        count = title_data.get("count", 1)
+        time_display = title_data.get("time_display", "")
+
+        if row is not None:
+            existing_ranks, existing_count, existing_time_display = row
+            ranks = sorted(set(json.loads(existing_ranks) + ranks))
+            count = existing_count + 1
+            if existing_time_display:
+                time_display = existing_time_display
+
+        conn.execute(
+            "INSERT OR REPLACE INTO titles "
+            "(word, title, platform, platform_name, url, mobile_url, ranks, count, "
+            "time_display, is_new, batch, position) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                word, title,
+                title_data.get("platform", ""),
+                title_data.get("source_name", ""),
+                title_data.get("url", ""),
+                title_data.get("mobile_url", ""),
+                json.dumps(ranks),
+                count,
+                time_display,
+                1 if title_data.get("is_new") else 0,
+                batch,
+                position,
+            )
+        )
+
+    def to_report_data(self, new_report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """导出用于渲染的完整报告数据
+
+        Args:
+            new_report_data: 本批次报告数据（提供新增新闻区域）
+
+        Returns:
+            Dict: 与 NewsReporter._merge_report_data 返回结构一致的报告数据
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'batch'").fetchone()
+            current_batch = row[0] if row else 0
+
+            stats_by_word = {}
+            stats = []
+            for (word,) in conn.execute("SELECT word FROM groups ORDER BY position"):
+                stat = {"word": word, "count": 0, "percentage": 0, "titles": []}
+                stats_by_word[word] = stat
+                stats.append(stat)
+
+            rows = conn.execute(
+                "SELECT word, title, platform, platform_name, url, mobile_url, ranks, count, "
+                "time_display, is_new, batch FROM titles ORDER BY position"
+            )
+            for (word, title, platform, platform_name, url, mobile_url,
+                 ranks, count, time_display, is_new, batch) in rows:
+                stats_by_word[word]["titles"].append({
+                    "title": title,
+                    "platform": platform,
+                    "source_name": platform_name,
+                    "time_display": time_display,
+                    "count": count,
+                    "ranks": json.loads(ranks),
+                    "rank_threshold": self.rank_threshold,
+                    "url": url,
+                    "mobile_url": mobile_url,
+                    "is_new": bool(is_new) and batch == current_batch,
+                })
+
+            failed_ids = [
+                platform_id for (platform_id,) in
+                conn.execute("SELECT platform_id FROM failed_ids ORDER BY position")
+            ]
+        finally:
+            conn.close()
+
+        for stat in stats:
+            stat["count"] = len(stat["titles"])
+
+        total_count = sum(stat["count"] for stat in stats)
+        if total_count > 0:
+            for stat in stats:
+                stat["percentage"] = round(stat["count"] / total_count * 100, 2)
+
+        return {
+            "stats": stats,
+            "new_titles": new_report_data.get("new_titles", []),
+            "failed_ids": failed_ids,
+            "total_new_count": new_report_data.get("total_new_count", 0),
+        }
@@ -0,0 +1,265 @@
+# coding=utf-8
+"""当日标题索引模块
+
+以 SQLite 文件按日期持久化当天所有批次的标题聚合结果，键为 (平台ID, 标题)。
+每次运行只需追加本批次数据（O(批次标题数)），读取当日聚合结果只需扫描一次
+索引（O(标题数)），不再需要逐个重新解析当天的所有 txt 快照文件。
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class TitleIndex:
+    """当日标题索引
+
+    负责：
+    - 追加单个批次的爬取结果并合并到聚合状态
+    - 读取当日聚合结果 (all_results, id_to_name, title_info)
+    - 记录已导入的快照文件（用于从旧版 txt 快照迁移）
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS platforms (
+            platform_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS titles (
+            platform_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            first_time TEXT NOT NULL,
+            last_time TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            ranks TEXT NOT NULL,
+            url TEXT NOT NULL DEFAULT '',
+            mobile_url TEXT NOT NULL DEFAULT '',
+            PRIMARY KEY (platform_id, title)
+        );
+        CREATE TABLE IF NOT EXISTS batches (
+            batch_key TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            time_info TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, index_path: Path):
+        """初始化索引
+
+        Args:
+            index_path: 索引文件路径（如 output/2025-01-15/index/titles.db）
+        """
+        self.index_path = Path(index_path)
+
+    @classmethod
+    def for_date_dir(cls, date_dir: Path) -> "TitleIndex":
+        """获取某个日期目录对应的索引
+
+        Args:
+            date_dir: 日期目录（如 output/2025-01-15）
+
+        Returns:
+            TitleIndex: 索引实例
+        """
+        return cls(Path(date_dir) / "index" / "titles.db")
+
+    def exists(self) -> bool:
+        """索引文件是否存在
+
+        Returns:
+            bool: 是否存在
+        """
+        return self.index_path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接（必要时创建表结构）
+
+        Returns:
+            sqlite3.Connection: 数据库连接
+        """
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    def append_batch(
+        self,
+        results: Dict,
+        id_to_name: Dict,
+        time_info: str,
+        batch_key: Optional[str] = None,
+        kind: str = "crawl"
+    ) -> bool:
+        """追加一个批次并合并到聚合状态
+
+        合并规则与 NewsRanking._process_source_data 一致：
+        新标题记录首次/最后出现时间，已有标题累加出现次数并追加排名
+
+        Args:
+            results: 本批次数据 {platform_id: {title: {ranks, url, mobileUrl}}}
+            id_to_name: 平台ID到名称的映射
+            time_info: 批次时间标识
+            batch_key: 批次唯一键（重复追加同一批次会被忽略），默认使用 kind:time_info
+            kind: 批次类型 (crawl: 爬取批次, snapshot: 从 txt 快照导入)
+
+        Returns:
+            bool: 是否追加成功（重复批次返回 False）
+        """
+        if batch_key is None:
+            batch_key = f"{kind}:{time_info}"
+
+        conn = self._connect()
+        try:
+            with conn:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO batches (batch_key, kind, time_info) VALUES (?, ?, ?)",
+                    (batch_key, kind, time_info)
+                ).rowcount
+                if not inserted:
+                    return False
+
+                conn.executemany(
+                    "INSERT INTO platforms (platform_id, name) VALUES (?, ?) "
+                    "ON CONFLICT(platform_id) DO UPDATE SET name = excluded.name",
+                    [(platform_id, name) for platform_id, name in id_to_name.items()
+                     if platform_id in results]
+                )
+
+                for platform_id, title_data in results.items():
+                    self._merge_platform_titles(conn, platform_id, title_data, time_info)
+
+            return True
+        finally:
+            conn.close()
+
+    def _merge_platform_titles(
+        self,
+        conn: sqlite3.Connection,
+        platform_id: str,
+        title_data: Dict,
+        time_info: str
+    ) -> None:
+        """合并单个平台的批次标题
+
+        Args:
+            conn: 数据库连接
+            platform_id: 平台ID
+            title_data: {title: {ranks, url, mobileUrl}}
+            time_info: 批次时间标识
+        """
+        for title, data in title_data.items():
+            ranks = list(data.get("ranks", []))
+            url = data.get("url", "") or ""
+            mobile_url = data.get("mobileUrl", "") or ""
+
+            row = conn.execute(
+                "SELECT first_time, last_time, count, ranks, url, mobile_url "
+                "FROM titles WHERE platform_id = ? AND title = ?",
+                (platform_id, title)
+            ).fetchone()
+
+            if row is None:
+                conn.execute(
+                    "INSERT INTO titles "
+                    "(platform_id, title, first_time, last_time, count, ranks, url, mobile_url) "
+                    "VALUES (?, ?, ?, ?, 1, ?, ?, ?)",
+                    (platform_id, title, time_info, time_info,
+                     json.dumps(ranks), url, mobile_url)
+                )
+                continue
+
+            first_time, last_time, count, existing_ranks, existing_url, existing_mobile = row
+            merged_ranks = json.loads(existing_ranks) + ranks
+
+            conn.execute(
+                "UPDATE titles SET first_time = ?, last_time = ?, count = ?, ranks = ?, "
+                "url = ?, mobile_url = ? WHERE platform_id = ? AND title = ?",
+                (
+                    min(first_time, time_info),
+                    max(last_time, time_info),
+                    count + 1,
+                    json.dumps(merged_ranks),
+                    existing_url or url,
+                    existing_mobile or mobile_url,
+                    platform_id,
+                    title,
+                )
+            )
+
+    def load(
+        self,
+        platform_ids: Optional[Iterable[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """读取当日聚合结果
+
+        Args:
+            platform_ids: 平台ID过滤列表，None 表示所有平台
+
+        Returns:
+            Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)，
+                结构与 NewsRanking.read_all_today_titles 一致
+        """
+        if not self.exists():
+            return {}, {}, {}
+
+        allowed = set(platform_ids) if platform_ids is not None else None
+
+        all_results = {}
+        id_to_name = {}
+        title_info = {}
+
+        conn = self._connect()
+        try:
+            for platform_id, name in conn.execute("SELECT platform_id, name FROM platforms"):
+                if allowed is None or platform_id in allowed:
+                    id_to_name[platform_id] = name
+
+            rows = conn.execute(
+                "SELECT platform_id, title, first_time, last_time, count, ranks, url, mobile_url "
+                "FROM titles ORDER BY rowid"
+            )
+            for platform_id, title, first_time, last_time, count, ranks, url, mobile_url in rows:
+                if allowed is not None and platform_id not in allowed:
+                    continue
+
+                ranks = json.loads(ranks)
+                all_results.setdefault(platform_id, {})[title] = {
+                    "ranks": ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+                title_info.setdefault(platform_id, {})[title] = {
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "count": count,
+                    "ranks": ranks,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        finally:
+            conn.close()
+
+        return all_results, id_to_name, title_info
+
+    def get_batch_keys(self, kind: Optional[str] = None) -> List[str]:
+        """获取已追加的批次键
+
+        Args:
+            kind: 批次类型过滤，None 表示所有类型
+
+        Returns:
+            List[str]: 批次键列表
+        """
+        if not self.exists():
+            return []
+
+        conn = self._connect()
+        try:
+            if kind is None:
+                rows = conn.execute("SELECT batch_key FROM batches")
+            else:
+                rows = conn.execute("SELECT batch_key FROM batches WHERE kind = ?", (kind,))
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
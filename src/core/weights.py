@@ -0,0 +1,139 @@
+# coding=utf-8
+"""批量权重计算模块
+
+将所有标题的排名展开为扁平数组，用 NumPy 一次性计算排名、频次、热度三项权重，
+并按 (-权重, 最高排名, -出现次数) 排序，支持只取每个词组的前 K 条。
+计算公式与 NewsRanking._calculate_weight 逐项一致，结果完全相同。
+"""
+
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TitleScores:
+    """一批标题的权重和排序键
+
+    负责：
+    - 批量计算权重（无法向量化时返回 None，由调用方回退到逐条计算）
+    - 对任意区间的标题排序或选出前 K 条
+    """
+
+    def __init__(self, weights, min_ranks, counts):
+        """初始化
+
+        Args:
+            weights: 权重数组
+            min_ranks: 最高排名数组（无排名时为 999）
+            counts: 出现次数数组
+        """
+        self.weights = weights
+        self.min_ranks = min_ranks
+        self.counts = counts
+
+    @classmethod
+    def compute(
+        cls,
+        items: Sequence[Dict],
+        rank_threshold: int,
+        rank_weight: float,
+        frequency_weight: float,
+        hotness_weight: float
+    ) -> Optional["TitleScores"]:
+        """批量计算权重
+
+        Args:
+            items: 标题数据列表（每项都包含 ranks 和 count 字段）
+            rank_threshold: 排名阈值
+            rank_weight: 排名权重系数
+            frequency_weight: 频次权重系数
+            hotness_weight: 热度权重系数
+
+        Returns:
+            Optional[TitleScores]: 计算结果，未安装 NumPy 或排名不全是整数（int）时返回 None
+        """
+        if not NUMPY_AVAILABLE:
+            return None
+
+        ranks_list = list(map(itemgetter("ranks"), items))
+        lengths = np.fromiter(map(len, ranks_list), dtype=np.int64, count=len(items))
+        counts = np.fromiter(map(itemgetter("count"), items), dtype=np.int64, count=len(items))
+
+        # 排名应为整数（来自榜单位置）；np.fromiter 会把 1.5、"3" 静默转换为整数，
+        # 因此先检查类型，其他类型交给逐条计算
+        if not all(type(rank) is int for rank in chain.from_iterable(ranks_list)):
+            return None
+        flat_ranks = np.fromiter(
+            chain.from_iterable(ranks_list), dtype=np.int64, count=int(lengths.sum())
+        )
+
+        weights = np.zeros(len(items), dtype=np.float64)
+        min_ranks = np.full(len(items), 999, dtype=np.int64)
+
+        has_ranks = lengths > 0
+        if flat_ranks.size:
+            # reduceat 需要每段起始位置，空排名的标题不参与计算
+            starts = (np.cumsum(lengths) - lengths)[has_ranks]
+            lengths_nonempty = lengths[has_ranks]
+
+            # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+            rank_scores = np.add.reduceat(11 - np.minimum(flat_ranks, 10), starts)
+            rank_weight_value = rank_scores / lengths_nonempty
+
+            # 频次权重：min(出现次数, 10) × 10
+            frequency_weight_value = np.minimum(counts[has_ranks], 10) * 10
+
+            # 热度加成：高排名次数 / 总出现次数 × 100
+            high_rank_count = np.add.reduceat(
+                (flat_ranks <= rank_threshold).astype(np.int64), starts
+            )
+            hotness_weight_value = (high_rank_count / lengths_nonempty) * 100
+
+            weights[has_ranks] = (
+                rank_weight_value * rank_weight
+                + frequency_weight_value * frequency_weight
+                + hotness_weight_value * hotness_weight
+            )
+            min_ranks[has_ranks] = np.minimum.reduceat(flat_ranks, starts)
+
+        return cls(weights, min_ranks, counts)
+
+    def order(self, start: int, end: int, top_k: Optional[int] = None) -> List[int]:
+        """对区间 [start, end) 内的标题排序
+
+        排序键为 (-权重, 最高排名, -出现次数)，相同键保持原有顺序
+
+        Args:
+            start: 区间起始下标
+            end: 区间结束下标
+            top_k: 只返回前 K 条（通过部分选择，避免全量排序）
+
+        Returns:
+            List[int]: 排序后的标题下标（全局下标）
+        """
+        neg_weights = -self.weights[start:end]
+        min_ranks = self.min_ranks[start:end]
+        neg_counts = -self.counts[start:end]
+        candidates = np.arange(end - start)
+
+        if top_k is not None and top_k < end - start:
+            if top_k <= 0:
+                return []
+            # 先按权重选出可能进入前 K 的候选（包含与第 K 名权重相同的全部标题）
+            threshold = np.partition(neg_weights, top_k - 1)[top_k - 1]
+            candidates = np.flatnonzero(neg_weights <= threshold)
+
+        local_order = candidates[np.lexsort((
+            neg_counts[candidates], min_ranks[candidates], neg_weights[candidates]
+        ))]
+
+        if top_k is not None:
+            local_order = local_order[:top_k]
+
+        return (local_order + start).tolist()
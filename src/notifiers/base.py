@@ -1,8 +1,16 @@
 # coding=utf-8
 """通知发送基类"""
 
+import asyncio
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from src.notifiers.render_cache import RenderCache
+from src.notifiers.transport import NotifierTransport
 
 
 class BaseNotifier(ABC):
@@ -11,13 +19,25 @@ class BaseNotifier(ABC):
     所有通知渠道的基类，定义统一的接口
     """
 
-    def __init__(self, config: Dict):
+    # 消息格式（分批发送的渠道设置，如 "dingtalk"）
+    batch_format: Optional[str] = None
+    # 批次大小配置项及默认值
+    batch_size_key: Optional[str] = None
+    default_batch_size: int = 4000
+
+    def __init__(self, config: Dict, transport: Optional[NotifierTransport] = None):
         """初始化通知器
 
         Args:
             config: 配置字典
+            transport: 共享的 HTTP 传输层（未提供时创建独立的传输层）
         """
         self.config = config
+        self.transport = transport or NotifierTransport.from_config(config)
+        # 事件循环 -> 本渠道的并发信号量（asyncio 原语不能跨事件循环使用）
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.BoundedSemaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     @property
     @abstractmethod
@@ -45,7 +65,8 @@ class BaseNotifier(ABC):
         report_type: str,
         update_info: Optional[Dict] = None,
         proxy_url: Optional[str] = None,
-        mode: str = "daily"
+        mode: str = "daily",
+        batches: Optional[List[str]] = None
     ) -> bool:
         """发送通知
 
@@ -55,21 +76,283 @@ class BaseNotifier(ABC):
             update_info: 更新信息
             proxy_url: 代理URL
             mode: 模式 (daily/current/incremental)
+            batches: 预先渲染的消息批次（未提供时由 render_batches 渲染）
 
         Returns:
             bool: 是否发送成功
         """
         pass
 
-    def _get_proxy(self, proxy_url: Optional[str] = None) -> Optional[Dict]:
-        """获取代理配置
+    def close(self) -> None:
+        """释放通知器自身持有的资源（共享的传输层由通知管理器关闭）"""
+        pass
+
+    def get_batch_size(self) -> int:
+        """获取每批次最大字节数
+
+        Returns:
+            int: 批次大小
+        """
+        if self.batch_size_key is None:
+            return self.default_batch_size
+        return self.config.get(self.batch_size_key, self.default_batch_size)
+
+    def render_batches(
+        self,
+        report_data: Dict,
+        update_info: Optional[Dict] = None,
+        mode: str = "daily",
+        cache: Optional[RenderCache] = None
+    ) -> List[str]:
+        """渲染消息批次
 
         Args:
-            proxy_url: 代理URL
+            report_data: 报告数据
+            update_info: 更新信息
+            mode: 模式
+            cache: 本次推送共享的渲染缓存（须为同一份报告数据创建）
 
         Returns:
-            Optional[Dict]: 代理字典
+            List[str]: 批次内容列表
+        """
+        if cache is None:
+            cache = RenderCache(report_data, self.config.get("RANK_THRESHOLD", 10))
+        return cache.get_batches(self.batch_format, update_info, self.get_batch_size(), mode)
+
+    def batch_context(self, report_data: Dict) -> Dict:
+        """提取发送单个批次时需要的报告信息（随批次一起持久化到发送队列）
+
+        Args:
+            report_data: 报告数据
+
+        Returns:
+            Dict: 批次上下文
+        """
+        return {}
+
+    def build_batch_request(
+        self,
+        content: str,
+        report_type: str,
+        index: int,
+        total: int,
+        context: Optional[Dict] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """构建单个批次的请求（同步与异步发送共用，分批渠道重写此方法）
+
+        Args:
+            content: 批次内容
+            report_type: 报告类型
+            index: 批次序号（从 1 开始）
+            total: 批次总数
+            context: 批次上下文（见 batch_context）
+
+        Returns:
+            Optional[Tuple[str, Dict]]: (请求地址, headers/json/data 等请求参数)，
+                不支持分批发送的渠道返回 None
         """
-        if proxy_url:
-            return {"http": proxy_url, "https": proxy_url}
         return None
+
+    def check_batch_response(self, response: Any, report_type: str, index: int, total: int) -> bool:
+        """检查单个批次的响应
+
+        Args:
+            response: 响应对象
+            report_type: 报告类型
+            index: 批次序号
+            total: 批次总数
+
+        Returns:
+            bool: 是否发送成功
+        """
+        if response.status_code == 200:
+            print(f"{self.name}第 {index}/{total} 批次发送成功 [{report_type}]")
+            return True
+        print(f"{self.name}第 {index}/{total} 批次发送失败: HTTP {response.status_code} [{report_type}]")
+        return False
+
+    def _report_batch_error(self, error: Exception, report_type: str, index: int, total: int) -> None:
+        """打印批次发送异常
+
+        Args:
+            error: 异常
+            report_type: 报告类型
+            index: 批次序号
+            total: 批次总数
+        """
+        if isinstance(error, requests.exceptions.Timeout):
+            print(f"{self.name}第 {index}/{total} 批次发送超时 [{report_type}]")
+        else:
+            print(f"{self.name}第 {index}/{total} 批次发送出错: {error} [{report_type}]")
+
+    def send_batch(
+        self,
+        content: str,
+        report_type: str,
+        index: int,
+        total: int,
+        proxy_url: Optional[str] = None,
+        context: Optional[Dict] = None
+    ) -> bool:
+        """发送单个批次
+
+        Args:
+            content: 批次内容
+            report_type: 报告类型
+            index: 批次序号（从 1 开始）
+            total: 批次总数
+            proxy_url: 代理URL
+            context: 批次上下文（见 batch_context）
+
+        Returns:
+            bool: 是否发送成功
+        """
+        batch_request = self.build_batch_request(content, report_type, index, total, context)
+        if batch_request is None:
+            print(f"{self.name} 不支持分批发送，跳过第 {index}/{total} 批次 [{report_type}]")
+            return False
+
+        url, request = batch_request
+        try:
+            response = self.transport.post(url, proxy_url=proxy_url, timeout=30, **request)
+            return self.check_batch_response(response, report_type, index, total)
+        except Exception as e:
+            self._report_batch_error(e, report_type, index, total)
+            return False
+
+    async def asend_batch(
+        self,
+        content: str,
+        report_type: str,
+        index: int,
+        total: int,
+        proxy_url: Optional[str] = None,
+        context: Optional[Dict] = None
+    ) -> bool:
+        """异步发送单个批次（参数同 send_batch）
+
+        Returns:
+            bool: 是否发送成功
+        """
+        batch_request = self.build_batch_request(content, report_type, index, total, context)
+        if batch_request is None:
+            print(f"{self.name} 不支持分批发送，跳过第 {index}/{total} 批次 [{report_type}]")
+            return False
+
+        url, request = batch_request
+        try:
+            response = await self.transport.apost(url, proxy_url=proxy_url, timeout=30, **request)
+            return self.check_batch_response(response, report_type, index, total)
+        except Exception as e:
+            self._report_batch_error(e, report_type, index, total)
+            return False
+
+    def send_batches(
+        self,
+        batches: List[str],
+        report_type: str,
+        proxy_url: Optional[str] = None,
+        context: Optional[Dict] = None
+    ) -> bool:
+        """逐批发送，成功的批次之间按 BATCH_SEND_INTERVAL 间隔
+
+        Args:
+            batches: 批次内容列表
+            report_type: 报告类型
+            proxy_url: 代理URL
+            context: 批次上下文
+
+        Returns:
+            bool: 是否全部发送成功
+        """
+        print(f"{self.name}消息分为 {len(batches)} 批次发送 [{report_type}]")
+
+        all_success = True
+        for i, batch_content in enumerate(batches, 1):
+            batch_size = len(batch_content.encode("utf-8"))
+            print(f"发送{self.name}第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]")
+
+            if self.send_batch(batch_content, report_type, i, len(batches), proxy_url, context):
+                if i < len(batches):
+                    time.sleep(self.config.get("BATCH_SEND_INTERVAL", 1))
+            else:
+                all_success = False
+
+        return all_success
+
+    def _get_semaphore(self) -> asyncio.BoundedSemaphore:
+        """获取当前事件循环中本渠道的并发信号量
+
+        Returns:
+            asyncio.BoundedSemaphore: 信号量（许可数为 NOTIFICATION_CHANNEL_CONCURRENCY）
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.BoundedSemaphore(
+                self.config.get("NOTIFICATION_CHANNEL_CONCURRENCY", 1)
+            )
+        return semaphore
+
+    async def asend_batches(
+        self,
+        batches: List[str],
+        report_type: str,
+        proxy_url: Optional[str] = None,
+        context: Optional[Dict] = None
+    ) -> bool:
+        """异步逐批发送（参数同 send_batches）
+
+        批次间隔使用 asyncio.sleep，不占用线程；同一渠道同时进行的推送数
+        受信号量限制，超出的推送排队等待
+
+        Returns:
+            bool: 是否全部发送成功
+        """
+        async with self._get_semaphore():
+            print(f"{self.name}消息分为 {len(batches)} 批次发送 [{report_type}]")
+
+            all_success = True
+            for i, batch_content in enumerate(batches, 1):
+                batch_size = len(batch_content.encode("utf-8"))
+                print(f"发送{self.name}第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]")
+
+                if await self.asend_batch(batch_content, report_type, i, len(batches), proxy_url, context):
+                    if i < len(batches):
+                        await asyncio.sleep(self.config.get("BATCH_SEND_INTERVAL", 1))
+                else:
+                    all_success = False
+
+            return all_success
+
+    async def asend(
+        self,
+        report_data: Dict,
+        report_type: str,
+        update_info: Optional[Dict] = None,
+        proxy_url: Optional[str] = None,
+        mode: str = "daily",
+        batches: Optional[List[str]] = None
+    ) -> bool:
+        """异步发送通知（参数同 send）
+
+        分批渠道直接异步发送；其他渠道在线程中执行同步的 send
+
+        Returns:
+            bool: 是否发送成功
+        """
+        if self.batch_format is None:
+            return await asyncio.to_thread(
+                self.send, report_data, report_type, update_info, proxy_url, mode
+            )
+
+        if not self.is_configured():
+            print(f"{self.name} 未配置，跳过发送")
+            return False
+
+        if batches is None:
+            batches = self.render_batches(report_data, update_info, mode)
+
+        return await self.asend_batches(
+            batches, report_type, proxy_url, self.batch_context(report_data)
+        )
@@ -1,24 +1,144 @@
 # coding=utf-8
 """消息分批发送工具"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.core.reporter import NewsReporter
+from src.utils.file import html_escape
 from src.utils.time import get_beijing_time
 
 
+def _byte_len(text: str) -> int:
+    """UTF-8 编码后的字节数"""
+    return len(text.encode("utf-8"))
+
+
+class _BatchAccumulator:
+    """按字节数累积批次内容
+
+    逐段记录字节数（每段只编码一次），批次内容用列表收集、最后一次性拼接，
+    总耗时与内容长度成线性关系
+    """
+
+    def __init__(self, header: str, footer: str, max_bytes: int):
+        """初始化
+
+        Args:
+            header: 每个批次的开头
+            footer: 每个批次的结尾
+            max_bytes: 批次正文（不含页脚）的字节上限
+        """
+        self.header = header
+        self.header_bytes = _byte_len(header)
+        self.footer = footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self._parts = [header]
+        self._bytes = self.header_bytes
+
+    @property
+    def has_content(self) -> bool:
+        """当前批次是否有标题以外的内容"""
+        return len(self._parts) > 1
+
+    def _fits(self, size: int) -> bool:
+        return self._bytes + size <= self.max_bytes
+
+    def _add(self, text: str, size: int) -> None:
+        self._parts.append(text)
+        self._bytes += size
+
+    def flush(self) -> None:
+        """结束当前批次（没有内容时不产生批次）"""
+        if self.has_content:
+            self.batches.append("".join(self._parts) + self.footer)
+        self._parts = [self.header]
+        self._bytes = self.header_bytes
+
+    def add_section(
+        self,
+        heading: str,
+        lines: List[str],
+        trailer: str = "",
+        continued_heading: Optional[str] = None
+    ) -> None:
+        """添加一个段落
+
+        段落放不进当前批次时换到新批次；单个段落超过批次上限时按行拆分，
+        每个拆分部分以 continued_heading 开头（单行本身超长时仍整行发送）
+
+        Args:
+            heading: 段落标题
+            lines: 段落内容行
+            trailer: 段落结尾
+            continued_heading: 拆分后续部分的标题（默认与 heading 相同）
+        """
+        heading_size = _byte_len(heading)
+        line_sizes = [_byte_len(line) for line in lines]
+        trailer_size = _byte_len(trailer)
+        total_size = heading_size + sum(line_sizes) + trailer_size
+
+        if not self._fits(total_size) and self.has_content:
+            self.flush()
+
+        if self._fits(total_size) or not lines:
+            self._add(heading + "".join(lines) + trailer, total_size)
+            return
+
+        # 段落超过批次上限，按行拆分
+        if continued_heading is None:
+            continued_heading = heading
+        continued_size = _byte_len(continued_heading)
+
+        self._add(heading, heading_size)
+        chunk_lines = 0
+        for line, size in zip(lines, line_sizes):
+            if chunk_lines and not self._fits(size + trailer_size):
+                self._add(trailer, trailer_size)
+                self.flush()
+                self._add(continued_heading, continued_size)
+                chunk_lines = 0
+            self._add(line, size)
+            chunk_lines += 1
+        self._add(trailer, trailer_size)
+
+
 class BatchSender:
     """消息分批发送器
 
     负责将长消息分批，避免超过平台限制
     """
 
-    def __init__(self, reporter: NewsReporter):
+    def __init__(self, reporter: NewsReporter, memoize: bool = False):
         """初始化分批发送器
 
         Args:
             reporter: 报告生成器
+            memoize: 是否按格式缓存已格式化的标题行（同一份报告数据按不同批次大小多次分批时使用）
         """
         self.reporter = reporter
+        self.memoize = memoize
+        # (格式, 段落对象 id) -> (段落对象, 格式化结果)，保留段落对象引用以免 id 被复用
+        self._line_cache: Dict[Tuple[str, int], Tuple[object, object]] = {}
+
+    def _memoized(self, platform: str, section: object, build):
+        """按格式缓存段落的格式化结果
+
+        Args:
+            platform: 平台类型
+            section: 段落数据（词组统计或新增新闻列表）
+            build: 无缓存时调用的构建函数
+
+        Returns:
+            构建结果
+        """
+        if not self.memoize:
+            return build()
+
+        key = (platform, id(section))
+        cached = self._line_cache.get(key)
+        if cached is None:
+            cached = self._line_cache[key] = (section, build())
+        return cached[1]
 
     def split_content_into_batches(
         self,
@@ -40,59 +160,48 @@ class BatchSender:
         Returns:
             List[str]: 批次内容列表
         """
-        batches = []
-        current_batch = ""
-
         # 构建基础页脚
         base_footer = self._build_footer(update_info, platform, mode)
-        footer_size = len(base_footer.encode("utf-8"))
+        footer_size = _byte_len(base_footer)
 
         # 留出安全余量
         safe_max_bytes = max_bytes - footer_size - 500
 
-        # 添加标题
+        # 每个批次以标题开头
         header = self._build_header(report_data, platform)
-        current_batch += header
+        accumulator = _BatchAccumulator(header, base_footer, safe_max_bytes)
 
-        # 处理词组统计
+        # 处理词组统计（超长词组在词组内部按标题拆分）
         for stat in report_data["stats"]:
             if stat["count"] <= 0:
                 continue
 
-            stat_content = self._build_stat_section(stat, platform)
-            stat_size = len(stat_content.encode("utf-8"))
-            current_size = len(current_batch.encode("utf-8"))
-
-            # 检查是否需要新批次
-            if current_size + stat_size > safe_max_bytes and current_batch.strip():
-                batches.append(current_batch + base_footer)
-                current_batch = header
-
-            current_batch += stat_content
+            accumulator.add_section(
+                self._build_stat_heading(stat, platform),
+                self._build_stat_lines(stat, platform),
+                trailer="\n",
+                continued_heading=self._build_stat_heading(stat, platform, continued=True),
+            )
 
         # 处理新增新闻
         if report_data.get("new_titles"):
-            new_section = self._build_new_titles_section(report_data["new_titles"], platform)
-            new_size = len(new_section.encode("utf-8"))
-            current_size = len(current_batch.encode("utf-8"))
+            heading, lines = self._build_new_titles_parts(report_data["new_titles"], platform)
+            accumulator.add_section(heading, lines)
 
-            if current_size + new_size > safe_max_bytes and current_batch.strip():
-                batches.append(current_batch + base_footer)
-                current_batch = header
-
-            current_batch += new_section
+        # 处理已消失新闻（增量推送）
+        if report_data.get("disappeared"):
+            heading, lines = self._build_disappeared_parts(report_data["disappeared"], platform)
+            accumulator.add_section(heading, lines)
 
         # 添加失败信息
         if report_data.get("failed_ids"):
             failed_section = self._build_failed_section(report_data["failed_ids"], platform)
-            current_batch += failed_section
+            accumulator.add_section(failed_section, [])
 
         # 添加最后一批
-        current_batch_has_content = current_batch.strip() != header.strip()
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
+        accumulator.flush()
 
-        return batches
+        return accumulator.batches
 
     def _build_header(self, report_data: Dict, platform: str) -> str:
         """构建消息头部
@@ -115,81 +224,132 @@ class BatchSender:
         else:
             return f"📊 热点词汇统计\n\n共 {total_news} 条匹配新闻\n\n"
 
-    def _build_stat_section(self, stat: Dict, platform: str) -> str:
-        """构建词组统计部分
+    def _build_stat_heading(self, stat: Dict, platform: str, continued: bool = False) -> str:
+        """构建词组标题行
 
         Args:
             stat: 统计数据
             platform: 平台类型
+            continued: 是否为拆分后的续接部分
 
         Returns:
-            str: 统计部分内容
+            str: 词组标题行
         """
-        content = ""
+        word = f"{stat['word']}（续）" if continued else stat["word"]
 
-        # 词组标题
         if platform == "feishu":
-            content += f"**{stat['word']}** (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
+            return f"**{word}** (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
         elif platform in ["dingtalk", "wework"]:
-            content += f"**{stat['word']}** (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
+            return f"**{word}** (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
         elif platform == "telegram":
-            content += f"<b>{stat['word']}</b> (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
+            return f"<b>{word}</b> (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
         else:
-            content += f"{stat['word']} (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
+            return f"{word} (共{stat['count']}条，占比{stat['percentage']}%)\n\n"
 
-        # 新闻列表
-        for title_data in stat["titles"]:
-            formatted_title = self.reporter.format_title_for_platform(
-                platform, title_data, show_source=True
-            )
-            content += f"{formatted_title}\n"
+    def _build_stat_lines(self, stat: Dict, platform: str) -> List[str]:
+        """构建词组下的新闻行
 
-        content += "\n"
-        return content
+        Args:
+            stat: 统计数据
+            platform: 平台类型
 
-    def _build_new_titles_section(self, new_titles: List[Dict], platform: str) -> str:
-        """构建新增新闻部分
+        Returns:
+            List[str]: 每条新闻一行（含换行符）
+        """
+        return self._memoized(platform, stat, lambda: [
+            self.reporter.format_title_for_platform(platform, title_data, show_source=True) + "\n"
+            for title_data in stat["titles"]
+        ])
+
+    def _build_new_titles_parts(self, new_titles: List[Dict], platform: str) -> Tuple[str, List[str]]:
+        """构建新增新闻部分的标题和可拆分的行
+
+        来源标题与该来源的第一条新闻合为一行，来源末尾的空行并入最后一条新闻，
+        拆分时不会出现孤立的来源标题
 
         Args:
             new_titles: 新增新闻列表
             platform: 平台类型
 
         Returns:
-            str: 新增部分内容
+            Tuple[str, List[str]]: (部分标题, 行列表)
         """
-        content = ""
+        return self._memoized(
+            platform, new_titles, lambda: self._render_new_titles_parts(new_titles, platform)
+        )
 
+    def _render_new_titles_parts(self, new_titles: List[Dict], platform: str) -> Tuple[str, List[str]]:
+        """格式化新增新闻部分（见 _build_new_titles_parts）"""
         if platform == "feishu":
-            content += "**🆕 最新批次新增**\n\n"
+            heading = "**🆕 最新批次新增**\n\n"
         elif platform in ["dingtalk", "wework"]:
-            content += "**🆕 最新批次新增**\n\n"
+            heading = "**🆕 最新批次新增**\n\n"
         elif platform == "telegram":
-            content += "<b>🆕 最新批次新增</b>\n\n"
+            heading = "<b>🆕 最新批次新增</b>\n\n"
         else:
-            content += "🆕 最新批次新增\n\n"
+            heading = "🆕 最新批次新增\n\n"
 
+        lines = []
         for source_data in new_titles:
             source_name = source_data["source_name"]
             titles_count = len(source_data["titles"])
 
             if platform == "feishu":
-                content += f"**{source_name}** (新增{titles_count}条)\n\n"
+                source_heading = f"**{source_name}** (新增{titles_count}条)\n\n"
             elif platform in ["dingtalk", "wework"]:
-                content += f"**{source_name}** (新增{titles_count}条)\n\n"
+                source_heading = f"**{source_name}** (新增{titles_count}条)\n\n"
             elif platform == "telegram":
-                content += f"<b>{source_name}</b> (新增{titles_count}条)\n\n"
+                source_heading = f"<b>{source_name}</b> (新增{titles_count}条)\n\n"
             else:
-                content += f"{source_name} (新增{titles_count}条)\n\n"
+                source_heading = f"{source_name} (新增{titles_count}条)\n\n"
 
-            for title_data in source_data["titles"]:
-                formatted_title = self.reporter.format_title_for_platform(
+            source_lines = [
+                self.reporter.format_title_for_platform(
                     platform, title_data, show_source=False
-                )
-                content += f"{formatted_title}\n"
+                ) + "\n"
+                for title_data in source_data["titles"]
+            ]
+            if not source_lines:
+                source_lines = [""]
+            source_lines[0] = source_heading + source_lines[0]
+            source_lines[-1] += "\n"
+            lines.extend(source_lines)
 
-            content += "\n"
+        return heading, lines
 
-        return content
+    def _build_disappeared_parts(self, disappeared: List[Dict], platform: str) -> Tuple[str, List[str]]:
+        """构建已消失新闻部分的标题和可拆分的行
+
+        Args:
+            disappeared: 已推送但本次不再出现的新闻 [{source_name, title, rank}]
+            platform: 平台类型
+
+        Returns:
+            Tuple[str, List[str]]: (部分标题, 行列表)
+        """
+        if platform == "feishu":
+            heading = "**📉 已不在榜单**\n\n"
+        elif platform in ["dingtalk", "wework"]:
+            heading = "**📉 已不在榜单**\n\n"
+        elif platform == "telegram":
+            heading = "<b>📉 已不在榜单</b>\n\n"
+        else:
+            heading = "📉 已不在榜单\n\n"
+
+        lines = []
+        for item in disappeared:
+            rank_text = f" (最高第{item['rank']}名)" if item.get("rank") else ""
+            if platform == "feishu":
+                line = f"<font color='grey'>[{item['source_name']}] {item['title']}{rank_text}</font>"
+            elif platform == "telegram":
+                line = f"[{html_escape(item['source_name'])}] {html_escape(item['title'])}{rank_text}"
+            else:
+                line = f"[{item['source_name']}] {item['title']}{rank_text}"
+            lines.append(f"  - {line}\n")
+        if lines:
+            lines[-1] += "\n"
+
+        return heading, lines
 
     def _build_failed_section(self, failed_ids: List[str], platform: str) -> str:
         """构建失败信息部分
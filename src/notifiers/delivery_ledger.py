@@ -0,0 +1,311 @@
+# coding=utf-8
+"""已推送条目账本模块
+
+增量推送（delta push）按渠道记录当天已送达的条目，下次推送只发送变化的部分：
+- 条目以 (平台, 标题哈希) 为键，记录已推送的最好排名
+- 新出现、重新出现或排名上升的条目会再次推送
+- 已推送但本次报告中不再出现的条目可附在消息末尾（每个条目只提示一次）
+- 账本按天存放在 output/.push_records/delivered_YYYYMMDD.json
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.time import get_beijing_time
+
+# 账本条目: [已推送的最好排名, 来源名称, 标题, 是否已提示消失]
+LedgerEntry = List
+
+
+@dataclass
+class DeliveryDelta:
+    """单个渠道本次需要推送的变化"""
+
+    # 只含变化条目的报告数据（含 disappeared 列表）
+    report_data: Dict
+    # 本次推送的条目键
+    changed_keys: Tuple[str, ...] = ()
+    # 本次提示消失的条目键
+    disappeared_keys: Tuple[str, ...] = ()
+    # 本次报告中全部条目的键和最好排名（推送成功后写入账本）
+    current: Dict[str, Tuple[Optional[int], str, str]] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """是否没有任何变化"""
+        return not self.changed_keys and not self.disappeared_keys
+
+    @property
+    def fingerprint(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """变化内容的指纹（指纹相同的渠道共用渲染结果）"""
+        return self.changed_keys, self.disappeared_keys
+
+    def to_record(self) -> Dict:
+        """转换为写入账本所需的数据（可 JSON 序列化，随发送队列的批次保存）
+
+        Returns:
+            Dict: {"current": {条目键: [最好排名, 来源名称, 标题]}, "disappeared": [条目键]}
+        """
+        return {
+            "current": {key: list(value) for key, value in self.current.items()},
+            "disappeared": list(self.disappeared_keys),
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "DeliveryDelta":
+        """从 to_record 的数据恢复（只含写入账本所需的字段）
+
+        Args:
+            record: to_record 返回的数据
+
+        Returns:
+            DeliveryDelta: 增量
+        """
+        return cls(
+            report_data={},
+            disappeared_keys=tuple(record.get("disappeared", ())),
+            current={key: tuple(value) for key, value in record.get("current", {}).items()},
+        )
+
+
+class DeliveryLedger:
+    """已推送条目账本
+
+    负责：
+    - 按渠道记录当天已推送的条目和排名
+    - 计算报告与已推送内容的差异
+    - 清理过期的账本文件
+    """
+
+    FILE_PREFIX = "delivered_"
+
+    def __init__(self, record_dir: Optional[Path] = None, retention_days: int = 7):
+        """初始化账本
+
+        Args:
+            record_dir: 账本目录，默认 output/.push_records
+            retention_days: 账本保留天数
+        """
+        self.record_dir = Path(record_dir) if record_dir else Path("output") / ".push_records"
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        # 当天账本的内存副本: (日期, {渠道: {条目键: 条目}})
+        self._loaded: Optional[Tuple[str, Dict[str, Dict[str, LedgerEntry]]]] = None
+
+    @staticmethod
+    def item_key(platform: str, title: str) -> str:
+        """计算条目键
+
+        Args:
+            platform: 平台ID
+            title: 新闻标题
+
+        Returns:
+            str: 条目键 "平台:标题哈希"
+        """
+        digest = hashlib.sha1(title.strip().encode("utf-8")).hexdigest()[:16]
+        return f"{platform}:{digest}"
+
+    def _get_record_file(self, date_str: str) -> Path:
+        """获取指定日期的账本文件路径
+
+        Args:
+            date_str: 日期 (YYYYMMDD)
+
+        Returns:
+            Path: 账本文件路径
+        """
+        return self.record_dir / f"{self.FILE_PREFIX}{date_str}.json"
+
+    def _load_today(self) -> Dict[str, Dict[str, LedgerEntry]]:
+        """加载当天的账本（跨天时重新加载并清理过期文件）
+
+        Returns:
+            Dict: {渠道: {条目键: 条目}}
+        """
+        today = get_beijing_time().strftime("%Y%m%d")
+        if self._loaded is not None and self._loaded[0] == today:
+            return self._loaded[1]
+
+        ledger: Dict[str, Dict[str, LedgerEntry]] = {}
+        record_file = self._get_record_file(today)
+        if record_file.exists():
+            try:
+                with open(record_file, "r", encoding="utf-8") as f:
+                    ledger = json.load(f)
+            except Exception as e:
+                print(f"读取推送账本失败: {e}")
+
+        self._loaded = (today, ledger)
+        self.cleanup_old_records()
+        return ledger
+
+    def _save_today(self) -> None:
+        """写入当天的账本（先写临时文件再替换，避免中断时损坏）"""
+        date_str, ledger = self._loaded
+        record_file = self._get_record_file(date_str)
+        tmp_file = record_file.with_suffix(".json.tmp")
+
+        try:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(ledger, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file, record_file)
+        except Exception as e:
+            print(f"保存推送账本失败: {e}")
+
+    def cleanup_old_records(self) -> None:
+        """清理过期的账本文件"""
+        if not self.record_dir.exists():
+            return
+
+        current_date = get_beijing_time().date()
+        for record_file in self.record_dir.glob(f"{self.FILE_PREFIX}*.json"):
+            try:
+                date_str = record_file.stem.replace(self.FILE_PREFIX, "")
+                file_date = datetime.strptime(date_str, "%Y%m%d").date()
+                if (current_date - file_date).days > self.retention_days:
+                    record_file.unlink()
+                    print(f"清理过期推送账本: {record_file.name}")
+            except ValueError:
+                print(f"警告: 推送账本文件名格式错误: {record_file.name}")
+            except Exception as e:
+                print(f"清理推送账本失败 {record_file}: {e}")
+
+    def get_channel_entries(self, channel: str) -> Dict[str, LedgerEntry]:
+        """获取渠道当天已推送的条目
+
+        Args:
+            channel: 渠道标识
+
+        Returns:
+            Dict[str, LedgerEntry]: {条目键: [最好排名, 来源名称, 标题, 是否已提示消失]}
+        """
+        with self._lock:
+            return dict(self._load_today().get(channel, {}))
+
+    def compute_delta(
+        self,
+        channel: str,
+        report_data: Dict,
+        include_disappeared: bool = True,
+        disappeared_limit: int = 10
+    ) -> DeliveryDelta:
+        """计算报告相对渠道已推送内容的变化
+
+        Args:
+            channel: 渠道标识
+            report_data: 完整报告数据
+            include_disappeared: 是否附带已消失条目的摘要
+            disappeared_limit: 摘要最多列出的条目数
+
+        Returns:
+            DeliveryDelta: 本次需要推送的变化
+        """
+        delivered = self.get_channel_entries(channel)
+        current: Dict[str, Tuple[Optional[int], str, str]] = {}
+        changed: Dict[str, None] = {}
+
+        def is_changed(platform: str, title_data: Dict) -> bool:
+            key = self.item_key(platform, title_data["title"])
+            ranks = title_data.get("ranks") or []
+            best_rank = min(ranks) if ranks else None
+            previous = current.get(key)
+            if previous is None or _rank_better(best_rank, previous[0]):
+                current[key] = (best_rank, title_data.get("source_name", ""), title_data["title"])
+
+            entry = delivered.get(key)
+            if entry is None or entry[3] or _rank_better(best_rank, entry[0]):
+                changed[key] = None
+                return True
+            return False
+
+        stats = []
+        for stat in report_data.get("stats", []):
+            titles = [
+                title_data for title_data in stat["titles"]
+                if is_changed(title_data.get("platform", ""), title_data)
+            ]
+            if titles:
+                stats.append({**stat, "count": len(titles), "titles": titles})
+
+        new_titles = []
+        for source_data in report_data.get("new_titles", []):
+            titles = [
+                title_data for title_data in source_data["titles"]
+                if is_changed(title_data.get("platform", source_data.get("source_id", "")), title_data)
+            ]
+            if titles:
+                new_titles.append({**source_data, "titles": titles})
+
+        disappeared = []
+        if include_disappeared:
+            gone = [
+                (key, entry) for key, entry in delivered.items()
+                if key not in current and not entry[3]
+            ]
+            gone.sort(key=lambda item: (item[1][0] is None, item[1][0] or 0))
+            disappeared = gone[:disappeared_limit]
+
+        delta_report = {
+            **report_data,
+            "stats": stats,
+            "new_titles": new_titles,
+            "total_new_count": sum(len(source["titles"]) for source in new_titles),
+            "disappeared": [
+                {"source_name": entry[1], "title": entry[2], "rank": entry[0]}
+                for _, entry in disappeared
+            ],
+        }
+        return DeliveryDelta(
+            report_data=delta_report,
+            changed_keys=tuple(changed),
+            disappeared_keys=tuple(key for key, _ in disappeared),
+            current=current,
+        )
+
+    def record(self, channel: str, delta: DeliveryDelta) -> None:
+        """推送成功后更新渠道的账本
+
+        本次报告中的条目记录最好排名并清除消失标记，已提示的消失条目标记为已提示
+
+        Args:
+            channel: 渠道标识
+            delta: 本次推送的变化
+        """
+        with self._lock:
+            ledger = self._load_today()
+            entries = ledger.setdefault(channel, {})
+
+            for key, (best_rank, source_name, title) in delta.current.items():
+                entry = entries.get(key)
+                if entry is not None and not _rank_better(best_rank, entry[0]):
+                    best_rank = entry[0]
+                entries[key] = [best_rank, source_name, title, False]
+
+            for key in delta.disappeared_keys:
+                if key in entries:
+                    entries[key][3] = True
+
+            self._save_today()
+
+
+def _rank_better(rank: Optional[int], previous: Optional[int]) -> bool:
+    """排名是否优于之前的排名（无排名视为最差）
+
+    Args:
+        rank: 当前排名
+        previous: 之前的排名
+
+    Returns:
+        bool: 是否更好
+    """
+    if rank is None:
+        return False
+    return previous is None or rank < previous
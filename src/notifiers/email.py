@@ -1,18 +1,42 @@
 # coding=utf-8
 """邮件通知器"""
 
+import asyncio
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.core.reporter import NewsReporter
 from src.notifiers.base import BaseNotifier
+from src.notifiers.smtp_pool import SMTPPool, get_smtp_pool, send_message_streamed
+from src.notifiers.transport import NotifierTransport
+
+# 8BITMIME 允许的单行最大字节数（RFC 5321）
+MAX_8BIT_LINE_BYTES = 998
 
 
 class EmailNotifier(BaseNotifier):
     """邮件通知发送器"""
 
+    def __init__(
+        self,
+        config: Dict,
+        transport: Optional[NotifierTransport] = None,
+        smtp_pool: Optional[SMTPPool] = None
+    ):
+        """初始化邮件通知器
+
+        Args:
+            config: 配置字典
+            transport: 共享的 HTTP 传输层（邮件不使用）
+            smtp_pool: SMTP 会话池（默认使用进程内共享的会话池）
+        """
+        super().__init__(config, transport)
+        self.smtp_pool = smtp_pool or get_smtp_pool()
+        # 空闲时间限制按本通知器的配置在每次取会话时传入，不修改共享会话池
+        self.idle_timeout = config.get("EMAIL_SMTP_IDLE_TIMEOUT")
+
     @property
     def name(self) -> str:
         return "邮件"
@@ -39,7 +63,7 @@ class EmailNotifier(BaseNotifier):
         """发送邮件通知
 
         Args:
-            report_data: 报告数据（未使用，邮件发送HTML文件）
+            report_data: 报告数据（开启纯文本正文时用于渲染文本部分）
             report_type: 报告类型
             update_info: 更新信息（未使用）
             proxy_url: 代理URL（邮件不支持）
@@ -54,6 +78,8 @@ class EmailNotifier(BaseNotifier):
         email_to = self.config.get("EMAIL_TO", "")
         smtp_server = self.config.get("EMAIL_SMTP_SERVER", "")
         smtp_port = self.config.get("EMAIL_SMTP_PORT", 465)
+        # 配置文件留空时为空字符串
+        smtp_port = int(smtp_port) if str(smtp_port).strip() else 465
 
         if not email_from or not email_password or not email_to:
             print("邮件配置不完整，跳过发送")
@@ -74,50 +100,128 @@ class EmailNotifier(BaseNotifier):
             print(f"HTML文件不存在: {html_file_path}，跳过邮件发送")
             return False
 
-        # 构建邮件
-        msg = MIMEMultipart("alternative")
+        text_content = None
+        if self.config.get("EMAIL_PLAIN_TEXT", False) and report_data:
+            reporter = NewsReporter(rank_threshold=self.config.get("RANK_THRESHOLD", 10))
+            text_content = reporter.render_text_report(report_data)
+
+        to_addrs = [addr.strip() for addr in email_to.split(",") if addr.strip()]
+        starttls = self.config.get("EMAIL_SMTP_STARTTLS", True)
+        keepalive = self.config.get("EMAIL_SMTP_KEEPALIVE", True)
+
+        # 发送邮件（复用的会话在发送时断开则重新连接一次）
+        for attempt in (1, 2):
+            smtp = None
+            try:
+                smtp = self.smtp_pool.acquire(
+                    smtp_server, smtp_port, email_from, email_password,
+                    starttls=starttls, idle_timeout=self.idle_timeout
+                )
+
+                eight_bit = smtp.has_extn("8bitmime")
+                msg = self._build_message(
+                    report_type, email_from, email_to, html_content, text_content, eight_bit
+                )
+
+                print(f"正在发送邮件到: {email_to}")
+                send_message_streamed(
+                    smtp, msg, email_from, to_addrs,
+                    ["BODY=8BITMIME"] if eight_bit else None
+                )
+
+                if keepalive:
+                    self.smtp_pool.release(smtp_server, smtp_port, email_from, smtp)
+                else:
+                    self.smtp_pool.discard(smtp)
+                print(f"邮件发送成功 [{report_type}]")
+                return True
+
+            except smtplib.SMTPServerDisconnected as e:
+                if smtp is not None:
+                    self.smtp_pool.discard(smtp)
+                if attempt == 1:
+                    print(f"SMTP连接已断开，重新连接: {e}")
+                    continue
+                print(f"邮件发送失败: 连接断开 - {e}")
+                return False
+            except smtplib.SMTPAuthenticationError:
+                print("邮件发送失败: 认证失败，请检查邮箱和密码")
+                return False
+            except smtplib.SMTPException as e:
+                if smtp is not None:
+                    self.smtp_pool.discard(smtp)
+                print(f"邮件发送失败: SMTP错误 - {e}")
+                return False
+            except Exception as e:
+                if smtp is not None:
+                    self.smtp_pool.discard(smtp)
+                print(f"邮件发送失败: {e}")
+                return False
+
+        return False
+
+    async def asend(
+        self,
+        report_data: Dict,
+        report_type: str,
+        update_info: Optional[Dict] = None,
+        proxy_url: Optional[str] = None,
+        mode: str = "daily",
+        html_file_path: Optional[str] = None
+    ) -> bool:
+        """异步发送邮件通知（smtplib 为阻塞调用，在线程中执行 send）
+
+        Returns:
+            bool: 是否发送成功
+        """
+        return await asyncio.to_thread(
+            self.send, report_data, report_type, update_info, proxy_url, mode, html_file_path
+        )
+
+    @staticmethod
+    def _build_message(
+        report_type: str,
+        email_from: str,
+        email_to: str,
+        html_content: str,
+        text_content: Optional[str] = None,
+        eight_bit: bool = False
+    ) -> EmailMessage:
+        """构建邮件
+
+        服务器支持 8BITMIME 且行长度允许时正文按 8bit 传输，
+        避免 base64 带来的约 1/3 体积膨胀
+
+        Args:
+            report_type: 报告类型
+            email_from: 发件人
+            email_to: 收件人（逗号分隔）
+            html_content: HTML 正文
+            text_content: 纯文本正文（提供时生成 multipart/alternative）
+            eight_bit: 服务器是否支持 8BITMIME
+
+        Returns:
+            EmailMessage: 邮件
+        """
+        def cte(content: str) -> Optional[str]:
+            if eight_bit and all(
+                len(line.encode("utf-8")) <= MAX_8BIT_LINE_BYTES for line in content.splitlines()
+            ):
+                return "8bit"
+            return None
+
+        msg = EmailMessage()
         msg["Subject"] = f"TrendRadar - {report_type}"
         msg["From"] = email_from
         msg["To"] = email_to
 
-        # 添加HTML内容
-        html_part = MIMEText(html_content, "html", "utf-8")
-        msg.attach(html_part)
-
-        # 发送邮件
-        try:
-            print(f"正在连接SMTP服务器: {smtp_server}:{smtp_port}")
-
-            # 根据端口选择连接方式
-            if smtp_port == 465:
-                # SSL连接
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-            else:
-                # TLS连接
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.starttls()
-
-            # 登录
-            print("正在登录邮箱...")
-            server.login(email_from, email_password)
-
-            # 发送
-            print(f"正在发送邮件到: {email_to}")
-            server.sendmail(email_from, email_to.split(","), msg.as_string())
-
-            server.quit()
-            print(f"邮件发送成功 [{report_type}]")
-            return True
-
-        except smtplib.SMTPAuthenticationError:
-            print("邮件发送失败: 认证失败，请检查邮箱和密码")
-            return False
-        except smtplib.SMTPException as e:
-            print(f"邮件发送失败: SMTP错误 - {e}")
-            return False
-        except Exception as e:
-            print(f"邮件发送失败: {e}")
-            return False
+        if text_content is not None:
+            msg.set_content(text_content, cte=cte(text_content))
+            msg.add_alternative(html_content, subtype="html", cte=cte(html_content))
+        else:
+            msg.set_content(html_content, subtype="html", cte=cte(html_content))
+
+        return msg
 
     def _get_smtp_server(self, email: str) -> Optional[str]:
         """根据邮箱地址自动检测SMTP服务器
@@ -1,7 +1,10 @@
 # coding=utf-8
 """通知管理器"""
 
-from typing import Dict, List, Optional, Type
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Any, Dict, List, Optional, Type
 
 from src.notifiers.base import BaseNotifier
 from src.notifiers.feishu import FeishuNotifier
@@ -10,7 +13,11 @@ from src.notifiers.wework import WeWorkNotifier
 from src.notifiers.telegram import TelegramNotifier
 from src.notifiers.email import EmailNotifier
 from src.notifiers.ntfy import NtfyNotifier
-from src.core.push_record import PushRecordManager
+from src.notifiers.delivery_ledger import DeliveryDelta, DeliveryLedger
+from src.notifiers.outbox import NotificationOutbox, OutboxDrainer
+from src.notifiers.render_cache import RenderCache
+from src.notifiers.transport import NotifierTransport
+from src.core.push_record import PushRecordManager, get_push_record_manager
 from src.utils.time import get_beijing_time
 
 
@@ -32,10 +39,28 @@ class NotificationManager:
         """
         self.config = config
         self.notifiers: Dict[str, BaseNotifier] = {}
+        # 所有通知器共享同一个连接池
+        self.transport = NotifierTransport.from_config(config)
+        # 最近一次发送的汇总结果
+        self.last_dispatch: Dict[str, Any] = {}
 
         # 注册所有通知器
         self._register_notifiers()
 
+        # 增量推送：分批渠道只发送相对当天已推送内容的变化
+        self.ledger: Optional[DeliveryLedger] = None
+        if config.get("NOTIFICATION_DELTA", False):
+            self.ledger = DeliveryLedger(
+                retention_days=config.get("PUSH_WINDOW", {}).get("RECORD_RETENTION_DAYS", 7)
+            )
+
+        # 发送队列：分批渠道的批次入队后由后台线程投递
+        # （在账本之后创建，恢复投递的批次送达后需要写入账本）
+        self.outbox: Optional[NotificationOutbox] = None
+        self.drainer: Optional[OutboxDrainer] = None
+        if config.get("NOTIFICATION_OUTBOX", False):
+            self._init_outbox()
+
     def _register_notifiers(self) -> None:
         """注册所有通知器"""
         notifier_classes: List[Type[BaseNotifier]] = [
@@ -48,11 +73,34 @@ class NotificationManager:
         ]
 
         for notifier_class in notifier_classes:
-            notifier = notifier_class(self.config)
+            notifier = notifier_class(self.config, transport=self.transport)
             # 使用类名作为key（去掉Notifier后缀）
             key = notifier_class.__name__.replace("Notifier", "").lower()
             self.notifiers[key] = notifier
 
+    def _init_outbox(self) -> None:
+        """创建发送队列和投递器，并恢复上次运行未送达的消息"""
+        self.outbox = NotificationOutbox.from_config(self.config)
+        # 只有分批渠道经发送队列投递
+        batch_notifiers = {
+            key: notifier for key, notifier in self._get_enabled_notifiers().items()
+            if notifier.batch_format is not None
+        }
+        self.drainer = OutboxDrainer(
+            self.outbox,
+            batch_notifiers,
+            rate_intervals=self.config.get("NOTIFICATION_OUTBOX_RATE_LIMITS") or {},
+            default_interval=self.config.get("BATCH_SEND_INTERVAL", 1),
+            on_delivered=self._record_queued_delivery,
+        )
+
+        if self.outbox.exists():
+            self.outbox.purge(self.config.get("NOTIFICATION_OUTBOX_RETENTION_DAYS", 7))
+            pending = self.outbox.pending_count()
+            if pending:
+                print(f"发送队列: 恢复 {pending} 条未送达的消息")
+                self.drainer.start()
+
     def send_notifications(
         self,
         report_data: Dict,
@@ -75,63 +123,602 @@ class NotificationManager:
         Returns:
             Dict[str, bool]: 各渠道发送结果
         """
-        results = {}
+        plan = self._prepare_dispatch(
+            report_data, report_type, update_info, proxy_url, mode, html_file_path
+        )
+        if plan is None:
+            return {}
+        enabled_notifiers, send_kwargs, rendered, channel_reports, settled, deltas = plan
 
+        dispatch_start = time.perf_counter()
+        if not enabled_notifiers:
+            channels = {}
+            dispatch_mode = "outbox" if self.outbox is not None else "skipped"
+        elif self.config.get("NOTIFICATION_ASYNC", False):
+            channels = self._dispatch_async(enabled_notifiers, send_kwargs, rendered, channel_reports)
+            dispatch_mode = "async"
+        elif self.config.get("NOTIFICATION_CONCURRENT", False):
+            channels = self._dispatch_concurrent(enabled_notifiers, send_kwargs, rendered, channel_reports)
+            dispatch_mode = "concurrent"
+        else:
+            channels = self._dispatch_sequential(enabled_notifiers, send_kwargs, rendered, channel_reports)
+            dispatch_mode = "sequential"
+        channels.update(settled)
+        self._record_deliveries(deltas, channels)
+
+        return self._finish_dispatch(report_type, channels, dispatch_mode, dispatch_start)
+
+    async def asend_notifications(
+        self,
+        report_data: Dict,
+        report_type: str,
+        update_info: Optional[Dict] = None,
+        proxy_url: Optional[str] = None,
+        mode: str = "daily",
+        html_file_path: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """异步发送通知到所有配置的渠道（参数同 send_notifications）
+
+        供运行在事件循环中的调用方直接 await，各渠道在同一事件循环中并发发送
+
+        Returns:
+            Dict[str, bool]: 各渠道发送结果
+        """
+        plan = self._prepare_dispatch(
+            report_data, report_type, update_info, proxy_url, mode, html_file_path
+        )
+        if plan is None:
+            return {}
+        enabled_notifiers, send_kwargs, rendered, channel_reports, settled, deltas = plan
+
+        dispatch_start = time.perf_counter()
+        if enabled_notifiers:
+            channels = await self._adispatch(enabled_notifiers, send_kwargs, rendered, channel_reports)
+            dispatch_mode = "async"
+        else:
+            channels = {}
+            dispatch_mode = "outbox" if self.outbox is not None else "skipped"
+        channels.update(settled)
+        self._record_deliveries(deltas, channels)
+
+        return self._finish_dispatch(report_type, channels, dispatch_mode, dispatch_start)
+
+    def _prepare_dispatch(
+        self,
+        report_data: Dict,
+        report_type: str,
+        update_info: Optional[Dict],
+        proxy_url: Optional[str],
+        mode: str,
+        html_file_path: Optional[str]
+    ) -> Optional[tuple]:
+        """发送前的检查、增量计算、渲染和入队
+
+        Args:
+            report_data: 报告数据
+            report_type: 报告类型
+            update_info: 更新信息
+            proxy_url: 代理URL
+            mode: 模式
+            html_file_path: HTML文件路径
+
+        Returns:
+            Optional[tuple]: (待直接发送的通知器, 发送参数, 各渠道批次, 各渠道的报告数据,
+                已入队或无需发送的渠道结果, 各渠道的增量)，不需要发送时为 None
+        """
         # 检查推送窗口
         if not self._check_push_window():
             print("推送窗口控制：不在推送时间范围内或今天已推送，跳过推送")
-            return results
+            return None
 
         # 获取启用的通知器
         enabled_notifiers = self._get_enabled_notifiers()
 
         if not enabled_notifiers:
             print("未配置任何通知渠道，跳过通知发送")
-            return results
+            return None
+
+        enabled_notifiers = self._filter_pushed_channels(enabled_notifiers)
+        if not enabled_notifiers:
+            print("推送窗口控制：所有渠道今天都已推送过，跳过推送")
+            return None
 
         # 显示推送信息
         show_update_info = self.config.get("SHOW_VERSION_UPDATE", True)
         update_to_send = update_info if show_update_info else None
 
-        # 逐个发送
-        for name, notifier in enabled_notifiers.items():
-            print(f"\n=== 发送到 {notifier.name} ===")
+        send_kwargs = {
+            "report_data": report_data,
+            "report_type": report_type,
+            "update_info": update_to_send,
+            "proxy_url": proxy_url,
+            "mode": mode,
+            "html_file_path": html_file_path,
+        }
+
+        settled: Dict[str, Dict[str, Any]] = {}
+        deltas: Dict[str, DeliveryDelta] = {}
+        # 增量模式的报告本身只含新增内容，不再与账本比较
+        if self.ledger is not None and mode != "incremental":
+            deltas = self._compute_deltas(enabled_notifiers, report_data)
+            for name, delta in deltas.items():
+                if delta.is_empty:
+                    print(f"增量推送: {enabled_notifiers[name].name} 没有新的变化，跳过")
+                    settled[name] = {
+                        "success": True,
+                        "elapsed": 0.0,
+                        "timed_out": False,
+                        "error": None,
+                        "skipped": True,
+                    }
+            enabled_notifiers = {
+                name: notifier for name, notifier in enabled_notifiers.items() if name not in settled
+            }
+        channel_reports = {
+            name: delta.report_data for name, delta in deltas.items() if name in enabled_notifiers
+        }
+
+        # 发送前统一渲染各渠道批次，格式与批次大小相同的渠道共用渲染结果
+        rendered = self._render_batches(
+            enabled_notifiers, report_data, update_to_send, mode, deltas
+        )
 
-            try:
-                # 邮件特殊处理
-                if isinstance(notifier, EmailNotifier):
-                    success = notifier.send(
-                        report_data=report_data,
-                        report_type=report_type,
-                        update_info=update_to_send,
-                        proxy_url=proxy_url,
-                        mode=mode,
-                        html_file_path=html_file_path
-                    )
-                else:
-                    success = notifier.send(
-                        report_data=report_data,
-                        report_type=report_type,
-                        update_info=update_to_send,
-                        proxy_url=proxy_url,
-                        mode=mode
-                    )
-
-                results[name] = success
+        if self.outbox is not None:
+            queued = self._enqueue(
+                enabled_notifiers, rendered, report_data, report_type, proxy_url, channel_reports, deltas
+            )
+            settled.update(queued)
+            enabled_notifiers = {
+                name: notifier for name, notifier in enabled_notifiers.items() if name not in queued
+            }
 
-            except Exception as e:
-                print(f"{notifier.name} 发送异常: {e}")
-                results[name] = False
+        return enabled_notifiers, send_kwargs, rendered, channel_reports, settled, deltas
 
-        # 记录推送
-        if any(results.values()):
-            self._record_push(report_type)
+    def _compute_deltas(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        report_data: Dict
+    ) -> Dict[str, DeliveryDelta]:
+        """计算各分批渠道相对已推送内容的增量
+
+        Args:
+            notifiers: 启用的通知器
+            report_data: 完整报告数据
+
+        Returns:
+            Dict[str, DeliveryDelta]: {渠道: 增量}，不分批的渠道（邮件）始终发送完整报告
+        """
+        include_disappeared = self.config.get("NOTIFICATION_DELTA_DIGEST", True)
+        disappeared_limit = self.config.get("NOTIFICATION_DELTA_DIGEST_LIMIT", 10)
+
+        deltas = {}
+        for name, notifier in notifiers.items():
+            if notifier.batch_format is None:
+                continue
+            deltas[name] = self.ledger.compute_delta(
+                name, report_data, include_disappeared, disappeared_limit
+            )
+        return deltas
+
+    def _record_deliveries(
+        self,
+        deltas: Dict[str, DeliveryDelta],
+        channels: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """将直接发送成功渠道的本次内容写入账本
+
+        写入发送队列的渠道在批次全部送达后由投递器回调写入（见 _record_queued_delivery）
+
+        Args:
+            deltas: 各渠道的增量
+            channels: 各渠道发送结果
+        """
+        for name, delta in deltas.items():
+            channel = channels.get(name)
+            if channel and channel["success"] and not channel.get("skipped") and "queued" not in channel:
+                self.ledger.record(name, delta)
+
+    def _record_queued_delivery(self, channel: str, delivery: Dict) -> None:
+        """发送队列中一次入队的批次全部送达后写入账本（投递线程中调用）
+
+        Args:
+            channel: 渠道标识
+            delivery: 入队时附带的 DeliveryDelta.to_record() 数据
+        """
+        if self.ledger is not None:
+            self.ledger.record(channel, DeliveryDelta.from_record(delivery))
+
+    def _finish_dispatch(
+        self,
+        report_type: str,
+        channels: Dict[str, Dict[str, Any]],
+        dispatch_mode: str,
+        dispatch_start: float
+    ) -> Dict[str, bool]:
+        """汇总发送结果、记录推送并打印汇总
+
+        Args:
+            report_type: 报告类型
+            channels: 各渠道发送结果
+            dispatch_mode: 发送方式
+            dispatch_start: 开始发送的时间（perf_counter）
+
+        Returns:
+            Dict[str, bool]: 各渠道发送结果
+        """
+        results = {name: channel["success"] for name, channel in channels.items()}
+        self.last_dispatch = {
+            "mode": dispatch_mode,
+            "elapsed": time.perf_counter() - dispatch_start,
+            "success_count": sum(1 for success in results.values() if success),
+            "fail_count": sum(1 for success in results.values() if not success),
+            "channels": channels,
+        }
+
+        # 记录推送（所有渠道都因没有变化而跳过时不算推送）
+        pushed = [
+            name for name, channel in channels.items()
+            if channel["success"] and not channel.get("skipped")
+        ]
+        if pushed:
+            self._record_push(report_type, pushed)
 
         # 打印汇总
         self._print_summary(results)
 
         return results
 
+    def get_last_dispatch(self) -> Dict[str, Any]:
+        """获取最近一次发送的汇总结果
+
+        Returns:
+            Dict: {mode, elapsed, success_count, fail_count, channels}，
+                channels 为 {渠道: {success, elapsed, timed_out, error}}，
+                写入发送队列的渠道另有 queued（新入队的批次数），
+                增量推送时没有变化的渠道另有 skipped
+        """
+        return self.last_dispatch
+
+    def _get_channel_timeout(self, name: str) -> float:
+        """获取渠道的推送超时
+
+        Args:
+            name: 渠道标识
+
+        Returns:
+            float: 超时秒数
+        """
+        overrides = self.config.get("NOTIFICATION_CHANNEL_TIMEOUTS") or {}
+        return overrides.get(name, self.config.get("NOTIFICATION_CHANNEL_TIMEOUT", 300))
+
+    def _render_batches(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        report_data: Dict,
+        update_info: Optional[Dict],
+        mode: str,
+        deltas: Optional[Dict[str, DeliveryDelta]] = None
+    ) -> Dict[str, List[str]]:
+        """渲染各分批渠道的消息批次
+
+        Args:
+            notifiers: 启用的通知器
+            report_data: 报告数据
+            update_info: 更新信息
+            mode: 模式
+            deltas: 各渠道的增量（增量相同的渠道共用一个渲染缓存）
+
+        Returns:
+            Dict[str, List[str]]: {渠道: 批次内容列表}，不分批的渠道（邮件）不包含在内
+        """
+        deltas = deltas or {}
+        rank_threshold = self.config.get("RANK_THRESHOLD", 10)
+        # 完整报告使用键 None，增量报告按变化内容的指纹区分
+        caches: Dict[Any, RenderCache] = {}
+
+        rendered = {}
+        for name, notifier in notifiers.items():
+            if notifier.batch_format is None:
+                continue
+            delta = deltas.get(name)
+            key = delta.fingerprint if delta is not None else None
+            cache = caches.get(key)
+            if cache is None:
+                data = delta.report_data if delta is not None else report_data
+                cache = caches[key] = RenderCache(data, rank_threshold)
+            rendered[name] = notifier.render_batches(cache.report_data, update_info, mode, cache=cache)
+
+        if rendered:
+            misses = sum(cache.misses for cache in caches.values())
+            print(f"消息渲染: {len(rendered)} 个渠道, 实际渲染 {misses} 次")
+        return rendered
+
+    def _enqueue(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        rendered: Dict[str, List[str]],
+        report_data: Dict,
+        report_type: str,
+        proxy_url: Optional[str],
+        channel_reports: Optional[Dict[str, Dict]] = None,
+        deltas: Optional[Dict[str, DeliveryDelta]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """将分批渠道的批次写入发送队列并启动后台投递
+
+        Args:
+            notifiers: 启用的通知器
+            rendered: 各渠道预先渲染的消息批次
+            report_data: 报告数据
+            report_type: 报告类型
+            proxy_url: 代理URL
+            channel_reports: 各渠道的报告数据（增量推送时为增量报告）
+            deltas: 各渠道的增量（随批次入队，全部送达后写入账本）
+
+        Returns:
+            Dict[str, Dict]: 入队渠道的结果 {渠道: {success, elapsed, timed_out, error, queued}}
+        """
+        channel_reports = channel_reports or {}
+        deltas = deltas or {}
+        queued = {}
+        for name, batches in rendered.items():
+            notifier = notifiers[name]
+            context = notifier.batch_context(channel_reports.get(name, report_data))
+            delta = deltas.get(name)
+            count = self.outbox.enqueue(
+                name, report_type, batches, context, proxy_url,
+                delivery=delta.to_record() if delta is not None else None
+            )
+            print(f"发送队列: {notifier.name} {count}/{len(batches)} 批次入队 [{report_type}]")
+            queued[name] = {
+                "success": True,
+                "elapsed": 0.0,
+                "timed_out": False,
+                "error": None,
+                "queued": count,
+            }
+
+        if queued:
+            self.drainer.start(list(queued))
+        return queued
+
+    def wait_for_outbox(self, timeout: Optional[float] = None) -> bool:
+        """等待发送队列投递完成
+
+        Args:
+            timeout: 最长等待秒数（None 表示一直等待）
+
+        Returns:
+            bool: 是否已全部完成（未启用发送队列时为 True）
+        """
+        if self.drainer is None:
+            return True
+        return self.drainer.wait(timeout)
+
+    def _send_one(
+        self,
+        notifier: BaseNotifier,
+        send_kwargs: Dict[str, Any],
+        batches: Optional[List[str]] = None,
+        report_data: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """发送到单个渠道（渠道内部按批次顺序发送）
+
+        Args:
+            notifier: 通知器
+            send_kwargs: 发送参数
+            batches: 预先渲染的消息批次
+            report_data: 该渠道的报告数据（增量推送时为增量报告）
+
+        Returns:
+            Dict: {success, elapsed, timed_out, error}
+        """
+        start = time.perf_counter()
+        error = None
+
+        try:
+            # 邮件特殊处理
+            if isinstance(notifier, EmailNotifier):
+                success = notifier.send(**send_kwargs)
+            else:
+                kwargs = dict(send_kwargs)
+                kwargs.pop("html_file_path")
+                if report_data is not None:
+                    kwargs["report_data"] = report_data
+                success = notifier.send(**kwargs, batches=batches)
+        except Exception as e:
+            print(f"{notifier.name} 发送异常: {e}")
+            success = False
+            error = str(e)
+
+        return {
+            "success": bool(success),
+            "elapsed": time.perf_counter() - start,
+            "timed_out": False,
+            "error": error,
+        }
+
+    def _dispatch_sequential(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        send_kwargs: Dict[str, Any],
+        rendered: Optional[Dict[str, List[str]]] = None,
+        channel_reports: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """逐个渠道发送
+
+        Args:
+            notifiers: 启用的通知器
+            send_kwargs: 发送参数
+            rendered: 各渠道预先渲染的消息批次
+            channel_reports: 各渠道的报告数据（增量推送时为增量报告）
+
+        Returns:
+            Dict[str, Dict]: 各渠道发送结果
+        """
+        rendered = rendered or {}
+        channel_reports = channel_reports or {}
+        channels = {}
+        for name, notifier in notifiers.items():
+            print(f"\n=== 发送到 {notifier.name} ===")
+            channels[name] = self._send_one(
+                notifier, send_kwargs, rendered.get(name), channel_reports.get(name)
+            )
+        return channels
+
+    def _dispatch_concurrent(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        send_kwargs: Dict[str, Any],
+        rendered: Optional[Dict[str, List[str]]] = None,
+        channel_reports: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """每个渠道一个线程并发发送，总耗时取决于最慢的渠道
+
+        超时的渠道记为失败，其线程在后台继续运行直到请求自身超时
+
+        Args:
+            notifiers: 启用的通知器
+            send_kwargs: 发送参数
+            rendered: 各渠道预先渲染的消息批次
+            channel_reports: 各渠道的报告数据（增量推送时为增量报告）
+
+        Returns:
+            Dict[str, Dict]: 各渠道发送结果
+        """
+        print(f"\n=== 并发发送到 {len(notifiers)} 个渠道: "
+              f"{', '.join(notifier.name for notifier in notifiers.values())} ===")
+
+        rendered = rendered or {}
+        channel_reports = channel_reports or {}
+        executor = ThreadPoolExecutor(max_workers=len(notifiers), thread_name_prefix="notify")
+        start = time.perf_counter()
+        futures = {
+            name: executor.submit(
+                self._send_one, notifier, send_kwargs, rendered.get(name), channel_reports.get(name)
+            )
+            for name, notifier in notifiers.items()
+        }
+
+        channels = {}
+        try:
+            for name, future in futures.items():
+                # 各渠道的截止时间都从同一起点计算
+                timeout = self._get_channel_timeout(name)
+                remaining = max(0.0, start + timeout - time.perf_counter())
+                try:
+                    channels[name] = future.result(timeout=remaining)
+                except FuturesTimeoutError:
+                    print(f"{notifiers[name].name} 发送超时（{timeout}秒）")
+                    channels[name] = {
+                        "success": False,
+                        "elapsed": time.perf_counter() - start,
+                        "timed_out": True,
+                        "error": f"超时（{timeout}秒）",
+                    }
+        finally:
+            executor.shutdown(wait=False)
+
+        return channels
+
+    def _dispatch_async(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        send_kwargs: Dict[str, Any],
+        rendered: Optional[Dict[str, List[str]]] = None,
+        channel_reports: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """在事件循环中并发发送（同步入口）
+
+        当前线程已有运行中的事件循环时（如 API 进程），在独立线程的新事件循环中执行，
+        不阻塞调用方的事件循环
+
+        Args:
+            notifiers: 启用的通知器
+            send_kwargs: 发送参数
+            rendered: 各渠道预先渲染的消息批次
+            channel_reports: 各渠道的报告数据（增量推送时为增量报告）
+
+        Returns:
+            Dict[str, Dict]: 各渠道发送结果
+        """
+        async def run() -> Dict[str, Dict[str, Any]]:
+            try:
+                return await self._adispatch(notifiers, send_kwargs, rendered, channel_reports)
+            finally:
+                # 异步客户端属于本次创建的事件循环，结束前关闭
+                await self.transport.aclose()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, run()).result()
+
+    async def _adispatch(
+        self,
+        notifiers: Dict[str, BaseNotifier],
+        send_kwargs: Dict[str, Any],
+        rendered: Optional[Dict[str, List[str]]] = None,
+        channel_reports: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """各渠道在同一事件循环中并发发送，超时的渠道记为失败
+
+        Args:
+            notifiers: 启用的通知器
+            send_kwargs: 发送参数
+            rendered: 各渠道预先渲染的消息批次
+            channel_reports: 各渠道的报告数据（增量推送时为增量报告）
+
+        Returns:
+            Dict[str, Dict]: 各渠道发送结果
+        """
+        print(f"\n=== 异步发送到 {len(notifiers)} 个渠道: "
+              f"{', '.join(notifier.name for notifier in notifiers.values())} ===")
+
+        rendered = rendered or {}
+        channel_reports = channel_reports or {}
+
+        async def send_one(name: str, notifier: BaseNotifier) -> Dict[str, Any]:
+            start = time.perf_counter()
+            timeout = self._get_channel_timeout(name)
+            kwargs = dict(send_kwargs)
+            html_file_path = kwargs.pop("html_file_path")
+            # 邮件特殊处理
+            if isinstance(notifier, EmailNotifier):
+                kwargs["html_file_path"] = html_file_path
+            else:
+                kwargs["batches"] = rendered.get(name)
+                if name in channel_reports:
+                    kwargs["report_data"] = channel_reports[name]
+
+            timed_out = False
+            error = None
+            try:
+                success = await asyncio.wait_for(notifier.asend(**kwargs), timeout)
+            except asyncio.TimeoutError:
+                print(f"{notifier.name} 发送超时（{timeout}秒）")
+                success = False
+                timed_out = True
+                error = f"超时（{timeout}秒）"
+            except Exception as e:
+                print(f"{notifier.name} 发送异常: {e}")
+                success = False
+                error = str(e)
+
+            return {
+                "success": bool(success),
+                "elapsed": time.perf_counter() - start,
+                "timed_out": timed_out,
+                "error": error,
+            }
+
+        results = await asyncio.gather(
+            *(send_one(name, notifier) for name, notifier in notifiers.items())
+        )
+        return dict(zip(notifiers, results))
+
     def _check_push_window(self) -> bool:
         """检查推送窗口限制
 
@@ -143,9 +730,7 @@ class NotificationManager:
         if not push_window.get("ENABLED", False):
             return True
 
-        push_manager = PushRecordManager(
-            retention_days=push_window.get("RECORD_RETENTION_DAYS", 7)
-        )
+        push_manager = self._get_push_records()
 
         # 检查时间范围
         time_range = push_window.get("TIME_RANGE", {})
@@ -160,8 +745,8 @@ class NotificationManager:
             )
             return False
 
-        # 检查每日一次限制
-        if push_window.get("ONCE_PER_DAY", False):
+        # 检查每日一次限制（按渠道限制时在 _filter_pushed_channels 中检查）
+        if push_window.get("ONCE_PER_DAY", False) and not push_window.get("PER_CHANNEL", False):
             if push_manager.has_pushed_today():
                 print("推送窗口控制：今天已推送过")
                 return False
@@ -170,6 +755,41 @@ class NotificationManager:
 
         return True
 
+    def _get_push_records(self) -> PushRecordManager:
+        """获取进程内共享的推送记录管理器
+
+        Returns:
+            PushRecordManager: 推送记录管理器
+        """
+        push_window = self.config.get("PUSH_WINDOW", {})
+        return get_push_record_manager(push_window.get("RECORD_RETENTION_DAYS", 7))
+
+    def _filter_pushed_channels(self, notifiers: Dict[str, BaseNotifier]) -> Dict[str, BaseNotifier]:
+        """按渠道执行每日一次限制，去掉今天已推送过的渠道
+
+        Args:
+            notifiers: 启用的通知器
+
+        Returns:
+            Dict[str, BaseNotifier]: 今天尚未推送的通知器
+        """
+        push_window = self.config.get("PUSH_WINDOW", {})
+        if not (
+            push_window.get("ENABLED", False)
+            and push_window.get("ONCE_PER_DAY", False)
+            and push_window.get("PER_CHANNEL", False)
+        ):
+            return notifiers
+
+        push_manager = self._get_push_records()
+        remaining = {}
+        for name, notifier in notifiers.items():
+            if push_manager.has_pushed_today(name):
+                print(f"推送窗口控制：{notifier.name} 今天已推送过")
+            else:
+                remaining[name] = notifier
+        return remaining
+
     def _get_enabled_notifiers(self) -> Dict[str, BaseNotifier]:
         """获取已配置的通知器
 
@@ -184,19 +804,17 @@ class NotificationManager:
 
         return enabled
 
-    def _record_push(self, report_type: str) -> None:
+    def _record_push(self, report_type: str, channels: Optional[List[str]] = None) -> None:
         """记录推送
 
         Args:
             report_type: 报告类型
+            channels: 推送成功的渠道
         """
         push_window = self.config.get("PUSH_WINDOW", {})
 
         if push_window.get("ENABLED", False) and push_window.get("ONCE_PER_DAY", False):
-            push_manager = PushRecordManager(
-                retention_days=push_window.get("RECORD_RETENTION_DAYS", 7)
-            )
-            push_manager.record_push(report_type)
+            self._get_push_records().record_push(report_type, channels)
 
     def _print_summary(self, results: Dict[str, bool]) -> None:
         """打印发送汇总
@@ -225,6 +843,21 @@ class NotificationManager:
         print(f"总计: {len(results)} 个渠道 | 成功: {success_count} | 失败: {fail_count}")
         print("=" * 50)
 
+    def close(self, drain_timeout: Optional[float] = None) -> None:
+        """等待发送队列投递后关闭各通知器的连接和共享的 HTTP 连接
+
+        Args:
+            drain_timeout: 等待发送队列的最长秒数（None 表示一直等待），
+                超时未送达的消息保留在队列中，下次运行时继续投递
+        """
+        if self.drainer is not None:
+            if not self.drainer.wait(drain_timeout):
+                print(f"发送队列: 仍有 {self.outbox.pending_count()} 条消息未送达，下次运行时继续投递")
+            self.drainer.stop()
+        for notifier in self.notifiers.values():
+            notifier.close()
+        self.transport.close()
+
     def list_notifiers(self) -> List[Dict[str, str]]:
         """列出所有通知器及其状态
 
@@ -0,0 +1,585 @@
+# coding=utf-8
+"""通知发送队列模块
+
+渲染好的消息批次先写入 SQLite 发送队列（output/.notification_outbox.db），
+再由后台投递线程逐条发送：
+- 每个渠道按入队顺序投递，前一批次未送达时后续批次等待（保证批次顺序）
+- 发送失败按指数退避重试，超过最大次数后标记为放弃
+- 同一渠道相邻两次发送之间至少间隔指定秒数（限速）
+- 每条消息以 (渠道, 报告类型, 批次序号, 内容) 的哈希作为幂等键，重复入队不会重复发送
+- 进程退出时未送达的消息保留在队列中，下次启动时继续投递
+- 入队时可附带送达回调的数据（保存在最后一个批次的上下文中），
+  同一次入队的批次全部送达后才回调（如写入增量推送账本）
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.notifiers.base import BaseNotifier
+
+# 消息状态
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_DEAD = "dead"
+
+# 批次上下文中送达回调数据的键
+DELIVERY_CONTEXT_KEY = "_delivery"
+
+
+class NotificationOutbox:
+    """持久化的通知发送队列
+
+    负责：
+    - 消息批次入队（幂等）
+    - 按渠道取出队首消息并加租约，防止多个投递线程/进程重复发送
+    - 记录发送结果并计算重试时间
+    - 清理过期的已完成消息
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idempotency_key TEXT NOT NULL UNIQUE,
+            channel TEXT NOT NULL,
+            report_type TEXT NOT NULL,
+            batch_index INTEGER NOT NULL,
+            batch_total INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            context TEXT NOT NULL DEFAULT '{}',
+            proxy_url TEXT,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            lease_until REAL NOT NULL DEFAULT 0,
+            last_error TEXT NOT NULL DEFAULT '',
+            created_at REAL NOT NULL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_messages_channel_status
+            ON messages (channel, status, id);
+    """
+
+    def __init__(
+        self,
+        db_path: Path = Path("output") / ".notification_outbox.db",
+        max_attempts: int = 5,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        lease_seconds: float = 120.0
+    ):
+        """初始化发送队列
+
+        Args:
+            db_path: 队列数据库路径
+            max_attempts: 单条消息的最大发送次数
+            backoff_base: 首次重试的等待秒数（之后每次翻倍）
+            backoff_max: 重试等待的上限秒数
+            lease_seconds: 取出消息后的租约时长，超时未回写结果的消息可被重新取出
+        """
+        self.db_path = Path(db_path)
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "NotificationOutbox":
+        """根据配置创建发送队列
+
+        Args:
+            config: 配置字典
+
+        Returns:
+            NotificationOutbox: 发送队列
+        """
+        return cls(
+            max_attempts=config.get("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5),
+            backoff_base=config.get("NOTIFICATION_OUTBOX_BACKOFF_BASE", 2.0),
+            backoff_max=config.get("NOTIFICATION_OUTBOX_BACKOFF_MAX", 300.0),
+        )
+
+    def exists(self) -> bool:
+        """队列数据库是否存在
+
+        Returns:
+            bool: 是否存在
+        """
+        return self.db_path.exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开数据库连接（必要时创建表结构）
+
+        Returns:
+            sqlite3.Connection: 数据库连接
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.SCHEMA)
+        return conn
+
+    @staticmethod
+    def make_key(channel: str, report_type: str, index: int, total: int, content: str) -> str:
+        """计算消息的幂等键
+
+        Args:
+            channel: 渠道标识
+            report_type: 报告类型
+            index: 批次序号
+            total: 批次总数
+            content: 批次内容
+
+        Returns:
+            str: 幂等键
+        """
+        raw = f"{channel}\n{report_type}\n{index}/{total}\n{content}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def enqueue(
+        self,
+        channel: str,
+        report_type: str,
+        batches: List[str],
+        context: Optional[Dict] = None,
+        proxy_url: Optional[str] = None,
+        delivery: Optional[Dict] = None
+    ) -> int:
+        """批次入队（已入队的相同批次会被忽略，已放弃的相同批次重新入队）
+
+        Args:
+            channel: 渠道标识
+            report_type: 报告类型
+            batches: 批次内容列表
+            context: 批次上下文
+            proxy_url: 代理URL
+            delivery: 全部批次送达后传给投递器送达回调的数据（保存在最后一个批次中）
+
+        Returns:
+            int: 新入队的批次数
+        """
+        now = time.time()
+        context_json = json.dumps(context or {}, ensure_ascii=False)
+        last_context_json = context_json
+        if delivery is not None:
+            last_context_json = json.dumps(
+                {**(context or {}), DELIVERY_CONTEXT_KEY: delivery}, ensure_ascii=False
+            )
+        rows = [
+            (
+                self.make_key(channel, report_type, i, len(batches), content),
+                channel, report_type, i, len(batches), content,
+                last_context_json if i == len(batches) else context_json, proxy_url,
+                STATUS_PENDING, now, now,
+            )
+            for i, content in enumerate(batches, 1)
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    "DELETE FROM messages WHERE idempotency_key = ? AND status = ?",
+                    [(row[0], STATUS_DEAD) for row in rows],
+                )
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO messages (
+                        idempotency_key, channel, report_type, batch_index, batch_total,
+                        content, context, proxy_url, status, next_attempt_at, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+                return conn.total_changes - before
+            finally:
+                conn.close()
+
+    def claim_next(self, channel: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """取出渠道的队首消息并加租约
+
+        队首消息尚未到重试时间或正被其他投递方持有时返回 None，保证同一渠道的批次顺序
+
+        Args:
+            channel: 渠道标识
+            now: 当前时间戳（默认 time.time()）
+
+        Returns:
+            Optional[Dict]: 消息，无可发送消息时为 None
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    """
+                    SELECT * FROM messages
+                    WHERE channel = ? AND status IN (?, ?)
+                    ORDER BY id LIMIT 1
+                    """,
+                    (channel, STATUS_PENDING, STATUS_SENDING),
+                ).fetchone()
+
+                if row is None:
+                    return None
+                if row["status"] == STATUS_SENDING and row["lease_until"] > now:
+                    return None
+                if row["status"] == STATUS_PENDING and row["next_attempt_at"] > now:
+                    return None
+
+                cursor = conn.execute(
+                    """
+                    UPDATE messages SET status = ?, lease_until = ?
+                    WHERE id = ? AND status = ? AND lease_until = ?
+                    """,
+                    (STATUS_SENDING, now + self.lease_seconds, row["id"], row["status"], row["lease_until"]),
+                )
+                conn.commit()
+                if cursor.rowcount != 1:
+                    return None
+
+                message = dict(row)
+                message["context"] = json.loads(message["context"])
+                return message
+            finally:
+                conn.close()
+
+    def mark_sent(self, message_id: int) -> None:
+        """标记消息已送达
+
+        Args:
+            message_id: 消息ID
+        """
+        self._update(
+            "UPDATE messages SET status = ?, attempts = attempts + 1, finished_at = ? WHERE id = ?",
+            (STATUS_SENT, time.time(), message_id),
+        )
+
+    def mark_failed(self, message_id: int, error: str, now: Optional[float] = None) -> bool:
+        """记录一次发送失败，未超过最大次数时按指数退避安排重试
+
+        Args:
+            message_id: 消息ID
+            error: 失败原因
+            now: 当前时间戳（默认 time.time()）
+
+        Returns:
+            bool: 是否还会重试
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT attempts FROM messages WHERE id = ?", (message_id,)
+                ).fetchone()
+                if row is None:
+                    return False
+
+                attempts = row["attempts"] + 1
+                if attempts >= self.max_attempts:
+                    conn.execute(
+                        """
+                        UPDATE messages SET status = ?, attempts = ?, last_error = ?, finished_at = ?
+                        WHERE id = ?
+                        """,
+                        (STATUS_DEAD, attempts, error, now, message_id),
+                    )
+                    conn.commit()
+                    return False
+
+                delay = min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+                conn.execute(
+                    """
+                    UPDATE messages SET status = ?, attempts = ?, last_error = ?,
+                        next_attempt_at = ?, lease_until = 0
+                    WHERE id = ?
+                    """,
+                    (STATUS_PENDING, attempts, error, now + delay, message_id),
+                )
+                conn.commit()
+                return True
+            finally:
+                conn.close()
+
+    def is_group_sent(self, message: Dict[str, Any]) -> bool:
+        """消息所在的一次入队（同一渠道、同一入队时间）的批次是否已全部送达
+
+        Args:
+            message: claim_next 返回的消息
+
+        Returns:
+            bool: 是否全部送达（有批次被放弃时为 False）
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    """
+                    SELECT COUNT(*) FROM messages
+                    WHERE channel = ? AND created_at = ? AND status != ?
+                    """,
+                    (message["channel"], message["created_at"], STATUS_SENT),
+                ).fetchone()
+                return row[0] == 0
+            finally:
+                conn.close()
+
+    def _update(self, sql: str, params: tuple) -> None:
+        """执行单条更新语句
+
+        Args:
+            sql: SQL 语句
+            params: 参数
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(sql, params)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def pending_channels(self) -> List[str]:
+        """有未完成消息的渠道
+
+        Returns:
+            List[str]: 渠道标识列表
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT DISTINCT channel FROM messages WHERE status IN (?, ?)",
+                    (STATUS_PENDING, STATUS_SENDING),
+                ).fetchall()
+                return [row["channel"] for row in rows]
+            finally:
+                conn.close()
+
+    def pending_count(self, channel: Optional[str] = None) -> int:
+        """未完成（待发送或发送中）的消息数
+
+        Args:
+            channel: 渠道标识（None 表示所有渠道）
+
+        Returns:
+            int: 消息数
+        """
+        sql = "SELECT COUNT(*) FROM messages WHERE status IN (?, ?)"
+        params: tuple = (STATUS_PENDING, STATUS_SENDING)
+        if channel is not None:
+            sql += " AND channel = ?"
+            params += (channel,)
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute(sql, params).fetchone()[0]
+            finally:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """按渠道统计各状态的消息数
+
+        Returns:
+            Dict[str, Dict[str, int]]: {渠道: {状态: 数量}}
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT channel, status, COUNT(*) AS n FROM messages GROUP BY channel, status"
+                ).fetchall()
+            finally:
+                conn.close()
+
+        stats: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            stats.setdefault(row["channel"], {})[row["status"]] = row["n"]
+        return stats
+
+    def purge(self, retention_days: int = 7) -> int:
+        """删除过期的已完成消息
+
+        Args:
+            retention_days: 已完成消息的保留天数
+
+        Returns:
+            int: 删除的消息数
+        """
+        cutoff = time.time() - retention_days * 86400
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    "DELETE FROM messages WHERE status IN (?, ?) AND finished_at < ?",
+                    (STATUS_SENT, STATUS_DEAD, cutoff),
+                )
+                conn.commit()
+                return cursor.rowcount
+            finally:
+                conn.close()
+
+
+class OutboxDrainer:
+    """发送队列的后台投递器
+
+    每个渠道一个投递线程，各渠道互不阻塞；渠道内按队列顺序逐条发送
+    """
+
+    def __init__(
+        self,
+        outbox: NotificationOutbox,
+        notifiers: Dict[str, BaseNotifier],
+        rate_intervals: Optional[Dict[str, float]] = None,
+        default_interval: float = 1.0,
+        poll_interval: float = 0.5,
+        on_delivered: Optional[Callable[[str, Dict], None]] = None
+    ):
+        """初始化投递器
+
+        Args:
+            outbox: 发送队列
+            notifiers: {渠道标识: 通知器}
+            rate_intervals: 按渠道覆盖的最小发送间隔(秒)
+            default_interval: 默认最小发送间隔(秒)
+            poll_interval: 队列为空或等待重试时的轮询间隔(秒)
+            on_delivered: 一次入队的批次全部送达后的回调 (渠道标识, 入队时附带的 delivery 数据)
+        """
+        self.outbox = outbox
+        self.notifiers = notifiers
+        self.rate_intervals = rate_intervals or {}
+        self.default_interval = default_interval
+        self.poll_interval = poll_interval
+        self.on_delivered = on_delivered
+        self._threads: Dict[str, threading.Thread] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self, channels: Optional[List[str]] = None) -> None:
+        """启动渠道的投递线程（已启动的渠道忽略）
+
+        Args:
+            channels: 渠道标识列表（默认所有有未完成消息的渠道）
+        """
+        if channels is None:
+            channels = self.outbox.pending_channels()
+
+        with self._lock:
+            for channel in channels:
+                if channel not in self.notifiers:
+                    continue
+                thread = self._threads.get(channel)
+                if thread is not None and thread.is_alive():
+                    continue
+                thread = threading.Thread(
+                    target=self._run_channel, args=(channel,),
+                    name=f"outbox-{channel}", daemon=True
+                )
+                self._threads[channel] = thread
+                thread.start()
+
+    def _run_channel(self, channel: str) -> None:
+        """渠道投递循环：队列清空后退出
+
+        Args:
+            channel: 渠道标识
+        """
+        notifier = self.notifiers[channel]
+        interval = self.rate_intervals.get(channel, self.default_interval)
+        last_sent = 0.0
+
+        while not self._stop.is_set():
+            # 限速：与上一次发送保持最小间隔
+            wait = last_sent + interval - time.time()
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+
+            message = self.outbox.claim_next(channel)
+            if message is None:
+                # 与 start 互斥，避免退出前刚入队的消息无人投递
+                with self._lock:
+                    if self.outbox.pending_count(channel) == 0:
+                        self._threads.pop(channel, None)
+                        return
+                # 队首消息等待重试或被其他投递方持有
+                self._stop.wait(self.poll_interval)
+                continue
+
+            index, total = message["batch_index"], message["batch_total"]
+            print(f"发送队列: {notifier.name} 第 {index}/{total} 批次 "
+                  f"(第 {message['attempts'] + 1} 次尝试) [{message['report_type']}]")
+
+            context = message["context"]
+            delivery = context.pop(DELIVERY_CONTEXT_KEY, None)
+            try:
+                success = notifier.send_batch(
+                    message["content"], message["report_type"], index, total,
+                    message["proxy_url"], context
+                )
+                error = "" if success else "发送失败"
+            except Exception as e:
+                success = False
+                error = str(e)
+            last_sent = time.time()
+
+            if success:
+                self.outbox.mark_sent(message["id"])
+                if delivery is not None and self.on_delivered is not None and self.outbox.is_group_sent(message):
+                    try:
+                        self.on_delivered(channel, delivery)
+                    except Exception as e:
+                        print(f"发送队列: {notifier.name} 送达回调出错: {e}")
+            elif not self.outbox.mark_failed(message["id"], error):
+                print(f"发送队列: {notifier.name} 第 {index}/{total} 批次已达最大重试次数，放弃发送")
+
+    def is_running(self) -> bool:
+        """是否有投递线程在运行
+
+        Returns:
+            bool: 是否运行中
+        """
+        with self._lock:
+            return any(thread.is_alive() for thread in self._threads.values())
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """等待投递线程把队列清空
+
+        Args:
+            timeout: 最长等待秒数（None 表示一直等待）
+
+        Returns:
+            bool: 是否已全部完成（超时返回 False，未完成的消息留在队列中）
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._lock:
+            threads = list(self._threads.values())
+
+        for thread in threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            thread.join(remaining)
+
+        return not any(thread.is_alive() for thread in threads)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """停止投递（正在发送的批次发送完后退出，未完成的消息留在队列中）
+
+        Args:
+            timeout: 等待投递线程退出的最长秒数（None 表示一直等待）
+        """
+        self._stop.set()
+        self.wait(timeout)
@@ -0,0 +1,88 @@
+# coding=utf-8
+"""通知内容渲染缓存
+
+一次推送内，各渠道的消息批次只按 (消息格式, 批次大小) 渲染一次：
+- 格式相同的渠道（钉钉与企业微信的 markdown 完全一致）共用同一份渲染结果
+- 标题行按格式缓存，批次大小不同的渠道只需重新分批，不必重新格式化标题
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.core.reporter import NewsReporter
+from src.notifiers.batch_sender import BatchSender
+
+# 输出完全相同的消息格式
+FORMAT_ALIASES = {
+    "wework": "dingtalk",
+}
+
+
+class RenderCache:
+    """单次推送的渲染缓存
+
+    负责：
+    - 按 (格式, 批次大小, 模式, 更新信息) 缓存分批结果
+    - 按格式缓存标题行
+    """
+
+    def __init__(self, report_data: Dict, rank_threshold: int = 10):
+        """初始化缓存
+
+        Args:
+            report_data: 本次推送的报告数据
+            rank_threshold: 排名阈值（用于高亮显示）
+        """
+        self.report_data = report_data
+        self.batch_sender = BatchSender(NewsReporter(rank_threshold=rank_threshold), memoize=True)
+        self._batches: Dict[Tuple, List[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def canonical_format(platform: str) -> str:
+        """获取输出相同的规范格式名
+
+        Args:
+            platform: 平台类型
+
+        Returns:
+            str: 规范格式名
+        """
+        return FORMAT_ALIASES.get(platform, platform)
+
+    def get_batches(
+        self,
+        platform: str,
+        update_info: Optional[Dict] = None,
+        max_bytes: int = 20000,
+        mode: str = "daily"
+    ) -> List[str]:
+        """获取（必要时渲染）消息批次
+
+        Args:
+            platform: 平台类型
+            update_info: 更新信息
+            max_bytes: 每批次最大字节数
+            mode: 模式
+
+        Returns:
+            List[str]: 批次内容列表
+        """
+        fmt = self.canonical_format(platform)
+        version = update_info.get("latest_version") if update_info else None
+        key = (fmt, max_bytes, mode, version)
+
+        with self._lock:
+            batches = self._batches.get(key)
+            if batches is not None:
+                self.hits += 1
+                return batches
+
+            self.misses += 1
+            batches = self.batch_sender.split_content_into_batches(
+                self.report_data, fmt, update_info, max_bytes, mode
+            )
+            self._batches[key] = batches
+            return batches
@@ -0,0 +1,273 @@
+# coding=utf-8
+"""SMTP 会话池模块
+
+邮件通知复用已登录的 SMTP 会话：
+- 会话按 (服务器, 端口, 账号) 缓存在进程内，API 定时任务的多次运行之间共用
+- 复用前发送 NOOP 检查连接，检查失败（或超过设置的空闲时间）时重新连接并登录
+- 共享会话池在进程退出时关闭，单次运行结束时不关闭
+- 邮件由 email.policy.SMTP 生成器直接分块写入 DATA 阶段的套接字（含点号转义），
+  不再先生成整封邮件的字符串
+"""
+
+import smtplib
+import threading
+import time
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+from typing import Dict, List, Optional, Tuple
+
+# 会话键：(服务器, 端口, 账号)
+SessionKey = Tuple[str, int, str]
+
+
+class _DataWriter:
+    """DATA 阶段的套接字写入器
+
+    对行首的 "." 做转义（RFC 5321 4.5.2），按块缓冲后写入套接字
+    """
+
+    def __init__(self, sock, chunk_size: int = 65536):
+        """初始化写入器
+
+        Args:
+            sock: SMTP 连接的套接字
+            chunk_size: 每次写入套接字的字节数
+        """
+        self.sock = sock
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._at_line_start = True
+
+    def write(self, data: bytes) -> None:
+        """写入邮件内容（由 BytesGenerator 调用）
+
+        Args:
+            data: 内容片段
+        """
+        if not data:
+            return
+        if self._at_line_start and data.startswith(b"."):
+            self._buffer += b"."
+        self._buffer += data.replace(b"\n.", b"\n..")
+        self._at_line_start = data.endswith(b"\n")
+
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """写出缓冲区"""
+        if self._buffer:
+            self.sock.sendall(self._buffer)
+            self._buffer.clear()
+
+    def finish(self) -> None:
+        """写入结束标记并写出缓冲区"""
+        if not self._at_line_start:
+            self._buffer += b"\r\n"
+        self._buffer += b".\r\n"
+        self.flush()
+
+
+def send_message_streamed(
+    smtp: smtplib.SMTP,
+    msg: EmailMessage,
+    from_addr: str,
+    to_addrs: List[str],
+    mail_options: Optional[List[str]] = None
+) -> Dict[str, Tuple[int, bytes]]:
+    """以流式方式发送邮件
+
+    与 smtplib.SMTP.sendmail 的语义一致，但邮件内容由生成器直接写入套接字
+
+    Args:
+        smtp: 已登录的 SMTP 连接
+        msg: 邮件
+        from_addr: 发件人
+        to_addrs: 收件人列表
+        mail_options: MAIL FROM 参数（如 ["BODY=8BITMIME"]）
+
+    Returns:
+        Dict[str, Tuple[int, bytes]]: 被拒绝的收件人 {地址: (状态码, 响应)}
+
+    Raises:
+        smtplib.SMTPException: 发件人或全部收件人被拒绝、DATA 失败
+    """
+    smtp.ehlo_or_helo_if_needed()
+
+    code, resp = smtp.mail(from_addr, mail_options or [])
+    if code != 250:
+        smtp.rset()
+        raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+    refused = {}
+    for addr in to_addrs:
+        code, resp = smtp.rcpt(addr)
+        if code not in (250, 251):
+            refused[addr] = (code, resp)
+    if len(refused) == len(to_addrs):
+        smtp.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+
+    code, resp = smtp.docmd("data")
+    if code != 354:
+        smtp.rset()
+        raise smtplib.SMTPDataError(code, resp)
+
+    writer = _DataWriter(smtp.sock)
+    BytesGenerator(writer, mangle_from_=False, policy=SMTP_POLICY).flatten(msg)
+    writer.finish()
+
+    code, resp = smtp.getreply()
+    if code != 250:
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+class SMTPPool:
+    """SMTP 会话池
+
+    负责：
+    - 缓存已登录的空闲会话
+    - 复用前检查会话是否可用
+    - 统计新建连接和复用次数
+    """
+
+    def __init__(self, idle_timeout: float = 0):
+        """初始化会话池
+
+        Args:
+            idle_timeout: 空闲会话的最长保留秒数（0 表示不限制，只依靠 NOOP 检查）
+        """
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[SessionKey, Tuple[smtplib.SMTP, float]] = {}
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.reuses = 0
+
+    def acquire(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        starttls: bool = True,
+        timeout: float = 30,
+        idle_timeout: Optional[float] = None
+    ) -> smtplib.SMTP:
+        """获取已登录的会话（优先复用空闲会话）
+
+        Args:
+            host: SMTP 服务器
+            port: 端口（465 使用 SSL 连接）
+            username: 账号
+            password: 密码或授权码
+            starttls: 非 SSL 端口是否升级为 TLS
+            timeout: 连接超时(秒)
+            idle_timeout: 本次复用允许的最长空闲秒数（None 使用会话池的设置，0 表示不限制）
+
+        Returns:
+            smtplib.SMTP: 会话，用完后调用 release 归还或 discard 丢弃
+        """
+        key = (host, port, username)
+        with self._lock:
+            entry = self._idle.pop(key, None)
+
+        if entry is not None:
+            smtp, last_used = entry
+            if idle_timeout is None:
+                idle_timeout = self.idle_timeout
+            fresh = not idle_timeout or time.time() - last_used <= idle_timeout
+            if fresh and self._is_alive(smtp):
+                self.reuses += 1
+                return smtp
+            self.discard(smtp)
+
+        print(f"正在连接SMTP服务器: {host}:{port}")
+        if port == 465:
+            smtp = smtplib.SMTP_SSL(host, port, timeout=timeout)
+        else:
+            smtp = smtplib.SMTP(host, port, timeout=timeout)
+            if starttls:
+                smtp.starttls()
+
+        try:
+            print("正在登录邮箱...")
+            smtp.login(username, password)
+        except Exception:
+            self.discard(smtp)
+            raise
+
+        self.connects += 1
+        return smtp
+
+    def release(self, host: str, port: int, username: str, smtp: smtplib.SMTP) -> None:
+        """归还会话
+
+        Args:
+            host: SMTP 服务器
+            port: 端口
+            username: 账号
+            smtp: 会话
+        """
+        key = (host, port, username)
+        with self._lock:
+            previous = self._idle.get(key)
+            self._idle[key] = (smtp, time.time())
+
+        if previous is not None:
+            self.discard(previous[0])
+
+    @staticmethod
+    def _is_alive(smtp: smtplib.SMTP) -> bool:
+        """NOOP 检查会话是否可用
+
+        Args:
+            smtp: 会话
+
+        Returns:
+            bool: 是否可用
+        """
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def discard(smtp: smtplib.SMTP) -> None:
+        """关闭会话（忽略关闭时的错误）
+
+        Args:
+            smtp: 会话
+        """
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    def close(self) -> None:
+        """关闭所有空闲会话"""
+        with self._lock:
+            sessions = [smtp for smtp, _ in self._idle.values()]
+            self._idle.clear()
+
+        for smtp in sessions:
+            self.discard(smtp)
+
+
+# 进程内共享的会话池（进程退出时调用 close_smtp_pool 关闭）
+_default_pool = SMTPPool()
+
+
+def get_smtp_pool() -> SMTPPool:
+    """获取进程内共享的会话池
+
+    Returns:
+        SMTPPool: 会话池
+    """
+    return _default_pool
+
+
+def close_smtp_pool() -> None:
+    """关闭进程内共享会话池中的空闲会话（进程退出时调用）"""
+    _default_pool.close()
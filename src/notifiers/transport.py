@@ -0,0 +1,222 @@
+# coding=utf-8
+"""通知渠道 HTTP 传输层
+
+所有 webhook 类通知器共享一个带连接池的 HTTP 客户端：
+同一主机的多批次消息复用 keep-alive 连接，不再为每条消息重新建立 TCP+TLS 连接。
+异步发送（apost）使用 httpx.AsyncClient，每个事件循环各自缓存客户端。
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class NotifierTransport:
+    """通知器共享的 HTTP 传输层
+
+    负责：
+    - 按代理地址缓存连接池（每个代理一个会话，替代逐次构造的 proxies 字典）
+    - 限制每个主机的连接数（连接用尽时等待空闲连接）
+    - 可选 HTTP/2（需要安装 httpx[http2]）
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 4,
+        http2: bool = False
+    ):
+        """初始化传输层
+
+        Args:
+            pool_connections: 缓存的主机连接池数量
+            pool_maxsize: 每个主机的最大连接数
+            http2: 是否启用 HTTP/2（未安装 h2 时回退到 HTTP/1.1）
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._clients: Dict[Optional[str], Any] = {}
+        # 事件循环 -> {代理URL: httpx.AsyncClient}（异步客户端不能跨事件循环使用）
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+        if http2 and not HTTP2_AVAILABLE:
+            print("未安装 h2，通知推送使用 HTTP/1.1（pip install httpx[http2] 以启用 HTTP/2）")
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "NotifierTransport":
+        """根据配置创建传输层
+
+        Args:
+            config: 配置字典
+
+        Returns:
+            NotifierTransport: 传输层实例
+        """
+        return cls(
+            pool_maxsize=config.get("NOTIFICATION_POOL_MAXSIZE", 4),
+            http2=config.get("NOTIFICATION_HTTP2", False),
+        )
+
+    def _create_client(self, proxy_url: Optional[str]) -> Any:
+        """创建客户端
+
+        Args:
+            proxy_url: 代理URL
+
+        Returns:
+            requests.Session 或 httpx.Client
+        """
+        if self.http2:
+            return httpx.Client(
+                http2=True,
+                proxy=proxy_url,
+                limits=httpx.Limits(
+                    max_connections=self.pool_connections * self.pool_maxsize,
+                    max_keepalive_connections=self.pool_connections * self.pool_maxsize,
+                ),
+            )
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if proxy_url:
+            session.proxies = {"http": proxy_url, "https": proxy_url}
+        return session
+
+    def _get_client(self, proxy_url: Optional[str]) -> Any:
+        """获取（必要时创建）代理对应的客户端
+
+        Args:
+            proxy_url: 代理URL
+
+        Returns:
+            requests.Session 或 httpx.Client
+        """
+        with self._lock:
+            client = self._clients.get(proxy_url)
+            if client is None:
+                client = self._clients[proxy_url] = self._create_client(proxy_url)
+            return client
+
+    def post(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> Any:
+        """发送 POST 请求
+
+        Args:
+            url: 请求地址
+            proxy_url: 代理URL
+            **kwargs: headers、json、data、timeout 等参数（同 requests.post）
+
+        Returns:
+            响应对象（提供 status_code、json()、text）
+
+        Raises:
+            requests.exceptions.RequestException: 请求失败（HTTP/2 模式下的异常也统一转换）
+        """
+        client = self._get_client(proxy_url)
+
+        if not self.http2:
+            return client.post(url, **kwargs)
+
+        data = kwargs.pop("data", None)
+        if data is not None:
+            kwargs["content"] = data
+        try:
+            return client.post(url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+
+    def _get_async_client(self, proxy_url: Optional[str]) -> Any:
+        """获取（必要时创建）当前事件循环中代理对应的异步客户端
+
+        Args:
+            proxy_url: 代理URL
+
+        Returns:
+            httpx.AsyncClient: 异步客户端
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(proxy_url)
+            if client is None:
+                client = clients[proxy_url] = httpx.AsyncClient(
+                    http2=self.http2,
+                    proxy=proxy_url,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_connections * self.pool_maxsize,
+                        max_keepalive_connections=self.pool_connections * self.pool_maxsize,
+                    ),
+                )
+            return client
+
+    async def apost(self, url: str, proxy_url: Optional[str] = None, **kwargs) -> Any:
+        """异步发送 POST 请求（未安装 httpx 时在线程中执行 post）
+
+        Args:
+            url: 请求地址
+            proxy_url: 代理URL
+            **kwargs: headers、json、data、timeout 等参数（同 requests.post）
+
+        Returns:
+            响应对象（提供 status_code、json()、text）
+
+        Raises:
+            requests.exceptions.RequestException: 请求失败（httpx 异常统一转换）
+        """
+        if not HTTPX_AVAILABLE:
+            return await asyncio.to_thread(self.post, url, proxy_url, **kwargs)
+
+        client = self._get_async_client(proxy_url)
+
+        data = kwargs.pop("data", None)
+        if data is not None:
+            kwargs["content"] = data
+        try:
+            return await client.post(url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.RequestException(str(e)) from e
+
+    async def aclose(self) -> None:
+        """关闭当前事件循环中的异步客户端（事件循环结束前调用）"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.pop(loop, {})
+
+        for client in clients.values():
+            await client.aclose()
+
+    def close(self) -> None:
+        """关闭所有同步连接（异步客户端由 aclose 在各自的事件循环中关闭）"""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
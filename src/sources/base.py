@@ -1,10 +1,36 @@
 # coding=utf-8
 """信息源抽象基类"""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Executor
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
 from src.models.news import News
 
+# 同步获取使用的线程池（TrendRadarApp 在一次爬取中设置，未设置时使用事件循环的默认线程池）
+fetch_executor: ContextVar[Optional[Executor]] = ContextVar("fetch_executor", default=None)
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """在线程池中执行同步调用
+
+    Args:
+        func: 同步函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        Any: 函数返回值
+    """
+    executor = fetch_executor.get()
+    if executor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
 
 class BaseSource(ABC):
     """信息源抽象基类
@@ -53,6 +79,20 @@ class BaseSource(ABC):
         """
         pass
 
+    async def afetch_news(self, **kwargs) -> List[News]:
+        """异步获取新闻列表
+
+        默认实现将同步的 fetch_news 放到线程池中执行（见 run_blocking），避免阻塞事件循环；
+        支持原生异步请求的子类应重写此方法
+
+        Args:
+            **kwargs: 可选参数，与 fetch_news 一致
+
+        Returns:
+            List[News]: 标准化的 News 对象列表
+        """
+        return await run_blocking(self.fetch_news, **kwargs)
+
     def _check_enabled(self) -> bool:
         """检查该信息源是否启用
 
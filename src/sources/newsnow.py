@@ -4,10 +4,13 @@
 import json
 import time
 import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Union, Optional
 from src.sources.base import BaseSource
 from src.models.news import News
-from src.utils.http import HTTPClient
+from src.utils.http import HTTPClient, AsyncHTTPClient, HostRateLimiter, HTTPX_AVAILABLE
 from src.utils.file import clean_title
 
 
@@ -30,12 +33,14 @@ class NewNowSource(BaseSource):
     def fetch_news(
         self,
         request_interval: Optional[int] = None,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> List[News]:
         """获取新闻列表
 
         Args:
             request_interval: 请求间隔（毫秒），默认从配置读取
+            max_workers: 并发请求数，默认从配置读取（<=1 时串行爬取）
             **kwargs: 其他参数
 
         Returns:
@@ -52,17 +57,140 @@ class NewNowSource(BaseSource):
         if request_interval is None:
             request_interval = self.config.get("REQUEST_INTERVAL", 1000)
 
+        # 获取并发数
+        if max_workers is None:
+            max_workers = source_config.get(
+                "max_workers", self.config.get("CRAWLER_MAX_WORKERS", 1)
+            )
+
         # 爬取数据
-        results, id_to_name, failed_ids = self._crawl_platforms(
-            platforms,
-            request_interval
-        )
+        if max_workers > 1:
+            results, id_to_name, failed_ids = self._crawl_platforms_concurrent(
+                platforms,
+                request_interval,
+                max_workers
+            )
+        else:
+            results, id_to_name, failed_ids = self._crawl_platforms(
+                platforms,
+                request_interval
+            )
 
         # 转换为 News 对象
         news_list = self._convert_to_news(results, id_to_name)
 
         return news_list
 
+    async def afetch_news(
+        self,
+        request_interval: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[News]:
+        """异步获取新闻列表
+
+        使用 httpx.AsyncClient 原生异步请求；未安装 httpx 时退回线程执行
+
+        Args:
+            request_interval: 同一主机的请求间隔（毫秒），默认从配置读取
+            max_workers: 同时在途的请求数，默认从配置读取
+            **kwargs: 其他参数
+
+        Returns:
+            List[News]: 新闻列表
+        """
+        if not HTTPX_AVAILABLE:
+            return await super().afetch_news(
+                request_interval=request_interval,
+                max_workers=max_workers,
+                **kwargs
+            )
+
+        source_config = self.get_source_config()
+        platforms = source_config.get("platforms", self.config.get("PLATFORMS", []))
+
+        if not platforms:
+            print(f"警告: {self.source_name} 未配置平台列表")
+            return []
+
+        if request_interval is None:
+            request_interval = self.config.get("REQUEST_INTERVAL", 1000)
+
+        if max_workers is None:
+            max_workers = source_config.get(
+                "max_workers", self.config.get("CRAWLER_MAX_WORKERS", 1)
+            )
+
+        results, id_to_name, failed_ids = await self._acrawl_platforms(
+            platforms,
+            request_interval,
+            max_workers
+        )
+
+        return self._convert_to_news(results, id_to_name)
+
+    async def _acrawl_platforms(
+        self,
+        platforms: List[Dict[str, str]],
+        request_interval: int,
+        max_workers: int
+    ) -> Tuple[Dict, Dict, List]:
+        """异步爬取多个平台数据
+
+        以信号量限制同时在途的请求数，并按主机限速；
+        返回结果与 _crawl_platforms 完全一致（包括平台顺序）
+
+        Args:
+            platforms: 平台列表 [{"id": "zhihu", "name": "知乎"}, ...]
+            request_interval: 同一主机的请求间隔（毫秒）
+            max_workers: 最大并发请求数
+
+        Returns:
+            Tuple[Dict, Dict, List]: 同 _crawl_platforms
+        """
+        proxy_url = None
+        if self.config.get("USE_PROXY"):
+            proxy_url = self.config.get("DEFAULT_PROXY")
+
+        rate_limiter = HostRateLimiter(
+            interval_ms=max(50, request_interval),
+            jitter_ms=(-10, 20)
+        )
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async with AsyncHTTPClient(proxy_url=proxy_url, rate_limiter=rate_limiter) as http_client:
+
+            async def crawl_one(platform_id: str) -> Optional[Dict]:
+                async with semaphore:
+                    response_text, success, error = await self._afetch_platform_data(
+                        http_client,
+                        platform_id
+                    )
+                return self._handle_platform_response(platform_id, response_text, success)
+
+            parsed_list = await asyncio.gather(
+                *(crawl_one(platform["id"]) for platform in platforms),
+                return_exceptions=True
+            )
+
+        id_to_name = {platform["id"]: platform["name"] for platform in platforms}
+        results = {}
+        failed_ids = []
+
+        for platform, parsed in zip(platforms, parsed_list):
+            platform_id = platform["id"]
+            if isinstance(parsed, BaseException):
+                print(f"爬取 {platform_id} 出错: {parsed}")
+                parsed = None
+
+            if parsed is not None:
+                results[platform_id] = parsed
+            else:
+                failed_ids.append(platform_id)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
+
     def _crawl_platforms(
         self,
         platforms: List[Dict[str, str]],
@@ -102,16 +230,9 @@ class NewNowSource(BaseSource):
                 platform_id
             )
 
-            if success and response_text:
-                try:
-                    data = json.loads(response_text)
-                    results[platform_id] = self._parse_platform_data(data)
-                except json.JSONDecodeError:
-                    print(f"解析 {platform_id} 响应失败")
-                    failed_ids.append(platform_id)
-                except Exception as e:
-                    print(f"处理 {platform_id} 数据出错: {e}")
-                    failed_ids.append(platform_id)
+            parsed = self._handle_platform_response(platform_id, response_text, success)
+            if parsed is not None:
+                results[platform_id] = parsed
             else:
                 failed_ids.append(platform_id)
 
@@ -126,6 +247,116 @@ class NewNowSource(BaseSource):
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
 
+    def _crawl_platforms_concurrent(
+        self,
+        platforms: List[Dict[str, str]],
+        request_interval: int,
+        max_workers: int
+    ) -> Tuple[Dict, Dict, List]:
+        """并发爬取多个平台数据
+
+        使用有界线程池控制同时在途的请求数，并以按主机限速器
+        替代串行模式下的全局 sleep；单个平台变慢或重试不会阻塞其他平台。
+        返回结果与 _crawl_platforms 完全一致（包括平台顺序）。
+
+        Args:
+            platforms: 平台列表 [{"id": "zhihu", "name": "知乎"}, ...]
+            request_interval: 同一主机的请求间隔（毫秒）
+            max_workers: 最大并发请求数
+
+        Returns:
+            Tuple[Dict, Dict, List]: 同 _crawl_platforms
+        """
+        proxy_url = None
+        if self.config.get("USE_PROXY"):
+            proxy_url = self.config.get("DEFAULT_PROXY")
+
+        rate_limiter = HostRateLimiter(
+            interval_ms=max(50, request_interval),
+            jitter_ms=(-10, 20)
+        )
+
+        # requests.Session 不保证线程安全，每个工作线程使用独立的客户端
+        local = threading.local()
+        clients = []
+        clients_lock = threading.Lock()
+
+        def get_client() -> HTTPClient:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = HTTPClient(proxy_url=proxy_url, rate_limiter=rate_limiter)
+                local.client = client
+                with clients_lock:
+                    clients.append(client)
+            return client
+
+        def crawl_one(platform_id: str) -> Optional[Dict]:
+            response_text, success, error = self._fetch_platform_data(
+                get_client(),
+                platform_id
+            )
+            return self._handle_platform_response(platform_id, response_text, success)
+
+        id_to_name = {platform["id"]: platform["name"] for platform in platforms}
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(platforms)),
+            thread_name_prefix="newsnow"
+        ) as executor:
+            futures = [
+                (platform["id"], executor.submit(crawl_one, platform["id"]))
+                for platform in platforms
+            ]
+
+            results = {}
+            failed_ids = []
+            for platform_id, future in futures:
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    print(f"爬取 {platform_id} 出错: {e}")
+                    parsed = None
+
+                if parsed is not None:
+                    results[platform_id] = parsed
+                else:
+                    failed_ids.append(platform_id)
+
+        for client in clients:
+            client.close()
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
+
+    def _handle_platform_response(
+        self,
+        platform_id: str,
+        response_text: Optional[str],
+        success: bool
+    ) -> Optional[Dict]:
+        """解析单个平台的响应
+
+        Args:
+            platform_id: 平台ID
+            response_text: 响应文本
+            success: 请求是否成功
+
+        Returns:
+            Optional[Dict]: 解析后的数据，失败返回 None
+        """
+        if not (success and response_text):
+            return None
+
+        try:
+            data = json.loads(response_text)
+            return self._parse_platform_data(data)
+        except json.JSONDecodeError:
+            print(f"解析 {platform_id} 响应失败")
+        except Exception as e:
+            print(f"处理 {platform_id} 数据出错: {e}")
+
+        return None
+
     def _fetch_platform_data(
         self,
         http_client: HTTPClient,
@@ -147,6 +378,46 @@ class NewNowSource(BaseSource):
 
         response_text, success, error = http_client.get(url, max_retries=2)
 
+        return self._check_platform_response(platform_id, response_text, success, error)
+
+    async def _afetch_platform_data(
+        self,
+        http_client: AsyncHTTPClient,
+        platform_id: str
+    ) -> Tuple[Optional[str], bool, Optional[str]]:
+        """异步获取单个平台数据
+
+        Args:
+            http_client: 异步 HTTP 客户端
+            platform_id: 平台ID
+
+        Returns:
+            Tuple[Optional[str], bool, Optional[str]]: 同 _fetch_platform_data
+        """
+        url = f"{self.API_BASE_URL}?id={platform_id}&latest"
+
+        response_text, success, error = await http_client.get(url, max_retries=2)
+
+        return self._check_platform_response(platform_id, response_text, success, error)
+
+    def _check_platform_response(
+        self,
+        platform_id: str,
+        response_text: Optional[str],
+        success: bool,
+        error: Optional[str]
+    ) -> Tuple[Optional[str], bool, Optional[str]]:
+        """检查平台响应状态
+
+        Args:
+            platform_id: 平台ID
+            response_text: 响应文本
+            success: 请求是否成功
+            error: 错误信息
+
+        Returns:
+            Tuple[Optional[str], bool, Optional[str]]: 同 _fetch_platform_data
+        """
         if success and response_text:
             try:
                 data_json = json.loads(response_text)
@@ -3,11 +3,13 @@
 
 import feedparser
 import ssl
+import asyncio
 from datetime import datetime
 from typing import List, Dict, Any
-from src.sources.base import BaseSource
+from src.sources.base import BaseSource, run_blocking
 from src.models.news import News
 from src.utils.file import clean_title
+from src.utils.http import AsyncHTTPClient, HTTPX_AVAILABLE
 
 # 处理 macOS SSL 证书问题
 # 在某些 macOS 系统上,Python 的 SSL 证书配置可能不完整
@@ -61,6 +63,83 @@ class RSSSource(BaseSource):
 
         return news_list
 
+    async def afetch_news(self, **kwargs) -> List[News]:
+        """异步获取新闻列表
+
+        所有 feed 通过 httpx 并发下载，下载完成后在线程中解析；
+        未安装 httpx 时退回线程执行 fetch_news
+
+        Returns:
+            List[News]: 新闻列表（按 feed 配置顺序）
+        """
+        if not HTTPX_AVAILABLE:
+            return await super().afetch_news(**kwargs)
+
+        source_config = self.get_source_config()
+        feeds = source_config.get("feeds", [])
+
+        if not feeds:
+            print(f"警告: {self.source_name} 未配置 feed 列表")
+            return []
+
+        proxy_url = None
+        if self.config.get("USE_PROXY"):
+            proxy_url = self.config.get("DEFAULT_PROXY")
+
+        feed_configs = [
+            (feed_config["url"], feed_config.get("name", feed_config["url"]))
+            for feed_config in feeds
+            if feed_config.get("url")
+        ]
+
+        # 与模块顶部关闭证书校验的处理保持一致
+        async with AsyncHTTPClient(proxy_url=proxy_url, timeout=30, verify=False) as http_client:
+            feed_results = await asyncio.gather(
+                *(self._afetch_feed(http_client, url, name) for url, name in feed_configs),
+                return_exceptions=True
+            )
+
+        news_list = []
+        for (feed_url, feed_name), feed_news in zip(feed_configs, feed_results):
+            if isinstance(feed_news, BaseException):
+                print(f"获取 RSS feed {feed_name} 失败: {feed_news}")
+                continue
+            news_list.extend(feed_news)
+
+        return news_list
+
+    async def _afetch_feed(
+        self,
+        http_client: AsyncHTTPClient,
+        feed_url: str,
+        feed_name: str
+    ) -> List[News]:
+        """异步获取单个 feed 的新闻
+
+        Args:
+            http_client: 异步 HTTP 客户端
+            feed_url: Feed URL
+            feed_name: Feed 名称
+
+        Returns:
+            List[News]: 新闻列表
+        """
+        response_text, success, error = await http_client.get(
+            feed_url,
+            headers={"Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*"},
+            max_retries=1
+        )
+        if not success:
+            print(f"获取 RSS feed {feed_name} 失败: {error}")
+            return []
+
+        try:
+            feed = await run_blocking(feedparser.parse, response_text)
+            return self._parse_feed(feed, feed_url, feed_name)
+        except Exception as e:
+            print(f"解析 RSS feed {feed_name} 失败: {e}")
+            return []
+
     def _fetch_feed(self, feed_url: str, feed_name: str) -> List[News]:
         """获取单个 feed 的新闻
 
@@ -73,52 +152,64 @@ class RSSSource(BaseSource):
         """
         try:
             feed = feedparser.parse(feed_url)
-
-            if feed.bozo:
-                print(f"警告: RSS feed {feed_name} 解析可能有问题")
-
-            news_list = []
-            for index, entry in enumerate(feed.entries, 1):
-                title = clean_title(entry.get("title", ""))
-                link = entry.get("link", "")
-
-                if not title or not link:
-                    continue
-
-                # 解析发布时间
-                published = entry.get("published_parsed") or entry.get("updated_parsed")
-                timestamp = None
-                if published:
-                    try:
-                        timestamp = datetime(*published[:6])
-                    except Exception:
-                        pass
-
-                # 提取摘要
-                summary = entry.get("summary", "")
-
-                news = News(
-                    title=title,
-                    url=link,
-                    platform="rss",
-                    platform_name=feed_name,
-                    rank=index,
-                    source_id=self.source_id,
-                    timestamp=timestamp,
-                    extra={
-                        "summary": summary,
-                        "feed_url": feed_url
-                    }
-                )
-                news_list.append(news)
-
-            print(f"获取 RSS feed {feed_name} 成功，共 {len(news_list)} 条")
-            return news_list
+            return self._parse_feed(feed, feed_url, feed_name)
 
         except Exception as e:
             print(f"解析 RSS feed {feed_name} 失败: {e}")
             return []
 
+    def _parse_feed(self, feed: Any, feed_url: str, feed_name: str) -> List[News]:
+        """将 feedparser 解析结果转换为 News 对象
+
+        Args:
+            feed: feedparser.parse 的返回值
+            feed_url: Feed URL
+            feed_name: Feed 名称
+
+        Returns:
+            List[News]: 新闻列表
+        """
+        if feed.bozo:
+            print(f"警告: RSS feed {feed_name} 解析可能有问题")
+
+        news_list = []
+        for index, entry in enumerate(feed.entries, 1):
+            title = clean_title(entry.get("title", ""))
+            link = entry.get("link", "")
+
+            if not title or not link:
+                continue
+
+            # 解析发布时间
+            published = entry.get("published_parsed") or entry.get("updated_parsed")
+            timestamp = None
+            if published:
+                try:
+                    timestamp = datetime(*published[:6])
+                except Exception:
+                    pass
+
+            # 提取摘要
+            summary = entry.get("summary", "")
+
+            news = News(
+                title=title,
+                url=link,
+                platform="rss",
+                platform_name=feed_name,
+                rank=index,
+                source_id=self.source_id,
+                timestamp=timestamp,
+                extra={
+                    "summary": summary,
+                    "feed_url": feed_url
+                }
+            )
+            news_list.append(news)
+
+        print(f"获取 RSS feed {feed_name} 成功，共 {len(news_list)} 条")
+        return news_list
+
     def validate_config(self) -> bool:
         """验证配置
 
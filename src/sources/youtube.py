@@ -5,9 +5,12 @@ YouTube 热门视频信息源
 支持多地区并发请求,按观看数作为热度指标
 """
 
+import json
+import asyncio
 from typing import List, Dict, Any, Optional
 from src.sources.base import BaseSource
 from src.models.news import News
+from src.utils.http import AsyncHTTPClient, HTTPX_AVAILABLE
 
 try:
     from googleapiclient.discovery import build
@@ -33,6 +36,9 @@ class YouTubeSource(BaseSource):
     VIDEO_URL_TEMPLATE = "https://www.youtube.com/watch?v={video_id}"
     MOBILE_URL_TEMPLATE = "https://m.youtube.com/watch?v={video_id}"
 
+    # videos.list REST 端点（异步模式直接调用，不经过同步 SDK）
+    VIDEOS_API_URL = "https://www.googleapis.com/youtube/v3/videos"
+
     def __init__(self, config: Dict[str, Any]):
         """初始化 YouTube 信息源
 
@@ -155,6 +161,109 @@ class YouTubeSource(BaseSource):
         print(f"{self.source_name} 共获取 {len(all_news)} 条新闻")
         return all_news
 
+    async def afetch_news(self, **kwargs) -> List[News]:
+        """异步获取 YouTube 热门视频列表
+
+        直接调用 videos.list REST 接口，各地区并发请求；
+        未安装 httpx 时退回线程执行 fetch_news
+
+        Returns:
+            List[News]: 标准化的 News 对象列表（按地区配置顺序）
+        """
+        if not HTTPX_AVAILABLE:
+            return await super().afetch_news(**kwargs)
+
+        source_config = self.get_source_config()
+        api_key = source_config.get("api_key", "").strip()
+        regions = source_config.get("regions", [])
+        max_results = source_config.get("max_results", 50)
+
+        if not api_key:
+            print(f"警告: {self.source_name} 缺少 API Key,跳过爬取")
+            return []
+
+        if not regions:
+            print(f"警告: {self.source_name} 未配置地区列表,跳过爬取")
+            return []
+
+        regions = [region for region in regions if region.get("code", "")]
+
+        proxy_url = None
+        if self.config.get("USE_PROXY"):
+            proxy_url = self.config.get("DEFAULT_PROXY")
+
+        async with AsyncHTTPClient(proxy_url=proxy_url, timeout=30) as http_client:
+            region_videos = await asyncio.gather(
+                *(
+                    self._afetch_region_videos(
+                        http_client,
+                        api_key=api_key,
+                        region_code=region["code"],
+                        max_results=max_results
+                    )
+                    for region in regions
+                ),
+                return_exceptions=True
+            )
+
+        all_news = []
+        for region, videos in zip(regions, region_videos):
+            region_name = region.get("name", "")
+
+            if isinstance(videos, BaseException):
+                print(f"  请求失败: {videos}")
+                videos = []
+
+            if videos:
+                news_list = self._convert_to_news(videos=videos, region_name=region_name)
+                all_news.extend(news_list)
+                print(f"获取 {region_name} 成功,共 {len(news_list)} 条")
+            else:
+                print(f"获取 {region_name} 失败或无数据")
+
+        print(f"{self.source_name} 共获取 {len(all_news)} 条新闻")
+        return all_news
+
+    async def _afetch_region_videos(
+        self,
+        http_client: AsyncHTTPClient,
+        api_key: str,
+        region_code: str,
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """异步获取指定地区的热门视频
+
+        Args:
+            http_client: 异步 HTTP 客户端
+            api_key: YouTube Data API v3 密钥
+            region_code: 地区代码(ISO 3166-1 alpha-2)
+            max_results: 获取数量(1-50)
+
+        Returns:
+            List[Dict]: 视频数据列表
+        """
+        response = await http_client.get_raw(
+            self.VIDEOS_API_URL,
+            params={
+                "part": "snippet,statistics",
+                "chart": "mostPopular",
+                "regionCode": region_code,
+                "maxResults": min(max_results, 50),
+                "key": api_key,
+            }
+        )
+
+        if response.status_code != 200:
+            self._print_api_error(response.status_code, response.text)
+            return []
+
+        items = response.json().get("items", [])
+        if not items:
+            print(f"  响应中没有视频数据")
+            return []
+
+        return items
+
     def _fetch_region_videos(
         self,
         region_code: str,
@@ -190,57 +299,62 @@ class YouTubeSource(BaseSource):
 
         except HttpError as e:
             # 处理 YouTube API HTTP 错误
-            error_code = e.resp.status
             error_content = e.content.decode('utf-8') if e.content else ""
-
-            print(f"  ❌ YouTube API 错误:")
-            print(f"     HTTP 状态码: {error_code}")
-
-            # 尝试解析错误信息
-            try:
-                import json
-                error_data = json.loads(error_content)
-                error_info = error_data.get("error", {})
-                error_message = error_info.get("message", "未知错误")
-                error_reason = error_info.get("errors", [{}])[0].get("reason", "unknown")
-
-                print(f"     原因: {error_reason}")
-                print(f"     详情: {error_message}")
-
-                # 提供针对性的解决建议
-                if error_code == 403:
-                    print(f"  💡 解决建议:")
-                    if "disabled" in error_message.lower() or "not enabled" in error_message.lower():
-                        print(f"     1. 访问 https://console.cloud.google.com/apis/library/youtube.googleapis.com")
-                        print(f"     2. 确保 YouTube Data API v3 已启用")
-                    elif "quota" in error_message.lower():
-                        print(f"     1. API 配额已用完,请等待配额重置(每天凌晨 PST 时间)")
-                        print(f"     2. 访问 https://console.cloud.google.com/apis/api/youtube.googleapis.com/quotas 查看配额")
-                    elif "key" in error_message.lower() or "credential" in error_message.lower():
-                        print(f"     1. 检查 API Key 是否正确")
-                        print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 验证密钥")
-                    else:
-                        print(f"     1. 检查 API Key 的访问限制(IP 限制、HTTP Referrer 限制)")
-                        print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 编辑 API 密钥")
-                        print(f"     3. 建议设置为'不限制密钥'(仅用于测试)")
-                elif error_code == 400:
-                    print(f"  💡 解决建议:")
-                    print(f"     1. 检查地区代码是否正确(应为 ISO 3166-1 alpha-2 格式,如 US, JP, KR)")
-                    print(f"     2. 检查 maxResults 参数是否在 1-50 范围内")
-                elif error_code == 401:
-                    print(f"  💡 解决建议:")
-                    print(f"     1. API Key 无效或已过期")
-                    print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 重新生成密钥")
-
-            except (json.JSONDecodeError, KeyError):
-                print(f"     错误内容: {error_content[:200]}")
-
+            self._print_api_error(e.resp.status, error_content)
             return []
 
         except Exception as e:
             print(f"  请求失败: {e}")
             return []
 
+    def _print_api_error(self, error_code: int, error_content: str) -> None:
+        """输出 YouTube API 错误信息及解决建议
+
+        Args:
+            error_code: HTTP 状态码
+            error_content: 错误响应内容
+        """
+        print(f"  ❌ YouTube API 错误:")
+        print(f"     HTTP 状态码: {error_code}")
+
+        # 尝试解析错误信息
+        try:
+            error_data = json.loads(error_content)
+            error_info = error_data.get("error", {})
+            error_message = error_info.get("message", "未知错误")
+            error_reason = error_info.get("errors", [{}])[0].get("reason", "unknown")
+
+            print(f"     原因: {error_reason}")
+            print(f"     详情: {error_message}")
+
+            # 提供针对性的解决建议
+            if error_code == 403:
+                print(f"  💡 解决建议:")
+                if "disabled" in error_message.lower() or "not enabled" in error_message.lower():
+                    print(f"     1. 访问 https://console.cloud.google.com/apis/library/youtube.googleapis.com")
+                    print(f"     2. 确保 YouTube Data API v3 已启用")
+                elif "quota" in error_message.lower():
+                    print(f"     1. API 配额已用完,请等待配额重置(每天凌晨 PST 时间)")
+                    print(f"     2. 访问 https://console.cloud.google.com/apis/api/youtube.googleapis.com/quotas 查看配额")
+                elif "key" in error_message.lower() or "credential" in error_message.lower():
+                    print(f"     1. 检查 API Key 是否正确")
+                    print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 验证密钥")
+                else:
+                    print(f"     1. 检查 API Key 的访问限制(IP 限制、HTTP Referrer 限制)")
+                    print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 编辑 API 密钥")
+                    print(f"     3. 建议设置为'不限制密钥'(仅用于测试)")
+            elif error_code == 400:
+                print(f"  💡 解决建议:")
+                print(f"     1. 检查地区代码是否正确(应为 ISO 3166-1 alpha-2 格式,如 US, JP, KR)")
+                print(f"     2. 检查 maxResults 参数是否在 1-50 范围内")
+            elif error_code == 401:
+                print(f"  💡 解决建议:")
+                print(f"     1. API Key 无效或已过期")
+                print(f"     2. 访问 https://console.cloud.google.com/apis/credentials 重新生成密钥")
+
+        except (json.JSONDecodeError, KeyError):
+            print(f"     错误内容: {error_content[:200]}")
+
     def _convert_to_news(
         self,
         videos: List[Dict[str, Any]],
@@ -3,9 +3,79 @@
 
 import time
 import random
+import asyncio
+import threading
 from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlparse
 import requests
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+class HostRateLimiter:
+    """按主机限速器
+
+    保证同一主机相邻两次请求的发起时间间隔不小于指定值，
+    多线程共享同一个实例时也能正确排队
+    """
+
+    def __init__(self, interval_ms: int = 1000, jitter_ms: Tuple[int, int] = (0, 0)):
+        """初始化限速器
+
+        Args:
+            interval_ms: 同一主机的最小请求间隔（毫秒）
+            jitter_ms: 每次间隔叠加的随机抖动范围（毫秒）
+        """
+        self.interval_ms = interval_ms
+        self.jitter_ms = jitter_ms
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def _reserve(self, url: str) -> float:
+        """为该 URL 所在主机预约下一个请求时间槽
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            float: 需要等待的秒数
+        """
+        host = urlparse(url).netloc
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+
+            interval = self.interval_ms + random.randint(*self.jitter_ms)
+            interval = max(0, interval)
+            self._next_slot[host] = slot + interval / 1000
+
+        return slot - now
+
+    def acquire(self, url: str) -> None:
+        """等待直到该 URL 所在主机允许发起下一次请求
+
+        Args:
+            url: 请求URL
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def aacquire(self, url: str) -> None:
+        """acquire 的异步版本，等待期间不阻塞事件循环
+
+        Args:
+            url: 请求URL
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
 
 class HTTPClient:
     """HTTP 客户端
@@ -21,15 +91,22 @@ class HTTPClient:
         "Cache-Control": "no-cache",
     }
 
-    def __init__(self, proxy_url: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        timeout: int = 10,
+        rate_limiter: Optional[HostRateLimiter] = None
+    ):
         """初始化 HTTP 客户端
 
         Args:
             proxy_url: 代理URL（如 "http://127.0.0.1:7890"）
             timeout: 请求超时时间（秒）
+            rate_limiter: 按主机限速器（可在多个客户端间共享）
         """
         self.proxy_url = proxy_url
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
 
     def get(
@@ -69,6 +146,9 @@ class HTTPClient:
 
         retries = 0
         while retries <= max_retries:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+
             try:
                 response = self.session.get(
                     url,
@@ -144,6 +224,9 @@ class HTTPClient:
 
         retries = 0
         while retries <= max_retries:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+
             try:
                 response = self.session.post(
                     url,
@@ -192,3 +275,134 @@ class HTTPClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """上下文管理器退出"""
         self.close()
+
+
+class AsyncHTTPClient:
+    """异步 HTTP 客户端
+
+    基于 httpx.AsyncClient，重试与返回值约定与 HTTPClient 保持一致
+    """
+
+    DEFAULT_HEADERS = HTTPClient.DEFAULT_HEADERS
+
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        timeout: int = 10,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        verify: bool = True
+    ):
+        """初始化异步 HTTP 客户端
+
+        Args:
+            proxy_url: 代理URL（如 "http://127.0.0.1:7890"）
+            timeout: 请求超时时间（秒）
+            rate_limiter: 按主机限速器
+            verify: 是否校验 SSL 证书
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("AsyncHTTPClient 需要安装 httpx: pip install httpx")
+
+        self.proxy_url = proxy_url
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.client = httpx.AsyncClient(
+            headers=self.DEFAULT_HEADERS,
+            proxy=proxy_url,
+            timeout=timeout,
+            verify=verify,
+            follow_redirects=True,
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        max_retries: int = 2,
+        min_retry_wait: int = 3,
+        max_retry_wait: int = 5,
+    ) -> Tuple[Optional[str], bool, Optional[str]]:
+        """发送 GET 请求（带重试机制）
+
+        Args:
+            url: 请求URL
+            headers: 请求头（会与默认请求头合并）
+            params: URL 参数
+            max_retries: 最大重试次数
+            min_retry_wait: 最小重试等待时间（秒）
+            max_retry_wait: 最大重试等待时间（秒）
+
+        Returns:
+            Tuple[Optional[str], bool, Optional[str]]:
+                - 响应文本（失败返回 None）
+                - 是否成功
+                - 错误信息（成功返回 None）
+        """
+        retries = 0
+        while retries <= max_retries:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(url)
+
+            try:
+                response = await self.client.get(url, headers=headers, params=params)
+                response.raise_for_status()
+
+                return response.text, True, None
+
+            except httpx.TimeoutException as e:
+                error_msg = f"请求超时: {e}"
+            except httpx.HTTPStatusError as e:
+                error_msg = f"HTTP 错误: {e}"
+            except httpx.HTTPError as e:
+                error_msg = f"请求异常: {e}"
+            except Exception as e:
+                error_msg = f"未知错误: {e}"
+
+            retries += 1
+            if retries <= max_retries:
+                # 计算等待时间（随机退避）
+                base_wait = random.uniform(min_retry_wait, max_retry_wait)
+                additional_wait = (retries - 1) * random.uniform(1, 2)
+                wait_time = base_wait + additional_wait
+
+                print(f"请求失败: {error_msg}. {wait_time:.2f}秒后重试...")
+                await asyncio.sleep(wait_time)
+            else:
+                print(f"请求最终失败: {error_msg}")
+                return None, False, error_msg
+
+        return None, False, "超过最大重试次数"
+
+    async def get_raw(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        """发送单次 GET 请求并返回原始响应（不重试、不检查状态码）
+
+        Args:
+            url: 请求URL
+            headers: 请求头
+            params: URL 参数
+
+        Returns:
+            httpx.Response: 原始响应
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(url)
+
+        return await self.client.get(url, headers=headers, params=params)
+
+    async def close(self):
+        """关闭客户端"""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出"""
+        await self.close()
@@ -90,6 +90,7 @@ class TestConfigManager:
         assert config_manager["VERSION_CHECK_URL"] == "https://example.com/version"
         assert config_manager["REQUEST_INTERVAL"] == 1000
         assert config_manager["REPORT_MODE"] == "daily"
+        assert config_manager["MAX_NEWS_PER_KEYWORD"] == 0
 
     def test_load_config_file_not_found(self):
         """测试配置文件不存在"""
@@ -0,0 +1,103 @@
+# coding=utf-8
+"""测试 MCP 标题数据缓存"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services.cache_service import FingerprintLRUCache, estimate_size
+from mcp_server.services.parser_service import ParserService
+from mcp_server.utils.errors import DataNotFoundError
+
+
+def _write_file(txt_dir, name, titles):
+    """按爬虫的文本格式写入一个数据文件"""
+    txt_dir.mkdir(parents=True, exist_ok=True)
+    lines = ["weibo | 微博"] + [f"{rank}. {title}" for rank, title in enumerate(titles, 1)]
+    (txt_dir / name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class TestFingerprintLRUCache:
+    """测试 FingerprintLRUCache 类"""
+
+    def test_fingerprint_invalidation(self):
+        """指纹变化时失效"""
+        cache = FingerprintLRUCache()
+        cache.set("a", "v1", {"x": 1})
+
+        assert cache.get("a", "v1") == {"x": 1}
+        assert cache.get("a", "v2") is None
+        assert cache.get("a", "v1") is None
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+        assert stats["total_entries"] == 0 and stats["total_bytes"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        """超过字节上限时淘汰最久未使用的条目"""
+        cache = FingerprintLRUCache(max_bytes=estimate_size(["x" * 100]) * 2)
+        cache.set("a", 1, ["x" * 100])
+        cache.set("b", 1, ["y" * 100])
+        cache.get("a", 1)
+        cache.set("c", 1, ["z" * 100])
+
+        assert cache.get("b", 1) is None
+        assert cache.get("a", 1) is not None and cache.get("c", 1) is not None
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["total_bytes"] <= cache.max_bytes
+
+
+class TestParserTitlesCache:
+    """测试 read_all_titles_for_date 的缓存"""
+
+    def test_new_file_invalidates_cache(self, tmp_path):
+        """爬虫写入新文件后立即读到新数据"""
+        parser = ParserService(str(tmp_path))
+        parser.titles_cache = FingerprintLRUCache()
+        date = datetime(2025, 1, 1)
+        txt_dir = tmp_path / "output" / "2025年01月01日" / "txt"
+        _write_file(txt_dir, "08时00分.txt", ["标题一"])
+
+        first = parser.read_all_titles_for_date(date)
+        assert parser.read_all_titles_for_date(date) == first
+        assert list(first[0]["weibo"]) == ["标题一"]
+
+        _write_file(txt_dir, "09时00分.txt", ["标题二"])
+        os.utime(txt_dir / "09时00分.txt", ns=(0, os.stat(txt_dir / "08时00分.txt").st_mtime_ns + 1))
+
+        second = parser.read_all_titles_for_date(date)
+        assert list(second[0]["weibo"]) == ["标题一", "标题二"]
+        stats = parser.titles_cache.get_stats()
+        assert (stats["hits"], stats["invalidations"]) == (1, 1)
+
+    def test_platform_views_share_one_entry(self, tmp_path):
+        """不同的平台过滤共用同一份解析结果"""
+        parser = ParserService(str(tmp_path))
+        parser.titles_cache = FingerprintLRUCache()
+        date = datetime(2025, 1, 1)
+        txt_dir = tmp_path / "output" / "2025年01月01日" / "txt"
+        txt_dir.mkdir(parents=True)
+        (txt_dir / "08时00分.txt").write_text(
+            "weibo | 微博\n1. 标题一\n\nzhihu | 知乎\n1. 标题二\n2. 标题三\n", encoding="utf-8"
+        )
+
+        all_titles, id_to_name, _ = parser.read_all_titles_for_date(date)
+        weibo, _, _ = parser.read_all_titles_for_date(date, ["weibo"])
+        zhihu, _, _ = parser.read_all_titles_for_date(date, ["zhihu", "douyin"])
+
+        assert weibo == {"weibo": all_titles["weibo"]}
+        assert zhihu == {"zhihu": {
+            "标题二": {"ranks": [1], "url": "", "mobileUrl": ""},
+            "标题三": {"ranks": [2], "url": "", "mobileUrl": ""},
+        }}
+        assert id_to_name == {"weibo": "微博", "zhihu": "知乎"}
+        stats = parser.titles_cache.get_stats()
+        assert (stats["total_entries"], stats["misses"], stats["hits"]) == (1, 1, 2)
+
+        # 视图是独立的副本
+        weibo["weibo"]["标题一"]["ranks"].append(5)
+        assert parser.read_all_titles_for_date(date)[0]["weibo"]["标题一"]["ranks"] == [1]
+
+        with pytest.raises(DataNotFoundError):
+            parser.read_all_titles_for_date(date, ["douyin"])
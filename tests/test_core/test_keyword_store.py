@@ -0,0 +1,101 @@
+# coding=utf-8
+"""测试标题关键词的预先提取"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services import keyword_store
+from mcp_server.services.cache_service import FingerprintLRUCache
+from mcp_server.services.keyword_store import KEYWORDS_FILE, KeywordStore, extract_keywords
+from mcp_server.services.parser_service import ParserService
+from mcp_server.tools.analytics import AnalyticsTools
+
+TITLES = [
+    "特斯拉 降价 新车型",
+    "特斯拉 降价 引发热议",
+    "苹果 发布会 新车型",
+    "特斯拉 降价，网友：早该降了 https://example.com/a",
+]
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    """今天的数据目录"""
+    txt_dir = tmp_path / "output" / datetime.now().strftime("%Y年%m月%d日") / "txt"
+    txt_dir.mkdir(parents=True)
+    lines = ["weibo | 微博"] + [f"{rank}. {title}" for rank, title in enumerate(TITLES, 1)]
+    (txt_dir / "08时00分.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return tmp_path
+
+
+class TestKeywordStore:
+    """测试 KeywordStore 类"""
+
+    def test_extract_keywords(self):
+        """按空白和标点切分，过滤URL、短词和停用词"""
+        assert extract_keywords("特斯拉 降价，网友：早该降了 https://example.com/a") == [
+            "特斯拉", "降价", "网友", "早该降了"
+        ]
+        assert extract_keywords("我 的 AI 自己") == ["AI"]
+
+    def test_persisted_once_per_title(self, tmp_path, monkeypatch):
+        """关键词写入日期目录，再次读取时只为新标题提取"""
+        KeywordStore(segmentation=False).get_keywords(tmp_path, TITLES[:2])
+        data = json.loads((tmp_path / KEYWORDS_FILE).read_text(encoding="utf-8"))
+        assert data["tokenizer"] == "regex"
+        assert data["keywords"][TITLES[0]] == ["特斯拉", "降价", "新车型"]
+
+        extracted = []
+        monkeypatch.setattr(keyword_store, "extract_keywords", lambda title: extracted.append(title) or [])
+        result = KeywordStore(segmentation=False).get_keywords(tmp_path, TITLES[:3])
+
+        assert extracted == [TITLES[2]]
+        assert result[TITLES[1]] == ("特斯拉", "降价", "引发热议")
+
+    def test_tokenizer_change_rebuilds(self, tmp_path):
+        """分词方式变化时忽略已有文件"""
+        (tmp_path / KEYWORDS_FILE).write_text(
+            json.dumps({"tokenizer": "jieba", "keywords": {TITLES[0]: ["特斯", "拉"]}}), encoding="utf-8"
+        )
+        result = KeywordStore(segmentation=False).get_keywords(tmp_path, TITLES[:1])
+        assert result[TITLES[0]] == ("特斯拉", "降价", "新车型")
+
+    def test_segmentation_requires_jieba(self, monkeypatch):
+        """未安装 jieba 时退回默认分词"""
+        monkeypatch.setattr(keyword_store, "JIEBA_AVAILABLE", False)
+        monkeypatch.setenv("KEYWORD_SEGMENTATION", "true")
+        assert KeywordStore().tokenizer == "regex"
+
+
+class TestAnalyticsKeywords:
+    """测试分析工具读取预先提取的关键词"""
+
+    def test_parser_keywords_beside_day(self, project_root):
+        """解析一天数据时提取关键词，文件不影响数据目录指纹"""
+        parser = ParserService(str(project_root))
+        parser.titles_cache = FingerprintLRUCache()
+        date_dir = project_root / "output" / datetime.now().strftime("%Y年%m月%d日")
+        fingerprint = parser.get_folder_fingerprint(date_dir / "txt")
+
+        title_keywords = parser.get_title_keywords()
+
+        assert set(title_keywords) == set(TITLES)
+        assert (date_dir / KEYWORDS_FILE).exists()
+        assert parser.get_folder_fingerprint(date_dir / "txt") == fingerprint
+        assert parser.titles_cache.get_stats()["misses"] == 1
+
+    def test_cooccurrence(self, project_root):
+        """共现分析结果与逐条提取一致"""
+        tools = AnalyticsTools(str(project_root))
+        tools.data_service.parser.titles_cache = FingerprintLRUCache()
+
+        result = tools.analyze_keyword_cooccurrence(min_frequency=2, top_n=5)
+
+        assert result["cooccurrence_pairs"][0] == {
+            "keyword1": "特斯拉",
+            "keyword2": "降价",
+            "cooccurrence_count": 3,
+            "sample_titles": [TITLES[0], TITLES[1], TITLES[3]],
+        }
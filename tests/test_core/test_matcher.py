@@ -0,0 +1,132 @@
+# coding=utf-8
+"""测试多模式关键词匹配模块"""
+
+import time
+
+import pytest
+
+from src.core.filter import NewsFilter
+from src.core.matcher import KeywordMatcher
+from scripts.benchmarks.bench_filter import generate_corpus, naive_first_group
+
+
+def _group(normal, required=None):
+    """构造词组"""
+    required = required or []
+    return {
+        "required": required,
+        "normal": normal,
+        "group_key": " ".join(normal or required),
+    }
+
+
+class TestKeywordMatcher:
+    """测试 KeywordMatcher 类"""
+
+    def test_first_matching_group_in_order(self):
+        """返回按配置顺序的第一个匹配词组"""
+        matcher = KeywordMatcher([_group(["苹果"]), _group(["手机", "苹果"])], [])
+
+        assert matcher.first_group("苹果手机发布") == 0
+        assert matcher.first_group("华为手机发布") == 1
+        assert matcher.first_group("天气预报") is None
+
+    def test_required_words(self):
+        """必须词需要全部出现"""
+        matcher = KeywordMatcher([_group(["编程"], ["Python"]), _group([], ["AI", "芯片"])], [])
+
+        assert matcher.first_group("python 编程入门") == 0
+        assert matcher.first_group("Java 编程入门") is None
+        assert matcher.first_group("AI 芯片量产") == 1
+        assert matcher.first_group("AI 模型发布") is None
+
+    def test_filter_words(self):
+        """命中过滤词则不匹配"""
+        matcher = KeywordMatcher([_group(["比赛"])], ["广告"])
+
+        assert matcher.first_group("比赛结果") == 0
+        assert matcher.first_group("比赛广告") is None
+        assert matcher.first_group("比赛广告", apply_filters=False) == 0
+
+    def test_overlapping_patterns(self):
+        """重叠和嵌套的关键词都能被找到"""
+        matcher = KeywordMatcher(
+            [_group(["she"]), _group(["he"]), _group(["hers"]), _group(["his"])], []
+        )
+
+        hits = matcher.scan("USHERS")
+        assert {matcher._pattern_ids[word] for word in ("she", "he", "hers")} == hits
+        assert matcher.first_group("ahishers") == 0
+        assert matcher.first_group("this") == 3
+
+    def test_matches_naive_implementation(self):
+        """在合成语料上与逐词子串查找的结果完全一致"""
+        word_groups, filter_words, titles = generate_corpus(200, 3000, seed=7)
+        matcher = KeywordMatcher(word_groups, filter_words)
+
+        for title in titles:
+            assert matcher.first_group(title) == naive_first_group(title, word_groups, filter_words)
+
+    def test_benchmark_against_naive(self):
+        """编译匹配器明显快于逐词子串查找"""
+        word_groups, filter_words, titles = generate_corpus(1000, 2000)
+        matcher = KeywordMatcher(word_groups, filter_words)
+
+        start = time.perf_counter()
+        naive_results = [naive_first_group(title, word_groups, filter_words) for title in titles]
+        naive_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compiled_results = [matcher.first_group(title) for title in titles]
+        compiled_time = time.perf_counter() - start
+
+        print(f"\n逐词查找: {naive_time:.3f}s, 编译匹配: {compiled_time:.3f}s, "
+              f"加速比: {naive_time / compiled_time:.1f}x")
+
+        assert compiled_results == naive_results
+        assert compiled_time < naive_time / 5
+
+
+class TestNewsFilterMatcher:
+    """测试 NewsFilter 使用编译匹配器"""
+
+    @pytest.fixture
+    def news_filter(self, tmp_path):
+        """创建新闻筛选器"""
+        words_file = tmp_path / "frequency_words.txt"
+        words_file.write_text("华为\n苹果\n!广告\n\n+Python\n编程\n", encoding="utf-8")
+        return NewsFilter(str(words_file))
+
+    def test_find_group(self, news_filter):
+        """find_group 返回第一个匹配的词组"""
+        assert news_filter.find_group("苹果发布会")["group_key"] == "华为 苹果"
+        assert news_filter.find_group("Python 编程技巧")["group_key"] == "编程"
+        assert news_filter.find_group("苹果广告") is None
+
+    def test_matches(self, news_filter):
+        """matches 与 find_group 一致"""
+        assert news_filter.matches("华为新机")
+        assert not news_filter.matches("编程技巧")
+        assert not news_filter.matches("华为广告")
+
+    def test_reload_rebuilds_matcher(self, news_filter, tmp_path):
+        """重新加载配置后匹配器随之更新"""
+        (tmp_path / "frequency_words.txt").write_text("小米\n", encoding="utf-8")
+        news_filter.reload()
+
+        assert news_filter.matches("小米汽车")
+        assert not news_filter.matches("华为新机")
+
+    def test_classify(self, news_filter):
+        """classify 直接返回匹配的词组键"""
+        assert news_filter.classify("华为新机") == "华为 苹果"
+        assert news_filter.classify("Python 编程技巧") == "编程"
+        assert news_filter.classify("华为广告") is None
+        assert news_filter.classify("天气预报") is None
+
+    def test_classify_without_groups(self, tmp_path):
+        """未配置词组时所有标题归入"全部新闻"""
+        words_file = tmp_path / "empty_words.txt"
+        words_file.write_text("", encoding="utf-8")
+
+        assert NewsFilter(str(words_file)).classify("任意标题") == "全部新闻"
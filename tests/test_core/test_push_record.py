@@ -222,3 +222,59 @@ class TestPushRecordManager:
 
         # 文件应该仍然存在（被跳过）
         assert invalid_file.exists()
+
+    def test_cached_read(self, record_manager, monkeypatch):
+        """记录文件未变化时不重复读取"""
+        record_manager.record_push("daily")
+
+        opened = []
+        real_open = open
+
+        def tracking_open(file, *args, **kwargs):
+            opened.append(file)
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+
+        for _ in range(3):
+            assert record_manager.has_pushed_today() is True
+        assert opened == []
+
+        # 其他进程写入的记录能被感知
+        other = PushRecordManager(retention_days=7)
+        other.clear_today_record()
+        assert record_manager.has_pushed_today() is False
+
+    def test_cleanup_once_per_day(self, record_manager, monkeypatch):
+        """过期记录在首次读写时清理，当天不再重复扫描"""
+        calls = []
+        real_cleanup = record_manager.cleanup_old_records
+        monkeypatch.setattr(record_manager, "cleanup_old_records", lambda: calls.append(1) or real_cleanup())
+
+        record_manager.has_pushed_today()
+        record_manager.record_push("daily")
+        record_manager.has_pushed_today()
+
+        assert len(calls) == 1
+
+    def test_atomic_write(self, record_manager):
+        """写入后不留下临时文件"""
+        record_manager.record_push("daily")
+        record_manager.record_push("current")
+
+        assert [path.name for path in record_manager.record_dir.iterdir()] == [
+            record_manager.get_today_record_file().name
+        ]
+
+    def test_channel_history(self, record_manager):
+        """按渠道记录推送历史"""
+        record_manager.record_push("daily", ["feishu"])
+        record_manager.record_push("current", ["feishu", "dingtalk"])
+
+        assert record_manager.has_pushed_today("feishu") is True
+        assert record_manager.has_pushed_today("telegram") is False
+
+        history = record_manager.get_channel_history("feishu")
+        assert history["count"] == 2
+        assert history["report_type"] == "current"
+        assert record_manager.get_channel_history("dingtalk")["count"] == 1
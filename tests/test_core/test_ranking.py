@@ -309,3 +309,39 @@ class TestNewsRanking:
         assert "zhihu" in current_batch
         assert "新闻A" in current_batch["zhihu"]
         assert "新闻B" not in current_batch["zhihu"]
+
+    def test_calculate_statistics_classifies_once(self, news_ranking, tmp_path, monkeypatch):
+        """每个标题只做一次筛选和词组归类，并记录各阶段耗时"""
+        monkeypatch.chdir(tmp_path)
+
+        calls = []
+        original_find_group = news_ranking.news_filter.find_group
+
+        def counting_find_group(title):
+            calls.append(title)
+            return original_find_group(title)
+
+        monkeypatch.setattr(news_ranking.news_filter, "find_group", counting_find_group)
+
+        results = {
+            "zhihu": {
+                "测试标题": {"ranks": [1], "url": "", "mobileUrl": ""},
+                "Python 编程": {"ranks": [2], "url": "", "mobileUrl": ""},
+                "无关标题": {"ranks": [3], "url": "", "mobileUrl": ""},
+            }
+        }
+
+        stats, total_titles = news_ranking.calculate_statistics(
+            results=results,
+            id_to_name={"zhihu": "知乎"},
+            title_info={},
+            mode="daily"
+        )
+
+        assert sorted(calls) == sorted(results["zhihu"].keys())
+        assert total_titles == 3
+        assert {stat.word: stat.count for stat in stats} == {"测试 新闻": 1, "编程": 1}
+
+        timings = news_ranking.get_phase_timings()
+        assert set(timings.keys()) == {"filter", "stats", "weight", "sort"}
+        assert all(value >= 0 for value in timings.values())
@@ -446,3 +446,49 @@ class TestNewsReporter:
         assert data2["metadata"]["total_news_count"] == 1
         assert len(data2["stats"]) == 1
         assert data2["stats"][0]["word_group"] == "新词组"
+
+
+class TestReportContext:
+    """测试报告上下文（报告数据只准备一次）"""
+
+    def test_build_context(self, reporter, sample_stats, sample_news_list):
+        """构建上下文时准备一次报告数据"""
+        context = reporter.build_context(
+            sample_stats, 10, failed_ids=["douyin"], new_news_list=sample_news_list[1:]
+        )
+
+        assert context.report_data["failed_ids"] == ["douyin"]
+        assert context.report_data["total_new_count"] == 1
+        assert "prepare" in reporter.get_render_timings()
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_render_reports_prepares_once(
+        self, reporter, sample_stats, tmp_path, monkeypatch, parallel
+    ):
+        """生成全部报告时不再重复准备报告数据"""
+        monkeypatch.chdir(tmp_path)
+        context = reporter.build_context(sample_stats, 10)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("不应重复准备报告数据")
+
+        monkeypatch.setattr(reporter, "prepare_report_data", fail)
+        paths = reporter.render_reports(context, parallel=parallel)
+
+        assert set(paths) == {"timestamp_txt", "summary_txt", "json", "html"}
+        assert all(path.exists() for path in paths.values())
+        assert paths["summary_txt"].name == "当日汇总.txt"
+        assert set(reporter.get_render_timings()) == {
+            "prepare", "timestamp_txt", "summary_txt", "json", "html", "total"
+        }
+
+    def test_render_reports_matches_separate_generation(
+        self, reporter, sample_stats, tmp_path, monkeypatch
+    ):
+        """与逐个生成的文本报告内容一致"""
+        monkeypatch.chdir(tmp_path)
+        expected = reporter.generate_text_report(sample_stats, 10).read_text(encoding="utf-8")
+
+        paths = reporter.render_reports(reporter.build_context(sample_stats, 10))
+
+        assert paths["timestamp_txt"].read_text(encoding="utf-8") == expected
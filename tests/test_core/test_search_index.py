@@ -0,0 +1,123 @@
+# coding=utf-8
+"""测试 MCP 关键词搜索的倒排索引"""
+
+import shutil
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services.parser_service import ParserService
+from mcp_server.services.search_index import SearchIndex, index_tokens, query_terms
+
+
+def _write_day(root, folder, name, sections):
+    """按爬虫的文本格式写入一个数据文件"""
+    txt_dir = root / "output" / folder / "txt"
+    txt_dir.mkdir(parents=True, exist_ok=True)
+    blocks = []
+    for header, titles in sections:
+        lines = [header] + [f"{rank}. {title}" for rank, title in enumerate(titles, 1)]
+        blocks.append("\n".join(lines))
+    (txt_dir / name).write_text("\n\n".join(blocks) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def index(tmp_path):
+    """两天数据上的索引"""
+    _write_day(tmp_path, "2025年01月01日", "08时00分.txt", [
+        ("weibo | 微博", ["人工智能大会开幕", "iPhone16 发布会", "今日天气"]),
+        ("zhihu | 知乎", ["如何看待人工智能", "AI 芯片新进展"]),
+    ])
+    _write_day(tmp_path, "2025年01月02日", "08时00分.txt", [
+        ("weibo | 微博", ["智能手机销量", "Apple iPhone 降价"]),
+    ])
+    search_index = SearchIndex(ParserService(str(tmp_path)), refresh_interval=0)
+    yield search_index
+    search_index.close()
+
+
+def _naive(parser, keyword, dates, platforms=None):
+    """逐日扫描的参考结果"""
+    results = []
+    for date in dates:
+        all_titles, _, _ = parser.load_titles_for_date(date)
+        for platform_id, titles in all_titles.items():
+            if platforms and platform_id not in platforms:
+                continue
+            results.extend(
+                (date.strftime("%Y-%m-%d"), title) for title in titles
+                if keyword.lower() in title.lower()
+            )
+    return sorted(results)
+
+
+def _found(index, keyword, platforms=None):
+    items = index.search(keyword, datetime(2025, 1, 1), datetime(2025, 1, 2), platforms)
+    return sorted((item["date"], item["title"]) for item in items)
+
+
+class TestTokens:
+    """测试分词"""
+
+    def test_index_and_query_tokens(self):
+        """中文按 bigram，英文单词索引后缀"""
+        tokens = index_tokens("iPhone16 发布会")
+        assert {"iphone16", "phone16", "发布", "布会"} <= tokens
+        assert query_terms("Phone") == [("phone", True)]
+        assert query_terms("人工智能") == [("人工", False), ("工智", False), ("智能", False)]
+        assert query_terms("智") == []
+
+
+class TestSearchIndex:
+    """测试 SearchIndex 类"""
+
+    @pytest.mark.parametrize("keyword", ["人工智能", "智能", "智", "phone", "IPHONE", "AI", "芯片 新"])
+    def test_matches_naive_scan(self, index, keyword):
+        """索引结果与逐日扫描一致"""
+        dates = [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+        assert _found(index, keyword) == _naive(index.parser, keyword, dates)
+
+    def test_platform_filter_and_fields(self, index):
+        """平台过滤和返回字段"""
+        items = index.search("iphone", datetime(2025, 1, 1), datetime(2025, 1, 1), ["weibo"])
+        assert items == [{
+            "title": "iPhone16 发布会",
+            "platform": "weibo",
+            "platform_name": "微博",
+            "ranks": [2],
+            "url": "",
+            "mobileUrl": "",
+            "date": "2025-01-01",
+        }]
+        assert _found(index, "人工智能", ["zhihu"]) == [("2025-01-01", "如何看待人工智能")]
+
+    def test_incremental_refresh(self, index, tmp_path):
+        """新增文件和日期时只重建变化的日期，删除的日期被移除"""
+        assert index.refresh(force=True) == 2
+        assert index.refresh(force=True) == 0
+
+        _write_day(tmp_path, "2025年01月02日", "12时00分.txt", [
+            ("zhihu | 知乎", ["人工智能写作"]),
+        ])
+        _write_day(tmp_path, "2025年01月03日", "08时00分.txt", [
+            ("weibo | 微博", ["人工智能考试"]),
+        ])
+        assert index.refresh(force=True) == 2
+        items = index.search("人工智能", datetime(2025, 1, 1), datetime(2025, 1, 3))
+        assert [item["date"] for item in items] == ["2025-01-01", "2025-01-01", "2025-01-02", "2025-01-03"]
+
+        shutil.rmtree(tmp_path / "output" / "2025年01月01日")
+        index.refresh(force=True)
+        assert index.get_stats()["days"] == 2
+        assert _found(index, "人工智能") == [("2025-01-02", "人工智能写作")]
+
+    def test_substring_past_suffix_limit(self, index, tmp_path):
+        """超长单词中超出后缀位置上限的子串仍能搜到"""
+        long_title = "Release " + "a" * 35 + "target"
+        _write_day(tmp_path, "2025年01月02日", "12时00分.txt", [
+            ("weibo | 微博", [long_title, "Target 门店"]),
+        ])
+        dates = [datetime(2025, 1, 1), datetime(2025, 1, 2)]
+        for keyword in ["target", "aatarget", "release"]:
+            assert _found(index, keyword) == _naive(index.parser, keyword, dates)
+        assert ("2025-01-02", long_title) in _found(index, "target")
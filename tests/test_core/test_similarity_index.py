@@ -0,0 +1,127 @@
+# coding=utf-8
+"""测试标题相似度索引"""
+
+from datetime import datetime
+from difflib import SequenceMatcher
+
+import pytest
+
+from mcp_server.services import similarity_index
+from mcp_server.services.cache_service import FingerprintLRUCache
+from mcp_server.services.similarity_index import SimilarityIndex, minhash_signature, minhash_signatures
+from mcp_server.tools.analytics import AnalyticsTools
+from mcp_server.tools.search_tools import SearchTools
+from scripts.benchmarks.bench_similarity import generate_titles, run_benchmark
+
+TITLES = {
+    "weibo | 微博": ["特斯拉宣布全系车型降价", "突发：特斯拉宣布全系降价", "今日天气晴", "iPhone 17 发布会定档"],
+    "zhihu | 知乎": ["如何看待特斯拉宣布全系车型降价？", "苹果 iPhone 17 发布会前瞻", "人工智能技术突破"],
+}
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    """今天的数据目录"""
+    txt_dir = tmp_path / "output" / datetime.now().strftime("%Y年%m月%d日") / "txt"
+    txt_dir.mkdir(parents=True)
+    sections = [
+        "\n".join([header] + [f"{rank}. {title}" for rank, title in enumerate(titles, 1)])
+        for header, titles in TITLES.items()
+    ]
+    (txt_dir / "08时00分.txt").write_text("\n\n".join(sections) + "\n", encoding="utf-8")
+    return str(tmp_path)
+
+
+def _use_private_cache(tools):
+    tools.data_service.parser.titles_cache = FingerprintLRUCache()
+    return tools
+
+
+class TestSignatures:
+    """测试 MinHash 签名"""
+
+    def test_batch_matches_single(self, monkeypatch):
+        """批量计算（NumPy 或纯 Python）与逐条计算结果一致"""
+        titles = generate_titles(300) + ["", "  "]
+        expected = [minhash_signature(title) for title in titles]
+
+        assert minhash_signatures(titles) == expected
+        monkeypatch.setattr(similarity_index, "NUMPY_AVAILABLE", False)
+        assert minhash_signatures(titles) == expected
+        assert expected[-1] == ()
+
+    def test_benchmark_recall(self):
+        """默认阈值下索引找回全量扫描的绝大部分结果"""
+        results = run_benchmark(600, 30, [0.6])
+        assert results[0.6]["recall"] >= 0.95
+        assert results[0.6]["candidates"] < 600 / 2
+
+
+class TestSimilarityIndex:
+    """测试 SimilarityIndex 类"""
+
+    def test_candidates(self):
+        """LSH、关键词和子串候选"""
+        titles = [title for titles in TITLES.values() for title in titles]
+        index = SimilarityIndex(titles)
+
+        query = "特斯拉宣布全系车型降价"
+        expected = {row for row, title in enumerate(titles) if SequenceMatcher(None, query, title).ratio() >= 0.6}
+        assert expected <= index.lsh_candidates(query, 0.6)
+        assert index.lsh_candidates(query, 0.1) == set(range(len(titles)))
+
+        assert index.keyword_candidates(["17"]) == {3, 5}
+        assert index.substring_candidates("IPHONE") == {3, 5}
+
+
+class TestSimilarityTools:
+    """测试使用索引后的查询结果与全量计算一致"""
+
+    def test_find_similar_news(self, project_root):
+        tools = _use_private_cache(AnalyticsTools(project_root))
+        result = tools.find_similar_news("特斯拉宣布全系车型降价", threshold=0.6)
+
+        expected = [
+            title for titles in TITLES.values() for title in titles
+            if title != "特斯拉宣布全系车型降价"
+            and SequenceMatcher(None, "特斯拉宣布全系车型降价", title).ratio() >= 0.6
+        ]
+        assert sorted(item["title"] for item in result["similar_news"]) == sorted(expected)
+        assert {item["platform"] for item in result["similar_news"]} == {"weibo", "zhihu"}
+
+    def test_fuzzy_search(self, project_root):
+        tools = _use_private_cache(SearchTools(project_root))
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        for query, threshold in [("特斯拉降价", 0.6), ("iPhone 17", 0.6), ("特斯拉宣布降价", 0.3)]:
+            result = tools.search_news_unified(
+                query, search_mode="fuzzy", threshold=threshold,
+                date_range={"start": today, "end": today}
+            )
+            expected = [
+                title for titles in TITLES.values() for title in titles
+                if tools._fuzzy_match(query, title, threshold)[0]
+            ]
+            assert sorted(item["title"] for item in result.get("results", [])) == sorted(expected), query
+
+        result = tools.search_news_unified(
+            "特斯拉", search_mode="fuzzy", platforms=["zhihu"], date_range={"start": today, "end": today}
+        )
+        assert [item["title"] for item in result["results"]] == ["如何看待特斯拉宣布全系车型降价？"]
+
+    def test_related_news_history(self, project_root):
+        tools = _use_private_cache(SearchTools(project_root))
+        today = datetime.now()
+        reference = "特斯拉 宣布降价"
+        reference_keywords = tools._extract_keywords(reference)
+
+        for threshold in (0.4, 0.2):
+            result = tools.search_related_news_history(
+                reference, time_preset="custom", start_date=today, end_date=today, threshold=threshold
+            )
+            expected = [
+                title for titles in TITLES.values() for title in titles
+                if tools._calculate_keyword_overlap(reference_keywords, tools._extract_keywords(title)) * 0.7
+                + tools._calculate_similarity(reference, title) * 0.3 >= threshold
+            ]
+            assert sorted(item["title"] for item in result["results"]) == sorted(expected), threshold
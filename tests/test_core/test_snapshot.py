@@ -0,0 +1,210 @@
+# coding=utf-8
+"""测试结构化快照模块"""
+
+import pytest
+
+from mcp_server.services.parser_service import ParserService
+from src.core.ranking import NewsRanking
+from src.core.reporter import NewsReporter
+from src.core.snapshot import (
+    build_batch_blocks, find_snapshot, iter_blocks, load_platform_titles, snapshot_path, write_snapshot
+)
+from src.models.news import News, WordGroupStatistic
+
+
+@pytest.fixture
+def reporter(tmp_path, monkeypatch):
+    """在临时目录中创建报告生成器"""
+    monkeypatch.chdir(tmp_path)
+    return NewsReporter(rank_threshold=10)
+
+
+@pytest.fixture
+def ranking():
+    """创建排序器（读取快照不依赖筛选器）"""
+    return NewsRanking(news_filter=None)
+
+
+@pytest.fixture
+def stats():
+    """示例词组统计（包含无法从名称推断ID的平台和非连续排名）"""
+    return [
+        WordGroupStatistic(
+            word="人工智能",
+            count=2,
+            news_list=[
+                News(
+                    title="GPT-5 即将发布",
+                    url="https://example.com/1",
+                    platform="custom-feed",
+                    platform_name="自定义源",
+                    rank=1,
+                    extra={
+                        "time_display": "[08:00 ~ 10:00]",
+                        "count": 3,
+                        "all_ranks": [1, 7, 12],
+                        "mobileUrl": "https://m.example.com/1",
+                    },
+                ),
+                News(
+                    title="AI 技术突破 [独家]",
+                    url="",
+                    platform="weibo",
+                    platform_name="微博",
+                    rank=5,
+                    extra={"time_display": "09:00", "count": 1, "all_ranks": [5]},
+                ),
+            ],
+        )
+    ]
+
+
+class TestReportSnapshot:
+    """测试文本报告旁的结构化快照"""
+
+    def test_snapshot_written_next_to_report(self, reporter, stats):
+        """生成文本报告时同时写入同名快照"""
+        txt_path = reporter.generate_text_report(stats, 2, failed_ids=["douyin"])
+
+        snapshot_file = find_snapshot(txt_path)
+        assert snapshot_file == snapshot_path(txt_path)
+        assert snapshot_file.suffix == ".jsonl"
+
+        blocks = list(iter_blocks(snapshot_file))
+        assert blocks[0]["type"] == "meta"
+        assert {block["type"] for block in blocks} >= {"groups", "titles", "failed"}
+
+    def test_parse_file_titles_reads_snapshot(self, reporter, ranking, stats):
+        """parse_file_titles 从快照读取准确的平台ID和完整排名"""
+        txt_path = reporter.generate_text_report(stats, 2)
+
+        titles_by_id, id_to_name = ranking.parse_file_titles(txt_path)
+
+        assert id_to_name == {"custom-feed": "自定义源", "weibo": "微博"}
+        assert titles_by_id["custom-feed"]["GPT-5 即将发布"] == {
+            "ranks": [1, 7, 12],
+            "url": "https://example.com/1",
+            "mobileUrl": "https://m.example.com/1",
+        }
+        assert "AI 技术突破 [独家]" in titles_by_id["weibo"]
+
+    def test_parse_file_titles_falls_back_to_text(self, reporter, ranking, stats):
+        """没有快照的旧数据仍按文本解析"""
+        txt_path = reporter.generate_text_report(stats, 2)
+        snapshot_path(txt_path).unlink()
+
+        titles_by_id, _ = ranking.parse_file_titles(txt_path)
+
+        assert "自定义源" in titles_by_id
+
+    def test_parse_existing_summary_reads_snapshot(self, reporter, stats):
+        """_parse_existing_summary 从快照读取，排名不会被展开为区间"""
+        txt_path = reporter.generate_text_report(
+            stats, 2, failed_ids=["douyin"], is_daily_summary=True
+        )
+
+        result = reporter._parse_existing_summary(txt_path)
+
+        title_data = result["stats"]["人工智能"]["GPT-5 即将发布"]
+        assert title_data["ranks"] == [1, 7, 12]
+        assert title_data["count"] == 3
+        assert title_data["platform"] == "custom-feed"
+        assert title_data["platform_name"] == "自定义源"
+        assert result["failed_ids"] == ["douyin"]
+
+    def test_merged_summary_keeps_platform_ids(self, reporter, stats):
+        """合并后的汇总快照保留历史标题的平台ID"""
+        reporter.generate_text_report(stats, 2, is_daily_summary=True)
+        later_stats = [
+            WordGroupStatistic(word="人工智能", count=1, news_list=stats[0].news_list[1:])
+        ]
+        txt_path = reporter.generate_text_report(later_stats, 1, is_daily_summary=True)
+
+        blocks = {block["type"]: block for block in iter_blocks(snapshot_path(txt_path))}
+
+        assert set(blocks["titles"]["platform"]) == {"custom-feed", "weibo"}
+
+
+class TestParserServiceSnapshot:
+    """测试 MCP ParserService 读取快照"""
+
+    def test_parse_txt_file_prefers_snapshot(self, tmp_path):
+        """存在快照时 parse_txt_file 读取快照"""
+        txt_path = tmp_path / "10时00分.txt"
+        txt_path.write_text("zhihu | 知乎\n1. 过时的文本标题\n", encoding="utf-8")
+        write_snapshot(snapshot_path(txt_path), [
+            {"type": "meta", "version": 1, "kind": "batch"},
+            {
+                "type": "titles",
+                "platforms": {"zhihu": "知乎"},
+                "platform": ["zhihu", "zhihu"],
+                "title": ["标题A", "标题B"],
+                "ranks": [[1, 3], [2]],
+                "url": ["https://zhihu.com/a", ""],
+                "mobile_url": ["", ""],
+            },
+        ])
+
+        titles_by_id, id_to_name = ParserService(str(tmp_path)).parse_txt_file(txt_path)
+
+        assert id_to_name == {"zhihu": "知乎"}
+        assert titles_by_id["zhihu"]["标题A"]["ranks"] == [1, 3]
+        assert "过时的文本标题" not in titles_by_id["zhihu"]
+
+    def test_matches_core_reader(self, tmp_path):
+        """与 src.core.snapshot.load_platform_titles 对同一快照的读取结果一致"""
+        path = write_snapshot(tmp_path / "10时00分.jsonl", [
+            {"type": "meta", "version": 1, "kind": "batch"},
+            {
+                "type": "titles",
+                "platforms": {"zhihu": "知乎", "custom-feed": ""},
+                "platform": ["zhihu", "custom-feed", "zhihu"],
+                "title": ["标题A", "无排名标题", "标题A"],
+                "ranks": [[1], [], [1, 4]],
+                "url": ["https://zhihu.com/a", "", "https://zhihu.com/a2"],
+                "mobile_url": ["", "https://m.example.com/x", ""],
+            },
+            {"type": "failed", "ids": ["douyin"]},
+        ])
+
+        expected = load_platform_titles(path)
+
+        assert ParserService(str(tmp_path)).parse_snapshot_file(path) == expected
+        assert expected[0]["custom-feed"]["无排名标题"]["ranks"] == []
+        assert expected[1]["custom-feed"] == "custom-feed"
+
+    def test_batch_snapshot_round_trip(self, tmp_path):
+        """爬取批次的快照区块可被两个读取器读出"""
+        results = {
+            "zhihu": {"标题A\n续行": {"ranks": [1, 3], "url": "https://zhihu.com/a", "mobileUrl": ""}},
+            "weibo": {"标题B": [2]},
+        }
+        path = write_snapshot(
+            tmp_path / "10时00分.jsonl", build_batch_blocks(results, {"zhihu": "知乎"}, ["douyin"])
+        )
+
+        titles_by_id, id_to_name = load_platform_titles(path)
+
+        assert id_to_name == {"zhihu": "知乎", "weibo": "weibo"}
+        assert titles_by_id["zhihu"]["标题A 续行"]["ranks"] == [1, 3]
+        assert titles_by_id["weibo"]["标题B"] == {"ranks": [2], "url": "", "mobileUrl": ""}
+        assert ParserService(str(tmp_path)).parse_snapshot_file(path) == (titles_by_id, id_to_name)
+
+    def test_broken_snapshot_falls_back_to_text(self, tmp_path):
+        """快照不完整（如写入中断）时改为解析文本"""
+        txt_path = tmp_path / "10时00分.txt"
+        txt_path.write_text("zhihu | 知乎\n1. 文本标题\n", encoding="utf-8")
+        snapshot_path(txt_path).write_text('{"type":"meta","version":1}\n{"type":"titles","plat', encoding="utf-8")
+
+        titles_by_id, _ = ParserService(str(tmp_path)).parse_txt_file(txt_path)
+
+        assert "文本标题" in titles_by_id["zhihu"]
+
+    def test_parse_txt_file_without_snapshot(self, tmp_path):
+        """没有快照时按文本解析"""
+        txt_path = tmp_path / "10时00分.txt"
+        txt_path.write_text("zhihu | 知乎\n1. 文本标题 [URL:https://zhihu.com/t]\n", encoding="utf-8")
+
+        titles_by_id, _ = ParserService(str(tmp_path)).parse_txt_file(txt_path)
+
+        assert titles_by_id["zhihu"]["文本标题"]["url"] == "https://zhihu.com/t"
@@ -0,0 +1,175 @@
+# coding=utf-8
+"""测试当日汇总合并状态"""
+
+import pytest
+
+from src.core.reporter import NewsReporter
+from src.core.summary_state import SummaryState
+
+
+def _title(title, platform="zhihu", source_name="知乎", ranks=None, time_display="10时00分"):
+    """构造 prepare_report_data 格式的标题数据"""
+    return {
+        "title": title,
+        "platform": platform,
+        "source_name": source_name,
+        "time_display": time_display,
+        "count": 1,
+        "ranks": ranks or [1],
+        "rank_threshold": 10,
+        "url": f"https://example.com/{title}",
+        "mobile_url": "",
+        "is_new": True,
+    }
+
+
+def _batch(groups, failed_ids=None):
+    """构造一批报告数据"""
+    return {
+        "stats": [
+            {"word": word, "count": len(titles), "percentage": 0, "titles": titles}
+            for word, titles in groups.items()
+        ],
+        "new_titles": [],
+        "failed_ids": failed_ids or [],
+        "total_new_count": 0,
+    }
+
+
+def _titles(report_data):
+    """按词组提取标题顺序"""
+    return {stat["word"]: [t["title"] for t in stat["titles"]] for stat in report_data["stats"]}
+
+
+@pytest.fixture
+def state(tmp_path):
+    """创建合并状态"""
+    return SummaryState.for_summary(tmp_path / "当日汇总.txt")
+
+
+class TestSummaryState:
+    """测试 SummaryState 类"""
+
+    def test_state_path_next_to_summary(self, tmp_path, state):
+        """状态文件位于汇总文件旁"""
+        assert state.state_path == tmp_path / "当日汇总.state.db"
+
+    def test_merge_accumulates_titles(self, state):
+        """重复标题累加次数、合并排名，保留首次时间"""
+        state.merge(_batch({"人工智能": [_title("A", ranks=[3])]}, ["douyin"]))
+        state.merge(_batch(
+            {"人工智能": [_title("A", ranks=[1, 3], time_display="11时00分")]},
+            ["douyin", "toutiao"],
+        ))
+
+        merged = state.to_report_data(_batch({}))
+        title = merged["stats"][0]["titles"][0]
+
+        assert title["count"] == 2
+        assert title["ranks"] == [1, 3]
+        assert title["time_display"] == "10时00分"
+        assert merged["failed_ids"] == ["douyin", "toutiao"]
+
+    def test_batch_titles_come_first(self, state):
+        """本批次的词组和标题排在历史数据之前"""
+        state.merge(_batch({"人工智能": [_title("A"), _title("B")], "区块链": [_title("C")]}))
+        state.merge(_batch({"区块链": [_title("D")], "人工智能": [_title("B")]}))
+
+        merged = state.to_report_data(_batch({}))
+
+        assert _titles(merged) == {"区块链": ["D", "C"], "人工智能": ["B", "A"]}
+        assert [stat["word"] for stat in merged["stats"]] == ["区块链", "人工智能"]
+
+    def test_groups_absent_from_batch_are_kept(self, state):
+        """本批次未出现的词组仍保留在汇总中"""
+        state.merge(_batch({"人工智能": [_title("A")], "区块链": [_title("C")]}))
+        state.merge(_batch({"人工智能": [_title("B")]}))
+
+        merged = state.to_report_data(_batch({}))
+
+        assert [stat["word"] for stat in merged["stats"]] == ["人工智能", "区块链"]
+        assert [stat["percentage"] for stat in merged["stats"]] == [66.67, 33.33]
+
+    def test_is_new_only_for_current_batch(self, state):
+        """只有最新批次的新标题标记为新增"""
+        state.merge(_batch({"人工智能": [_title("A")]}))
+        state.merge(_batch({"人工智能": [_title("B")]}))
+
+        titles = state.to_report_data(_batch({}))["stats"][0]["titles"]
+
+        assert [(t["title"], t["is_new"]) for t in titles] == [("B", True), ("A", False)]
+
+    def test_matches_full_merge(self, state):
+        """与解析后整体合并（_merge_report_data）的结果一致"""
+        reporter = NewsReporter(rank_threshold=10)
+        first = _batch({"人工智能": [_title("A", ranks=[2]), _title("B", "weibo", "微博", [5])]})
+        second = _batch({"人工智能": [_title("B", "weibo", "微博", [4]), _title("E", ranks=[7])]})
+
+        state.merge(first)
+        state.merge(second)
+        merged = state.to_report_data(second)
+
+        existing = {
+            "stats": {
+                "人工智能": {
+                    t["title"]: {**t, "platform_name": t["source_name"]}
+                    for t in first["stats"][0]["titles"]
+                }
+            },
+            "failed_ids": [],
+        }
+        expected = reporter._merge_report_data(existing, second)
+
+        keys = ("title", "source_name", "count", "ranks", "time_display", "url")
+        assert [[{k: t[k] for k in keys} for t in stat["titles"]] for stat in merged["stats"]] == \
+            [[{k: t[k] for k in keys} for t in stat["titles"]] for stat in expected["stats"]]
+
+
+class TestReporterSummaryState:
+    """测试 NewsReporter 通过合并状态维护当日汇总"""
+
+    @pytest.fixture
+    def reporter(self, tmp_path, monkeypatch):
+        """在临时目录中创建报告生成器"""
+        monkeypatch.chdir(tmp_path)
+        return NewsReporter(rank_threshold=10)
+
+    def test_existing_summary_not_reparsed(self, reporter, monkeypatch):
+        """状态存在时不再解析现有汇总文件"""
+        file_path = reporter.get_output_path("txt", "当日汇总.txt")
+        reporter._generate_merged_text_report(file_path, _batch({"人工智能": [_title("A")]}))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("不应重新解析汇总文件")
+
+        monkeypatch.setattr(reporter, "_parse_existing_summary", fail)
+        reporter._generate_merged_text_report(file_path, _batch({"人工智能": [_title("A")]}))
+
+        assert "(2次)" in file_path.read_text(encoding="utf-8")
+
+    def test_seeds_state_from_text_summary(self, reporter):
+        """只有旧的汇总文本时解析一次导入状态"""
+        file_path = reporter.get_output_path("txt", "当日汇总.txt")
+        file_path.write_text(
+            "区块链 (共1条)\n\n[百度热搜] 比特币价格暴涨 [3] - 15时30分 [URL:https://example.com/3]\n",
+            encoding="utf-8",
+        )
+
+        reporter._generate_merged_text_report(file_path, _batch({"人工智能": [_title("A")]}))
+
+        content = file_path.read_text(encoding="utf-8")
+        assert SummaryState.for_summary(file_path).exists()
+        assert content.index("人工智能") < content.index("区块链")
+        assert "比特币价格暴涨" in content
+
+    def test_state_reset_when_summary_removed(self, reporter):
+        """汇总文件不存在时从空状态开始"""
+        file_path = reporter.get_output_path("txt", "当日汇总.txt")
+        reporter._generate_merged_text_report(file_path, _batch({"人工智能": [_title("A")]}))
+        file_path.unlink()
+
+        reporter._generate_merged_text_report(file_path, _batch({"区块链": [_title("C")]}))
+
+        content = file_path.read_text(encoding="utf-8")
+        assert "人工智能" not in content
+        assert "区块链 (共1条)" in content
@@ -0,0 +1,181 @@
+# coding=utf-8
+"""测试当日标题索引模块"""
+
+import pytest
+from pathlib import Path
+
+from src.core.filter import NewsFilter
+from src.core.ranking import NewsRanking
+from src.core.title_index import TitleIndex
+from src.utils.time import format_date_folder
+
+
+BATCHES = [
+    ("09:00", {
+        "zhihu": {
+            "标题A": {"ranks": [1], "url": "", "mobileUrl": ""},
+            "标题B": {"ranks": [2], "url": "https://zhihu.com/b", "mobileUrl": ""},
+        },
+    }),
+    ("10:00", {
+        "zhihu": {
+            "标题A": {"ranks": [3], "url": "https://zhihu.com/a", "mobileUrl": "https://m.zhihu.com/a"},
+        },
+        "weibo": {
+            "标题C": {"ranks": [5], "url": "https://weibo.com/c", "mobileUrl": ""},
+        },
+    }),
+    ("11:00", {
+        "zhihu": {
+            "标题A": {"ranks": [2], "url": "https://other.com/a", "mobileUrl": ""},
+            "标题D": {"ranks": [8], "url": "", "mobileUrl": ""},
+        },
+    }),
+]
+
+ID_TO_NAME = {"zhihu": "知乎", "weibo": "微博"}
+
+
+@pytest.fixture
+def ranking(tmp_path, monkeypatch):
+    """在临时目录中创建排序器"""
+    words_file = tmp_path / "frequency_words.txt"
+    words_file.write_text("标题\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return NewsRanking(NewsFilter(str(words_file)))
+
+
+@pytest.fixture
+def index(tmp_path):
+    """创建临时索引"""
+    return TitleIndex(tmp_path / "index" / "titles.db")
+
+
+class TestTitleIndex:
+    """测试 TitleIndex 类"""
+
+    def test_load_missing_index(self, index):
+        """索引不存在时返回空结果"""
+        assert index.load() == ({}, {}, {})
+        assert not index.exists()
+
+    def test_merge_matches_legacy_processing(self, index, ranking):
+        """逐批追加的结果与逐文件合并的结果一致"""
+        legacy_results = {}
+        legacy_title_info = {}
+        for time_info, results in BATCHES:
+            index.append_batch(results, ID_TO_NAME, time_info)
+            for source_id, title_data in results.items():
+                ranking._process_source_data(
+                    source_id,
+                    {title: dict(data) for title, data in title_data.items()},
+                    time_info,
+                    legacy_results,
+                    legacy_title_info
+                )
+
+        all_results, id_to_name, title_info = index.load()
+
+        assert title_info == legacy_title_info
+        assert id_to_name == ID_TO_NAME
+        assert all_results["zhihu"]["标题A"]["ranks"] == [1, 3, 2]
+        assert title_info["zhihu"]["标题A"]["first_time"] == "09:00"
+        assert title_info["zhihu"]["标题A"]["last_time"] == "11:00"
+        assert title_info["zhihu"]["标题A"]["count"] == 3
+        assert title_info["zhihu"]["标题A"]["url"] == "https://zhihu.com/a"
+
+    def test_duplicate_batch_is_ignored(self, index):
+        """同一批次重复追加只记录一次"""
+        time_info, results = BATCHES[0]
+
+        assert index.append_batch(results, ID_TO_NAME, time_info) is True
+        assert index.append_batch(results, ID_TO_NAME, time_info) is False
+
+        _, _, title_info = index.load()
+        assert title_info["zhihu"]["标题A"]["count"] == 1
+
+    def test_platform_filter(self, index):
+        """按平台过滤读取"""
+        for time_info, results in BATCHES:
+            index.append_batch(results, ID_TO_NAME, time_info)
+
+        all_results, id_to_name, title_info = index.load(["weibo"])
+
+        assert list(all_results.keys()) == ["weibo"]
+        assert id_to_name == {"weibo": "微博"}
+        assert list(title_info.keys()) == ["weibo"]
+
+
+class TestRankingWithIndex:
+    """测试 NewsRanking 通过索引读取当日数据"""
+
+    def test_record_batch_and_read(self, ranking):
+        """record_batch 追加的批次可以被 read_all_today_titles 读取"""
+        for time_info, results in BATCHES:
+            ranking.record_batch(results, ID_TO_NAME, time_info)
+
+        all_results, id_to_name, title_info = ranking.read_all_today_titles()
+
+        assert set(all_results.keys()) == {"zhihu", "weibo"}
+        assert title_info["zhihu"]["标题A"]["count"] == 3
+        assert title_info["weibo"]["标题C"]["first_time"] == "10:00"
+
+    def test_import_legacy_snapshots(self, ranking):
+        """索引不存在时从当天的 txt 快照构建"""
+        txt_dir = Path("output") / format_date_folder() / "txt"
+        txt_dir.mkdir(parents=True)
+        (txt_dir / "09:00.txt").write_text(
+            "[知乎] 标题A [1] - 09:00 [URL:https://zhihu.com/a]\n", encoding="utf-8"
+        )
+        (txt_dir / "10:00.txt").write_text(
+            "[知乎] 标题A [4] - 10:00\n[微博] 标题C [2] - 10:00\n", encoding="utf-8"
+        )
+        (txt_dir / "当日汇总.txt").write_text("[知乎] 汇总标题 [1] - 10:00\n", encoding="utf-8")
+
+        all_results, _, title_info = ranking.read_all_today_titles()
+
+        assert all_results["zhihu"]["标题A"]["ranks"] == [1, 4]
+        assert title_info["zhihu"]["标题A"]["last_time"] == "10:00"
+        assert "汇总标题" not in all_results["zhihu"]
+        assert "标题C" in all_results["weibo"]
+
+        # 再次读取不会重复导入
+        _, _, title_info = ranking.read_all_today_titles()
+        assert title_info["zhihu"]["标题A"]["count"] == 2
+
+    def test_snapshots_ignored_after_crawl_batch(self, ranking):
+        """索引开始记录爬取批次后，txt 报告文件不再被导入"""
+        time_info, results = BATCHES[0]
+        ranking.record_batch(results, ID_TO_NAME, time_info)
+
+        txt_dir = Path("output") / format_date_folder() / "txt"
+        txt_dir.mkdir(parents=True)
+        (txt_dir / "09:01.txt").write_text("[知乎] 标题A [1] - 09:01\n", encoding="utf-8")
+
+        _, _, title_info = ranking.read_all_today_titles()
+
+        assert title_info["zhihu"]["标题A"]["count"] == 1
+
+    def test_record_batch_imports_existing_snapshots(self, ranking):
+        """升级后首次运行：先导入当天已有的 txt 快照，再追加爬取批次"""
+        txt_dir = Path("output") / format_date_folder() / "txt"
+        txt_dir.mkdir(parents=True)
+        (txt_dir / "10时00分.txt").write_text(
+            "[知乎] 标题A [1] - 10:00\n[微博] 标题C [2] - 10:00\n", encoding="utf-8"
+        )
+
+        ranking.record_batch({"zhihu": {"标题D": {"ranks": [3], "url": "", "mobileUrl": ""}}}, ID_TO_NAME, "11时00分")
+        all_results, _, title_info = ranking.read_all_today_titles()
+
+        assert set(all_results["zhihu"]) == {"标题A", "标题D"}
+        assert "标题C" in all_results["weibo"]
+        assert title_info["zhihu"]["标题A"]["count"] == 1
+
+    def test_same_minute_batches_both_recorded(self, ranking):
+        """同一分钟内的两次运行都会被记录"""
+        time_info, results = BATCHES[0]
+        assert ranking.record_batch(results, ID_TO_NAME, time_info) is True
+        assert ranking.record_batch(results, ID_TO_NAME, time_info) is True
+
+        _, _, title_info = ranking.read_all_today_titles()
+        assert title_info["zhihu"]["标题A"]["count"] == 2
@@ -0,0 +1,134 @@
+# coding=utf-8
+"""测试批量权重计算模块"""
+
+import random
+
+import pytest
+
+from src.core.ranking import NewsRanking
+from src.core.weights import TitleScores, NUMPY_AVAILABLE
+from scripts.benchmarks.bench_weights import generate_word_stats
+
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="未安装 NumPy")
+
+
+@pytest.fixture
+def news_ranking():
+    """创建排序器（权重计算不依赖筛选器）"""
+    return NewsRanking(news_filter=None, rank_threshold=5)
+
+
+def _random_items(count, seed=0):
+    """生成随机标题数据（排名范围较小以制造相同权重）"""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        ranks = [rng.randint(1, 15) for _ in range(rng.randint(0, 6))]
+        items.append({"ranks": ranks, "count": rng.randint(1, 12)})
+    return items
+
+
+def _scalar_order(news_ranking, items):
+    """逐条计算的排序结果"""
+    return sorted(
+        range(len(items)),
+        key=lambda i: (
+            -news_ranking._calculate_weight(items[i]),
+            min(items[i]["ranks"]) if items[i]["ranks"] else 999,
+            -items[i]["count"],
+        ),
+    )
+
+
+class TestTitleScores:
+    """测试 TitleScores 类"""
+
+    def test_weights_match_scalar_exactly(self, news_ranking):
+        """批量权重与 _calculate_weight 逐位相等"""
+        items = _random_items(2000)
+        scores = TitleScores.compute(
+            items, news_ranking.rank_threshold, news_ranking.rank_weight,
+            news_ranking.frequency_weight, news_ranking.hotness_weight
+        )
+
+        assert scores.weights.tolist() == [news_ranking._calculate_weight(item) for item in items]
+
+    def test_order_matches_scalar(self, news_ranking):
+        """全量排序与逐条计算的排序一致（相同键保持原顺序）"""
+        items = _random_items(2000, seed=1)
+        scores = TitleScores.compute(items, 5, 0.6, 0.3, 0.1)
+
+        assert scores.order(0, len(items)) == _scalar_order(news_ranking, items)
+
+    def test_top_k_matches_scalar_prefix(self, news_ranking):
+        """前 K 选择与全量排序的前 K 条一致"""
+        items = _random_items(500, seed=2)
+        scores = TitleScores.compute(items, 5, 0.6, 0.3, 0.1)
+        expected = _scalar_order(news_ranking, items)
+
+        for top_k in (0, 1, 7, 50, 499, 500, 800):
+            assert scores.order(0, len(items), top_k) == expected[:top_k]
+
+    def test_order_sub_range(self, news_ranking):
+        """对子区间排序返回全局下标"""
+        items = _random_items(100, seed=3)
+        scores = TitleScores.compute(items, 5, 0.6, 0.3, 0.1)
+
+        expected = [i + 40 for i in _scalar_order(news_ranking, items[40:70])]
+        assert scores.order(40, 70) == expected
+
+    @pytest.mark.parametrize("rank", [None, 1.5, "3", True])
+    def test_non_integer_ranks_fall_back(self, rank):
+        """排名不全是整数时返回 None（不做截断转换）"""
+        items = [{"ranks": [2], "count": 1}, {"ranks": [1, rank], "count": 1}]
+        assert TitleScores.compute(items, 5, 0.6, 0.3, 0.1) is None
+
+
+class TestVectorizedStatistics:
+    """测试 NewsRanking 批量权重路径"""
+
+    def _titles(self, stats):
+        return {stat.word: [news.title for news in stat.news_list] for stat in stats}
+
+    def test_matches_scalar_path(self, news_ranking):
+        """批量路径与逐条路径生成的统计完全一致"""
+        word_stats = generate_word_stats(20, 3000, seed=5)
+
+        news_ranking.vectorized = False
+        scalar_stats = news_ranking._generate_statistics(word_stats, 3000)
+        news_ranking.vectorized = True
+        vectorized_stats = news_ranking._generate_statistics(word_stats, 3000)
+
+        assert self._titles(vectorized_stats) == self._titles(scalar_stats)
+        assert [stat.count for stat in vectorized_stats] == [stat.count for stat in scalar_stats]
+
+    def test_top_k(self, news_ranking):
+        """top_k 只截断新闻列表，不影响词组计数"""
+        word_stats = generate_word_stats(10, 2000, seed=6)
+
+        full_stats = self._titles(news_ranking._generate_statistics(word_stats, 2000))
+        top_stats = news_ranking._generate_statistics(word_stats, 2000, top_k=5)
+
+        for stat in top_stats:
+            assert len(stat.news_list) == 5
+            assert [news.title for news in stat.news_list] == full_stats[stat.word][:5]
+            assert stat.count == word_stats[stat.word]["count"]
+
+    def test_benchmark_against_scalar(self, news_ranking):
+        """批量计算 + 前 K 选择明显快于逐条计算 + 全量排序"""
+        word_stats = generate_word_stats(200, 50000)
+
+        def run(vectorized, top_k):
+            news_ranking.vectorized = vectorized
+            news_ranking.phase_timings = {"filter": 0.0, "stats": 0.0, "weight": 0.0, "sort": 0.0}
+            news_ranking._generate_statistics(word_stats, 50000, top_k)
+            return news_ranking.phase_timings["weight"] + news_ranking.phase_timings["sort"]
+
+        scalar_time = run(False, None)
+        vectorized_time = run(True, 20)
+
+        print(f"\n逐条计算: {scalar_time:.3f}s, 批量计算: {vectorized_time:.3f}s, "
+              f"加速比: {scalar_time / vectorized_time:.1f}x")
+
+        assert vectorized_time < scalar_time / 2
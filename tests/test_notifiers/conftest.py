@@ -0,0 +1,38 @@
+# coding=utf-8
+"""通知器测试公共夹具"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_proxy(monkeypatch):
+    """避免环境代理拦截本地请求"""
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def report_data():
+    """最小报告数据"""
+    return {
+        "stats": [{
+            "word": "人工智能",
+            "count": 1,
+            "percentage": 100.0,
+            "titles": [{
+                "title": "GPT-5 即将发布",
+                "platform": "zhihu",
+                "source_name": "知乎",
+                "time_display": "10时00分",
+                "count": 1,
+                "ranks": [1],
+                "rank_threshold": 10,
+                "url": "https://example.com/1",
+                "mobile_url": "",
+                "is_new": True,
+            }],
+        }],
+        "new_titles": [],
+        "failed_ids": [],
+        "total_new_count": 0,
+    }
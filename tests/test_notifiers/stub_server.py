@@ -0,0 +1,81 @@
+# coding=utf-8
+"""测试用本地 webhook 桩服务器"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubWebhookServer:
+    """本地 webhook 桩服务器
+
+    每个请求延迟固定时间后返回各渠道都视为成功的响应，
+    支持 HTTP/1.1 keep-alive，并记录请求数、最大并发请求数、成功请求的内容和使用过的连接
+    """
+
+    def __init__(self, delay: float = 0.0, fail_first: int = 0):
+        """初始化桩服务器
+
+        Args:
+            delay: 每个请求的响应延迟（秒）
+            fail_first: 前若干个请求返回 HTTP 500
+        """
+        self.delay = delay
+        self.fail_first = fail_first
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bodies = []
+        self.connections = set()
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                request_body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with lock:
+                    stub.request_count += 1
+                    number = stub.request_count
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                stub.connections.add(self.client_address)
+                time.sleep(stub.delay)
+                with lock:
+                    stub.in_flight -= 1
+
+                if number <= stub.fail_first:
+                    status = 500
+                else:
+                    status = 200
+                    stub.bodies.append(request_body.decode("utf-8"))
+
+                body = json.dumps({"errcode": 0, "code": 0, "StatusCode": 0, "ok": True})
+                body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """webhook 地址"""
+        return f"http://127.0.0.1:{self.server.server_address[1]}/webhook"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
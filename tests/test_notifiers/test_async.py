@@ -0,0 +1,121 @@
+# coding=utf-8
+"""测试异步通知发送"""
+
+import asyncio
+import time
+
+from src.notifiers.dingtalk import DingTalkNotifier
+from src.notifiers.manager import NotificationManager
+from scripts.benchmarks.bench_batch import generate_report_data
+from tests.test_notifiers.stub_server import StubWebhookServer
+
+
+def _dingtalk(url, **overrides):
+    config = {
+        "DINGTALK_WEBHOOK_URL": url,
+        "DINGTALK_BATCH_SIZE": 1200,
+        "BATCH_SEND_INTERVAL": 0.1,
+    }
+    config.update(overrides)
+    return DingTalkNotifier(config)
+
+
+class TestAsyncNotifier:
+    """测试 BaseNotifier.asend"""
+
+    def test_pacing_does_not_block_event_loop(self):
+        """批次间隔和请求期间事件循环保持响应"""
+        report_data = generate_report_data(30, 10, seed=1)
+
+        with StubWebhookServer(delay=0.05) as server:
+            notifier = _dingtalk(server.url)
+            batch_count = len(notifier.render_batches(report_data))
+
+            async def run():
+                ticks = 0
+                done = asyncio.Event()
+
+                async def ticker():
+                    nonlocal ticks
+                    while not done.is_set():
+                        ticks += 1
+                        await asyncio.sleep(0.01)
+
+                task = asyncio.create_task(ticker())
+                start = time.perf_counter()
+                success = await notifier.asend(report_data, "当日汇总")
+                elapsed = time.perf_counter() - start
+                done.set()
+                await task
+                await notifier.transport.aclose()
+                return success, elapsed, ticks
+
+            success, elapsed, ticks = asyncio.run(run())
+
+        assert success
+        assert server.request_count == batch_count > 2
+        assert elapsed >= (batch_count - 1) * 0.1
+        # 阻塞式发送时 ticker 在整个推送期间无法运行
+        assert ticks >= elapsed / 0.01 * 0.5
+
+    def test_channel_semaphore_bounds_pushes(self, report_data):
+        """同一渠道的并发推送受信号量限制，超出的推送排队"""
+        with StubWebhookServer(delay=0.1) as server:
+            notifier = _dingtalk(server.url, NOTIFICATION_CHANNEL_CONCURRENCY=1)
+
+            async def run():
+                results = await asyncio.gather(
+                    *(notifier.asend(report_data, f"推送{i}") for i in range(3))
+                )
+                await notifier.transport.aclose()
+                return results
+
+            start = time.perf_counter()
+            results = asyncio.run(run())
+            elapsed = time.perf_counter() - start
+
+        assert results == [True, True, True]
+        assert server.max_in_flight == 1
+        assert elapsed >= 0.3
+
+
+class TestAsyncDispatch:
+    """测试通知管理器的异步发送"""
+
+    def _manager(self, urls):
+        return NotificationManager({
+            "FEISHU_WEBHOOK_URL": urls["feishu"],
+            "DINGTALK_WEBHOOK_URL": urls["dingtalk"],
+            "BATCH_SEND_INTERVAL": 0,
+            "SHOW_VERSION_UPDATE": False,
+            "PUSH_WINDOW": {"ENABLED": False},
+            "NOTIFICATION_ASYNC": True,
+        })
+
+    def test_channels_sent_concurrently(self, report_data):
+        """同步入口在事件循环中并发发送各渠道"""
+        with StubWebhookServer(0.4) as feishu, StubWebhookServer(0.3) as dingtalk:
+            manager = self._manager({"feishu": feishu.url, "dingtalk": dingtalk.url})
+
+            start = time.perf_counter()
+            results = manager.send_notifications(report_data, "当日汇总")
+            elapsed = time.perf_counter() - start
+
+        assert results == {"feishu": True, "dingtalk": True}
+        assert 0.4 <= elapsed < 0.7
+        assert manager.get_last_dispatch()["mode"] == "async"
+
+    def test_sync_entry_inside_running_loop(self, report_data):
+        """在运行中的事件循环里调用同步入口时改在独立线程的事件循环中发送"""
+        with StubWebhookServer(0.2) as feishu, StubWebhookServer(0.2) as dingtalk:
+            manager = self._manager({"feishu": feishu.url, "dingtalk": dingtalk.url})
+
+            async def run():
+                sync_results = manager.send_notifications(report_data, "当日汇总")
+                async_results = await manager.asend_notifications(report_data, "当日汇总")
+                await manager.transport.aclose()
+                return sync_results, async_results
+
+            sync_results, async_results = asyncio.run(run())
+
+        assert sync_results == async_results == {"feishu": True, "dingtalk": True}
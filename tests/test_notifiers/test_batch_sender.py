@@ -0,0 +1,74 @@
+# coding=utf-8
+"""测试消息分批"""
+
+import pytest
+
+from src.core.reporter import NewsReporter
+from src.notifiers.batch_sender import BatchSender
+from scripts.benchmarks.bench_batch import PLATFORM_BATCH_SIZES, generate_report_data, legacy_split
+
+
+@pytest.fixture
+def sender():
+    """创建分批发送器"""
+    return BatchSender(NewsReporter())
+
+
+def _title_positions(batches, report_data):
+    """各标题在批次内容中的位置（按标题编号定位，未找到为 -1）"""
+    markers = [
+        t["title"].split(" ")[0] + " " for stat in report_data["stats"] for t in stat["titles"]
+    ]
+    text = "".join(batches)
+    return [text.find(marker) for marker in markers]
+
+
+class TestBatchSender:
+    """测试 BatchSender 类"""
+
+    @pytest.mark.parametrize("platform", list(PLATFORM_BATCH_SIZES))
+    def test_matches_legacy_without_oversized_groups(self, sender, platform):
+        """没有超长词组时与原算法的输出完全一致"""
+        report_data = generate_report_data(300, 60, new_count=20, seed=1)
+
+        assert sender.split_content_into_batches(report_data, platform, None, 20000) == \
+            legacy_split(sender, report_data, platform, None, 20000)
+
+    @pytest.mark.parametrize("platform, max_bytes", list(PLATFORM_BATCH_SIZES.items()))
+    def test_batches_within_limit(self, sender, platform, max_bytes):
+        """超长词组在内部拆分，所有批次都不超过上限"""
+        report_data = generate_report_data(2000, 5, new_count=300, seed=2)
+
+        batches = sender.split_content_into_batches(report_data, platform, None, max_bytes)
+
+        assert all(len(batch.encode("utf-8")) <= max_bytes for batch in batches)
+
+    def test_split_keeps_all_title_positions(self, sender):
+        """拆分后每条标题都保留且顺序不变"""
+        report_data = generate_report_data(1000, 3, seed=3)
+
+        batches = sender.split_content_into_batches(report_data, "wework", None, 4000)
+        positions = _title_positions(batches, report_data)
+
+        assert -1 not in positions
+        assert positions == sorted(positions)
+
+    def test_continued_heading(self, sender):
+        """拆分后的续接批次带有词组续接标题，且没有只含标题的空批次"""
+        report_data = generate_report_data(200, 1, seed=4)
+        word = report_data["stats"][0]["word"]
+
+        batches = sender.split_content_into_batches(report_data, "dingtalk", None, 4000)
+
+        assert len(batches) > 1
+        assert f"**{word}** (共" in batches[0]
+        assert all(f"**{word}（续）** (共" in batch for batch in batches[1:])
+
+    def test_failed_ids_only(self, sender):
+        """只有失败信息时仍生成一个批次"""
+        report_data = {"stats": [], "new_titles": [], "failed_ids": ["douyin"]}
+
+        batches = sender.split_content_into_batches(report_data, "ntfy", None, 4000)
+
+        assert len(batches) == 1
+        assert "douyin" in batches[0]
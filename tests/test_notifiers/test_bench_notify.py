@@ -0,0 +1,39 @@
+# coding=utf-8
+"""测试通知吞吐基准测试的本地渠道"""
+
+from scripts.benchmarks.bench_batch import generate_report_data
+from scripts.benchmarks.bench_notify import (
+    AIOSMTPD_AVAILABLE,
+    NOTIFIER_CLASSES,
+    find_regressions,
+    run_benchmark,
+)
+
+
+class TestNotifyBenchmark:
+    """测试 bench_notify"""
+
+    def test_all_channels_delivered(self):
+        """各渠道的响应格式都被通知器识别为成功，批次数与渲染结果一致"""
+        results = run_benchmark([100], list(NOTIFIER_CLASSES), repeat=1)
+        report_data = generate_report_data(100, 10, 10)
+
+        expected = set(NOTIFIER_CLASSES) if AIOSMTPD_AVAILABLE else set(NOTIFIER_CLASSES) - {"email"}
+        assert {key.split("/")[0] for key in results} == expected
+        for key, result in results.items():
+            channel = key.split("/")[0]
+            assert result["success"], key
+            assert result["bytes"] > 0
+            if channel == "email":
+                assert result["batches"] == 1
+            else:
+                notifier = NOTIFIER_CLASSES[channel]({})
+                assert result["batches"] == len(notifier.render_batches(report_data))
+
+    def test_regression_gate(self):
+        """CPU 时间超出容差或批次数变化时报告回归"""
+        baseline = {"feishu/100": {"cpu": 0.010, "batches": 1}}
+
+        assert find_regressions({"feishu/100": {"cpu": 0.012, "batches": 1}}, baseline, 0.3) == []
+        assert len(find_regressions({"feishu/100": {"cpu": 0.020, "batches": 1}}, baseline, 0.3)) == 1
+        assert len(find_regressions({"feishu/100": {"cpu": 0.010, "batches": 2}}, baseline, 0.3)) == 1
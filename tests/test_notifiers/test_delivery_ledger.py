@@ -0,0 +1,141 @@
+# coding=utf-8
+"""测试增量推送"""
+
+import copy
+import json
+
+import pytest
+
+from src.notifiers.delivery_ledger import DeliveryLedger
+from src.notifiers.manager import NotificationManager
+from src.notifiers.outbox import STATUS_DEAD
+from tests.test_notifiers.stub_server import StubWebhookServer
+
+
+@pytest.fixture(autouse=True)
+def output_dir(tmp_path, monkeypatch):
+    """账本写入临时目录"""
+    monkeypatch.chdir(tmp_path)
+
+
+def _add_title(report_data, title, rank):
+    """在第一个词组中追加一条新闻"""
+    stat = report_data["stats"][0]
+    item = dict(stat["titles"][0], title=title, ranks=[rank], url="")
+    stat["titles"].append(item)
+    stat["count"] += 1
+    return report_data
+
+
+def _titles(delta):
+    return [title["title"] for stat in delta.report_data["stats"] for title in stat["titles"]]
+
+
+class TestDeliveryLedger:
+    """测试 DeliveryLedger 类"""
+
+    def test_unchanged_report_is_empty(self, report_data):
+        """已推送的报告再次计算时没有变化"""
+        ledger = DeliveryLedger()
+        delta = ledger.compute_delta("dingtalk", report_data)
+        assert _titles(delta) == ["GPT-5 即将发布"]
+        ledger.record("dingtalk", delta)
+
+        assert DeliveryLedger().compute_delta("dingtalk", report_data).is_empty
+        # 账本按渠道独立
+        assert not ledger.compute_delta("feishu", report_data).is_empty
+
+    def test_new_and_improved_titles(self, report_data):
+        """只推送新出现和排名上升的新闻"""
+        report_data["stats"][0]["titles"][0]["ranks"] = [5]
+        ledger = DeliveryLedger()
+        ledger.record("dingtalk", ledger.compute_delta("dingtalk", report_data))
+
+        updated = _add_title(copy.deepcopy(report_data), "新标题", 8)
+        updated["stats"][0]["titles"][0]["ranks"] = [5, 2]
+        delta = ledger.compute_delta("dingtalk", updated)
+
+        assert _titles(delta) == ["GPT-5 即将发布", "新标题"]
+        assert delta.report_data["stats"][0]["count"] == 2
+
+        ledger.record("dingtalk", delta)
+        # 排名下降不再推送
+        updated["stats"][0]["titles"][0]["ranks"] = [3]
+        assert ledger.compute_delta("dingtalk", updated).is_empty
+
+    def test_disappeared_digest_once(self, report_data):
+        """不再上榜的新闻只在摘要中提示一次"""
+        ledger = DeliveryLedger()
+        full = _add_title(copy.deepcopy(report_data), "已下榜", 3)
+        ledger.record("dingtalk", ledger.compute_delta("dingtalk", full))
+
+        delta = ledger.compute_delta("dingtalk", report_data)
+        assert _titles(delta) == []
+        assert delta.report_data["disappeared"] == [
+            {"source_name": "知乎", "title": "已下榜", "rank": 3}
+        ]
+        ledger.record("dingtalk", delta)
+
+        assert ledger.compute_delta("dingtalk", report_data).is_empty
+        # 重新上榜时再次推送
+        assert _titles(ledger.compute_delta("dingtalk", full)) == ["已下榜"]
+
+
+class TestDeltaPush:
+    """测试通知管理器的增量推送"""
+
+    def _manager(self, url, **overrides):
+        config = {
+            "DINGTALK_WEBHOOK_URL": url,
+            "BATCH_SEND_INTERVAL": 0,
+            "SHOW_VERSION_UPDATE": False,
+            "PUSH_WINDOW": {"ENABLED": False},
+            "NOTIFICATION_DELTA": True,
+        }
+        config.update(overrides)
+        return NotificationManager(config)
+
+    def test_repeated_push_sends_changes_only(self, report_data):
+        """相同报告再次推送时跳过，之后只发送变化和下榜摘要"""
+        with StubWebhookServer() as server:
+            manager = self._manager(server.url)
+
+            assert manager.send_notifications(report_data, "当前榜单") == {"dingtalk": True}
+            assert server.request_count == 1
+
+            assert manager.send_notifications(report_data, "当前榜单") == {"dingtalk": True}
+            assert server.request_count == 1
+            assert manager.get_last_dispatch()["channels"]["dingtalk"]["skipped"]
+
+            updated = copy.deepcopy(report_data)
+            updated["stats"][0]["titles"][0]["title"] = "新标题"
+            manager.send_notifications(updated, "当前榜单")
+
+        text = json.loads(server.bodies[-1])["markdown"]["text"]
+        assert "新标题" in text
+        assert "已不在榜单" in text and "GPT-5 即将发布" in text
+
+    def test_dead_outbox_batch_resent(self, report_data):
+        """发送队列放弃的批次不写入账本，下次运行重新推送"""
+        config = {
+            "NOTIFICATION_OUTBOX": True,
+            "NOTIFICATION_OUTBOX_MAX_ATTEMPTS": 1,
+        }
+        with StubWebhookServer(fail_first=1) as server:
+            manager = self._manager(server.url, **config)
+            assert manager.send_notifications(report_data, "当前榜单") == {"dingtalk": True}
+            assert manager.wait_for_outbox(timeout=10)
+            manager.close()
+            assert manager.outbox.get_stats() == {"dingtalk": {STATUS_DEAD: 1}}
+            assert DeliveryLedger().get_channel_entries("dingtalk") == {}
+
+            manager = self._manager(server.url, **config)
+            manager.send_notifications(report_data, "当前榜单")
+            assert manager.wait_for_outbox(timeout=10)
+            assert len(server.bodies) == 1
+            assert "GPT-5 即将发布" in json.loads(server.bodies[0])["markdown"]["text"]
+
+            # 送达后写入账本，相同报告不再推送
+            manager.send_notifications(report_data, "当前榜单")
+            assert manager.get_last_dispatch()["channels"]["dingtalk"]["skipped"]
+            manager.close()
@@ -0,0 +1,184 @@
+# coding=utf-8
+"""测试邮件通知器（本地 aiosmtpd 服务器）"""
+
+import asyncio
+import socket
+import time
+from email import message_from_bytes
+from email.policy import default as default_policy
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from src.notifiers.email import EmailNotifier
+from src.notifiers.smtp_pool import SMTPPool
+
+HTML = "<html><body>\n<p>人工智能 热点</p>\n.以点号开头的行\n</body></html>\n"
+
+
+class RecordingHandler:
+    """记录收到的邮件及其所在连接"""
+
+    def __init__(self):
+        self.messages = []
+        self.peers = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(message_from_bytes(envelope.original_content, policy=default_policy))
+        self.peers.append(session.peer)
+        return "250 OK"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    """本地 SMTP 服务器（接受任意账号登录）"""
+    handler = RecordingHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=_free_port(),
+        authenticator=lambda *args: AuthResult(success=True),
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def html_file(tmp_path):
+    path = tmp_path / "report.html"
+    path.write_text(HTML, encoding="utf-8")
+    return str(path)
+
+
+def _notifier(controller, pool, **overrides):
+    config = {
+        "EMAIL_FROM": "bot@example.com",
+        "EMAIL_PASSWORD": "secret",
+        "EMAIL_TO": "a@example.com,b@example.com",
+        "EMAIL_SMTP_SERVER": controller.hostname,
+        "EMAIL_SMTP_PORT": str(controller.port),
+        "EMAIL_SMTP_STARTTLS": False,
+    }
+    config.update(overrides)
+    return EmailNotifier(config, smtp_pool=pool)
+
+
+class TestEmailNotifier:
+    """测试 EmailNotifier 类"""
+
+    def test_session_reused_across_sends(self, smtp_server, html_file, report_data):
+        """多次发送复用同一个已登录的连接"""
+        controller, handler = smtp_server
+        pool = SMTPPool()
+        notifier = _notifier(controller, pool)
+
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        notifier.smtp_pool.close()
+
+        assert len(handler.messages) == 2
+        assert handler.peers[0] == handler.peers[1]
+        assert (pool.connects, pool.reuses) == (1, 1)
+
+    def test_session_kept_across_runs(self, smtp_server, html_file, report_data):
+        """单次运行结束后会话留在池中，下次运行经 NOOP 检查后复用（不按空闲时间丢弃）"""
+        controller, handler = smtp_server
+        pool = SMTPPool()
+
+        notifier = _notifier(controller, pool)
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        notifier.close()
+        # 模拟一小时后的下一次定时运行
+        for key, (smtp, _) in list(pool._idle.items()):
+            pool._idle[key] = (smtp, time.time() - 3600)
+
+        assert _notifier(controller, pool).send(report_data, "当日汇总", html_file_path=html_file)
+        pool.close()
+
+        assert len(handler.messages) == 2
+        assert handler.peers[0] == handler.peers[1]
+        assert (pool.connects, pool.reuses) == (1, 1)
+
+    def test_reconnect_after_dead_session(self, smtp_server, html_file, report_data):
+        """空闲会话失效时 NOOP 检查失败并重新连接"""
+        controller, handler = smtp_server
+        pool = SMTPPool()
+        notifier = _notifier(controller, pool)
+
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        # 模拟服务器断开空闲连接
+        for smtp, _ in pool._idle.values():
+            smtp.sock.shutdown(socket.SHUT_RDWR)
+
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        notifier.smtp_pool.close()
+
+        assert len(handler.messages) == 2
+        assert handler.peers[0] != handler.peers[1]
+        assert pool.connects == 2
+
+    def test_streamed_html_body(self, smtp_server, html_file, report_data):
+        """流式发送的正文完整（含点号转义），支持 8BITMIME 时不做 base64 编码"""
+        controller, handler = smtp_server
+        notifier = _notifier(controller, SMTPPool())
+
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        notifier.smtp_pool.close()
+
+        msg = handler.messages[0]
+        assert msg["Subject"] == "TrendRadar - 当日汇总"
+        assert msg.get_content_type() == "text/html"
+        assert msg["Content-Transfer-Encoding"] == "8bit"
+        assert msg.get_content().replace("\r\n", "\n") == HTML
+
+    def test_plain_text_alternative(self, smtp_server, html_file, report_data):
+        """开启纯文本正文时发送 multipart/alternative"""
+        controller, handler = smtp_server
+        notifier = _notifier(controller, SMTPPool(), EMAIL_PLAIN_TEXT=True)
+
+        assert notifier.send(report_data, "当日汇总", html_file_path=html_file)
+        notifier.smtp_pool.close()
+
+        msg = handler.messages[0]
+        assert msg.get_content_type() == "multipart/alternative"
+        text, html = msg.iter_parts()
+        assert text.get_content_type() == "text/plain"
+        assert "GPT-5 即将发布" in text.get_content()
+        assert html.get_content().replace("\r\n", "\n") == HTML
+
+    def test_send_batch_not_supported(self):
+        """邮件不是分批渠道，单批次发送返回失败而不抛出异常"""
+        notifier = EmailNotifier({"EMAIL_FROM": "bot@example.com"}, smtp_pool=SMTPPool())
+
+        assert notifier.build_batch_request("内容", "当日汇总", 1, 1) is None
+        assert notifier.send_batch("内容", "当日汇总", 1, 1) is False
+        assert asyncio.run(notifier.asend_batch("内容", "当日汇总", 1, 1)) is False
+
+    def test_idle_timeout_per_notifier(self, smtp_server, html_file, report_data):
+        """空闲时间限制只作用于配置它的通知器，不修改共享会话池"""
+        controller, handler = smtp_server
+        pool = SMTPPool()
+
+        assert _notifier(controller, pool).send(report_data, "当日汇总", html_file_path=html_file)
+        for key, (smtp, _) in list(pool._idle.items()):
+            pool._idle[key] = (smtp, time.time() - 600)
+
+        strict = _notifier(controller, pool, EMAIL_SMTP_IDLE_TIMEOUT=300)
+        assert pool.idle_timeout == 0
+        assert strict.send(report_data, "当日汇总", html_file_path=html_file)
+        pool.close()
+
+        assert len(handler.messages) == 2
+        assert (pool.connects, pool.reuses) == (2, 0)
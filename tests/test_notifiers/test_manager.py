@@ -0,0 +1,117 @@
+# coding=utf-8
+"""测试通知管理器的多渠道发送"""
+
+import time
+
+from src.notifiers.manager import NotificationManager
+from tests.test_notifiers.stub_server import StubWebhookServer
+
+
+def _manager(urls, **overrides):
+    """创建只启用指定 webhook 渠道的通知管理器"""
+    config = {
+        "FEISHU_WEBHOOK_URL": urls.get("feishu", ""),
+        "DINGTALK_WEBHOOK_URL": urls.get("dingtalk", ""),
+        "WEWORK_WEBHOOK_URL": urls.get("wework", ""),
+        "BATCH_SEND_INTERVAL": 0,
+        "SHOW_VERSION_UPDATE": False,
+        "PUSH_WINDOW": {"ENABLED": False},
+    }
+    config.update(overrides)
+    return NotificationManager(config)
+
+
+class TestConcurrentDispatch:
+    """测试并发发送"""
+
+    DELAYS = {"feishu": 0.6, "dingtalk": 0.4, "wework": 0.4}
+
+    def _run(self, report_data, concurrent):
+        with StubWebhookServer(self.DELAYS["feishu"]) as feishu, \
+                StubWebhookServer(self.DELAYS["dingtalk"]) as dingtalk, \
+                StubWebhookServer(self.DELAYS["wework"]) as wework:
+            manager = _manager(
+                {"feishu": feishu.url, "dingtalk": dingtalk.url, "wework": wework.url},
+                NOTIFICATION_CONCURRENT=concurrent,
+            )
+
+            start = time.perf_counter()
+            results = manager.send_notifications(report_data, "当日汇总")
+            elapsed = time.perf_counter() - start
+
+        return manager, results, elapsed
+
+    def test_wall_clock_equals_slowest_channel(self, report_data):
+        """并发发送的总耗时接近最慢渠道，而不是各渠道之和"""
+        manager, results, elapsed = self._run(report_data, concurrent=True)
+
+        assert results == {"feishu": True, "dingtalk": True, "wework": True}
+        slowest = max(self.DELAYS.values())
+        assert slowest <= elapsed < slowest + 0.3
+        assert manager.get_last_dispatch()["mode"] == "concurrent"
+
+    def test_sequential_is_sum_of_channels(self, report_data):
+        """逐个发送的总耗时为各渠道之和"""
+        manager, results, elapsed = self._run(report_data, concurrent=False)
+
+        assert all(results.values())
+        assert elapsed >= sum(self.DELAYS.values())
+        assert manager.get_last_dispatch()["mode"] == "sequential"
+
+    def test_aggregated_result(self, report_data):
+        """汇总结果包含各渠道的耗时和状态"""
+        manager, _, _ = self._run(report_data, concurrent=True)
+
+        dispatch = manager.get_last_dispatch()
+        assert dispatch["success_count"] == 3
+        assert dispatch["fail_count"] == 0
+        for name, delay in self.DELAYS.items():
+            channel = dispatch["channels"][name]
+            assert channel["success"] and not channel["timed_out"]
+            assert channel["elapsed"] >= delay
+
+    def test_channel_timeout(self, report_data):
+        """超时的渠道记为失败，不阻塞其他渠道"""
+        with StubWebhookServer(1.2) as slow, StubWebhookServer(0.1) as fast:
+            manager = _manager(
+                {"feishu": slow.url, "dingtalk": fast.url},
+                NOTIFICATION_CONCURRENT=True,
+                NOTIFICATION_CHANNEL_TIMEOUT=10,
+                NOTIFICATION_CHANNEL_TIMEOUTS={"feishu": 0.3},
+            )
+
+            start = time.perf_counter()
+            results = manager.send_notifications(report_data, "当日汇总")
+            elapsed = time.perf_counter() - start
+
+        assert results == {"feishu": False, "dingtalk": True}
+        assert elapsed < 1.0
+        channel = manager.get_last_dispatch()["channels"]["feishu"]
+        assert channel["timed_out"]
+        assert channel["error"]
+
+
+class TestPushWindow:
+    """测试按渠道的每日一次限制"""
+
+    def test_per_channel_once_per_day(self, report_data, tmp_path, monkeypatch):
+        """只补发今天尚未推送成功的渠道"""
+        monkeypatch.chdir(tmp_path)
+        push_window = {
+            "ENABLED": True,
+            "TIME_RANGE": {"START": "00:00", "END": "23:59"},
+            "ONCE_PER_DAY": True,
+            "PER_CHANNEL": True,
+        }
+
+        with StubWebhookServer(fail_first=1) as feishu, StubWebhookServer() as dingtalk:
+            urls = {"feishu": feishu.url, "dingtalk": dingtalk.url}
+
+            first = _manager(urls, PUSH_WINDOW=push_window).send_notifications(report_data, "当日汇总")
+            second = _manager(urls, PUSH_WINDOW=push_window).send_notifications(report_data, "当日汇总")
+            third = _manager(urls, PUSH_WINDOW=push_window).send_notifications(report_data, "当日汇总")
+
+        assert first == {"feishu": False, "dingtalk": True}
+        assert second == {"feishu": True}
+        assert third == {}
+        assert (feishu.request_count, dingtalk.request_count) == (2, 1)
@@ -0,0 +1,153 @@
+# coding=utf-8
+"""测试通知发送队列"""
+
+import json
+import re
+import time
+
+import pytest
+
+from src.notifiers.manager import NotificationManager
+from src.notifiers.outbox import NotificationOutbox, STATUS_DEAD, STATUS_SENT
+from scripts.benchmarks.bench_batch import generate_report_data
+from tests.test_notifiers.stub_server import StubWebhookServer
+
+
+@pytest.fixture(autouse=True)
+def output_dir(tmp_path, monkeypatch):
+    """队列数据库写入临时目录"""
+    monkeypatch.chdir(tmp_path)
+
+
+def _manager(url, **overrides):
+    """创建只启用钉钉并开启发送队列的通知管理器"""
+    config = {
+        "DINGTALK_WEBHOOK_URL": url,
+        "DINGTALK_BATCH_SIZE": 1200,
+        "BATCH_SEND_INTERVAL": 0,
+        "SHOW_VERSION_UPDATE": False,
+        "PUSH_WINDOW": {"ENABLED": False},
+        "NOTIFICATION_OUTBOX": True,
+        "NOTIFICATION_OUTBOX_BACKOFF_BASE": 0.05,
+    }
+    config.update(overrides)
+    return NotificationManager(config)
+
+
+def _batch_indexes(bodies):
+    """按送达顺序提取批次序号"""
+    return [
+        int(re.search(r"第 (\d+)/\d+ 批次", json.loads(body)["markdown"]["text"]).group(1))
+        for body in bodies
+    ]
+
+
+class TestNotificationOutbox:
+    """测试 NotificationOutbox 类"""
+
+    def test_enqueue_is_idempotent(self):
+        """相同批次重复入队不会重复发送"""
+        outbox = NotificationOutbox()
+
+        assert outbox.enqueue("dingtalk", "当日汇总", ["a", "b"]) == 2
+        assert outbox.enqueue("dingtalk", "当日汇总", ["a", "b"]) == 0
+        assert outbox.pending_count("dingtalk") == 2
+
+    def test_head_of_line_order(self):
+        """队首消息等待重试时不会取出后续批次"""
+        outbox = NotificationOutbox(backoff_base=10)
+        outbox.enqueue("dingtalk", "当日汇总", ["a", "b"])
+
+        first = outbox.claim_next("dingtalk")
+        assert outbox.mark_failed(first["id"], "HTTP 500")
+
+        assert outbox.claim_next("dingtalk") is None
+        retried = outbox.claim_next("dingtalk", now=time.time() + 10)
+        assert retried["content"] == "a"
+
+    def test_expired_lease_reclaimed(self):
+        """租约过期的消息可被重新取出"""
+        outbox = NotificationOutbox(lease_seconds=30)
+        outbox.enqueue("ntfy", "当日汇总", ["a"])
+
+        message = outbox.claim_next("ntfy")
+        assert outbox.claim_next("ntfy") is None
+        assert outbox.claim_next("ntfy", now=time.time() + 31)["id"] == message["id"]
+
+    def test_dead_after_max_attempts(self):
+        """超过最大次数后放弃并让出队首"""
+        outbox = NotificationOutbox(max_attempts=2, backoff_base=0)
+        outbox.enqueue("feishu", "当日汇总", ["a", "b"])
+
+        message = outbox.claim_next("feishu")
+        assert outbox.mark_failed(message["id"], "HTTP 500")
+        message = outbox.claim_next("feishu")
+        assert not outbox.mark_failed(message["id"], "HTTP 500")
+
+        assert outbox.get_stats()["feishu"] == {STATUS_DEAD: 1, "pending": 1}
+        assert outbox.claim_next("feishu")["content"] == "b"
+
+
+class TestOutboxDelivery:
+    """测试通知管理器经发送队列投递"""
+
+    def test_failed_batches_retried_in_order(self):
+        """中途失败的批次重试后送达，且批次顺序不变"""
+        report_data = generate_report_data(30, 10, seed=1)
+
+        with StubWebhookServer(delay=0.05, fail_first=2) as server:
+            manager = _manager(server.url)
+
+            start = time.perf_counter()
+            results = manager.send_notifications(report_data, "当日汇总")
+            enqueue_time = time.perf_counter() - start
+
+            assert results == {"dingtalk": True}
+            assert manager.wait_for_outbox(timeout=10)
+            manager.close()
+
+        total = manager.get_last_dispatch()["channels"]["dingtalk"]["queued"]
+        assert total > 2
+        # 入队后立即返回，不等待投递
+        assert enqueue_time < total * 0.05
+        assert _batch_indexes(server.bodies) == list(range(1, total + 1))
+        assert manager.outbox.get_stats() == {"dingtalk": {STATUS_SENT: total}}
+
+    def test_resume_after_restart(self):
+        """上次运行未送达的批次在下次启动时继续投递"""
+        NotificationOutbox().enqueue("dingtalk", "当日汇总", ["**[第 1/2 批次]**", "**[第 2/2 批次]**"])
+
+        with StubWebhookServer() as server:
+            manager = _manager(server.url)
+
+            assert manager.wait_for_outbox(timeout=10)
+            manager.close()
+
+        assert server.request_count == 2
+        assert manager.outbox.pending_count() == 0
+
+    def test_rate_limit_per_channel(self):
+        """同一渠道相邻两次发送间隔不小于限速设置"""
+        NotificationOutbox().enqueue("dingtalk", "当日汇总", ["a", "b", "c"])
+
+        with StubWebhookServer() as server:
+            start = time.perf_counter()
+            manager = _manager(server.url, NOTIFICATION_OUTBOX_RATE_LIMITS={"dingtalk": 0.2})
+            assert manager.wait_for_outbox(timeout=10)
+            elapsed = time.perf_counter() - start
+            manager.close()
+
+        assert server.request_count == 3
+        assert elapsed >= 0.4
+
+    def test_close_stops_drainer(self):
+        """等待超时后关闭时投递线程退出，未送达的消息留在队列中"""
+        NotificationOutbox().enqueue("dingtalk", "当日汇总", ["a", "b", "c"])
+
+        with StubWebhookServer() as server:
+            manager = _manager(server.url, NOTIFICATION_OUTBOX_RATE_LIMITS={"dingtalk": 1})
+            manager.close(drain_timeout=0.2)
+
+            assert not manager.drainer.is_running()
+            assert server.request_count == 1
+            assert manager.outbox.pending_count() == 2
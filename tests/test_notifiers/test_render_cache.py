@@ -0,0 +1,66 @@
+# coding=utf-8
+"""测试通知内容渲染缓存"""
+
+from src.core.reporter import NewsReporter
+from src.notifiers.batch_sender import BatchSender
+from src.notifiers.dingtalk import DingTalkNotifier
+from src.notifiers.render_cache import RenderCache
+from src.notifiers.wework import WeWorkNotifier
+from scripts.benchmarks.bench_batch import PLATFORM_BATCH_SIZES, generate_report_data
+
+
+class TestRenderCache:
+    """测试 RenderCache 类"""
+
+    def test_matches_uncached_output(self):
+        """缓存的分批结果与直接分批一致"""
+        report_data = generate_report_data(500, 20, new_count=50, seed=1)
+        cache = RenderCache(report_data)
+        sender = BatchSender(NewsReporter())
+
+        for platform, max_bytes in PLATFORM_BATCH_SIZES.items():
+            assert cache.get_batches(platform, None, max_bytes) == \
+                sender.split_content_into_batches(report_data, platform, None, max_bytes)
+
+    def test_aliased_formats_share_render(self):
+        """钉钉与企业微信在相同批次大小下共用一次渲染"""
+        report_data = generate_report_data(200, 10, seed=2)
+        cache = RenderCache(report_data)
+
+        dingtalk = DingTalkNotifier({"DINGTALK_BATCH_SIZE": 4000})
+        wework = WeWorkNotifier({"WEWORK_BATCH_SIZE": 4000})
+
+        assert dingtalk.render_batches(report_data, cache=cache) is \
+            wework.render_batches(report_data, cache=cache)
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_titles_formatted_once(self, monkeypatch):
+        """不同批次大小重新分批时不重复格式化标题"""
+        report_data = generate_report_data(300, 10, new_count=30, seed=3)
+        cache = RenderCache(report_data)
+        calls = []
+        original = NewsReporter.format_title_for_platform
+
+        def counting(self, *args, **kwargs):
+            calls.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(NewsReporter, "format_title_for_platform", counting)
+
+        cache.get_batches("dingtalk", None, 20000)
+        first = len(calls)
+        cache.get_batches("dingtalk", None, 4000)
+
+        assert first == 330
+        assert len(calls) == first
+
+    def test_update_info_in_key(self):
+        """更新信息不同时分别渲染"""
+        report_data = generate_report_data(50, 5, seed=4)
+        cache = RenderCache(report_data)
+
+        plain = cache.get_batches("ntfy")
+        updated = cache.get_batches("ntfy", {"current_version": "1.0", "latest_version": "2.0"})
+
+        assert plain != updated
+        assert cache.misses == 2
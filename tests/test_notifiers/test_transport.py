@@ -0,0 +1,83 @@
+# coding=utf-8
+"""测试通知器共享 HTTP 传输层"""
+
+from src.notifiers.dingtalk import DingTalkNotifier
+from src.notifiers.manager import NotificationManager
+from src.notifiers.transport import NotifierTransport
+from tests.test_notifiers.stub_server import StubWebhookServer
+
+
+def _report_data(group_count):
+    """每个词组一条标题的报告数据"""
+    return {
+        "stats": [
+            {
+                "word": f"词组{i}",
+                "count": 1,
+                "percentage": 5.0,
+                "titles": [{
+                    "title": f"标题{i}",
+                    "platform": "zhihu",
+                    "source_name": "知乎",
+                    "time_display": "10时00分",
+                    "count": 1,
+                    "ranks": [1],
+                    "rank_threshold": 10,
+                    "url": f"https://example.com/{i}",
+                    "mobile_url": "",
+                    "is_new": False,
+                }],
+            }
+            for i in range(group_count)
+        ],
+        "new_titles": [],
+        "failed_ids": [],
+        "total_new_count": 0,
+    }
+
+
+class TestNotifierTransport:
+    """测试 NotifierTransport 类"""
+
+    def test_batches_reuse_one_connection(self):
+        """钉钉 20 批次推送复用同一个连接"""
+        with StubWebhookServer() as server:
+            notifier = DingTalkNotifier({
+                "DINGTALK_WEBHOOK_URL": server.url,
+                "DINGTALK_BATCH_SIZE": 700,  # 每个词组一个批次
+                "BATCH_SEND_INTERVAL": 0,
+            })
+
+            assert notifier.send(_report_data(20), "当日汇总")
+            notifier.transport.close()
+
+        assert server.request_count == 20
+        assert len(server.connections) == 1
+
+    def test_manager_shares_transport(self):
+        """通知管理器的所有通知器共享同一个传输层"""
+        manager = NotificationManager({"PUSH_WINDOW": {"ENABLED": False}})
+
+        transports = {id(notifier.transport) for notifier in manager.notifiers.values()}
+
+        assert transports == {id(manager.transport)}
+
+    def test_client_per_proxy(self):
+        """每个代理地址缓存一个会话"""
+        transport = NotifierTransport()
+
+        direct = transport._get_client(None)
+        proxied = transport._get_client("http://127.0.0.1:7890")
+
+        assert transport._get_client(None) is direct
+        assert proxied is not direct
+        assert proxied.proxies == {"http": "http://127.0.0.1:7890", "https": "http://127.0.0.1:7890"}
+
+        transport.close()
+        assert transport._clients == {}
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """未安装 h2 时回退到 HTTP/1.1"""
+        monkeypatch.setattr("src.notifiers.transport.HTTP2_AVAILABLE", False)
+
+        assert NotifierTransport(http2=True).http2 is False
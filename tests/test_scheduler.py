@@ -3,6 +3,7 @@
 
 import pytest
 import asyncio
+import time
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
@@ -231,5 +232,106 @@ async def test_execution_history_limit(scheduler):
     assert scheduler.execution_history[-1]["task_id"] == "test_4"
 
 
+def _slow_run(duration: float):
+    """构造一个模拟慢速爬取的 app.run，按阶段上报进度并响应取消"""
+    def run(mode="daily", progress_callback=None, cancel_event=None):
+        from src.app import CrawlCancelledError
+
+        for stage in ["fetch", "history", "report"]:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CrawlCancelledError(f"在 {stage} 阶段开始前被取消")
+            if progress_callback is not None:
+                progress_callback(stage, f"进入 {stage}")
+            time.sleep(duration / 3)
+        return True
+    return run
+
+
+@pytest.mark.asyncio
+async def test_run_crawler_task_records_progress(scheduler):
+    """测试执行进度写入执行历史"""
+    with patch('src.api.scheduler.task_scheduler.TrendRadarApp') as MockApp:
+        mock_app = Mock()
+        mock_app.run.side_effect = _slow_run(0.15)
+        MockApp.return_value = mock_app
+
+        await scheduler._run_crawler_task(mode="daily")
+
+    record = scheduler.execution_history[0]
+    assert record["status"] == "success"
+    assert record["current_stage"] == "report"
+    assert [p["stage"] for p in record["progress"]] == ["fetch", "history", "report"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_task(scheduler):
+    """测试取消正在执行的任务"""
+    with patch('src.api.scheduler.task_scheduler.TrendRadarApp') as MockApp:
+        mock_app = Mock()
+        mock_app.run.side_effect = _slow_run(0.6)
+        MockApp.return_value = mock_app
+
+        task = asyncio.create_task(scheduler._run_crawler_task(mode="daily"))
+        await asyncio.sleep(0.1)
+
+        assert scheduler.execution_history[0]["status"] == "running"
+        assert await scheduler.cancel_task() is True
+        await task
+
+    record = scheduler.execution_history[0]
+    assert record["status"] == "cancelled"
+    assert record["success"] is False
+    assert await scheduler.cancel_task() is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_trigger_is_skipped(scheduler):
+    """测试同一时间只运行一个任务"""
+    with patch('src.api.scheduler.task_scheduler.TrendRadarApp') as MockApp:
+        mock_app = Mock()
+        mock_app.run.side_effect = _slow_run(0.3)
+        MockApp.return_value = mock_app
+
+        first = asyncio.create_task(scheduler._run_crawler_task(mode="daily"))
+        await asyncio.sleep(0.05)
+        await scheduler.trigger_now(mode="current")
+        await first
+
+    assert len(scheduler.execution_history) == 1
+    assert MockApp.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_health_latency_during_slow_crawl(scheduler):
+    """测试慢速爬取期间 /health 仍能快速响应"""
+    import httpx
+    from src.api.server import app
+
+    with patch('src.api.scheduler.task_scheduler.TrendRadarApp') as MockApp:
+        mock_app = Mock()
+        mock_app.run.side_effect = _slow_run(1.5)
+        MockApp.return_value = mock_app
+
+        task = asyncio.create_task(scheduler._run_crawler_task(mode="daily"))
+        await asyncio.sleep(0.05)
+
+        latencies = []
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for _ in range(5):
+                start = time.perf_counter()
+                response = await client.get("/health")
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+                await asyncio.sleep(0.1)
+
+        assert not task.done()
+        await task
+
+    print(f"\n/health 最大延迟: {max(latencies) * 1000:.1f}ms")
+    assert max(latencies) < 0.2
+    assert scheduler.execution_history[0]["status"] == "success"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
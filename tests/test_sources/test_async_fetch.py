@@ -0,0 +1,134 @@
+# coding=utf-8
+"""测试信息源异步接口与并发编排"""
+
+import asyncio
+import time
+from typing import List
+
+from src.app import TrendRadarApp
+from src.sources.base import BaseSource
+from src.models.news import News
+
+
+class SyncOnlySource(BaseSource):
+    """只实现同步接口的信息源"""
+
+    def __init__(self, config, source_id="sync_only", delay=0.0, fail=False):
+        self._id = source_id
+        self.delay = delay
+        self.fail = fail
+        super().__init__(config)
+
+    @property
+    def source_id(self) -> str:
+        return self._id
+
+    @property
+    def source_name(self) -> str:
+        return f"同步信息源 {self._id}"
+
+    def fetch_news(self, **kwargs) -> List[News]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("模拟失败")
+        return [
+            News(
+                title=f"{self._id} 新闻",
+                url=f"https://example.com/{self._id}",
+                platform=self._id,
+                platform_name=self._id,
+                rank=1,
+                source_id=self._id
+            )
+        ]
+
+
+def make_app(config):
+    """构造不加载配置文件的应用实例"""
+    app = TrendRadarApp.__new__(TrendRadarApp)
+    app.config = config
+    return app
+
+
+class TestBaseSourceAsync:
+    """测试 BaseSource.afetch_news 默认实现"""
+
+    def test_afetch_news_falls_back_to_thread(self):
+        """同步信息源通过线程执行，不阻塞事件循环"""
+        source = SyncOnlySource({}, delay=0.2)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.02)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            news_list = await source.afetch_news()
+            task.cancel()
+            return news_list, ticks
+
+        news_list, ticks = asyncio.run(run())
+
+        assert len(news_list) == 1
+        assert ticks >= 5
+
+
+class TestFetchAllNews:
+    """测试 TrendRadarApp 并发获取所有信息源"""
+
+    def test_sources_run_concurrently(self):
+        """多个信息源并发执行，总耗时约等于最慢的信息源"""
+        app = make_app({"REQUEST_INTERVAL": 0})
+        sources = [SyncOnlySource({}, source_id=f"s{i}", delay=0.3) for i in range(4)]
+
+        start = time.perf_counter()
+        all_news, failed_ids = app._fetch_all_news(sources)
+        elapsed = time.perf_counter() - start
+
+        assert [n.platform for n in all_news] == ["s0", "s1", "s2", "s3"]
+        assert failed_ids == []
+        assert elapsed < 0.9
+
+    def test_timeout_and_failure_are_isolated(self):
+        """超时与失败的信息源记入失败列表，不影响其他信息源"""
+        app = make_app({"REQUEST_INTERVAL": 0, "SOURCE_TIMEOUT": 0.2})
+        sources = [
+            SyncOnlySource({}, source_id="ok"),
+            SyncOnlySource({}, source_id="slow", delay=1.0),
+            SyncOnlySource({}, source_id="broken", fail=True),
+        ]
+
+        all_news, failed_ids = app._fetch_all_news(sources)
+
+        assert [n.platform for n in all_news] == ["ok"]
+        assert failed_ids == ["slow", "broken"]
+
+    def test_fetch_inside_running_loop(self):
+        """在事件循环中调用同步入口也能正常工作"""
+        app = make_app({"REQUEST_INTERVAL": 0})
+        sources = [SyncOnlySource({}, source_id="a")]
+
+        async def run():
+            return app._fetch_all_news(sources)
+
+        all_news, failed_ids = asyncio.run(run())
+
+        assert len(all_news) == 1
+        assert failed_ids == []
+
+    def test_timeout_bounds_wall_time(self):
+        """超时的同步信息源不会拖住整次爬取"""
+        app = make_app({"REQUEST_INTERVAL": 0, "SOURCE_TIMEOUT": 0.2})
+        sources = [SyncOnlySource({}, source_id="ok"), SyncOnlySource({}, source_id="slow", delay=1.5)]
+
+        start = time.perf_counter()
+        all_news, failed_ids = app._fetch_all_news(sources)
+        elapsed = time.perf_counter() - start
+
+        assert [n.platform for n in all_news] == ["ok"]
+        assert failed_ids == ["slow"]
+        assert elapsed < 1.0
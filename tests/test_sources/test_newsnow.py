@@ -0,0 +1,183 @@
+# coding=utf-8
+"""NewNow 信息源并发爬取测试"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from src.sources.newsnow import NewNowSource
+from src.utils.http import HostRateLimiter
+
+
+STUB_LATENCY = 0.15
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """模拟 newsnow API 的请求处理器"""
+
+    def do_GET(self):
+        platform_id = parse_qs(urlparse(self.path).query).get("id", [""])[0]
+        time.sleep(STUB_LATENCY)
+
+        if platform_id == "broken":
+            payload = {"status": "error", "items": []}
+        else:
+            payload = {
+                "status": "success",
+                "items": [
+                    {
+                        "title": f"{platform_id} 新闻 {i}",
+                        "url": f"https://example.com/{platform_id}/{i}",
+                        "mobileUrl": f"https://m.example.com/{platform_id}/{i}",
+                    }
+                    for i in range(1, 6)
+                ] + [{"title": f"{platform_id} 新闻 1", "url": "", "mobileUrl": ""}],
+            }
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """启动本地 newsnow 模拟服务器"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/s"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def platforms():
+    """测试平台列表（包含一个失败平台）"""
+    ids = ["zhihu", "weibo", "broken", "douyin", "baidu", "toutiao", "bilibili", "tieba"]
+    return [{"id": pid, "name": pid.upper()} for pid in ids]
+
+
+@pytest.fixture
+def source(stub_server, platforms):
+    """指向模拟服务器的 NewNowSource"""
+    config = {
+        "SOURCES": {
+            "enabled": ["newsnow"],
+            "newsnow": {"platforms": platforms},
+        }
+    }
+    source = NewNowSource(config)
+    source.API_BASE_URL = stub_server
+    return source
+
+
+class TestHostRateLimiter:
+    """测试 HostRateLimiter"""
+
+    def test_spaces_requests_to_same_host(self):
+        """同一主机的请求按间隔排队"""
+        limiter = HostRateLimiter(interval_ms=50)
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("http://a.example.com/x")
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.09
+
+    def test_different_hosts_do_not_wait(self):
+        """不同主机互不影响"""
+        limiter = HostRateLimiter(interval_ms=500)
+
+        start = time.monotonic()
+        limiter.acquire("http://a.example.com/x")
+        limiter.acquire("http://b.example.com/x")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.1
+
+
+class TestNewNowConcurrentCrawl:
+    """测试 NewNowSource 并发爬取"""
+
+    def test_concurrent_matches_serial(self, source, platforms):
+        """并发模式的结果与串行模式完全一致"""
+        serial = source._crawl_platforms(platforms, request_interval=0)
+        concurrent = source._crawl_platforms_concurrent(
+            platforms, request_interval=0, max_workers=4
+        )
+
+        serial_results, serial_names, serial_failed = serial
+        results, id_to_name, failed_ids = concurrent
+
+        assert results == serial_results
+        assert list(results.keys()) == list(serial_results.keys())
+        assert id_to_name == serial_names
+        assert failed_ids == serial_failed == ["broken"]
+        assert results["zhihu"]["zhihu 新闻 1"]["ranks"] == [1, 6]
+
+    def test_fetch_news_uses_configured_workers(self, source):
+        """fetch_news 读取 max_workers 配置"""
+        source.config["SOURCES"]["newsnow"]["max_workers"] = 4
+
+        news_list = source.fetch_news(request_interval=0)
+
+        assert len(news_list) == 7 * 5
+        assert {news.platform for news in news_list} == {
+            "zhihu", "weibo", "douyin", "baidu", "toutiao", "bilibili", "tieba"
+        }
+
+    def test_concurrent_timing_benchmark(self, source, platforms):
+        """并发模式的耗时显著低于串行模式"""
+        start = time.perf_counter()
+        source._crawl_platforms(platforms, request_interval=50)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        source._crawl_platforms_concurrent(platforms, request_interval=50, max_workers=8)
+        concurrent_time = time.perf_counter() - start
+
+        print(f"\n串行: {serial_time:.3f}s, 并发: {concurrent_time:.3f}s, "
+              f"加速比: {serial_time / concurrent_time:.1f}x")
+
+        # 串行约 8 × (150ms + 50ms)，并发约 8 × 50ms 的限速 + 150ms 延迟
+        assert concurrent_time < serial_time / 2
+
+
+class TestNewNowAsyncCrawl:
+    """测试 NewNowSource 原生异步爬取"""
+
+    def test_async_matches_serial(self, source, platforms):
+        """异步模式的结果与串行模式完全一致"""
+        serial = source._crawl_platforms(platforms, request_interval=0)
+        results, id_to_name, failed_ids = asyncio.run(
+            source._acrawl_platforms(platforms, request_interval=0, max_workers=4)
+        )
+
+        assert results == serial[0]
+        assert list(results.keys()) == list(serial[0].keys())
+        assert id_to_name == serial[1]
+        assert failed_ids == serial[2]
+
+    def test_afetch_news(self, source):
+        """afetch_news 返回与 fetch_news 相同的新闻"""
+        source.config["SOURCES"]["newsnow"]["max_workers"] = 4
+
+        async_news = asyncio.run(source.afetch_news(request_interval=0))
+        sync_news = source.fetch_news(request_interval=0)
+
+        def key(news):
+            return (news.platform, news.title, news.url, news.rank, news.extra["all_ranks"])
+
+        assert [key(n) for n in async_news] == [key(n) for n in sync_news]